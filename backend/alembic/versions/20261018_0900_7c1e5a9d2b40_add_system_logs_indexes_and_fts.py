@@ -0,0 +1,64 @@
+"""add_system_logs_indexes_and_fts
+
+Revision ID: 7c1e5a9d2b40
+Revises: 044dc4a795c8
+Create Date: 2026-10-18 09:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e5a9d2b40'
+down_revision: Union[str, None] = '044dc4a795c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_system_logs_timestamp_id', 'system_logs', ['timestamp', 'id'], unique=False)
+    op.create_index('idx_system_logs_level_timestamp', 'system_logs', ['level', 'timestamp'], unique=False)
+
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS system_logs_fts USING fts5("
+            "message, content='system_logs', content_rowid='rowid')"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS system_logs_fts_insert AFTER INSERT ON system_logs BEGIN "
+            "INSERT INTO system_logs_fts(rowid, message) VALUES (new.rowid, new.message); END"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS system_logs_fts_delete AFTER DELETE ON system_logs BEGIN "
+            "INSERT INTO system_logs_fts(system_logs_fts, rowid, message) "
+            "VALUES ('delete', old.rowid, old.message); END"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS system_logs_fts_update AFTER UPDATE OF message ON system_logs BEGIN "
+            "INSERT INTO system_logs_fts(system_logs_fts, rowid, message) "
+            "VALUES ('delete', old.rowid, old.message); "
+            "INSERT INTO system_logs_fts(rowid, message) VALUES (new.rowid, new.message); END"
+        )
+        op.execute("INSERT INTO system_logs_fts(system_logs_fts) VALUES ('rebuild')")
+    elif dialect == 'postgresql':
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS idx_system_logs_message_fts ON system_logs "
+            "USING gin (to_tsvector('simple', message))"
+        )
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        op.execute("DROP TRIGGER IF EXISTS system_logs_fts_update")
+        op.execute("DROP TRIGGER IF EXISTS system_logs_fts_delete")
+        op.execute("DROP TRIGGER IF EXISTS system_logs_fts_insert")
+        op.execute("DROP TABLE IF EXISTS system_logs_fts")
+    elif dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS idx_system_logs_message_fts")
+
+    op.drop_index('idx_system_logs_level_timestamp', table_name='system_logs')
+    op.drop_index('idx_system_logs_timestamp_id', table_name='system_logs')
@@ -0,0 +1,41 @@
+"""add_ai_verdict_cache_table
+
+Revision ID: 3b8f2d6e9a14
+Revises: 7c1e5a9d2b40
+Create Date: 2026-10-18 10:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8f2d6e9a14'
+down_revision: Union[str, None] = '7c1e5a9d2b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'ai_verdict_cache',
+        sa.Column('text_hash', sa.String(length=64), nullable=False),
+        sa.Column('prompt_version', sa.String(length=32), nullable=False),
+        sa.Column('model_id', sa.String(length=100), nullable=False),
+        sa.Column('label', sa.String(length=20), nullable=False),
+        sa.Column('confidence', sa.Numeric(precision=5, scale=4), nullable=False),
+        sa.Column('reasoning', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.Column('last_used_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.PrimaryKeyConstraint('text_hash', 'prompt_version', 'model_id')
+    )
+    op.create_index('idx_ai_verdict_cache_created_at', 'ai_verdict_cache', ['created_at'], unique=False)
+    op.create_index('idx_ai_verdict_cache_last_used_at', 'ai_verdict_cache', ['last_used_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_ai_verdict_cache_last_used_at', table_name='ai_verdict_cache')
+    op.drop_index('idx_ai_verdict_cache_created_at', table_name='ai_verdict_cache')
+    op.drop_table('ai_verdict_cache')
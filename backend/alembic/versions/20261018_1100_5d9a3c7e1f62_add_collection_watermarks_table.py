@@ -0,0 +1,33 @@
+"""add_collection_watermarks_table
+
+Revision ID: 5d9a3c7e1f62
+Revises: 3b8f2d6e9a14
+Create Date: 2026-10-18 11:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d9a3c7e1f62'
+down_revision: Union[str, None] = '3b8f2d6e9a14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'collection_watermarks',
+        sa.Column('source', sa.String(length=20), nullable=False),
+        sa.Column('symbol', sa.String(length=10), nullable=False),
+        sa.Column('last_published_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.PrimaryKeyConstraint('source', 'symbol')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('collection_watermarks')
@@ -0,0 +1,48 @@
+"""add_pipeline_jobs_table
+
+Revision ID: 9e4b1f7c3a58
+Revises: 5d9a3c7e1f62
+Create Date: 2026-10-18 12:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4b1f7c3a58'
+down_revision: Union[str, None] = '5d9a3c7e1f62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'pipeline_jobs',
+        sa.Column('id', sa.String(length=36), nullable=False),
+        sa.Column('run_id', sa.String(length=36), nullable=False),
+        sa.Column('status', sa.String(length=16), nullable=False),
+        sa.Column('source', sa.String(length=32), nullable=False),
+        sa.Column('config', sa.JSON(), nullable=False),
+        sa.Column('progress', sa.JSON(), nullable=True),
+        sa.Column('result', sa.JSON(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('cancel_requested', sa.Boolean(), nullable=False),
+        sa.Column('worker_id', sa.String(length=64), nullable=True),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_pipeline_jobs_run_id', 'pipeline_jobs', ['run_id'], unique=False)
+    op.create_index('idx_pipeline_jobs_status_created', 'pipeline_jobs', ['status', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_pipeline_jobs_status_created', table_name='pipeline_jobs')
+    op.drop_index('ix_pipeline_jobs_run_id', table_name='pipeline_jobs')
+    op.drop_table('pipeline_jobs')
@@ -16,7 +16,7 @@ import os
 import hashlib
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional, Tuple, Set
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
@@ -34,6 +34,7 @@ from ..infrastructure.rate_limiter import RateLimitHandler, RequestPriority
 from ..data_access.repositories.sentiment_repository import SentimentDataRepository
 from ..data_access.repositories.stock_repository import StockRepository
 from ..infrastructure.log_system import get_logger
+from ..infrastructure.event_bus import get_event_bus
 # Sentiment Analysis Integration
 from ..service.sentiment_processing import get_sentiment_engine, EngineConfig
 from ..service.sentiment_processing import TextInput, DataSource, SentimentResult
@@ -77,6 +78,8 @@ class PipelineConfig:
     include_yfinance: bool = True
     include_comments: bool = True
     parallel_collectors: bool = True
+    # Start each (source, symbol) query at its high-water mark instead of date_range.start_date
+    incremental: bool = False
     processing_config: Optional[ProcessingConfig] = None
     
     def __post_init__(self):
@@ -120,6 +123,30 @@ class PipelineConfig:
             max_items_per_symbol=max_items_per_symbol,
             **kwargs
         )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form, for handing a run to another process."""
+        data = asdict(self)
+        data["date_range"] = {
+            "start_date": self.date_range.start_date.isoformat(),
+            "end_date": self.date_range.end_date.isoformat()
+        }
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PipelineConfig':
+        """Inverse of to_dict()."""
+        data = dict(data)
+        date_range = data.pop("date_range")
+        processing_config = data.pop("processing_config", None)
+        return cls(
+            date_range=DateRange(
+                start_date=datetime.fromisoformat(date_range["start_date"]),
+                end_date=datetime.fromisoformat(date_range["end_date"])
+            ),
+            processing_config=ProcessingConfig(**processing_config) if processing_config else None,
+            **data
+        )
 
 
 @dataclass
@@ -174,6 +201,63 @@ class PipelineResult:
             return 0.0
         successful = sum(1 for stat in self.collector_stats if stat.success)
         return successful / len(self.collector_stats)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form, for reporting a run to another process."""
+        data = asdict(self)
+        data["status"] = self.status.value
+        data["start_time"] = self.start_time.isoformat()
+        data["end_time"] = self.end_time.isoformat() if self.end_time else None
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PipelineResult':
+        """Inverse of to_dict()."""
+        data = dict(data)
+        end_time = data.pop("end_time", None)
+        return cls(
+            status=PipelineStatus(data.pop("status")),
+            start_time=datetime.fromisoformat(data.pop("start_time")),
+            end_time=datetime.fromisoformat(end_time) if end_time else None,
+            collector_stats=[CollectorStats(**stat) for stat in data.pop("collector_stats", [])],
+            **data
+        )
+
+
+def pipeline_engine_config() -> EngineConfig:
+    """
+    Sentiment engine configuration used by the pipeline.
+
+    The engine is a process-wide singleton configured by whoever creates it
+    first, so startup warm-up must build it with this same configuration.
+    """
+    from ..infrastructure.config.settings import get_settings
+    from ..service.collector_config_service import get_collector_config_service
+    
+    settings = get_settings()
+    collector_config = get_collector_config_service()
+    
+    # Get AI settings from dynamic config (JSON) first, fallback to env settings
+    ai_config = collector_config.get_ai_service_config("gemini") or {}
+    
+    # Determine effective settings (Dynamic Config > Env Config)
+    ai_mode = ai_config.get("verification_mode", settings.ai_verification_mode)
+    ai_threshold = ai_config.get("confidence_threshold", settings.ai_confidence_threshold)
+    
+    return EngineConfig(
+        enable_finbert=True,
+        use_ensemble_finbert=True,  # Enabled for +1-2% accuracy
+        finbert_use_gpu=True,  # Will auto-detect if GPU is available
+        finbert_use_calibration=True,  # Enable confidence calibration (temperature scaling)
+        quantize_int8=settings.sentiment_quantize_int8,  # Opt-in INT8 CPU inference
+        max_concurrent_batches=4,  # Increased for better throughput
+        default_batch_size=32,  # Increased for better GPU utilization
+        fallback_to_neutral=True,  # Graceful degradation
+        cache_results=True,  # Enable caching to prevent re-processing
+        # AI Verification settings (Dynamic > Env)
+        ai_verification_mode=ai_mode,
+        ai_confidence_threshold=ai_threshold
+    )
 
 
 class DataPipeline:
@@ -213,33 +297,7 @@ class DataPipeline:
         self._repository_initialized = False
         
         # Initialize sentiment analysis engine with FinBERT-Tone (singleton)
-        from ..infrastructure.config.settings import get_settings
-        from ..service.collector_config_service import get_collector_config_service
-        
-        settings = get_settings()
-        collector_config = get_collector_config_service()
-        
-        # Get AI settings from dynamic config (JSON) first, fallback to env settings
-        ai_config = collector_config.get_ai_service_config("gemini") or {}
-        
-        # Determine effective settings (Dynamic Config > Env Config)
-        ai_mode = ai_config.get("verification_mode", settings.ai_verification_mode)
-        ai_threshold = ai_config.get("confidence_threshold", settings.ai_confidence_threshold)
-        
-        sentiment_config = EngineConfig(
-            enable_finbert=True,
-            use_ensemble_finbert=True,  # Enabled for +1-2% accuracy
-            finbert_use_gpu=True,  # Will auto-detect if GPU is available
-            finbert_use_calibration=True,  # Enable confidence calibration (temperature scaling)
-            max_concurrent_batches=4,  # Increased for better throughput
-            default_batch_size=32,  # Increased for better GPU utilization
-            fallback_to_neutral=True,  # Graceful degradation
-            cache_results=True,  # Enable caching to prevent re-processing
-            # AI Verification settings (Dynamic > Env)
-            ai_verification_mode=ai_mode,
-            ai_confidence_threshold=ai_threshold
-        )
-        self.sentiment_engine = get_sentiment_engine(sentiment_config)
+        self.sentiment_engine = get_sentiment_engine(pipeline_engine_config())
         
         # Pipeline state
         self.current_status = PipelineStatus.IDLE
@@ -783,6 +841,9 @@ class DataPipeline:
                     items_stored=stored_count
                 )
                 self._progress["stages_completed"].append("storage")
+                
+                # Results are stored: later runs can start after them
+                await self._advance_watermarks(collection_results, config)
             else:
                 self.logger.log_pipeline_operation(
                     "storage_phase_skipped",
@@ -874,6 +935,7 @@ class DataPipeline:
         
         finally:
             self.current_status = result.status
+            self._publish_progress("status")
         
         return result
     
@@ -935,6 +997,19 @@ class DataPipeline:
             else:
                 self.logger.info("YFinance collector is disabled by admin configuration", component="pipeline")
         
+        # Per-symbol high-water marks narrow each source's query window
+        since_by_source: Dict[str, Dict[str, datetime]] = {}
+        if config.incremental:
+            from app.service.watermark_service import get_watermark_service
+            watermark_service = get_watermark_service()
+            for name, _ in collectors_to_run:
+                since_by_source[name] = await watermark_service.load_since(name, fair_symbols)
+            self.logger.info(
+                "Incremental collection from high-water marks",
+                component="pipeline",
+                symbols_with_marks={name: len(since) for name, since in since_by_source.items()}
+            )
+        
         # Run collectors in parallel or sequential mode
         if config.parallel_collectors:
             # Run collectors in parallel (standard mode)
@@ -951,7 +1026,8 @@ class DataPipeline:
                     symbols=fair_symbols,
                     date_range=config.date_range,
                     max_items_per_symbol=source_max_items,
-                    include_comments=source_settings.include_comments if source_settings else config.include_comments
+                    include_comments=source_settings.include_comments if source_settings else config.include_comments,
+                    since=since_by_source.get(name, {})
                 )
                 
                 task = asyncio.create_task(
@@ -1000,7 +1076,8 @@ class DataPipeline:
                         symbols=fair_symbols,
                         date_range=config.date_range,
                         max_items_per_symbol=source_max_items,
-                        include_comments=source_settings.include_comments if source_settings else config.include_comments
+                        include_comments=source_settings.include_comments if source_settings else config.include_comments,
+                        since=since_by_source.get(name, {})
                     )
                     
                     result = await self._run_collector_with_timeout(name, collector, source_collection_config)
@@ -1023,6 +1100,23 @@ class DataPipeline:
         
         return collection_results
     
+    async def _advance_watermarks(
+        self,
+        collection_results: Dict[str, CollectionResult],
+        config: PipelineConfig
+    ) -> None:
+        """Move each successful source's per-symbol high-water marks to the newest item collected."""
+        from app.service.watermark_service import get_watermark_service
+        watermark_service = get_watermark_service()
+        
+        for name, collection_result in collection_results.items():
+            if not collection_result.success or not collection_result.data:
+                continue
+            marks = watermark_service.marks_from_items(collection_result.data, config.date_range.end_date)
+            advanced = await watermark_service.advance(name, marks)
+            if advanced:
+                self.logger.debug(f"Advanced {advanced} {name} watermarks", component="pipeline")
+    
     async def _record_quota_usage(self, source: str, num_symbols: int):
         """
         Record API quota usage after successful collection.
@@ -1519,6 +1613,7 @@ class DataPipeline:
         stored_count = 0
         skipped_duplicate_urls = 0
         skipped_no_symbol = 0
+        stored_by_table: Dict[str, int] = {"news_articles": 0, "hackernews_posts": 0}
         
         try:
             # Process each collection result
@@ -1672,6 +1767,7 @@ class DataPipeline:
                             
                             await session.commit()
                             stored_count += 1
+                            stored_by_table["hackernews_posts" if source_name.lower() == 'hackernews' else "news_articles"] += 1
                             
                     except Exception as e:
                         self.logger.error(
@@ -1684,6 +1780,12 @@ class DataPipeline:
                         )
                         continue
             
+            # Keep the cached admin table statistics current without a rescan
+            from ..service.table_statistics_service import get_table_statistics_service
+            table_statistics = get_table_statistics_service()
+            for table_name, table_count in stored_by_table.items():
+                table_statistics.record_writes(table_name, table_count)
+            
             # Log success metrics
             self.logger.log_pipeline_operation(
                 "raw_data_storage_complete",
@@ -1789,6 +1891,18 @@ class DataPipeline:
             self._progress["items_analyzed"] = items_analyzed
         if items_stored is not None:
             self._progress["items_stored"] = items_stored
+        
+        self._publish_progress("progress")
+    
+    def _publish_progress(self, event_type: str) -> None:
+        """Push the current status and progress to admin UI subscribers."""
+        get_event_bus().publish("pipeline", event_type, {
+            "pipeline_id": self.current_result.pipeline_id if self.current_result else None,
+            "status": self.current_status.value,
+            "is_running": self.current_status == PipelineStatus.RUNNING,
+            "progress": dict(self._progress, stages_completed=list(self._progress.get("stages_completed", []))),
+            "error_message": self.current_result.error_message if self.current_result else None
+        })
     
     def _reset_progress(self) -> None:
         """Reset progress tracking for new pipeline run."""
@@ -1865,9 +1979,9 @@ class DataPipeline:
         """
         self.logger.info("Starting sentiment analysis with deduplication...")
         
-        # Initialize sentiment engine if not already done
+        # Wait for the background model warm-up (or load now if none was started)
         if not self.sentiment_engine.is_initialized:
-            await self.sentiment_engine.initialize()
+            await self.sentiment_engine.wait_until_ready()
         
         sentiment_results = []
         
@@ -1970,6 +2084,8 @@ class DataPipeline:
             Number of records stored
         """
         stored_count = 0
+        stored_labels: Dict[str, int] = {}
+        newest_created_at = None
         
         try:
             from ..data_access.database.connection import get_db_session
@@ -2045,6 +2161,8 @@ class DataPipeline:
                         # Store using repository with proper session management
                         await sentiment_repository.create(sentiment_data)
                         stored_count += 1
+                        stored_labels[sentiment_label] = stored_labels.get(sentiment_label, 0) + 1
+                        newest_created_at = sentiment_data['created_at']
                         
                         # ALSO update the corresponding news_articles or hackernews_posts record with sentiment
                         await self._update_raw_data_with_sentiment(
@@ -2061,6 +2179,15 @@ class DataPipeline:
             
             self.logger.info(f"Stored {stored_count} sentiment records")
             
+            # Keep the cached admin table statistics current without a rescan
+            from ..service.table_statistics_service import get_table_statistics_service
+            get_table_statistics_service().record_sentiment_writes(stored_labels, newest_created_at)
+            
+            # Watchlist analytics snapshots include the new rows from now on
+            if stored_count > 0:
+                from ..service.watchlist_analytics_service import get_watchlist_analytics_service
+                get_watchlist_analytics_service().invalidate()
+            
         except Exception as e:
             self.logger.error(f"Failed to store sentiment data: {str(e)}")
             raise
@@ -2220,6 +2347,13 @@ class DataPipeline:
         except Exception as e:
             self.logger.error(f"Error during sentiment engine shutdown: {e}")
         
+        # Close the collectors' shared HTTP clients
+        try:
+            from app.infrastructure.http_transport import get_http_transport
+            await get_http_transport().aclose()
+        except Exception as e:
+            self.logger.error(f"Error during HTTP transport shutdown: {e}")
+        
         # Reset state
         self.current_status = PipelineStatus.IDLE
         self.current_result = None
@@ -2264,6 +2398,7 @@ class DataPipeline:
                 include_newsapi=True,
                 include_gdelt=True,
                 include_yfinance=True,
+                incremental=True,
                 parallel_collectors=True
             )
             
@@ -2581,6 +2716,10 @@ class DataPipeline:
                     
                     await db.commit()
                     
+                    if sentiment_records > 0:
+                        from ..service.watchlist_analytics_service import get_watchlist_analytics_service
+                        get_watchlist_analytics_service().invalidate()
+                    
                     self.logger.info(
                         f"Processed {processed_count} items, created {sentiment_records} sentiment records"
                         + (f", discarded {discarded_count} low-confidence" if discarded_count > 0 else "")
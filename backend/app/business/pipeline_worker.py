@@ -0,0 +1,176 @@
+"""
+Pipeline Worker
+===============
+
+Runs pipeline jobs queued in the pipeline_jobs table, in a process of its
+own (scripts/run_pipeline_worker.py); see app/service/pipeline_job_queue.py
+for the API side.
+
+Each job is claimed atomically, so any number of workers can share the
+queue. On SQLite the shards of a run are claimed one after another: one
+file has one writer, and parallel shards would only queue on its lock.
+While a job runs, the worker writes its progress to the job row and reads
+back cancellation requests. Jobs of a worker that stopped
+heartbeating (killed, host lost, loop blocked) are requeued by the other
+workers, and failed after MAX_ATTEMPTS. A worker that comes back after its
+job was taken over notices on its next heartbeat, cancels its run and
+leaves the job's outcome to the new owner.
+"""
+
+import asyncio
+import json
+import os
+import socket
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+from app.data_access.database import get_db_session
+from app.data_access.repositories import PipelineJobRepository
+from app.infrastructure.config.settings import get_settings
+from app.infrastructure.log_system import get_logger
+from .pipeline import DataPipeline, PipelineConfig, PipelineStatus
+
+logger = get_logger()
+
+HEARTBEAT_SECONDS = 5.0
+STALE_AFTER = timedelta(minutes=10)  # Inference can hold the loop for a while; be patient
+REQUEUE_CHECK_SECONDS = 60.0
+MAX_ATTEMPTS = 2
+
+
+class PipelineWorker:
+    """Claims queued pipeline jobs and runs them one at a time."""
+
+    def __init__(self, worker_id: Optional[str] = None, poll_interval: float = 2.0):
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.poll_interval = poll_interval
+        self.jobs_run = 0
+        self._pipeline: Optional[DataPipeline] = None
+        self._stopping = asyncio.Event()
+        self.serialize_runs = "sqlite" in get_settings().database_url.lower()
+
+    @property
+    def pipeline(self) -> DataPipeline:
+        # Created on first use and reused, like the scheduler's pipeline
+        if self._pipeline is None:
+            self._pipeline = DataPipeline(auto_configure_collectors=True)
+        return self._pipeline
+
+    def stop(self) -> None:
+        """Stop after the current job (if any) finishes."""
+        self._stopping.set()
+
+    async def run(self, max_jobs: Optional[int] = None) -> None:
+        """
+        Process jobs until stopped.
+
+        Args:
+            max_jobs: Exit after this many jobs (None runs forever)
+        """
+        logger.info(f"Pipeline worker {self.worker_id} started")
+        next_requeue_check = 0.0
+        loop = asyncio.get_running_loop()
+        try:
+            while not self._stopping.is_set():
+                if loop.time() >= next_requeue_check:
+                    next_requeue_check = loop.time() + REQUEUE_CHECK_SECONDS
+                    await self._requeue_stale()
+
+                job = await self._claim()
+                if job is None:
+                    try:
+                        await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                await self._execute(job.id, job.config)
+                self.jobs_run += 1
+                if max_jobs is not None and self.jobs_run >= max_jobs:
+                    break
+        finally:
+            if self._pipeline is not None:
+                await self._pipeline.shutdown()
+            logger.info(f"Pipeline worker {self.worker_id} stopped after {self.jobs_run} job(s)")
+
+    async def _claim(self):
+        try:
+            async with get_db_session() as session:
+                return await PipelineJobRepository(session).claim_next(self.worker_id, self.serialize_runs)
+        except Exception as e:
+            logger.warning(f"Failed to claim a pipeline job: {e}")
+            return None
+
+    async def _requeue_stale(self) -> None:
+        try:
+            async with get_db_session() as session:
+                recovered = await PipelineJobRepository(session).requeue_stale(STALE_AFTER, MAX_ATTEMPTS)
+            if recovered:
+                logger.warning(f"Recovered {recovered} pipeline job(s) abandoned by other workers")
+        except Exception as e:
+            logger.warning(f"Stale pipeline job check failed: {e}")
+
+    async def _execute(self, job_id: str, config_data: Dict[str, Any]) -> None:
+        logger.info(f"Running pipeline job {job_id}")
+        pipeline = self.pipeline
+        try:
+            config = PipelineConfig.from_dict(config_data)
+        except Exception as e:
+            await self._finish(job_id, "failed", error=f"Invalid job config: {e}")
+            return
+
+        task = asyncio.create_task(pipeline.run_pipeline(config))
+        while not task.done():
+            await asyncio.wait({task}, timeout=HEARTBEAT_SECONDS)
+            if task.done():
+                break
+            state = await self._heartbeat(job_id, pipeline.get_status()["progress"])
+            if state == "lost":
+                logger.warning(f"Pipeline job {job_id} was taken over by another worker, abandoning it")
+                pipeline.cancel_pipeline()
+                await asyncio.gather(task, return_exceptions=True)
+                return
+            if state == "cancel_requested":
+                pipeline.cancel_pipeline()
+
+        try:
+            result = task.result()
+        except Exception as e:
+            logger.error(f"Pipeline job {job_id} crashed: {e}")
+            await self._finish(job_id, "failed", error=str(e) or type(e).__name__)
+            return
+
+        status = result.status
+        if status not in (PipelineStatus.COMPLETED, PipelineStatus.FAILED, PipelineStatus.CANCELLED):
+            status = PipelineStatus.FAILED
+        await self._finish(
+            job_id, status.value,
+            result=json.loads(json.dumps(result.to_dict(), default=str)),
+            error=result.error_message,
+            progress=json.loads(json.dumps(pipeline.get_status()["progress"], default=str))
+        )
+        logger.info(f"Pipeline job {job_id} finished: {status.value}")
+
+    async def _heartbeat(self, job_id: str, progress: Dict[str, Any]) -> str:
+        """Report progress; returns "running", "cancel_requested" or "lost"."""
+        try:
+            async with get_db_session() as session:
+                return await PipelineJobRepository(session).heartbeat(
+                    job_id, self.worker_id, json.loads(json.dumps(progress, default=str))
+                )
+        except Exception as e:
+            logger.warning(f"Heartbeat of pipeline job {job_id} failed: {e}")
+            return "running"
+
+    async def _finish(self, job_id: str, status: str, **fields) -> None:
+        # The outcome must not be lost to a transient lock error
+        for attempt in range(3):
+            try:
+                async with get_db_session() as session:
+                    owned = await PipelineJobRepository(session).finish(job_id, self.worker_id, status, **fields)
+                if not owned:
+                    logger.warning(f"Pipeline job {job_id} is no longer ours, outcome not recorded")
+                return
+            except Exception as e:
+                logger.warning(f"Failed to record the outcome of pipeline job {job_id}: {e}")
+                await asyncio.sleep(2 ** attempt)
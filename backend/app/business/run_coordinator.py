@@ -0,0 +1,235 @@
+"""
+Pipeline Run Coordinator
+========================
+
+Serializes pipeline runs on the leader and coalesces overlapping requests.
+
+Scheduled jobs, the admin's manual collection and the system trigger can
+all ask for a run at the same moment. Before, each started its own run:
+several pipelines collected the same symbols side by side, spent API quota
+twice and fought over the SQLite write lock. Now every request goes through
+submit():
+
+- nothing running: the request starts a run
+- a run is in flight and already covers the request (same or wider symbols,
+  sources and lookback): the caller joins it
+- otherwise the request is merged into the one follow-up run queued behind
+  the in-flight run: symbols are unioned, sources widened and the longest
+  lookback kept
+
+Every caller gets the handle of the run that serves it, so callers of the
+same run share one id and one result. At most one run executes at a time.
+"""
+
+import asyncio
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from app.infrastructure.log_system import get_logger
+from app.utils.timezone import ensure_utc, utc_now
+from .pipeline import DateRange, PipelineConfig, PipelineResult
+
+logger = get_logger()
+
+SOURCE_FLAGS = ("include_hackernews", "include_finnhub", "include_newsapi", "include_gdelt", "include_yfinance")
+RECENT_RUNS = 20
+
+Executor = Callable[[PipelineConfig], Awaitable[PipelineResult]]
+
+
+def _copy(config: PipelineConfig) -> PipelineConfig:
+    # The pipeline fills in empty symbols in place; keep the requested config intact
+    return PipelineConfig.from_dict(config.to_dict())
+
+
+def covers(running: PipelineConfig, request: PipelineConfig) -> bool:
+    """Whether a run with config `running` collects everything `request` asks for."""
+    if running.symbols:
+        # Empty symbols mean the whole watchlist, which only an empty list covers
+        if not request.symbols or not set(request.symbols) <= set(running.symbols):
+            return False
+    if any(getattr(request, flag) and not getattr(running, flag) for flag in SOURCE_FLAGS):
+        return False
+    if request.include_comments and not running.include_comments:
+        return False
+    if running.incremental and not request.incremental:
+        return False
+    return (
+        ensure_utc(running.date_range.start_date) <= ensure_utc(request.date_range.start_date)
+        and running.max_items_per_symbol >= request.max_items_per_symbol
+    )
+
+
+def merge(base: PipelineConfig, request: PipelineConfig) -> PipelineConfig:
+    """One config collecting everything both configs ask for."""
+    merged = _copy(base)
+    if base.symbols and request.symbols:
+        merged.symbols = list(dict.fromkeys(base.symbols + request.symbols))
+    else:
+        merged.symbols = []
+    for flag in SOURCE_FLAGS:
+        setattr(merged, flag, getattr(base, flag) or getattr(request, flag))
+    merged.include_comments = base.include_comments or request.include_comments
+    merged.incremental = base.incremental and request.incremental
+    merged.max_items_per_symbol = max(base.max_items_per_symbol, request.max_items_per_symbol)
+    merged.date_range = DateRange(
+        start_date=min(base.date_range.start_date, request.date_range.start_date, key=ensure_utc),
+        end_date=max(base.date_range.end_date, request.date_range.end_date, key=ensure_utc)
+    )
+    return merged
+
+
+@dataclass
+class PipelineRunHandle:
+    """A run shared by every request it serves."""
+    run_id: str
+    config: PipelineConfig
+    executor: Executor
+    requesters: List[str] = field(default_factory=list)
+    state: str = "queued"  # queued, running, finished
+    submitted_at: str = field(default_factory=lambda: utc_now().isoformat())
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    _future: Optional[asyncio.Future] = field(default=None, repr=False)
+
+    def __post_init__(self):
+        self._future = asyncio.get_running_loop().create_future()
+
+    async def wait(self) -> PipelineResult:
+        """Result of the run (raises what the run raised)."""
+        # Shielded: one waiter giving up must not cancel the run for the others
+        return await asyncio.shield(self._future)
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = None
+        if self._future.done() and not self._future.cancelled() and self._future.exception() is None:
+            result = self._future.result()
+        return {
+            "run_id": self.run_id,
+            "state": self.state,
+            "requesters": list(self.requesters),
+            "symbols": list(self.config.symbols),
+            "sources": [flag.replace("include_", "") for flag in SOURCE_FLAGS if getattr(self.config, flag)],
+            "start_date": self.config.date_range.start_date.isoformat(),
+            "end_date": self.config.date_range.end_date.isoformat(),
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "status": result.status.value if result else None,
+        }
+
+
+class PipelineRunCoordinator:
+    """One run at a time; overlapping requests join or merge."""
+
+    def __init__(self):
+        self._current: Optional[PipelineRunHandle] = None
+        self._next: Optional[PipelineRunHandle] = None
+        self._task: Optional[asyncio.Task] = None
+        self._recent: Deque[PipelineRunHandle] = deque(maxlen=RECENT_RUNS)
+        self._joined = 0
+        self._merged = 0
+
+    def submit(self, config: PipelineConfig, executor: Executor, requester: str = "manual") -> PipelineRunHandle:
+        """
+        Request a run.
+
+        Args:
+            config: What to collect
+            executor: Runs a config to completion (used if this request
+                starts a run)
+            requester: Who asked, recorded on the handle
+
+        Returns:
+            Handle of the run that will serve the request
+        """
+        current, queued = self._current, self._next
+        if current is not None and covers(current.config, config):
+            current.requesters.append(requester)
+            self._joined += 1
+            logger.info(f"Pipeline request from {requester} joined in-flight run {current.run_id}")
+            return current
+
+        if current is not None:
+            if queued is None:
+                self._next = PipelineRunHandle(str(uuid.uuid4()), _copy(config), executor, [requester])
+                logger.info(f"Pipeline request from {requester} queued behind run {current.run_id}")
+            else:
+                if not covers(queued.config, config):
+                    queued.config = merge(queued.config, config)
+                queued.requesters.append(requester)
+                self._merged += 1
+                logger.info(f"Pipeline request from {requester} merged into queued run {queued.run_id}")
+            return self._next
+
+        self._current = PipelineRunHandle(str(uuid.uuid4()), _copy(config), executor, [requester])
+        self._task = asyncio.create_task(self._drive())
+        return self._current
+
+    async def _drive(self) -> None:
+        while self._current is not None:
+            handle = self._current
+            handle.state = "running"
+            handle.started_at = utc_now().isoformat()
+            logger.info(
+                f"Starting pipeline run {handle.run_id}",
+                requesters=handle.requesters,
+                symbol_count=len(handle.config.symbols)
+            )
+            try:
+                result = await handle.executor(_copy(handle.config))
+            except asyncio.CancelledError:
+                # Shutdown: the queued run is dropped with the in-flight one
+                handle._future.cancel()
+                self._abandon_queued()
+                raise
+            except Exception as e:
+                handle._future.set_exception(e)
+                # Nobody may be waiting on a fire-and-forget request
+                handle._future.exception()
+                logger.error(f"Pipeline run {handle.run_id} failed: {e}")
+            else:
+                handle._future.set_result(result)
+                logger.info(f"Pipeline run {handle.run_id} finished: {result.status.value}")
+            finally:
+                handle.state = "finished"
+                handle.finished_at = utc_now().isoformat()
+                self._recent.append(handle)
+                self._current, self._next = self._next, None
+        self._task = None
+
+    def _abandon_queued(self) -> None:
+        if self._next is not None:
+            self._next._future.cancel()
+            self._next.state = "finished"
+            self._next = None
+
+    async def stop(self) -> None:
+        """Cancel the in-flight run and drop the queued one."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    def get(self, run_id: str) -> Optional[PipelineRunHandle]:
+        for handle in (self._current, self._next, *self._recent):
+            if handle is not None and handle.run_id == run_id:
+                return handle
+        return None
+
+    @property
+    def is_running(self) -> bool:
+        return self._current is not None
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "current": self._current.to_dict() if self._current else None,
+            "queued": self._next.to_dict() if self._next else None,
+            "joined_requests": self._joined,
+            "merged_requests": self._merged,
+            "recent": [handle.to_dict() for handle in reversed(self._recent)],
+        }
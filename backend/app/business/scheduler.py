@@ -19,9 +19,11 @@ the sentiment analysis workflow according to configured schedules.
 """
 
 import asyncio
+import itertools
 import json
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -29,10 +31,11 @@ import uuid
 import pytz
 import logging
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from ..utils.timezone import utc_now, to_naive_utc
+from ..utils.timezone import ensure_utc, utc_now, to_naive_utc
 from apscheduler.triggers.cron import CronTrigger
 
 from app.infrastructure.log_system import get_logger
+from app.infrastructure.event_bus import get_event_bus
 from app.business.pipeline import DataPipeline
 from app.service.watchlist_service import get_current_stock_symbols
 from app.service.price_service import price_service
@@ -92,36 +95,49 @@ class ScheduledJob:
     last_duration_seconds: Optional[float] = None
 
 
-_recent_job_events: List[Dict[str, Any]] = []
 MAX_JOB_EVENTS = 50
+# Newest first: (timestamp, event)
+_recent_job_events: Deque[Tuple[datetime, Dict[str, Any]]] = deque(maxlen=MAX_JOB_EVENTS)
 
 
 def add_job_event(event_type: str, job_name: str, details: Optional[Dict] = None):
-    """Add a job event for frontend notification."""
-    global _recent_job_events
+    """Add a job event for frontend notification (also pushed on the event bus)."""
+    timestamp = utc_now()
     event = {
         "type": event_type,  # "started", "completed", "failed"
         "job_name": job_name,
-        "timestamp": utc_now().isoformat(),
+        "timestamp": timestamp.isoformat(),
         "details": details or {}
     }
-    _recent_job_events.insert(0, event)
-    # Keep only recent events
-    if len(_recent_job_events) > MAX_JOB_EVENTS:
-        _recent_job_events = _recent_job_events[:MAX_JOB_EVENTS]
+    published = get_event_bus().publish("jobs", event_type, event)
+    event["seq"] = published.seq
+    _recent_job_events.appendleft((timestamp, event))
+
+
+def add_relayed_job_event(event: Dict[str, Any]) -> None:
+    """Record a job event published by the leader worker (multi-worker mode)."""
+    try:
+        timestamp = ensure_utc(datetime.fromisoformat(event["timestamp"].replace('Z', '+00:00')))
+    except (KeyError, ValueError):
+        timestamp = utc_now()
+    _recent_job_events.appendleft((timestamp, event))
 
 
 def get_recent_job_events(since_timestamp: Optional[str] = None) -> List[Dict[str, Any]]:
     """Get recent job events, optionally filtered by timestamp."""
     if not since_timestamp:
-        return _recent_job_events[:10]
+        return [event for _, event in itertools.islice(_recent_job_events, 10)]
     
-    # Filter events newer than the given timestamp
+    # Filter events newer than the given timestamp (events are newest first)
     try:
-        since_dt = datetime.fromisoformat(since_timestamp.replace('Z', '+00:00'))
-        return [e for e in _recent_job_events if datetime.fromisoformat(e["timestamp"].replace('Z', '+00:00')) > since_dt]
-    except:
-        return _recent_job_events[:10]
+        since_dt = ensure_utc(datetime.fromisoformat(since_timestamp.replace('Z', '+00:00')))
+    except ValueError:
+        return [event for _, event in itertools.islice(_recent_job_events, 10)]
+    return [
+        event for _, event in itertools.takewhile(
+            lambda entry: entry[0] > since_dt, _recent_job_events
+        )
+    ]
 
 
 class Scheduler:
@@ -788,18 +804,20 @@ class Scheduler:
                 symbols=symbols,
                 date_range=DateRange(start_date=start_date, end_date=end_date),
                 max_items_per_symbol=20,
+                incremental=True,  # Only fetch what is newer than the last stored items
                 **sources  # Pass source configuration
             )
             
-            result = await self.pipeline.run_pipeline(config)
+            # Runs here or in a pipeline worker; joins or queues behind an overlapping run
+            from .worker_coordinator import get_worker_coordinator
+            result = await get_worker_coordinator().run_pipeline(self.pipeline, config, source="scheduled")
             
             # Calculate duration
             end_time = utc_now()
             duration_seconds = (end_time - start_time).total_seconds()
             job.last_duration_seconds = duration_seconds
             
-            # Record quota usage for quota-limited sources
-            await self._record_quota_usage(sources, len(symbols))
+            # Quota usage is recorded by the pipeline as each source is collected
             
             if result.status.value == "completed":
                 job.status = JobStatus.COMPLETED
@@ -874,19 +892,6 @@ class Scheduler:
             # Persist state to disk (even on exception)
             self._save_job_state()
     
-    async def _record_quota_usage(self, sources: Dict[str, bool], num_symbols: int):
-        """Record quota usage after a successful run."""
-        try:
-            from app.service.quota_tracking_service import get_quota_tracking_service
-            quota_service = get_quota_tracking_service()
-            
-            # Record NewsAPI usage
-            if sources.get("include_newsapi", False):
-                quota_service.record_usage("newsapi", num_symbols)
-                
-        except Exception as e:
-            self.logger.warning(f"Failed to record quota usage: {e}")
-    
     def cancel_job(self, job_id: str) -> bool:
         """Cancel a scheduled job"""
         job = self.jobs.get(job_id)
@@ -939,6 +944,36 @@ class Scheduler:
 
         return jobs_list
     
+    @staticmethod
+    def job_to_dict(job: ScheduledJob) -> Dict[str, Any]:
+        """Serializable view of a job for the admin API."""
+        return {
+            "job_id": job.job_id,
+            "name": job.name,
+            "job_type": job.job_type,
+            "trigger_config": job.trigger_config,
+            "parameters": job.parameters,
+            "status": job.status.value,
+            "created_at": job.created_at.isoformat(),
+            "last_run": job.last_run.isoformat() if job.last_run else None,
+            "next_run": job.next_run.isoformat() if job.next_run else None,
+            "run_count": job.run_count,
+            "error_count": job.error_count,
+            "last_error": job.last_error,
+            "enabled": job.enabled,
+            "today_run_count": job.today_run_count,
+            "last_duration_seconds": job.last_duration_seconds
+        }
+    
+    def get_jobs_snapshot(self) -> Dict[str, Any]:
+        """All jobs and the scheduler state, serializable."""
+        jobs_data = [self.job_to_dict(job) for job in self.list_jobs()]
+        return {
+            "jobs": jobs_data,
+            "total_jobs": len(jobs_data),
+            "scheduler_running": self._is_running
+        }
+    
     def enable_job(self, job_id: str) -> bool:
         """Enable a job"""
         job = self.jobs.get(job_id)
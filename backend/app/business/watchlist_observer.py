@@ -3,6 +3,15 @@ Watchlist Observer Pattern Implementation
 
 Observer pattern for real-time dashboard updates when watchlist changes occur.
 Provides observer interfaces, concrete implementations, and event notification system.
+
+The caches derived from the watchlist (table statistics, watchlist
+analytics) are invalidated as soon as an event is published, so the next
+read never sees the old watchlist. Observers are not called event by event:
+the process-wide dispatcher collects the events of a short debounce window
+into one net diff and delivers that once, so importing 100 symbols refreshes
+the scheduler once instead of 100 times. Observers run in parallel, each
+bounded by a timeout, and one failing or slow observer does not hold up the
+others.
 """
 
 from abc import ABC, abstractmethod
@@ -10,11 +19,17 @@ from typing import List, Dict, Any, Optional, Set
 from datetime import datetime
 from enum import Enum
 import asyncio
+import time
 
 from app.infrastructure.log_system import get_logger
 
 logger = get_logger()
 
+DEBOUNCE_SECONDS = 0.5  # Quiet time that ends a burst of edits
+MAX_DEBOUNCE_SECONDS = 5.0  # A steady stream of edits still dispatches this often
+OBSERVER_TIMEOUT_SECONDS = 10.0  # Default; an observer may set its own `timeout`
+SCHEDULER_REFRESH_TIMEOUT_SECONDS = 30.0  # Round trip to the leader worker
+
 
 class WatchlistEventType(Enum):
     """Types of watchlist events that can occur"""
@@ -101,39 +116,198 @@ class WatchlistSubject(ABC):
         """
         Notify all observers of a watchlist change
         
+        Watchlist-derived caches are invalidated right away. The event is
+        queued with the dispatcher and delivered, merged with the other
+        events of its debounce window, shortly after; this returns without
+        waiting for the observers.
+        
         Args:
             event: The watchlist change event
         """
         self._logger.info(
-            "Notifying watchlist observers",
+            "Queueing watchlist event for observers",
             event_type=event.event_type.value,
             observer_count=len(self._observers),
             stocks_affected=event.stocks_affected
         )
+        from app.service.table_statistics_service import get_table_statistics_service
+        from app.service.watchlist_analytics_service import get_watchlist_analytics_service
+        get_table_statistics_service().invalidate()
+        get_watchlist_analytics_service().invalidate()
+        watchlist_dispatcher.publish(event, list(self._observers))
+
+
+class WatchlistEventDispatcher:
+    """
+    Debounces watchlist events into one diff and delivers it to observers
+    
+    Consecutive events are merged into a net diff (a symbol added and then
+    removed again cancels out). When no event arrived for DEBOUNCE_SECONDS,
+    or MAX_DEBOUNCE_SECONDS after the first one, the diff is delivered as a
+    single event: STOCK_ADDED or STOCK_REMOVED when it has one kind of
+    change, otherwise WATCHLIST_UPDATED with the details in its metadata.
+    """
+    
+    def __init__(self):
+        self._logger = get_logger()
+        self._observers: Dict[str, WatchlistObserver] = {}
+        self._events: List[WatchlistEvent] = []
+        self._added: Dict[str, None] = {}  # Ordered sets
+        self._removed: Dict[str, None] = {}
+        self._updated: Dict[str, None] = {}
+        self._cleared = False
+        self._first_at = 0.0
+        self._deadline = 0.0
+        self._flush_task: Optional[asyncio.Task] = None
+        self._events_received = 0
+        self._dispatches = 0
+        self._observer_stats: Dict[str, Dict[str, Any]] = {}
+    
+    def publish(self, event: WatchlistEvent, observers: List[WatchlistObserver]) -> None:
+        """Add an event to the current window (delivered by a background flush)."""
+        now = time.monotonic()
+        if not self._events:
+            self._first_at = now
+        self._events.append(event)
+        self._events_received += 1
+        for observer in observers:
+            self._observers[observer.observer_id] = observer
         
-        tasks = []
-        for observer in self._observers:
-            try:
-                task = asyncio.create_task(observer.update(event))
-                tasks.append(task)
-            except Exception as e:
-                self._logger.error(
-                    "Error creating notification task",
-                    observer_id=observer.observer_id,
-                    error=str(e)
-                )
+        symbols = event.stocks_affected
+        if event.event_type == WatchlistEventType.STOCK_ADDED:
+            for symbol in symbols:
+                if symbol in self._removed:
+                    del self._removed[symbol]  # Removed and re-added: no net change
+                else:
+                    self._added[symbol] = None
+        elif event.event_type == WatchlistEventType.STOCK_REMOVED:
+            for symbol in symbols:
+                if symbol in self._added:
+                    del self._added[symbol]
+                else:
+                    self._removed[symbol] = None
+        elif event.event_type == WatchlistEventType.WATCHLIST_CLEARED:
+            self._added.clear()
+            self._removed.clear()
+            self._updated.clear()
+            self._cleared = True
+        else:
+            self._updated.update(dict.fromkeys(symbols))
         
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    observer = list(self._observers)[i]
-                    self._logger.error(
-                        "Observer notification failed",
-                        observer_id=observer.observer_id,
-                        error=str(result)
-                    )
+        self._deadline = min(now + DEBOUNCE_SECONDS, self._first_at + MAX_DEBOUNCE_SECONDS)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_when_quiet())
+    
+    async def _flush_when_quiet(self) -> None:
+        # Events published while a dispatch is running start the next window;
+        # publish() sees this task still running, so it delivers them too
+        while self._events:
+            delay = self._deadline - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            await self.flush()
+    
+    async def flush(self) -> None:
+        """Deliver the pending diff now."""
+        if not self._events:
+            return
+        events, added, removed, updated, cleared = (
+            self._events, list(self._added), list(self._removed), list(self._updated), self._cleared
+        )
+        observers = list(self._observers.values())
+        self._events, self._added, self._removed, self._updated, self._cleared = [], {}, {}, {}, False
+        self._observers = {}
+        
+        event = self._merge(events, added, removed, updated, cleared)
+        if event is None:
+            self._logger.info("Watchlist edits cancelled out, nothing to dispatch", events=len(events))
+            return
+        
+        self._dispatches += 1
+        self._logger.info(
+            "Dispatching watchlist changes",
+            event_type=event.event_type.value,
+            events_coalesced=len(events),
+            stocks_affected=len(event.stocks_affected),
+            observer_count=len(observers)
+        )
+        await asyncio.gather(*(self._deliver(observer, event) for observer in observers))
+    
+    @staticmethod
+    def _merge(
+        events: List[WatchlistEvent],
+        added: List[str],
+        removed: List[str],
+        updated: List[str],
+        cleared: bool
+    ) -> Optional[WatchlistEvent]:
+        if len(events) == 1:
+            return events[0]
+        
+        changes = [kind for kind, symbols in (("added", added), ("removed", removed), ("updated", updated)) if symbols]
+        metadata = dict(events[-1].metadata, coalesced_events=len(events))
+        if cleared and not changes:
+            return WatchlistEvent(WatchlistEventType.WATCHLIST_CLEARED, [], metadata)
+        if not changes and not any(e.event_type == WatchlistEventType.WATCHLIST_UPDATED for e in events):
+            return None
+        if changes == ["added"] and not cleared:
+            return WatchlistEvent(WatchlistEventType.STOCK_ADDED, added, metadata)
+        if changes == ["removed"] and not cleared:
+            return WatchlistEvent(WatchlistEventType.STOCK_REMOVED, removed, metadata)
+        
+        metadata.update(added=added, removed=removed, updated=updated, cleared=cleared)
+        return WatchlistEvent(
+            WatchlistEventType.WATCHLIST_UPDATED,
+            list(dict.fromkeys(added + removed + updated)),
+            metadata
+        )
+    
+    async def _deliver(self, observer: WatchlistObserver, event: WatchlistEvent) -> None:
+        """Run one observer under its timeout; never raises."""
+        timeout = getattr(observer, "timeout", OBSERVER_TIMEOUT_SECONDS)
+        outcome = "ok"
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(observer.update(event), timeout=timeout)
+        except asyncio.TimeoutError:
+            outcome = "timeout"
+            self._logger.error("Observer timed out", observer_id=observer.observer_id, timeout_seconds=timeout)
+        except Exception as e:
+            outcome = "failed"
+            self._logger.error("Observer notification failed", observer_id=observer.observer_id, error=str(e))
+        finally:
+            self._record(observer.observer_id, (time.perf_counter() - start) * 1000, outcome)
+    
+    def _record(self, observer_id: str, elapsed_ms: float, outcome: str) -> None:
+        stats = self._observer_stats.setdefault(observer_id, {
+            "calls": 0, "failures": 0, "timeouts": 0, "total_ms": 0.0, "max_ms": 0.0, "last_ms": 0.0
+        })
+        stats["calls"] += 1
+        stats["failures"] += outcome == "failed"
+        stats["timeouts"] += outcome == "timeout"
+        stats["total_ms"] += elapsed_ms
+        stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+        stats["last_ms"] = elapsed_ms
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Event, dispatch and per-observer latency counters."""
+        return {
+            "events_received": self._events_received,
+            "dispatches": self._dispatches,
+            "pending_events": len(self._events),
+            "observers": {
+                observer_id: {
+                    "calls": stats["calls"],
+                    "failures": stats["failures"],
+                    "timeouts": stats["timeouts"],
+                    "avg_ms": round(stats["total_ms"] / stats["calls"], 2),
+                    "max_ms": round(stats["max_ms"], 2),
+                    "last_ms": round(stats["last_ms"], 2),
+                }
+                for observer_id, stats in self._observer_stats.items()
+            },
+        }
 
 
 class DashboardObserver(WatchlistObserver):
@@ -238,6 +412,9 @@ class AnalyticsObserver(WatchlistObserver):
 class DataCollectionObserver(WatchlistObserver):
     """Observer for data collection pipeline updates"""
     
+    # Outlasts the leader round trip, so a missing leader is reported as such
+    timeout = SCHEDULER_REFRESH_TIMEOUT_SECONDS + 5.0
+    
     def __init__(self):
         self._observer_id = "data_collection_observer"
         self._logger = get_logger()
@@ -289,20 +466,18 @@ class DataCollectionObserver(WatchlistObserver):
         await self._refresh_data_collection_scheduler()
     
     async def _refresh_data_collection_scheduler(self) -> None:
-        """Refresh the data collection scheduler with updated watchlist"""
-        try:
-            # Import here to avoid circular imports
-            from app.business.scheduler import Scheduler
-            
-            scheduler = Scheduler()
-            if scheduler._is_running:
-                await scheduler.refresh_scheduled_jobs()
-                self._logger.info("Successfully refreshed data collection scheduler")
-            else:
-                self._logger.warning("Scheduler is not running, cannot refresh jobs")
-                
-        except Exception as e:
-            self._logger.error("Failed to refresh data collection scheduler", error=str(e))
+        """Refresh the data collection scheduler with updated watchlist (errors propagate)"""
+        # Import here to avoid circular imports
+        from app.business.worker_coordinator import get_worker_coordinator
+        
+        # The scheduler may run in the leader worker rather than here
+        result = await get_worker_coordinator().call_leader(
+            "scheduler.refresh", timeout=SCHEDULER_REFRESH_TIMEOUT_SECONDS
+        )
+        if result["refreshed"]:
+            self._logger.info("Successfully refreshed data collection scheduler")
+        else:
+            self._logger.warning("Scheduler is not running, cannot refresh jobs")
 
 
 class WatchlistObserverManager:
@@ -358,5 +533,6 @@ class WatchlistObserverManager:
             self._logger.info("Unregistered observer", observer_id=observer_id)
 
 
+watchlist_dispatcher = WatchlistEventDispatcher()
 observer_manager = WatchlistObserverManager()
 observer_manager.register_default_observers()
\ No newline at end of file
@@ -0,0 +1,456 @@
+"""
+Worker Coordinator
+==================
+
+Decides which process runs the scheduler, the real-time price service and
+the pipeline (settings.deployment_mode):
+
+- single: this process runs everything (the default)
+- multi_worker: uvicorn runs several API workers for request throughput.
+  They elect one leader through a lock file, and only the leader runs the
+  scheduler, price service and pipelines. Followers serve API requests:
+  they read the leader's state from the shared state store and hand
+  leader-only actions to it as commands. The leader's pipeline/job events
+  go through the shared store too, and every worker (the leader included)
+  streams them to its SSE clients with the store's sequence numbers, so
+  an EventSource can resume with Last-Event-ID on any worker. When the leader exits, a follower takes over
+  within LEADER_RETRY_SECONDS.
+
+API code does not branch on the mode: it calls call_leader(), leader_state()
+and run_pipeline(), which act locally on the leader and go through the
+shared store on a follower.
+
+Independently of the mode, settings.pipeline_execution = "worker" makes the
+leader queue its pipeline runs for separate worker processes
+(app/service/pipeline_job_queue.py) instead of running them itself.
+
+Either way, pipeline requests reach the leader's PipelineRunCoordinator,
+which runs one pipeline at a time and coalesces overlapping requests.
+"""
+
+import asyncio
+import os
+import socket
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from app.infrastructure.event_bus import EventBus, ResyncRequired, get_event_bus
+from app.infrastructure.leader_election import FileLeaderLock
+from app.infrastructure.log_system import get_logger
+from app.infrastructure.shared_state import get_shared_state
+from app.utils.timezone import utc_now
+from .pipeline import DataPipeline, PipelineConfig, PipelineResult, PipelineStatus
+from .run_coordinator import PipelineRunCoordinator
+
+logger = get_logger()
+
+LEADER_RETRY_SECONDS = 5.0
+POLL_SECONDS = 0.5  # Command/event flush, event relay
+SNAPSHOT_SECONDS = 2.0
+COMMAND_TIMEOUT_SECONDS = 30.0
+PIPELINE_RUN_TIMEOUT_SECONDS = 4 * 3600
+MIRRORED_TOPICS = ["pipeline", "jobs"]
+RELAY_BACKLOG = 100  # Events a starting worker replays from the shared store
+
+
+class LeaderUnavailable(Exception):
+    """No leader answered a command in time."""
+
+
+class WorkerCoordinator:
+    """Leader election and leader/follower plumbing for the API process."""
+
+    def __init__(self, mode: str = "single", lock_path: str = "./data/leader.lock",
+                 pipeline_execution: str = "in_process"):
+        self.mode = mode.lower()
+        self.pipeline_execution = pipeline_execution.lower()
+        self._lock = FileLeaderLock(lock_path) if self.multi_worker else None
+        self._is_leader = False
+        self._leader_since: Optional[str] = None
+        self._tasks: List[asyncio.Task] = []
+        self._command_tasks: Set[asyncio.Task] = set()
+        self._outbox: List[Dict[str, Any]] = []
+        self._stream_bus = EventBus() if self.multi_worker else None
+        self._active_pipelines: Set[DataPipeline] = set()
+        self.runs = PipelineRunCoordinator()
+
+        self._handlers: Dict[str, Callable[..., Awaitable[Any]]] = {
+            "pipeline.run": self._handle_pipeline_run,
+            "pipeline.submit": self._handle_pipeline_submit,
+            "pipeline.cancel": self._handle_pipeline_cancel,
+            "scheduler.job_action": self._handle_job_action,
+            "scheduler.refresh": self._handle_scheduler_refresh,
+            "price_service.start": self._handle_price_service_start,
+            "price_service.stop": self._handle_price_service_stop,
+        }
+        self._state_providers: Dict[str, Callable[[], Any]] = {
+            "scheduler": self._scheduler_state,
+            "price_service": self._price_service_state,
+            "pipeline_runs": self._pipeline_runs_state,
+        }
+
+    @property
+    def multi_worker(self) -> bool:
+        return self.mode == "multi_worker"
+
+    @property
+    def is_leader(self) -> bool:
+        # A single-process deployment is always its own leader, started or not
+        return self._is_leader or not self.multi_worker
+
+    @property
+    def pipeline_workers(self) -> bool:
+        """Pipelines run in separate worker processes, fed through the job queue."""
+        return self.pipeline_execution == "worker"
+
+    @property
+    def runs_pipelines_locally(self) -> bool:
+        """This process executes pipelines, so their live status is its own."""
+        return self.is_leader and not self.pipeline_workers
+
+    @property
+    def event_stream(self) -> EventBus:
+        """
+        Events for SSE clients.
+
+        In multi_worker mode these are relayed from the shared store on
+        every worker, numbered by the store; otherwise the local bus.
+        """
+        return self._stream_bus if self.multi_worker else get_event_bus()
+
+    # Lifecycle
+
+    async def start(self) -> None:
+        if self.multi_worker:
+            self._spawn(self._relay_events())
+        if not self.multi_worker or self._lock.try_acquire():
+            await self._become_leader()
+        else:
+            holder = self._lock.holder() or {}
+            logger.info(f"Running as follower worker; leader is pid {holder.get('pid')}")
+            self._spawn(self._follow())
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+        if self._is_leader:
+            from .scheduler import Scheduler
+            await Scheduler().stop()
+            await self.runs.stop()
+            if self.multi_worker:
+                await self._flush_outbox()
+            self._is_leader = False
+        if self._lock is not None:
+            self._lock.release()
+
+    async def _become_leader(self) -> None:
+        from .scheduler import Scheduler
+        self._is_leader = True
+        self._leader_since = utc_now().isoformat()
+        if self.multi_worker:
+            abandoned = await get_shared_state().abandon_running()
+            if abandoned:
+                logger.warning(f"Failed {abandoned} commands left unfinished by the previous leader")
+            # Mirror events before the scheduler starts emitting them
+            self._spawn(self._mirror_events())
+            self._spawn(self._lead())
+            logger.info(f"Elected leader worker (pid {os.getpid()})")
+        await Scheduler().start()
+
+    def _spawn(self, coro) -> None:
+        self._tasks.append(asyncio.create_task(coro))
+
+    # Leader side
+
+    async def _mirror_events(self) -> None:
+        """Queue the leader's pipeline/job events for the shared store."""
+        bus = get_event_bus()
+        while True:
+            try:
+                async for event in bus.subscribe(MIRRORED_TOPICS):
+                    self._outbox.append({
+                        "topic": event.topic,
+                        "type": event.type,
+                        "data": event.data,
+                        "timestamp": event.timestamp,
+                    })
+            except ResyncRequired:
+                continue
+
+    async def _flush_outbox(self) -> None:
+        if self._outbox:
+            events, self._outbox = self._outbox, []
+            await get_shared_state().append_events(events)
+
+    async def _lead(self) -> None:
+        store = get_shared_state()
+        next_snapshot = 0.0
+        while True:
+            try:
+                await self._flush_outbox()
+
+                for command_id, name, payload in await store.claim_commands():
+                    task = asyncio.create_task(self._execute(command_id, name, payload))
+                    self._command_tasks.add(task)
+                    task.add_done_callback(self._command_tasks.discard)
+
+                if time.monotonic() >= next_snapshot:
+                    next_snapshot = time.monotonic() + SNAPSHOT_SECONDS
+                    await store.put("leader", {
+                        "pid": os.getpid(),
+                        "host": socket.gethostname(),
+                        "since": self._leader_since,
+                        "heartbeat": utc_now().isoformat(),
+                    })
+                    for name, provider in self._state_providers.items():
+                        await store.put(name, provider())
+            except Exception as e:
+                logger.warning(f"Leader state sync failed: {e}")
+            await asyncio.sleep(POLL_SECONDS)
+
+    async def _execute(self, command_id: int, name: str, payload: Dict[str, Any]) -> None:
+        store = get_shared_state()
+        handler = self._handlers.get(name)
+        if handler is None:
+            await store.finish_command(command_id, error=f"Unknown command: {name}")
+            return
+        try:
+            result = await handler(**payload)
+        except Exception as e:
+            logger.error(f"Leader command {name} failed: {e}")
+            await store.finish_command(command_id, error=str(e) or type(e).__name__)
+        else:
+            await store.finish_command(command_id, result=result)
+
+    # Every worker (multi_worker mode)
+
+    async def _relay_events(self) -> None:
+        """Stream the shared store's events to this worker's SSE clients."""
+        store = get_shared_state()
+        after = None
+        while True:
+            try:
+                if after is None:
+                    after = max(0, await store.last_event_seq() - RELAY_BACKLOG)
+                for event in await store.events_after(after):
+                    after = event["seq"]
+                    self._relay(event)
+            except Exception as e:
+                logger.warning(f"Event relay failed: {e}")
+            await asyncio.sleep(POLL_SECONDS)
+
+    def _relay(self, event: Dict[str, Any]) -> None:
+        # The store's seq is the SSE id, identical on every worker
+        self._stream_bus.publish(
+            event["topic"], event["type"], event["data"], seq=event["seq"], timestamp=event["timestamp"]
+        )
+        if event["topic"] == "jobs" and not self._is_leader:
+            # The leader recorded its own job events when it published them
+            from .scheduler import add_relayed_job_event
+            add_relayed_job_event({**event["data"], "seq": event["seq"]})
+
+    # Follower side
+
+    async def _follow(self) -> None:
+        next_attempt = time.monotonic() + LEADER_RETRY_SECONDS
+        while True:
+            await asyncio.sleep(POLL_SECONDS)
+            if time.monotonic() < next_attempt:
+                continue
+            next_attempt = time.monotonic() + LEADER_RETRY_SECONDS
+            try:
+                if self._lock.try_acquire():
+                    logger.info("Previous leader is gone, taking over")
+                    await self._become_leader()
+                    return
+            except Exception as e:
+                logger.warning(f"Leader takeover failed: {e}")
+
+    # API used by routes and services
+
+    async def call_leader(self, name: str, timeout: Optional[float] = COMMAND_TIMEOUT_SECONDS, **payload) -> Any:
+        """
+        Run a leader-only action and return its result.
+
+        Args:
+            name: Command name (see _handlers)
+            timeout: Seconds to wait for a follower's command (None waits forever)
+            **payload: JSON-serializable command arguments
+
+        Raises:
+            LeaderUnavailable: No leader finished the command in time
+            RuntimeError: The command failed on the leader
+        """
+        if self.is_leader:
+            return await self._handlers[name](**payload)
+
+        store = get_shared_state()
+        command_id = await store.submit_command(name, payload)
+        deadline = time.monotonic() + timeout if timeout else None
+        while True:
+            await asyncio.sleep(POLL_SECONDS / 2)
+            command = await store.get_command(command_id)
+            if command and command["status"] == "done":
+                return command["result"]
+            if command and command["status"] == "failed":
+                raise RuntimeError(command["error"])
+            if deadline and time.monotonic() > deadline:
+                raise LeaderUnavailable(f"No leader finished '{name}' within {timeout:.0f}s")
+
+    async def leader_state(self, name: str) -> Optional[Any]:
+        """Leader-owned state ("scheduler", "price_service", "pipeline_runs"); the last snapshot on a follower."""
+        if self.is_leader:
+            return self._state_providers[name]()
+        value, _ = await get_shared_state().get(name)
+        return value
+
+    def pipeline_state(self) -> Optional[Dict[str, Any]]:
+        """Status and progress of the newest pipeline event seen by this process."""
+        recent = self.event_stream.recent("pipeline", 1)
+        return recent[0].data if recent else None
+
+    async def run_pipeline(self, pipeline: DataPipeline, config: PipelineConfig,
+                           source: str = "manual") -> PipelineResult:
+        """
+        Run a pipeline on the leader and wait for its result.
+
+        On the leader the request goes to the run coordinator, so it may be
+        served by a run that is already in flight or merged into the next
+        one; a follower sends the config to the leader and waits.
+        """
+        if self.is_leader:
+            return await self.runs.submit(config, self._pipeline_executor(pipeline, source), source).wait()
+
+        result = await self.call_leader(
+            "pipeline.run", timeout=PIPELINE_RUN_TIMEOUT_SECONDS, config=config.to_dict(), source=source
+        )
+        return PipelineResult.from_dict(result)
+
+    async def submit_pipeline(self, pipeline: DataPipeline, config: PipelineConfig,
+                              source: str = "manual") -> Dict[str, Any]:
+        """
+        Request a run on the leader without waiting for it.
+
+        Returns:
+            The serving run's handle (run_id, state, requesters, ...); requests
+            served by the same run get the same run_id
+        """
+        if self.is_leader:
+            return self.runs.submit(config, self._pipeline_executor(pipeline, source), source).to_dict()
+        return await self.call_leader("pipeline.submit", config=config.to_dict(), source=source)
+
+    def _pipeline_executor(self, pipeline: DataPipeline, source: str):
+        async def execute(config: PipelineConfig) -> PipelineResult:
+            if self.pipeline_workers:
+                from app.service.pipeline_job_queue import get_pipeline_job_queue
+                return await get_pipeline_job_queue().run(config, source=source, timeout=PIPELINE_RUN_TIMEOUT_SECONDS)
+
+            self._active_pipelines.add(pipeline)
+            try:
+                return await pipeline.run_pipeline(config)
+            finally:
+                self._active_pipelines.discard(pipeline)
+        return execute
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "deployment_mode": self.mode,
+            "is_leader": self.is_leader,
+            "pipeline_execution": self.pipeline_execution,
+            "pid": os.getpid(),
+            "leader_since": self._leader_since,
+            "leader": self._lock.holder() if self._lock else None,
+        }
+
+    # Command handlers (run on the leader)
+
+    async def _handle_pipeline_run(self, config: Dict[str, Any], source: str = "manual") -> Dict[str, Any]:
+        pipeline = DataPipeline(auto_configure_collectors=True)
+        result = await self.run_pipeline(pipeline, PipelineConfig.from_dict(config), source=source)
+        return result.to_dict()
+
+    async def _handle_pipeline_submit(self, config: Dict[str, Any], source: str = "manual") -> Dict[str, Any]:
+        pipeline = DataPipeline(auto_configure_collectors=True)
+        return await self.submit_pipeline(pipeline, PipelineConfig.from_dict(config), source=source)
+
+    async def _handle_pipeline_cancel(self) -> Dict[str, Any]:
+        from .scheduler import Scheduler
+        pipelines = set(self._active_pipelines)
+        if Scheduler._instance is not None:
+            pipelines.add(Scheduler().pipeline)
+        cancelled = 0
+        for pipeline in pipelines:
+            if pipeline.current_status == PipelineStatus.RUNNING:
+                pipeline.cancel_pipeline()
+                cancelled += 1
+        if self.pipeline_workers:
+            from app.service.pipeline_job_queue import get_pipeline_job_queue
+            cancelled += await get_pipeline_job_queue().cancel()
+        return {"cancelled": cancelled}
+
+    async def _handle_job_action(self, job_id: str, action: str) -> Dict[str, Any]:
+        from .scheduler import Scheduler
+        scheduler = Scheduler()
+        actions = {
+            "enable": scheduler.enable_job,
+            "disable": scheduler.disable_job,
+            "cancel": scheduler.cancel_job,
+        }
+        if action not in actions:
+            raise ValueError(f"Unknown action: {action}")
+        return {"success": actions[action](job_id)}
+
+    async def _handle_scheduler_refresh(self) -> Dict[str, Any]:
+        from .scheduler import Scheduler
+        scheduler = Scheduler()
+        if not scheduler._is_running:
+            return {"refreshed": False}
+        await scheduler.refresh_scheduled_jobs()
+        return {"refreshed": True}
+
+    async def _handle_price_service_start(self) -> Dict[str, Any]:
+        from app.service.price_service import price_service
+        if price_service.is_running:
+            return {"started": False}
+        await price_service.start()
+        return {"started": True}
+
+    async def _handle_price_service_stop(self) -> Dict[str, Any]:
+        from app.service.price_service import price_service
+        if not price_service.is_running:
+            return {"stopped": False}
+        await price_service.stop()
+        return {"stopped": True}
+
+    # State providers (run on the leader)
+
+    @staticmethod
+    def _scheduler_state() -> Dict[str, Any]:
+        from .scheduler import Scheduler
+        return Scheduler().get_jobs_snapshot()
+
+    @staticmethod
+    def _price_service_state() -> Dict[str, Any]:
+        from app.service.price_service import price_service
+        return price_service.get_service_status()
+
+    def _pipeline_runs_state(self) -> Dict[str, Any]:
+        return self.runs.get_status()
+
+
+_worker_coordinator: Optional[WorkerCoordinator] = None
+
+
+def get_worker_coordinator() -> WorkerCoordinator:
+    """Get the process-wide worker coordinator."""
+    global _worker_coordinator
+    if _worker_coordinator is None:
+        from app.infrastructure.config.settings import get_settings
+        settings = get_settings()
+        _worker_coordinator = WorkerCoordinator(
+            settings.deployment_mode, settings.leader_lock_path, settings.pipeline_execution
+        )
+    return _worker_coordinator
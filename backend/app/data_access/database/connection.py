@@ -105,6 +105,12 @@ async def init_database():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
         logger.info("Database tables created/verified")
+    
+    # Full-text index for the admin logs viewer (separate transaction so a
+    # missing FTS module cannot roll back table creation)
+    from app.data_access.database.log_search import ensure_log_search_index
+    async with engine.begin() as conn:
+        await ensure_log_search_index(conn)
 
 
 @asynccontextmanager
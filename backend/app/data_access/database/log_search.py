@@ -0,0 +1,143 @@
+"""
+System Log Full-Text Search
+
+Full-text index over system_logs.message for the admin logs viewer:
+
+- SQLite: an external-content FTS5 table (system_logs_fts) kept in sync by
+  insert/update/delete triggers
+- PostgreSQL: a GIN index on to_tsvector('simple', message)
+
+ensure_log_search_index() is idempotent and runs at startup after the tables
+are created; the Alembic migration applies the same DDL. When the index is
+unavailable (SQLite built without FTS5) searches fall back to ILIKE.
+"""
+
+import re
+from typing import Optional
+
+from sqlalchemy import Integer, func, literal_column, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.data_access.models import SystemLog
+from app.infrastructure.log_system import get_logger
+from app.utils.sql import escape_like
+
+logger = get_logger()
+
+SQLITE_FTS_TABLE = "system_logs_fts"
+POSTGRES_FTS_INDEX = "idx_system_logs_message_fts"
+
+SQLITE_FTS_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} USING fts5("
+    f"message, content='system_logs', content_rowid='rowid')",
+    f"CREATE TRIGGER IF NOT EXISTS system_logs_fts_insert AFTER INSERT ON system_logs BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, message) VALUES (new.rowid, new.message); END",
+    f"CREATE TRIGGER IF NOT EXISTS system_logs_fts_delete AFTER DELETE ON system_logs BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, message) "
+    f"VALUES ('delete', old.rowid, old.message); END",
+    f"CREATE TRIGGER IF NOT EXISTS system_logs_fts_update AFTER UPDATE OF message ON system_logs BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, message) "
+    f"VALUES ('delete', old.rowid, old.message); "
+    f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, message) VALUES (new.rowid, new.message); END"
+)
+
+POSTGRES_FTS_DDL = (
+    f"CREATE INDEX IF NOT EXISTS {POSTGRES_FTS_INDEX} ON system_logs "
+    f"USING gin (to_tsvector('simple', message))",
+)
+
+# Dialect name -> whether the full-text index is usable, set at startup
+_fts_available = {}
+
+
+async def ensure_log_search_index(conn: AsyncConnection) -> bool:
+    """
+    Create the full-text index for system log messages if it is missing.
+
+    Args:
+        conn: Connection in its own transaction (engine.begin())
+
+    Returns:
+        True if full-text search is available
+    """
+    dialect = conn.dialect.name
+    try:
+        if dialect == "sqlite":
+            existed = await conn.scalar(text(
+                "SELECT count(*) FROM sqlite_master WHERE name = :name"
+            ), {"name": SQLITE_FTS_TABLE})
+            for statement in SQLITE_FTS_DDL:
+                await conn.execute(text(statement))
+            if not existed:
+                # Index rows written before the FTS table existed
+                await conn.execute(text(
+                    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}) VALUES ('rebuild')"
+                ))
+        elif dialect == "postgresql":
+            for statement in POSTGRES_FTS_DDL:
+                await conn.execute(text(statement))
+        else:
+            _fts_available[dialect] = False
+            return False
+    except Exception as e:
+        # e.g. SQLite compiled without FTS5; searches use ILIKE instead
+        logger.warning(f"System log full-text index unavailable: {e}")
+        _fts_available[dialect] = False
+        return False
+
+    _fts_available[dialect] = True
+    return True
+
+
+def log_search_available(dialect: str) -> bool:
+    """Whether ensure_log_search_index() succeeded for this dialect."""
+    return _fts_available.get(dialect, False)
+
+
+def _search_tokens(term: str) -> list:
+    # Word characters only, so user input never reaches the query syntax
+    return re.findall(r"\w+", term.lower())
+
+
+def log_message_search(term: str, dialect: str) -> Optional[ColumnElement]:
+    """
+    Build a WHERE condition matching log messages against a search term.
+
+    Every word of the term must appear in the message as a word prefix
+    ("timeout err" matches "Timeout error ..."). Without a usable full-text
+    index the condition is a substring ILIKE.
+
+    Args:
+        term: User search input
+        dialect: Dialect name of the session
+
+    Returns:
+        SQLAlchemy condition, or None for a blank term
+    """
+    if not term or not term.strip():
+        return None
+
+    tokens = _search_tokens(term)
+    if not tokens or not log_search_available(dialect):
+        return SystemLog.message.ilike(f"%{escape_like(term)}%")
+
+    if dialect == "sqlite":
+        match = " ".join(f'"{token}"*' for token in tokens)
+        matching_rows = text(
+            f"SELECT rowid FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH :log_search_query"
+        ).bindparams(log_search_query=match).columns(rowid=Integer)
+        return literal_column("system_logs.rowid").in_(matching_rows)
+
+    # postgresql: must use the indexed expression verbatim
+    query = " & ".join(f"{token}:*" for token in tokens)
+    return func.to_tsvector(literal_column("'simple'"), SystemLog.message).op("@@")(
+        func.to_tsquery(literal_column("'simple'"), query)
+    )
+
+
+__all__ = [
+    "ensure_log_search_index",
+    "log_message_search",
+    "log_search_available"
+]
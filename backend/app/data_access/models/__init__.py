@@ -148,6 +148,67 @@ class SystemLog(Base):
     line_number = Column(Integer)  # Line number
     extra_data = Column(JSON)
     timestamp = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        # Keyset pagination in the logs viewer orders by (timestamp, id)
+        Index('idx_system_logs_timestamp_id', 'timestamp', 'id'),
+        Index('idx_system_logs_level_timestamp', 'level', 'timestamp'),
+    )
+
+
+class AIVerdict(Base):
+    """Cached AI verification verdict for a normalized text."""
+    __tablename__ = "ai_verdict_cache"
+    
+    text_hash = Column(String(64), primary_key=True)  # SHA-256 of the normalized text
+    prompt_version = Column(String(32), primary_key=True)
+    model_id = Column(String(100), primary_key=True)
+    label = Column(String(20), nullable=False)  # positive, negative, neutral
+    confidence = Column(Numeric(precision=5, scale=4), nullable=False)
+    reasoning = Column(Text)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_used_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        # TTL expiry and least-recently-used eviction
+        Index('idx_ai_verdict_cache_created_at', 'created_at'),
+        Index('idx_ai_verdict_cache_last_used_at', 'last_used_at'),
+    )
+
+
+class CollectionWatermark(Base):
+    """Newest item already collected for a (source, symbol) pair."""
+    __tablename__ = "collection_watermarks"
+    
+    source = Column(String(20), primary_key=True)  # hackernews, finnhub, newsapi, gdelt, yfinance
+    symbol = Column(String(10), primary_key=True)
+    last_published_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class PipelineJob(Base):
+    """A pipeline run queued for the out-of-process pipeline worker."""
+    __tablename__ = "pipeline_jobs"
+    
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    run_id = Column(String(36), nullable=False, index=True)  # Shards of one run share it
+    status = Column(String(16), nullable=False, default="queued")  # queued, running, completed, failed, cancelled
+    source = Column(String(32), nullable=False, default="manual")  # manual, scheduled, api
+    config = Column(JSON, nullable=False)  # PipelineConfig.to_dict()
+    progress = Column(JSON)  # Latest status/progress reported by the worker
+    result = Column(JSON)  # PipelineResult.to_dict()
+    error = Column(Text)
+    cancel_requested = Column(Boolean, nullable=False, default=False)
+    worker_id = Column(String(64))
+    attempts = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    started_at = Column(DateTime(timezone=True))
+    heartbeat_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+    
+    __table_args__ = (
+        Index('idx_pipeline_jobs_status_created', 'status', 'created_at'),
+    )
 
 
 Stock = StocksWatchlist  # Type alias for backward compatibility
@@ -160,5 +221,8 @@ __all__ = [
     "StockPrice", 
     "NewsArticle", 
     "HackerNewsPost", 
-    "SystemLog"
+    "SystemLog",
+    "AIVerdict",
+    "CollectionWatermark",
+    "PipelineJob"
 ]
\ No newline at end of file
@@ -9,10 +9,18 @@ from .base_repository import BaseRepository
 from .stock_repository import StockRepository
 from .sentiment_repository import SentimentDataRepository
 from .stock_price_repository import StockPriceRepository
+from .system_log_repository import SystemLogRepository
+from .ai_verdict_repository import AIVerdictRepository
+from .watermark_repository import CollectionWatermarkRepository
+from .pipeline_job_repository import PipelineJobRepository
 
 __all__ = [
     'BaseRepository',
     'StockRepository', 
     'SentimentDataRepository',
-    'StockPriceRepository'
+    'StockPriceRepository',
+    'SystemLogRepository',
+    'AIVerdictRepository',
+    'CollectionWatermarkRepository',
+    'PipelineJobRepository'
 ]
\ No newline at end of file
@@ -0,0 +1,143 @@
+"""
+AI Verdict Repository
+
+Repository for the persistent AI verification verdict cache.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy import and_, delete, desc, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.data_access.models import AIVerdict
+from app.utils.timezone import to_naive_utc, utc_now
+from .base_repository import BaseRepository
+
+# Keeps IN lists well below SQLite's bound-parameter limit
+_IN_CHUNK = 500
+
+
+class AIVerdictRepository(BaseRepository[AIVerdict]):
+    """Repository for cached AI verdicts keyed by (text_hash, prompt_version, model_id)."""
+
+    def __init__(self, db_session: AsyncSession):
+        super().__init__(AIVerdict, db_session)
+
+    async def get_fresh(
+        self,
+        text_hashes: Sequence[str],
+        prompt_version: str,
+        model_id: str,
+        created_after: datetime
+    ) -> List[AIVerdict]:
+        """
+        Get unexpired verdicts for text hashes and mark them as used
+
+        Args:
+            text_hashes: Normalized text hashes
+            prompt_version: Verification prompt version
+            model_id: AI model id
+            created_after: Verdicts created before this are expired
+
+        Returns:
+            Matching verdicts
+        """
+        verdicts: List[AIVerdict] = []
+        hashes = list(dict.fromkeys(text_hashes))
+        for start in range(0, len(hashes), _IN_CHUNK):
+            chunk = hashes[start:start + _IN_CHUNK]
+            result = await self.db_session.execute(
+                select(AIVerdict).where(and_(
+                    AIVerdict.text_hash.in_(chunk),
+                    AIVerdict.prompt_version == prompt_version,
+                    AIVerdict.model_id == model_id,
+                    AIVerdict.created_at >= to_naive_utc(created_after)
+                ))
+            )
+            verdicts.extend(result.scalars().all())
+
+        if verdicts:
+            used = [verdict.text_hash for verdict in verdicts]
+            for start in range(0, len(used), _IN_CHUNK):
+                await self.db_session.execute(
+                    update(AIVerdict)
+                    .where(and_(
+                        AIVerdict.text_hash.in_(used[start:start + _IN_CHUNK]),
+                        AIVerdict.prompt_version == prompt_version,
+                        AIVerdict.model_id == model_id
+                    ))
+                    .values(last_used_at=utc_now())
+                    .execution_options(synchronize_session=False)
+                )
+        return verdicts
+
+    async def upsert_many(self, prompt_version: str, model_id: str, verdicts: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Insert or refresh verdicts
+
+        Args:
+            prompt_version: Verification prompt version
+            model_id: AI model id
+            verdicts: text_hash -> {"label", "confidence", "reasoning"}
+
+        Returns:
+            Number of verdicts written
+        """
+        if not verdicts:
+            return 0
+
+        existing = {}
+        hashes = list(verdicts)
+        for start in range(0, len(hashes), _IN_CHUNK):
+            result = await self.db_session.execute(
+                select(AIVerdict).where(and_(
+                    AIVerdict.text_hash.in_(hashes[start:start + _IN_CHUNK]),
+                    AIVerdict.prompt_version == prompt_version,
+                    AIVerdict.model_id == model_id
+                ))
+            )
+            existing.update({row.text_hash: row for row in result.scalars().all()})
+
+        now = utc_now()
+        for text_hash, values in verdicts.items():
+            row = existing.get(text_hash)
+            if row is None:
+                row = AIVerdict(text_hash=text_hash, prompt_version=prompt_version, model_id=model_id)
+                self.db_session.add(row)
+            row.label = values["label"]
+            row.confidence = values["confidence"]
+            row.reasoning = values.get("reasoning")
+            row.created_at = now
+            row.last_used_at = now
+        await self.db_session.flush()
+        return len(verdicts)
+
+    async def prune(self, created_before: datetime, max_entries: int) -> int:
+        """
+        Delete expired verdicts, then the least recently used beyond max_entries
+
+        Returns:
+            Number of verdicts deleted
+        """
+        result = await self.db_session.execute(
+            delete(AIVerdict).where(AIVerdict.created_at < to_naive_utc(created_before))
+        )
+        deleted = result.rowcount or 0
+
+        total = int(await self.db_session.scalar(select(func.count()).select_from(AIVerdict)) or 0)
+        if total > max_entries:
+            # last_used_at of the newest verdict that no longer fits; verdicts
+            # written together share it, so ties are kept (the cap is soft)
+            cutoff = await self.db_session.scalar(
+                select(AIVerdict.last_used_at)
+                .order_by(desc(AIVerdict.last_used_at))
+                .offset(max_entries)
+                .limit(1)
+            )
+            if cutoff is not None:
+                result = await self.db_session.execute(
+                    delete(AIVerdict).where(AIVerdict.last_used_at < cutoff)
+                )
+                deleted += result.rowcount or 0
+        return deleted
@@ -0,0 +1,225 @@
+"""
+Pipeline Job Repository
+
+Repository for pipeline runs queued for the out-of-process pipeline worker.
+"""
+
+import uuid
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, exists, func, select, update
+from sqlalchemy.orm import aliased
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.data_access.models import PipelineJob
+from app.utils.timezone import utc_now
+from .base_repository import BaseRepository
+
+FINISHED_STATUSES = ("completed", "failed", "cancelled")
+
+
+class PipelineJobRepository(BaseRepository[PipelineJob]):
+    """Repository for PipelineJob rows."""
+
+    def __init__(self, db_session: AsyncSession):
+        super().__init__(PipelineJob, db_session)
+
+    async def enqueue(self, run_id: str, config: Dict[str, Any], source: str = "manual") -> PipelineJob:
+        """Queue one run (or one shard of a run) for a worker."""
+        return await self.create({
+            "id": str(uuid.uuid4()),
+            "run_id": run_id,
+            "status": "queued",
+            "source": source,
+            "config": config,
+            "cancel_requested": False,
+            "attempts": 0,
+        })
+
+    async def claim_next(self, worker_id: str, serialize_runs: bool = False) -> Optional[PipelineJob]:
+        """
+        Take the oldest queued job
+
+        The conditions in the UPDATE make the claim atomic: when two
+        workers pick the same row, only one of them changes it.
+
+        Args:
+            worker_id: Identifier of the claiming worker
+            serialize_runs: Skip jobs whose run already has a running shard,
+                so the shards of a run execute one after another
+
+        Returns:
+            The claimed job, or None when no job can be claimed
+        """
+        claimable = [PipelineJob.status == "queued"]
+        if serialize_runs:
+            other = aliased(PipelineJob)
+            claimable.append(~exists().where(and_(other.run_id == PipelineJob.run_id, other.status == "running")))
+
+        while True:
+            job_id = (await self.db_session.execute(
+                select(PipelineJob.id)
+                .where(and_(*claimable))
+                .order_by(PipelineJob.created_at, PipelineJob.id)
+                .limit(1)
+            )).scalar_one_or_none()
+            if job_id is None:
+                return None
+
+            now = utc_now()
+            result = await self.db_session.execute(
+                update(PipelineJob)
+                .where(and_(PipelineJob.id == job_id, *claimable))
+                .values(
+                    status="running",
+                    worker_id=worker_id,
+                    started_at=now,
+                    heartbeat_at=now,
+                    attempts=PipelineJob.attempts + 1
+                )
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount:
+                return await self.get_job(job_id)
+
+    async def get_job(self, job_id: str) -> Optional[PipelineJob]:
+        result = await self.db_session.execute(
+            select(PipelineJob).where(PipelineJob.id == job_id).execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_run(self, run_id: str) -> List[PipelineJob]:
+        """All shards of one run"""
+        result = await self.db_session.execute(
+            select(PipelineJob)
+            .where(PipelineJob.run_id == run_id)
+            .order_by(PipelineJob.created_at, PipelineJob.id)
+            .execution_options(populate_existing=True)
+        )
+        return list(result.scalars().all())
+
+    async def heartbeat(self, job_id: str, worker_id: str, progress: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Record that a worker is still running a job
+
+        Only the worker that holds the job may touch it: once a job was
+        requeued as stale and claimed by another worker, the old worker's
+        heartbeats are ignored.
+
+        Returns:
+            "running", "cancel_requested", or "lost" when the job is no
+            longer this worker's
+        """
+        values: Dict[str, Any] = {"heartbeat_at": utc_now()}
+        if progress is not None:
+            values["progress"] = progress
+        result = await self.db_session.execute(
+            update(PipelineJob)
+            .where(self._owned(job_id, worker_id))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if not result.rowcount:
+            return "lost"
+        cancel_requested = (await self.db_session.execute(
+            select(PipelineJob.cancel_requested).where(PipelineJob.id == job_id)
+        )).scalar_one_or_none()
+        return "cancel_requested" if cancel_requested else "running"
+
+    async def finish(
+        self,
+        job_id: str,
+        worker_id: str,
+        status: str,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+        progress: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Record the outcome of a job the worker still holds
+
+        Returns:
+            False when the job is no longer this worker's (nothing written)
+        """
+        values: Dict[str, Any] = {"status": status, "result": result, "error": error, "finished_at": utc_now()}
+        if progress is not None:
+            values["progress"] = progress
+        updated = await self.db_session.execute(
+            update(PipelineJob)
+            .where(self._owned(job_id, worker_id))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        return bool(updated.rowcount)
+
+    @staticmethod
+    def _owned(job_id: str, worker_id: str):
+        return and_(
+            PipelineJob.id == job_id,
+            PipelineJob.worker_id == worker_id,
+            PipelineJob.status == "running"
+        )
+
+    async def request_cancel(self, run_id: Optional[str] = None) -> int:
+        """
+        Cancel queued jobs and flag running ones for their worker
+
+        Args:
+            run_id: Only the shards of this run (all unfinished jobs when None)
+
+        Returns:
+            Number of jobs cancelled or flagged
+        """
+        scope = [PipelineJob.run_id == run_id] if run_id else []
+        queued = await self.db_session.execute(
+            update(PipelineJob)
+            .where(and_(PipelineJob.status == "queued", *scope))
+            .values(status="cancelled", error="Cancelled before start", finished_at=utc_now())
+            .execution_options(synchronize_session=False)
+        )
+        running = await self.db_session.execute(
+            update(PipelineJob)
+            .where(and_(PipelineJob.status == "running", *scope))
+            .values(cancel_requested=True)
+            .execution_options(synchronize_session=False)
+        )
+        return (queued.rowcount or 0) + (running.rowcount or 0)
+
+    async def requeue_stale(self, stale_after: timedelta, max_attempts: int) -> int:
+        """
+        Recover jobs of workers that stopped heartbeating
+
+        A job is queued again until it has been attempted max_attempts
+        times, then failed.
+
+        Returns:
+            Number of jobs requeued or failed
+        """
+        cutoff = utc_now() - stale_after
+        stale = and_(PipelineJob.status == "running", PipelineJob.heartbeat_at < cutoff)
+        failed = await self.db_session.execute(
+            update(PipelineJob)
+            .where(and_(stale, PipelineJob.attempts >= max_attempts))
+            .values(status="failed", error="Worker stopped responding", finished_at=utc_now())
+            .execution_options(synchronize_session=False)
+        )
+        requeued = await self.db_session.execute(
+            update(PipelineJob)
+            .where(stale)
+            .values(status="queued", worker_id=None, started_at=None, heartbeat_at=None)
+            .execution_options(synchronize_session=False)
+        )
+        return (failed.rowcount or 0) + (requeued.rowcount or 0)
+
+    async def list_recent(self, limit: int = 20) -> List[PipelineJob]:
+        result = await self.db_session.execute(
+            select(PipelineJob).order_by(PipelineJob.created_at.desc()).limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def count_by_status(self) -> Dict[str, int]:
+        result = await self.db_session.execute(
+            select(PipelineJob.status, func.count()).group_by(PipelineJob.status)
+        )
+        return {status: count for status, count in result.all()}
@@ -4,18 +4,32 @@ Sentiment Data Repository
 Repository for SentimentData model with specialized sentiment analysis queries.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, desc, and_, or_, between
+from sqlalchemy.engine import Row
 from app.utils.timezone import ensure_utc, to_naive_utc
 from datetime import datetime, timedelta
 import uuid
 from app.utils.timezone import utc_now
+from app.utils.time_buckets import dialect_name, parse_bucket, time_bucket
 
 from app.data_access.models import SentimentData, Stock
 from .base_repository import BaseRepository
 
 
+# Columns read by dashboards, stock pages and accuracy metrics. Projecting
+# these instead of whole entities skips raw_text and additional_metadata.
+SENTIMENT_POINT_COLUMNS = (
+    SentimentData.stock_id,
+    SentimentData.sentiment_score,
+    SentimentData.confidence,
+    SentimentData.sentiment_label,
+    SentimentData.source,
+    SentimentData.created_at
+)
+
+
 class SentimentDataRepository(BaseRepository[SentimentData]):
     """Repository for SentimentData model with specialized sentiment analysis queries."""
     
@@ -106,6 +120,73 @@ class SentimentDataRepository(BaseRepository[SentimentData]):
         )
         return result.scalars().all()
     
+    async def get_sentiment_points_by_date_range(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        limit: Optional[int] = None
+    ) -> Sequence[Row]:
+        """
+        Lightweight variant of get_sentiment_by_date_range
+        
+        Args:
+            symbol: Stock symbol
+            start_date: Start of date range
+            end_date: End of date range
+            limit: Maximum number of rows (latest first)
+            
+        Returns:
+            Rows with the SENTIMENT_POINT_COLUMNS attributes (stock_id,
+            sentiment_score, confidence, sentiment_label, source, created_at),
+            latest first
+        """
+        query = (
+            select(*SENTIMENT_POINT_COLUMNS)
+            .join(Stock)
+            .where(
+                and_(
+                    Stock.symbol == symbol.upper(),
+                    between(SentimentData.created_at, start_date, end_date)
+                )
+            )
+            .order_by(desc(SentimentData.created_at))
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        result = await self.db_session.execute(query)
+        return result.all()
+    
+    async def get_recent_sentiment_points(
+        self,
+        since: datetime,
+        limit: int = 1000,
+        stock_ids: Optional[Sequence[Any]] = None
+    ) -> Sequence[Row]:
+        """
+        Lightweight variant of get_recent_sentiment_scores
+        
+        Args:
+            since: Start time for recent data
+            limit: Maximum number of rows to return
+            stock_ids: Restrict to these stocks (all stocks if None)
+            
+        Returns:
+            Rows with the SENTIMENT_POINT_COLUMNS attributes, latest first;
+            created_at is returned as stored (naive UTC on SQLite)
+        """
+        conditions = [SentimentData.created_at >= to_naive_utc(since)]
+        if stock_ids is not None:
+            conditions.append(SentimentData.stock_id.in_(list(stock_ids)))
+        
+        result = await self.db_session.execute(
+            select(*SENTIMENT_POINT_COLUMNS)
+            .where(and_(*conditions))
+            .order_by(desc(SentimentData.created_at))
+            .limit(limit)
+        )
+        return result.all()
+    
     async def get_latest_sentiment_by_stock(self, symbol: str) -> Optional[SentimentData]:
         """
         Get the most recent sentiment data for a stock
@@ -192,6 +273,62 @@ class SentimentDataRepository(BaseRepository[SentimentData]):
             'generated_at': utc_now()
         }
     
+    async def get_average_sentiment_by_stock(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        active_only: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Get average sentiment per stock within a date range in one grouped query
+        
+        Stocks without sentiment records in the range are included with a
+        zero count.
+        
+        Args:
+            start_date: Start of date range
+            end_date: End of date range
+            active_only: Only include actively tracked stocks
+            
+        Returns:
+            List of dicts with symbol, name, current_price, avg_sentiment and record_count
+        """
+        query = (
+            select(
+                Stock.symbol,
+                Stock.name,
+                Stock.current_price,
+                func.avg(SentimentData.sentiment_score).label('avg_sentiment'),
+                func.count(SentimentData.id).label('record_count')
+            )
+            .select_from(
+                Stock.__table__.outerjoin(
+                    SentimentData.__table__,
+                    and_(
+                        SentimentData.stock_id == Stock.id,
+                        between(SentimentData.created_at, start_date, end_date)
+                    )
+                )
+            )
+            .group_by(Stock.id, Stock.symbol, Stock.name, Stock.current_price)
+            .order_by(Stock.symbol)
+        )
+        if active_only:
+            query = query.where(Stock.is_active.is_(True))
+        
+        result = await self.db_session.execute(query)
+        
+        return [
+            {
+                'symbol': row.symbol,
+                'name': row.name,
+                'current_price': float(row.current_price) if row.current_price else None,
+                'avg_sentiment': float(row.avg_sentiment) if row.avg_sentiment is not None else 0.0,
+                'record_count': row.record_count
+            }
+            for row in result
+        ]
+    
     async def get_sentiment_trends(
         self, 
         symbol: str, 
@@ -204,17 +341,27 @@ class SentimentDataRepository(BaseRepository[SentimentData]):
         Args:
             symbol: Stock symbol
             days: Number of days to analyze
-            interval_hours: Grouping interval in hours
+            interval_hours: Grouping interval in hours (below 1 hour buckets by
+                minute, 1-23 by hour, 24-167 by day, 168+ by week)
             
         Returns:
-            List of sentiment trend data points
+            List of sentiment trend data points, 'date' being the UTC bucket start
         """
         cutoff_date = to_naive_utc(utc_now() - timedelta(days=days))
         
-        # PostgreSQL-style date truncation (adapt for SQLite if needed)
+        if interval_hours >= 168:
+            unit = "week"
+        elif interval_hours >= 24:
+            unit = "day"
+        elif interval_hours >= 1:
+            unit = "hour"
+        else:
+            unit = "minute"
+        bucket = time_bucket(SentimentData.created_at, unit, dialect_name(self.db_session))
+        
         result = await self.db_session.execute(
             select(
-                func.date(SentimentData.created_at).label('date'),
+                bucket.label('date'),
                 func.avg(SentimentData.sentiment_score).label('avg_sentiment'),
                 func.count(SentimentData.id).label('record_count')
             )
@@ -225,14 +372,14 @@ class SentimentDataRepository(BaseRepository[SentimentData]):
                     SentimentData.created_at >= cutoff_date
                 )
             )
-            .group_by(func.date(SentimentData.created_at))
-            .order_by(func.date(SentimentData.created_at))
+            .group_by(bucket)
+            .order_by(bucket)
         )
         
         trends = []
         for row in result:
             trends.append({
-                'date': row.date,
+                'date': parse_bucket(row.date),
                 'average_sentiment': float(row.avg_sentiment),
                 'record_count': row.record_count
             })
@@ -0,0 +1,171 @@
+"""
+System Log Repository
+
+Repository for SystemLog with keyset pagination, indexed filtering and cached
+counts for the admin logs viewer.
+"""
+
+import base64
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, desc, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.data_access.database.log_search import log_message_search
+from app.data_access.models import SystemLog
+from app.utils.sql import escape_like
+from app.utils.time_buckets import dialect_name
+from app.utils.timezone import ensure_utc, to_naive_utc
+from .base_repository import BaseRepository
+
+# Seconds a count stays cached; the viewer tolerates slightly stale totals
+COUNT_CACHE_TTL_SECONDS = 30.0
+
+# Filter key -> (count, monotonic time computed)
+_count_cache: Dict[Tuple, Tuple[int, float]] = {}
+
+
+def encode_log_cursor(timestamp: datetime, log_id: uuid.UUID) -> str:
+    """Opaque cursor for the row after which the next page starts."""
+    raw = f"{ensure_utc(timestamp).isoformat()}|{log_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_log_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """
+    Decode a cursor from encode_log_cursor().
+
+    Raises:
+        ValueError: Malformed cursor
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        timestamp, log_id = raw.split("|", 1)
+        return ensure_utc(datetime.fromisoformat(timestamp)), uuid.UUID(log_id)
+    except Exception as e:
+        raise ValueError(f"Invalid log cursor: {cursor}") from e
+
+
+def invalidate_log_counts() -> None:
+    """Drop cached counts (call after deleting logs)."""
+    _count_cache.clear()
+
+
+class SystemLogRepository(BaseRepository[SystemLog]):
+    """Repository for SystemLog with viewer-oriented queries."""
+
+    def __init__(self, db_session: AsyncSession):
+        super().__init__(SystemLog, db_session)
+
+    def build_conditions(
+        self,
+        levels: Optional[Sequence[str]] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        logger_name: Optional[str] = None,
+        component: Optional[str] = None,
+        search_term: Optional[str] = None
+    ) -> List[Any]:
+        """
+        Translate viewer filters into WHERE conditions
+
+        Args:
+            levels: Log levels to include
+            start_time: Earliest timestamp
+            end_time: Latest timestamp
+            logger_name: Substring of the logger name
+            component: Substring of the component
+            search_term: Words to find in the message (full-text when indexed)
+
+        Returns:
+            List of SQLAlchemy conditions
+        """
+        conditions = []
+        if levels:
+            conditions.append(SystemLog.level.in_(list(levels)))
+        if start_time:
+            conditions.append(SystemLog.timestamp >= to_naive_utc(start_time))
+        if end_time:
+            conditions.append(SystemLog.timestamp <= to_naive_utc(end_time))
+        if logger_name:
+            conditions.append(SystemLog.logger.ilike(f"%{escape_like(logger_name)}%"))
+        if component:
+            conditions.append(SystemLog.component.ilike(f"%{escape_like(component)}%"))
+        if search_term:
+            search = log_message_search(search_term, dialect_name(self.db_session))
+            if search is not None:
+                conditions.append(search)
+        return conditions
+
+    async def get_page(
+        self,
+        conditions: Sequence[Any],
+        limit: int,
+        cursor: Optional[str] = None,
+        offset: int = 0
+    ) -> Tuple[List[SystemLog], Optional[str]]:
+        """
+        Get one page of logs, newest first
+
+        With a cursor the page starts strictly after the cursor row using the
+        (timestamp, id) index, so deep pages cost the same as the first one.
+        Without a cursor the offset is applied (first page or legacy clients).
+
+        Args:
+            conditions: Conditions from build_conditions()
+            limit: Page size
+            cursor: Cursor returned with the previous page
+            offset: Rows to skip when no cursor is given
+
+        Returns:
+            (logs, next_cursor); next_cursor is None on the last page
+        """
+        query = select(SystemLog).where(and_(*conditions)) if conditions else select(SystemLog)
+
+        if cursor:
+            cursor_timestamp, cursor_id = decode_log_cursor(cursor)
+            cursor_timestamp = to_naive_utc(cursor_timestamp)
+            query = query.where(or_(
+                SystemLog.timestamp < cursor_timestamp,
+                and_(SystemLog.timestamp == cursor_timestamp, SystemLog.id < cursor_id)
+            ))
+        elif offset:
+            query = query.offset(offset)
+
+        # One extra row tells whether another page exists
+        query = query.order_by(desc(SystemLog.timestamp), desc(SystemLog.id)).limit(limit + 1)
+        result = await self.db_session.execute(query)
+        logs = list(result.scalars().all())
+
+        next_cursor = None
+        if len(logs) > limit:
+            logs = logs[:limit]
+            last = logs[-1]
+            if last.timestamp is not None:
+                next_cursor = encode_log_cursor(last.timestamp, last.id)
+        return logs, next_cursor
+
+    async def count(self, conditions: Sequence[Any], cache_key: Tuple = ()) -> int:
+        """
+        Count logs matching conditions, cached for COUNT_CACHE_TTL_SECONDS
+
+        Args:
+            conditions: Conditions from build_conditions()
+            cache_key: Hashable description of the filters (empty for all logs)
+
+        Returns:
+            Number of matching logs (possibly up to the TTL stale)
+        """
+        cached = _count_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[1] < COUNT_CACHE_TTL_SECONDS:
+            return cached[0]
+
+        query = select(func.count()).select_from(SystemLog)
+        if conditions:
+            query = query.where(and_(*conditions))
+        value = int(await self.db_session.scalar(query) or 0)
+        _count_cache[cache_key] = (value, time.monotonic())
+        return value
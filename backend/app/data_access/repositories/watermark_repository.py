@@ -0,0 +1,103 @@
+"""
+Collection Watermark Repository
+
+Repository for per-(source, symbol) collection high-water marks.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import and_, delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.data_access.models import CollectionWatermark
+from app.utils.timezone import ensure_utc, utc_now
+from .base_repository import BaseRepository
+
+
+class CollectionWatermarkRepository(BaseRepository[CollectionWatermark]):
+    """Repository for CollectionWatermark rows."""
+
+    def __init__(self, db_session: AsyncSession):
+        super().__init__(CollectionWatermark, db_session)
+
+    async def get_for_source(self, source: str, symbols: Sequence[str]) -> Dict[str, CollectionWatermark]:
+        """
+        Get watermarks of one source
+
+        Args:
+            source: Data source name
+            symbols: Symbols to look up
+
+        Returns:
+            symbol -> watermark for symbols that have one
+        """
+        if not symbols:
+            return {}
+        result = await self.db_session.execute(
+            select(CollectionWatermark).where(and_(
+                CollectionWatermark.source == source,
+                CollectionWatermark.symbol.in_([symbol.upper() for symbol in symbols])
+            ))
+        )
+        return {row.symbol: row for row in result.scalars().all()}
+
+    async def advance_many(
+        self,
+        source: str,
+        marks: Dict[str, datetime]
+    ) -> int:
+        """
+        Move watermarks forward; a mark older than the stored one is ignored
+
+        Args:
+            source: Data source name
+            marks: symbol -> newest published_at
+
+        Returns:
+            Number of watermarks created or moved
+        """
+        if not marks:
+            return 0
+
+        existing = await self.get_for_source(source, list(marks))
+        changed = 0
+        for symbol, published_at in marks.items():
+            symbol = symbol.upper()
+            row = existing.get(symbol)
+            if row is None:
+                self.db_session.add(CollectionWatermark(
+                    source=source,
+                    symbol=symbol,
+                    last_published_at=published_at,
+                    updated_at=utc_now()
+                ))
+                changed += 1
+            elif ensure_utc(published_at) > ensure_utc(row.last_published_at):
+                row.last_published_at = published_at
+                row.updated_at = utc_now()
+                changed += 1
+        await self.db_session.flush()
+        return changed
+
+    async def clear(self, source: Optional[str] = None, symbols: Optional[List[str]] = None) -> int:
+        """
+        Delete watermarks so the next run fetches the full lookback window
+
+        Args:
+            source: Only this source (all when None)
+            symbols: Only these symbols (all when None)
+
+        Returns:
+            Number of watermarks deleted
+        """
+        conditions = []
+        if source:
+            conditions.append(CollectionWatermark.source == source)
+        if symbols:
+            conditions.append(CollectionWatermark.symbol.in_([symbol.upper() for symbol in symbols]))
+        query = delete(CollectionWatermark)
+        if conditions:
+            query = query.where(and_(*conditions))
+        result = await self.db_session.execute(query)
+        return result.rowcount or 0
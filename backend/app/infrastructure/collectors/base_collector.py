@@ -13,10 +13,10 @@ Following FYP Report specification:
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 import asyncio
-from app.utils.timezone import utc_now
+from app.utils.timezone import ensure_utc, to_naive_utc, utc_now
 
 # Use centralized logging system
 from app.infrastructure.log_system import get_logger
@@ -86,12 +86,30 @@ class CollectionConfig:
     include_comments: bool = True
     language: str = "en"
     min_score: Optional[int] = None  # HackerNews points, news engagement
+    # Per-symbol high-water marks: only items published after these are requested
+    since: Dict[str, datetime] = field(default_factory=dict)
     
     def __post_init__(self):
         if not self.symbols:
             raise ValueError("At least one stock symbol must be provided")
         if self.max_items_per_symbol <= 0:
             raise ValueError("max_items_per_symbol must be positive")
+    
+    def window_start(self, symbol: str) -> datetime:
+        """
+        Start of the query window for a symbol.
+        
+        The symbol's high-water mark when it is newer than the range start,
+        otherwise the range start. Returned naive or aware like start_date.
+        """
+        start = self.date_range.start_date
+        mark = self.since.get(symbol.upper())
+        if mark is None:
+            return start
+        mark = ensure_utc(mark)
+        if mark <= ensure_utc(start):
+            return start
+        return mark if start.tzinfo else to_naive_utc(mark)
 
 
 @dataclass
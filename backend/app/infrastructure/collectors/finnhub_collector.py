@@ -12,9 +12,9 @@ Following FYP Report specification:
 """
 
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 import asyncio
-from app.utils.timezone import utc_now
+from app.utils.timezone import ensure_utc, utc_now
 
 try:
     import finnhub
@@ -25,6 +25,7 @@ except ImportError:
 
 import httpx
 
+from app.infrastructure.http_transport import get_http_transport
 from .base_collector import (
     BaseCollector, 
     DataSource, 
@@ -50,6 +51,9 @@ class FinHubCollector(BaseCollector):
     - Professional financial sources
     """
     
+    # Company-news requests in flight during batch collection
+    MAX_CONCURRENT_REQUESTS = 5
+    
     def __init__(self, api_key: str, rate_limiter=None):
         """
         Initialize FinHub collector.
@@ -77,15 +81,8 @@ class FinHubCollector(BaseCollector):
         return True
     
     def _get_http_client(self) -> httpx.AsyncClient:
-        """Get HTTP client with connection pooling for better performance"""
-        return httpx.AsyncClient(
-            timeout=30.0,
-            limits=httpx.Limits(
-                max_keepalive_connections=20,  # Keep 20 connections alive
-                max_connections=100,            # Max 100 total connections
-                keepalive_expiry=30.0           # Keep connections alive for 30s
-            )
-        )
+        """Get the shared, long-lived HTTP client for FinHub (do not close it)"""
+        return get_http_transport().httpx_client(self.base_url, timeout=30.0)
     
     async def validate_connection(self) -> bool:
         """Validate FinHub API connection"""
@@ -97,10 +94,10 @@ class FinHubCollector(BaseCollector):
                 "token": self.api_key
             }
             
-            async with self._get_http_client() as client:
-                response = await client.get(url, params=params)
-                return response.status_code == 200 and response.json().get("c") is not None
-                
+            client = self._get_http_client()
+            response = await client.get(url, params=params)
+            return response.status_code == 200 and response.json().get("c") is not None
+            
         except Exception as e:
             self.logger.error(f"FinHub connection validation failed: {str(e)}")
             return False
@@ -154,7 +151,7 @@ class FinHubCollector(BaseCollector):
     
     async def _collect_batch(self, symbols: List[str], config: CollectionConfig) -> List[RawData]:
         """
-        Collect news for multiple symbols in parallel with smart batching.
+        Collect news for multiple symbols with a sliding window of requests.
         
         Args:
             symbols: List of stock symbols
@@ -164,67 +161,101 @@ class FinHubCollector(BaseCollector):
             List of collected news data
         """
         collected_data = []
+        async for _symbol, symbol_data in self.iter_batch(symbols, config):
+            collected_data.extend(symbol_data)
+        return collected_data
+    
+    async def iter_batch(
+        self,
+        symbols: List[str],
+        config: CollectionConfig,
+        max_concurrent: Optional[int] = None,
+        max_retries: int = 3
+    ) -> AsyncIterator[Tuple[str, List[RawData]]]:
+        """
+        Collect news for multiple symbols, yielding each symbol as it completes.
         
-        # Process symbols in parallel batches of 5 (FinHub handles this well)
-        batch_size = 5
-        tasks = []
+        A fixed pool of workers pulls symbols from a queue, so a slow symbol
+        only occupies one slot instead of holding up a whole group; request
+        pacing comes from the rate limiter. A symbol that fails transiently
+        (network error, 429, 5xx) is put back on the queue after an
+        exponential backoff (1s, 2s, 4s) without occupying a worker meanwhile.
         
-        for i in range(0, len(symbols), batch_size):
-            batch = symbols[i:i + batch_size]
-            
-            # Create parallel tasks for this batch
-            for symbol in batch:
-                tasks.append(self._collect_symbol_with_limit(symbol, config))
-            
-            # Wait for batch to complete before starting next batch (respects rate limits)
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Process results
-            for result in batch_results:
-                if isinstance(result, Exception):
-                    self.logger.error(f"Batch collection error: {str(result)}")
-                    continue
-                if isinstance(result, list):
-                    collected_data.extend(result)
+        Args:
+            symbols: List of stock symbols
+            config: Collection configuration
+            max_concurrent: Requests in flight (default MAX_CONCURRENT_REQUESTS)
+            max_retries: Attempts per symbol
             
-            # Clear tasks for next batch
-            tasks = []
+        Yields:
+            (symbol, news items) in completion order; failed symbols yield []
+        """
+        unique_symbols = list(dict.fromkeys(symbols))
+        if not unique_symbols:
+            return
         
-        return collected_data
+        loop = asyncio.get_running_loop()
+        pending: asyncio.Queue = asyncio.Queue()
+        completed: asyncio.Queue = asyncio.Queue()
+        retry_handles = []
+        for symbol in unique_symbols:
+            pending.put_nowait((symbol, 0))
+        
+        async def worker() -> None:
+            while True:
+                symbol, attempt = await pending.get()
+                try:
+                    await self._apply_rate_limit()
+                    symbol_data = await self._collect_company_news(symbol, config, raise_on_error=True)
+                    completed.put_nowait((symbol, symbol_data[:config.max_items_per_symbol]))
+                except Exception as e:
+                    if attempt < max_retries - 1 and self._is_retryable(e):
+                        delay = 2 ** attempt
+                        self.logger.warning(
+                            f"FinHub collection failed for {symbol} (attempt {attempt + 1}/{max_retries}): {str(e)}. "
+                            f"Retrying in {delay}s..."
+                        )
+                        retry_handles.append(
+                            loop.call_later(delay, pending.put_nowait, (symbol, attempt + 1))
+                        )
+                    else:
+                        self.logger.error(f"FinHub collection failed for {symbol} after {attempt + 1} attempts: {str(e)}")
+                        completed.put_nowait((symbol, []))
+        
+        worker_count = max(1, min(max_concurrent or self.MAX_CONCURRENT_REQUESTS, len(unique_symbols)))
+        workers = [asyncio.create_task(worker()) for _ in range(worker_count)]
+        try:
+            for _ in unique_symbols:
+                yield await completed.get()
+        finally:
+            for handle in retry_handles:
+                handle.cancel()
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
     
-    async def _collect_symbol_with_limit(
-        self, 
-        symbol: str, 
-        config: CollectionConfig, 
-        max_retries: int = 3
-    ) -> List[RawData]:
-        """Collect news for a single symbol with rate limiting and retry logic"""
-        for attempt in range(max_retries):
-            try:
-                await self._apply_rate_limit()
-                symbol_data = await self._collect_company_news(symbol, config)
-                return symbol_data[:config.max_items_per_symbol]
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    # Exponential backoff: 2^attempt seconds (1s, 2s, 4s)
-                    delay = 2 ** attempt
-                    self.logger.warning(
-                        f"FinHub collection failed for {symbol} (attempt {attempt + 1}/{max_retries}): {str(e)}. "
-                        f"Retrying in {delay}s..."
-                    )
-                    await asyncio.sleep(delay)
-                else:
-                    self.logger.error(f"FinHub collection failed for {symbol} after {max_retries} attempts: {str(e)}")
-                    return []  # Return empty list on final failure
-        return []
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """Network errors, throttling and server errors are worth retrying"""
+        if isinstance(error, httpx.HTTPStatusError):
+            status_code = error.response.status_code
+            return status_code == 429 or status_code >= 500
+        return isinstance(error, (httpx.TransportError, asyncio.TimeoutError))
     
-    async def _collect_company_news(self, symbol: str, config: CollectionConfig) -> List[RawData]:
-        """Collect company-specific news"""
+    async def _collect_company_news(
+        self,
+        symbol: str,
+        config: CollectionConfig,
+        raise_on_error: bool = False
+    ) -> List[RawData]:
+        """Collect company-specific news (request errors are logged, or raised when raise_on_error)"""
         collected_data = []
         
         try:
-            # Format dates for API
-            from_date = config.date_range.start_date.strftime("%Y-%m-%d")
+            # Format dates for API (from the symbol's high-water mark when known;
+            # Finnhub only takes dates, so the rest of that day is filtered below)
+            window_start = config.window_start(symbol)
+            from_date = window_start.strftime("%Y-%m-%d")
             to_date = config.date_range.end_date.strftime("%Y-%m-%d")
             
             url = f"{self.base_url}/company-news"
@@ -235,29 +266,35 @@ class FinHubCollector(BaseCollector):
                 "token": self.api_key
             }
             
-            async with self._get_http_client() as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                
-                news_data = response.json()
-                
-                if not isinstance(news_data, list):
-                    self.logger.warning(f"Unexpected response format for {symbol}")
-                    return collected_data
-                
-                for item in news_data[:config.max_items_per_symbol]:
-                    try:
-                        article_data = self._parse_news_item(item, symbol, "company_news")
-                        if article_data:
-                            collected_data.append(article_data)
-                    except Exception as e:
-                        self.logger.warning(f"Error parsing news item for {symbol}: {str(e)}")
-                        continue
+            client = self._get_http_client()
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+            
+            news_data = response.json()
+            
+            if not isinstance(news_data, list):
+                self.logger.warning(f"Unexpected response format for {symbol}")
+                return collected_data
+            
+            if symbol.upper() in config.since:
+                start_ts = ensure_utc(window_start).timestamp()
+                news_data = [item for item in news_data if (item.get("datetime") or 0) >= start_ts]
+            
+            for item in news_data[:config.max_items_per_symbol]:
+                try:
+                    article_data = self._parse_news_item(item, symbol, "company_news")
+                    if article_data:
+                        collected_data.append(article_data)
+                except Exception as e:
+                    self.logger.warning(f"Error parsing news item for {symbol}: {str(e)}")
+                    continue
             
             # Log at debug level to reduce noise (summary logged at end of collection)
             self.logger.debug(f"Collected {len(collected_data)} news items for {symbol}")
             
         except Exception as e:
+            if raise_on_error:
+                raise
             self.logger.error(f"Error collecting company news for {symbol}: {str(e)}")
         
         return collected_data
@@ -273,38 +310,38 @@ class FinHubCollector(BaseCollector):
                 "token": self.api_key
             }
             
-            async with self._get_http_client() as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                
-                news_data = response.json()
-                
-                if not isinstance(news_data, list):
-                    self.logger.warning("Unexpected response format for market news")
-                    return collected_data
-                
-                # Filter market news by date and relevance
-                relevant_news = []
-                for item in news_data:
-                    try:
-                        news_time = datetime.fromtimestamp(item.get("datetime", 0), tz=timezone.utc)
-                        if config.date_range.start_date <= news_time <= config.date_range.end_date:
-                            # Check if news mentions any target symbols
-                            headline = item.get("headline", "").upper()
-                            summary = item.get("summary", "").upper()
-                            
-                            for symbol in config.symbols:
-                                if symbol.upper() in headline or symbol.upper() in summary:
-                                    article_data = self._parse_news_item(item, symbol, "market_news")
-                                    if article_data:
-                                        relevant_news.append(article_data)
-                                    break
-                    except Exception as e:
-                        self.logger.warning(f"Error filtering market news: {str(e)}")
-                        continue
-                
-                # Limit results
-                collected_data = relevant_news[:config.max_items_per_symbol]
+            client = self._get_http_client()
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+            
+            news_data = response.json()
+            
+            if not isinstance(news_data, list):
+                self.logger.warning("Unexpected response format for market news")
+                return collected_data
+            
+            # Filter market news by date and relevance
+            relevant_news = []
+            for item in news_data:
+                try:
+                    news_time = datetime.fromtimestamp(item.get("datetime", 0), tz=timezone.utc)
+                    if config.date_range.start_date <= news_time <= config.date_range.end_date:
+                        # Check if news mentions any target symbols
+                        headline = item.get("headline", "").upper()
+                        summary = item.get("summary", "").upper()
+                        
+                        for symbol in config.symbols:
+                            if symbol.upper() in headline or symbol.upper() in summary:
+                                article_data = self._parse_news_item(item, symbol, "market_news")
+                                if article_data:
+                                    relevant_news.append(article_data)
+                                break
+                except Exception as e:
+                    self.logger.warning(f"Error filtering market news: {str(e)}")
+                    continue
+            
+            # Limit results
+            collected_data = relevant_news[:config.max_items_per_symbol]
             
             self.logger.info(f"Collected {len(collected_data)} relevant market news items")
             
@@ -374,22 +411,22 @@ class FinHubCollector(BaseCollector):
                 "token": self.api_key
             }
             
-            async with self._get_http_client() as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                
-                quote_data = response.json()
-                
-                return {
-                    "symbol": symbol.upper(),
-                    "current_price": quote_data.get("c"),
-                    "high": quote_data.get("h"),
-                    "low": quote_data.get("l"),
-                    "open": quote_data.get("o"),
-                    "previous_close": quote_data.get("pc"),
-                    "timestamp": utc_now().isoformat()
-                }
-                
+            client = self._get_http_client()
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+            
+            quote_data = response.json()
+            
+            return {
+                "symbol": symbol.upper(),
+                "current_price": quote_data.get("c"),
+                "high": quote_data.get("h"),
+                "low": quote_data.get("l"),
+                "open": quote_data.get("o"),
+                "previous_close": quote_data.get("pc"),
+                "timestamp": utc_now().isoformat()
+            }
+            
         except Exception as e:
             self.logger.error(f"Error getting quote for {symbol}: {str(e)}")
             return None
@@ -33,6 +33,7 @@ import asyncio
 import aiohttp
 from app.utils.timezone import utc_now
 from app.infrastructure.log_system import get_logger
+from app.infrastructure.http_transport import get_http_transport
 
 from .base_collector import (
     BaseCollector, 
@@ -93,9 +94,6 @@ class GDELTCollector(BaseCollector):
         """
         super().__init__(api_key=None, rate_limiter=rate_limiter)
         
-        # HTTP session for connection pooling
-        self._session: Optional[aiohttp.ClientSession] = None
-        
     @property
     def source(self) -> DataSource:
         return DataSource.GDELT
@@ -105,24 +103,18 @@ class GDELTCollector(BaseCollector):
         return False
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session with connection pooling"""
-        if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT)
-            connector = aiohttp.TCPConnector(limit=10, limit_per_host=5)
-            self._session = aiohttp.ClientSession(
-                timeout=timeout,
-                connector=connector,
-                headers={
-                    "User-Agent": "InsightStockDash/1.0 (Financial Sentiment Analysis)"
-                }
-            )
-        return self._session
+        """Get the shared, long-lived aiohttp session for the GDELT API"""
+        return await get_http_transport().aiohttp_session(
+            self.BASE_URL,
+            timeout=self.REQUEST_TIMEOUT,
+            headers={
+                "User-Agent": "InsightStockDash/1.0 (Financial Sentiment Analysis)"
+            }
+        )
     
     async def close(self):
-        """Close the HTTP session"""
-        if self._session and not self._session.closed:
-            await self._session.close()
-            self._session = None
+        """Nothing to close: the shared session is closed by DataPipeline.shutdown()"""
+        pass
     
     async def validate_connection(self) -> bool:
         """Validate connection to GDELT API"""
@@ -288,8 +280,9 @@ class GDELTCollector(BaseCollector):
             else:
                 query = f"{symbol} stock"
             
-            # Build date range for GDELT format (YYYYMMDDHHMMSS)
-            start_dt = config.date_range.start_date.strftime("%Y%m%d%H%M%S")
+            # Build date range for GDELT format (YYYYMMDDHHMMSS), from the
+            # symbol's high-water mark when known
+            start_dt = config.window_start(symbol).strftime("%Y%m%d%H%M%S")
             end_dt = config.date_range.end_date.strftime("%Y%m%d%H%M%S")
             
             # Build API parameters
@@ -24,8 +24,9 @@ from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Any, Optional, Set
 import asyncio
 import aiohttp
-from app.utils.timezone import utc_now
+from app.utils.timezone import ensure_utc, utc_now
 from app.infrastructure.log_system import get_logger
+from app.infrastructure.http_transport import get_http_transport
 
 from .base_collector import (
     BaseCollector, 
@@ -80,9 +81,6 @@ class HackerNewsCollector(BaseCollector):
             re.compile(r'\b([A-Z]{2,5})\b'),  # AAPL format (2-5 chars)
         ]
         
-        # HTTP session for connection pooling
-        self._session: Optional[aiohttp.ClientSession] = None
-        
     @property
     def source(self) -> DataSource:
         return DataSource.HACKERNEWS
@@ -92,17 +90,14 @@ class HackerNewsCollector(BaseCollector):
         return False
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session with connection pooling"""
-        if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT)
-            self._session = aiohttp.ClientSession(timeout=timeout)
-        return self._session
+        """Get the shared, long-lived aiohttp session for the Algolia HN API"""
+        return await get_http_transport().aiohttp_session(
+            self.BASE_URL, timeout=self.REQUEST_TIMEOUT
+        )
     
     async def close(self):
-        """Close the HTTP session"""
-        if self._session and not self._session.closed:
-            await self._session.close()
-            self._session = None
+        """Nothing to close: the shared session is closed by DataPipeline.shutdown()"""
+        pass
     
     async def validate_connection(self) -> bool:
         """Validate connection to Hacker News API"""
@@ -302,9 +297,9 @@ class HackerNewsCollector(BaseCollector):
             else:
                 query = symbol
             
-            # Build date filters
-            start_ts = int(config.date_range.start_date.timestamp())
-            end_ts = int(config.date_range.end_date.timestamp())
+            # Build date filters (from the symbol's high-water mark when known)
+            start_ts = int(ensure_utc(config.window_start(symbol)).timestamp())
+            end_ts = int(ensure_utc(config.date_range.end_date).timestamp())
             
             # Use search_by_date for recent items (more relevant for real-time)
             params = {
@@ -420,9 +415,9 @@ class HackerNewsCollector(BaseCollector):
             else:
                 query = symbol
             
-            # Build date filters
-            start_ts = int(config.date_range.start_date.timestamp())
-            end_ts = int(config.date_range.end_date.timestamp())
+            # Build date filters (from the symbol's high-water mark when known)
+            start_ts = int(ensure_utc(config.window_start(symbol)).timestamp())
+            end_ts = int(ensure_utc(config.date_range.end_date).timestamp())
             
             params = {
                 "query": query,
@@ -25,6 +25,7 @@ except ImportError:
 
 import httpx
 
+from app.infrastructure.http_transport import get_http_transport
 from .base_collector import (
     BaseCollector, 
     DataSource, 
@@ -93,17 +94,13 @@ class NewsAPICollector(BaseCollector):
         return True
     
     def _get_http_client(self) -> httpx.AsyncClient:
-        """Get HTTP client with connection pooling for better performance"""
-        return httpx.AsyncClient(
+        """Get the shared, long-lived HTTP client for NewsAPI (do not close it)"""
+        return get_http_transport().httpx_client(
+            self.base_url,
             timeout=30.0,
             headers={
                 "User-Agent": "InsightStockDash/1.0 (Financial News Collector)"
-            },
-            limits=httpx.Limits(
-                max_keepalive_connections=20,  # Keep 20 connections alive
-                max_connections=100,            # Max 100 total connections
-                keepalive_expiry=30.0           # Keep connections alive for 30s
-            )
+            }
         )
     
     async def validate_connection(self) -> bool:
@@ -116,39 +113,39 @@ class NewsAPICollector(BaseCollector):
                 "apiKey": self.api_key
             }
             
-            async with self._get_http_client() as client:
-                response = await client.get(url, params=params)
-                
-                if response.status_code == 200:
-                    self.logger.debug("NewsAPI connection validated successfully")
-                    return True
-                elif response.status_code == 401:
-                    error_msg = "Invalid API key - Please check your NewsAPI key in settings"
-                    self.logger.error(f"NewsAPI validation failed: {error_msg} (401 Unauthorized)")
-                    raise ValueError(error_msg)
-                elif response.status_code == 426:
-                    error_msg = "Upgrade required - Your NewsAPI plan doesn't support this endpoint"
-                    self.logger.error(f"NewsAPI validation failed: {error_msg} (426 Upgrade Required)")
-                    raise ValueError(error_msg)
-                elif response.status_code == 429:
-                    error_msg = "Rate limit exceeded - You've reached your daily request limit. Try again tomorrow or upgrade your NewsAPI plan"
-                    self.logger.error(f"NewsAPI validation failed: {error_msg} (429 Too Many Requests)")
-                    raise ValueError(error_msg)
-                elif response.status_code == 500:
-                    error_msg = "NewsAPI server error - Service temporarily unavailable"
-                    self.logger.error(f"NewsAPI validation failed: {error_msg} (500 Internal Server Error)")
-                    raise ValueError(error_msg)
-                else:
-                    error_msg = f"Unexpected error (HTTP {response.status_code})"
-                    try:
-                        error_data = response.json()
-                        api_message = error_data.get('message', 'Unknown error')
-                        error_msg = f"{error_msg}: {api_message}"
-                    except:
-                        pass
-                    self.logger.error(f"NewsAPI validation failed: {error_msg}")
-                    raise ValueError(error_msg)
-                
+            client = self._get_http_client()
+            response = await client.get(url, params=params)
+            
+            if response.status_code == 200:
+                self.logger.debug("NewsAPI connection validated successfully")
+                return True
+            elif response.status_code == 401:
+                error_msg = "Invalid API key - Please check your NewsAPI key in settings"
+                self.logger.error(f"NewsAPI validation failed: {error_msg} (401 Unauthorized)")
+                raise ValueError(error_msg)
+            elif response.status_code == 426:
+                error_msg = "Upgrade required - Your NewsAPI plan doesn't support this endpoint"
+                self.logger.error(f"NewsAPI validation failed: {error_msg} (426 Upgrade Required)")
+                raise ValueError(error_msg)
+            elif response.status_code == 429:
+                error_msg = "Rate limit exceeded - You've reached your daily request limit. Try again tomorrow or upgrade your NewsAPI plan"
+                self.logger.error(f"NewsAPI validation failed: {error_msg} (429 Too Many Requests)")
+                raise ValueError(error_msg)
+            elif response.status_code == 500:
+                error_msg = "NewsAPI server error - Service temporarily unavailable"
+                self.logger.error(f"NewsAPI validation failed: {error_msg} (500 Internal Server Error)")
+                raise ValueError(error_msg)
+            else:
+                error_msg = f"Unexpected error (HTTP {response.status_code})"
+                try:
+                    error_data = response.json()
+                    api_message = error_data.get('message', 'Unknown error')
+                    error_msg = f"{error_msg}: {api_message}"
+                except:
+                    pass
+                self.logger.error(f"NewsAPI validation failed: {error_msg}")
+                raise ValueError(error_msg)
+            
         except Exception as e:
             self.logger.error(
                 f"NewsAPI connection validation exception: {str(e)}",
@@ -256,7 +253,8 @@ class NewsAPICollector(BaseCollector):
             params = {
                 "q": query,
                 # No source filtering - let NewsAPI find from any available source
-                "from": config.date_range.start_date.strftime("%Y-%m-%d"),
+                # From the symbol's high-water mark when known (NewsAPI accepts a time)
+                "from": config.window_start(symbol).strftime("%Y-%m-%dT%H:%M:%S"),
                 "to": config.date_range.end_date.strftime("%Y-%m-%d"),
                 "sortBy": "relevancy",
                 "language": config.language,
@@ -264,37 +262,37 @@ class NewsAPICollector(BaseCollector):
                 "apiKey": self.api_key
             }
             
-            async with self._get_http_client() as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                
-                news_data = response.json()
-                articles = news_data.get("articles", [])
-                
-                for article in articles:
-                    try:
-                        # Pre-filter before creating RawData
-                        title = article.get("title") or ""
-                        description = article.get("description") or ""
-                        content = article.get("content") or ""
-                        full_text = f"{title} {description} {content}"
+            client = self._get_http_client()
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+            
+            news_data = response.json()
+            articles = news_data.get("articles", [])
+            
+            for article in articles:
+                try:
+                    # Pre-filter before creating RawData
+                    title = article.get("title") or ""
+                    description = article.get("description") or ""
+                    content = article.get("content") or ""
+                    full_text = f"{title} {description} {content}"
+                    
+                    # Skip obviously non-financial content
+                    if self._is_non_financial_content(full_text):
+                        self.logger.debug(f"Skipping non-financial article: {title[:50]}")
+                        continue
+                    
+                    article_data = self._parse_article(article, symbol, "symbol_news")
+                    if article_data:
+                        collected_data.append(article_data)
                         
-                        # Skip obviously non-financial content
-                        if self._is_non_financial_content(full_text):
-                            self.logger.debug(f"Skipping non-financial article: {title[:50]}")
-                            continue
+                    # Stop once we have enough
+                    if len(collected_data) >= config.max_items_per_symbol:
+                        break
                         
-                        article_data = self._parse_article(article, symbol, "symbol_news")
-                        if article_data:
-                            collected_data.append(article_data)
-                            
-                        # Stop once we have enough
-                        if len(collected_data) >= config.max_items_per_symbol:
-                            break
-                            
-                    except Exception as e:
-                        self.logger.warning(f"Error parsing article for {symbol}: {str(e)}")
-                        continue
+                except Exception as e:
+                    self.logger.warning(f"Error parsing article for {symbol}: {str(e)}")
+                    continue
             
             self.logger.info(f"Collected {len(collected_data)} news articles for {symbol}")
             
@@ -383,50 +381,50 @@ class NewsAPICollector(BaseCollector):
                 "apiKey": self.api_key
             }
             
-            async with self._get_http_client() as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                
-                news_data = response.json()
-                articles = news_data.get("articles", [])
-                
-                # Filter articles that mention target symbols - handle None values safely
-                for article in articles:
-                    try:
-                        # Safely handle None values
-                        title = article.get("title") or ""
-                        description = article.get("description") or ""
-                        content = article.get("content") or ""
-                        full_text = f"{title} {description} {content}"
-                        
-                        # Skip non-financial content
-                        if self._is_non_financial_content(full_text):
-                            continue
-                        
-                        title_upper = title.upper()
-                        description_upper = description.upper()
-                        content_upper = content.upper()
-                        
-                        # Check if article mentions any target symbols
-                        mentioned_symbols = []
-                        for symbol in config.symbols:
-                            symbol_upper = symbol.upper()
-                            if (symbol_upper in title_upper or 
-                                symbol_upper in description_upper or 
-                                symbol_upper in content_upper):
-                                mentioned_symbols.append(symbol)
-                        
-                        if mentioned_symbols:
-                            # Use first mentioned symbol
-                            article_data = self._parse_article(
-                                article, mentioned_symbols[0], "general_news"
-                            )
-                            if article_data:
-                                collected_data.append(article_data)
-                                
-                    except Exception as e:
-                        self.logger.debug(f"Skipping article due to error: {str(e)}")
+            client = self._get_http_client()
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+            
+            news_data = response.json()
+            articles = news_data.get("articles", [])
+            
+            # Filter articles that mention target symbols - handle None values safely
+            for article in articles:
+                try:
+                    # Safely handle None values
+                    title = article.get("title") or ""
+                    description = article.get("description") or ""
+                    content = article.get("content") or ""
+                    full_text = f"{title} {description} {content}"
+                    
+                    # Skip non-financial content
+                    if self._is_non_financial_content(full_text):
                         continue
+                    
+                    title_upper = title.upper()
+                    description_upper = description.upper()
+                    content_upper = content.upper()
+                    
+                    # Check if article mentions any target symbols
+                    mentioned_symbols = []
+                    for symbol in config.symbols:
+                        symbol_upper = symbol.upper()
+                        if (symbol_upper in title_upper or 
+                            symbol_upper in description_upper or 
+                            symbol_upper in content_upper):
+                            mentioned_symbols.append(symbol)
+                    
+                    if mentioned_symbols:
+                        # Use first mentioned symbol
+                        article_data = self._parse_article(
+                            article, mentioned_symbols[0], "general_news"
+                        )
+                        if article_data:
+                            collected_data.append(article_data)
+                            
+                except Exception as e:
+                    self.logger.debug(f"Skipping article due to error: {str(e)}")
+                    continue
             
             self.logger.info(f"Collected {len(collected_data)} general financial news articles")
             
@@ -505,13 +503,13 @@ class NewsAPICollector(BaseCollector):
                 "apiKey": self.api_key
             }
             
-            async with self._http_client as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                
-                sources_data = response.json()
-                return sources_data.get("sources", [])
-                
+            client = self._get_http_client()
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+            
+            sources_data = response.json()
+            return sources_data.get("sources", [])
+            
         except Exception as e:
             self.logger.error(f"Error getting sources: {str(e)}")
             return []
@@ -520,5 +518,5 @@ class NewsAPICollector(BaseCollector):
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._http_client:
-            await self._http_client.aclose()
\ No newline at end of file
+        # The HTTP client is shared; it is closed by DataPipeline.shutdown()
+        pass
\ No newline at end of file
@@ -23,6 +23,7 @@ from typing import List, Dict, Any, Optional
 import asyncio
 from app.utils.timezone import utc_now
 from app.infrastructure.log_system import get_logger
+from app.infrastructure.http_transport import get_http_transport
 
 try:
     import yfinance as yf
@@ -43,6 +44,9 @@ from .base_collector import (
 # Use centralized logging system
 logger = get_logger()
 
+# Host yfinance talks to, for the shared transport's per-host metrics
+YAHOO_HOST = "query2.finance.yahoo.com"
+
 
 class YFinanceCollector(BaseCollector):
     """
@@ -89,9 +93,18 @@ class YFinanceCollector(BaseCollector):
         return False
     
     async def close(self):
-        """Close any resources (no persistent connections needed for yfinance)"""
+        """Close any resources (the shared session is closed by DataPipeline.shutdown())"""
         pass
     
+    def _ticker(self, symbol: str):
+        """Create a Ticker on the shared Yahoo session (yfinance's own when curl_cffi is missing)"""
+        transport = get_http_transport()
+        transport.record_request(YAHOO_HOST, "yfinance")
+        session = transport.sync_session("yfinance")
+        if session is None:
+            return yf.Ticker(symbol)
+        return yf.Ticker(symbol, session=session)
+    
     async def validate_connection(self) -> bool:
         """Validate connection to Yahoo Finance by testing a simple query"""
         try:
@@ -99,7 +112,7 @@ class YFinanceCollector(BaseCollector):
             loop = asyncio.get_event_loop()
             
             def _test_connection():
-                ticker = yf.Ticker("AAPL")
+                ticker = self._ticker("AAPL")
                 news = ticker.news
                 return news is not None
             
@@ -238,7 +251,7 @@ class YFinanceCollector(BaseCollector):
             loop = asyncio.get_event_loop()
             
             def _get_news():
-                ticker = yf.Ticker(symbol)
+                ticker = self._ticker(symbol)
                 return ticker.news
             
             news_items = await loop.run_in_executor(None, _get_news)
@@ -352,7 +365,7 @@ class YFinanceCollector(BaseCollector):
             
             # Check if within date range
             if config.date_range:
-                start_date = config.date_range.start_date
+                start_date = config.window_start(symbol)
                 end_date = config.date_range.end_date
                 
                 # Make dates timezone-aware if needed
@@ -80,6 +80,9 @@ class Settings(BaseSettings):
     # Rate Limiting
     rate_limit_requests: int = 100
     rate_limit_window: int = 3600  # 1 hour in seconds
+    rate_limit_backend: str = "memory"  # memory, sqlite (shared by local workers), redis (uses redis_url)
+    rate_limit_sqlite_path: str = "./data/rate_limits.db"
+    rate_limit_max_clients: int = 10000  # Bound of the in-memory store
     
     # Security Headers
     enable_security_headers: bool = True
@@ -91,6 +94,17 @@ class Settings(BaseSettings):
     # CORS Settings
     allowed_origins: str = "http://localhost:3000,http://localhost:5173,http://localhost:8080,http://127.0.0.1:3000,http://127.0.0.1:8080"
     
+    # Deployment mode: single (this process runs the scheduler, price service and
+    # pipelines) or multi_worker (uvicorn --workers N; one elected leader runs them)
+    deployment_mode: str = "single"
+    leader_lock_path: str = "./data/leader.lock"
+    shared_state_path: str = "./data/shared_state.db"  # Leader state shared with the other workers
+    
+    # Pipeline execution: in_process (the leader runs pipelines itself) or
+    # worker (runs are queued for scripts/run_pipeline_worker.py processes)
+    pipeline_execution: str = "in_process"
+    pipeline_worker_shard_size: int = 0  # Symbols per queued job; 0 = one job per run
+    
     # Redis Configuration
     redis_url: str = "redis://localhost:6379/0"
     
@@ -102,6 +116,11 @@ class Settings(BaseSettings):
     ai_verification_mode: str = "low_confidence_and_neutral"  # none, low_confidence, neutral_only, low_confidence_and_neutral, all
     ai_confidence_threshold: float = 0.85
     
+    # Sentiment Model Inference
+    sentiment_quantize_int8: bool = False  # Dynamic INT8 FinBERT weights for CPU-only deployments
+    # Model startup: background (warm up after the API is serving), eager (load before serving), lazy (first use)
+    sentiment_startup_mode: str = "background"
+    
     def get_allowed_origins_list(self) -> List[str]:
         """Convert allowed_origins string to list."""
         if isinstance(self.allowed_origins, str):
@@ -0,0 +1,206 @@
+"""
+Event Bus
+=========
+
+In-process publish/subscribe for server-push to the admin UI.
+
+Pipeline progress and scheduler job events are published here and streamed
+to the browser over Server-Sent Events (/api/admin/events/stream), so the
+UI no longer has to poll status endpoints.
+
+- Every event gets a monotonically increasing sequence number (the SSE id)
+- The newest events are kept in a ring buffer, so a client reconnecting
+  with Last-Event-ID gets what it missed
+- publish() is synchronous and never blocks: a subscriber that falls
+  too far behind is told to resynchronize instead of stalling publishers
+"""
+
+import asyncio
+import itertools
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.utils.timezone import utc_now
+
+DEFAULT_BUFFER_SIZE = 1000
+SUBSCRIBER_QUEUE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class Event:
+    """A published event."""
+    seq: int
+    topic: str  # "pipeline", "jobs"
+    type: str
+    data: Dict[str, Any]
+    timestamp: str = field(default_factory=lambda: utc_now().isoformat())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "seq": self.seq,
+            "topic": self.topic,
+            "type": self.type,
+            "timestamp": self.timestamp,
+            "data": self.data,
+        }
+
+
+class _Subscription:
+    """Queue of events for one subscriber, bound to the subscriber's loop."""
+
+    def __init__(self, topics: Optional[Set[str]], loop: asyncio.AbstractEventLoop):
+        self.topics = topics
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self.overflowed = False
+
+    def wants(self, event: Event) -> bool:
+        return self.topics is None or event.topic in self.topics
+
+    def offer(self, event: Event) -> None:
+        # Runs on the subscriber's loop
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+
+class ResyncRequired(Exception):
+    """The subscriber missed events that are no longer buffered."""
+
+
+class EventBus:
+    """Sequence-numbered pub/sub with a replay buffer."""
+
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        self._buffer: Deque[Event] = deque(maxlen=buffer_size)
+        self._seq = itertools.count(1)
+        self._subscriptions: List[_Subscription] = []
+        self._lock = threading.Lock()
+
+    @property
+    def last_seq(self) -> int:
+        with self._lock:
+            return self._buffer[-1].seq if self._buffer else 0
+
+    def publish(self, topic: str, event_type: str, data: Optional[Dict[str, Any]] = None,
+                seq: Optional[int] = None, timestamp: Optional[str] = None) -> Event:
+        """
+        Publish an event to the buffer and every matching subscriber.
+
+        Safe to call from synchronous code and from other threads.
+
+        Args:
+            seq, timestamp: Keep those of an event relayed from elsewhere
+                (they must increase); numbered here when omitted
+        """
+        with self._lock:
+            if seq is None:
+                seq = next(self._seq)
+            else:
+                self._seq = itertools.count(seq + 1)
+            event = Event(seq=seq, topic=topic, type=event_type, data=data or {},
+                          timestamp=timestamp or utc_now().isoformat())
+            self._buffer.append(event)
+            subscriptions = [sub for sub in self._subscriptions if sub.wants(event)]
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        for sub in subscriptions:
+            if sub.loop is running_loop:
+                sub.offer(event)
+            elif not sub.loop.is_closed():
+                sub.loop.call_soon_threadsafe(sub.offer, event)
+        return event
+
+    def replay(self, after_seq: int, topics: Optional[Iterable[str]] = None) -> Tuple[List[Event], bool]:
+        """
+        Buffered events newer than after_seq.
+
+        Returns:
+            (events, complete); complete is False when events after after_seq
+            have already been evicted from the buffer
+        """
+        wanted = set(topics) if topics else None
+        with self._lock:
+            buffered = list(self._buffer)
+        complete = not buffered or buffered[0].seq <= after_seq + 1
+        events = [
+            event for event in buffered
+            if event.seq > after_seq and (wanted is None or event.topic in wanted)
+        ]
+        return events, complete
+
+    def recent(self, topic: str, limit: int) -> List[Event]:
+        """Newest buffered events of a topic, newest first."""
+        result = []
+        with self._lock:
+            for event in reversed(self._buffer):
+                if event.topic == topic:
+                    result.append(event)
+                    if len(result) >= limit:
+                        break
+        return result
+
+    async def subscribe(
+        self,
+        topics: Optional[Iterable[str]] = None,
+        after_seq: Optional[int] = None
+    ) -> AsyncIterator[Event]:
+        """
+        Stream events, first replaying buffered ones newer than after_seq.
+
+        Raises:
+            ResyncRequired: Events were missed (evicted from the buffer, or
+                the subscriber could not keep up); fetch a fresh snapshot
+        """
+        wanted = set(topics) if topics else None
+        sub = _Subscription(wanted, asyncio.get_running_loop())
+        with self._lock:
+            self._subscriptions.append(sub)
+        try:
+            last_seen = 0
+            if after_seq is not None:
+                events, complete = self.replay(after_seq, wanted)
+                if not complete:
+                    raise ResyncRequired()
+                for event in events:
+                    last_seen = event.seq
+                    yield event
+
+            while True:
+                event = await sub.queue.get()
+                if event.seq <= last_seen:
+                    continue  # Already replayed
+                last_seen = event.seq
+                yield event
+                if sub.overflowed and sub.queue.empty():
+                    raise ResyncRequired()
+        finally:
+            with self._lock:
+                self._subscriptions.remove(sub)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "last_seq": self._buffer[-1].seq if self._buffer else 0,
+                "buffered": len(self._buffer),
+                "subscribers": len(self._subscriptions),
+            }
+
+
+_event_bus: Optional[EventBus] = None
+
+
+def get_event_bus() -> EventBus:
+    """Get the process-wide event bus."""
+    global _event_bus
+    if _event_bus is None:
+        _event_bus = EventBus()
+    return _event_bus
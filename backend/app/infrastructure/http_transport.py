@@ -0,0 +1,385 @@
+"""
+HTTP Transport
+==============
+
+Process-wide, long-lived HTTP clients shared by the data collectors.
+
+Creating a client per request throws its connection pool away, so every
+symbol paid a fresh TCP + TLS handshake. Here each upstream host gets one
+pooled client that lives until DataPipeline.shutdown():
+
+- httpx clients (FinHub, NewsAPI) with HTTP/2 when the h2 package is
+  installed, per-host connection limits and cached DNS lookups
+- aiohttp sessions (HackerNews, GDELT) with per-host connection limits and
+  aiohttp's DNS cache
+- a shared curl_cffi session for yfinance when curl_cffi is installed
+- per-host request / new connection / reused connection counters
+
+Clients are bound to the event loop that created them; when called from a
+different loop (scripts calling asyncio.run repeatedly) a fresh client is
+created for that loop.
+"""
+
+import asyncio
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+import httpcore
+import httpx
+
+from app.infrastructure.log_system import get_logger
+
+logger = get_logger()
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+DNS_CACHE_TTL_SECONDS = 300
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 10
+KEEPALIVE_EXPIRY_SECONDS = 60.0
+DEFAULT_USER_AGENT = "InsightStockDash/1.0"
+
+# Upstream host -> max concurrent connections (kept below what each API tolerates)
+HOST_CONNECTION_LIMITS: Dict[str, int] = {
+    "finnhub.io": 10,
+    "newsapi.org": 5,
+    "hn.algolia.com": 10,
+    "api.gdeltproject.org": 5,
+}
+
+
+def host_of(url: str) -> str:
+    """Host part of a URL, or the value itself when it already is a host."""
+    return (urlsplit(url).hostname or url).lower()
+
+
+@dataclass
+class HostMetrics:
+    """Connection usage for one upstream host."""
+    client: str
+    requests: int = 0
+    new_connections: int = 0
+    reused_connections: int = 0
+    errors: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        connections = self.new_connections + self.reused_connections
+        return {
+            "client": self.client,
+            "requests": self.requests,
+            "new_connections": self.new_connections,
+            "reused_connections": self.reused_connections,
+            "reuse_rate": round(self.reused_connections / connections * 100, 1) if connections else 0.0,
+            "errors": self.errors,
+        }
+
+
+class DNSCache:
+    """Caches getaddrinfo results for DNS_CACHE_TTL_SECONDS."""
+
+    def __init__(self, ttl_seconds: float = DNS_CACHE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Tuple[str, int], Tuple[List[str], float]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def resolve(self, host: str, port: int) -> List[str]:
+        key = (host, port)
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[1] < self.ttl_seconds:
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            host, port, type=socket.SOCK_STREAM
+        )
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        self._entries[key] = (addresses, time.monotonic())
+        return addresses
+
+    def forget(self, host: str, port: int) -> None:
+        self._entries.pop((host, port), None)
+
+
+class _CachingDNSBackend(httpcore.AsyncNetworkBackend):
+    """
+    httpcore network backend that connects to cached addresses.
+
+    TLS still verifies against the original hostname, since httpcore passes
+    the origin host to start_tls() separately.
+    """
+
+    def __init__(self, backend: httpcore.AsyncNetworkBackend, dns_cache: DNSCache):
+        self._backend = backend
+        self._dns_cache = dns_cache
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        try:
+            addresses = await self._dns_cache.resolve(host, port)
+        except OSError:
+            addresses = []
+
+        for address in addresses:
+            try:
+                return await self._backend.connect_tcp(
+                    address, port, timeout=timeout,
+                    local_address=local_address, socket_options=socket_options
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout):
+                continue
+
+        # Cached addresses unreachable (or lookup failed): resolve afresh
+        self._dns_cache.forget(host, port)
+        return await self._backend.connect_tcp(
+            host, port, timeout=timeout,
+            local_address=local_address, socket_options=socket_options
+        )
+
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        return await self._backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+class HTTPTransportManager:
+    """Owns one pooled HTTP client per upstream host."""
+
+    def __init__(self):
+        self._httpx_clients: Dict[str, Tuple[httpx.AsyncClient, asyncio.AbstractEventLoop]] = {}
+        self._aiohttp_sessions: Dict[str, Tuple[aiohttp.ClientSession, asyncio.AbstractEventLoop]] = {}
+        self._sync_sessions: Dict[str, Any] = {}
+        self._sync_lock = threading.Lock()
+        self._metrics: Dict[str, HostMetrics] = {}
+        self._dns_cache = DNSCache()
+
+    def connection_limit(self, host: str) -> int:
+        return HOST_CONNECTION_LIMITS.get(host, DEFAULT_MAX_CONNECTIONS_PER_HOST)
+
+    def httpx_client(
+        self,
+        url: str,
+        timeout: float = 30.0,
+        headers: Optional[Dict[str, str]] = None
+    ) -> httpx.AsyncClient:
+        """
+        Get the shared httpx client for a URL's host.
+
+        The client is owned by the manager: use it directly, never in
+        ``async with`` (that would close it for every other caller).
+
+        Args:
+            url: Any URL on the upstream host (or the host itself)
+            timeout: Request timeout, applied when the client is created
+            headers: Default headers, applied when the client is created
+        """
+        host = host_of(url)
+        loop = asyncio.get_running_loop()
+        entry = self._httpx_clients.get(host)
+        if entry is not None and not entry[0].is_closed and entry[1] is loop:
+            return entry[0]
+
+        limit = self.connection_limit(host)
+        transport = httpx.AsyncHTTPTransport(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=limit,
+                max_keepalive_connections=limit,
+                keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS
+            ),
+            retries=1
+        )
+        pool = getattr(transport, "_pool", None)
+        if isinstance(pool, httpcore.AsyncConnectionPool):
+            pool._network_backend = _CachingDNSBackend(pool._network_backend, self._dns_cache)
+
+        metrics = self._host_metrics(host, "httpx")
+
+        async def _on_request(request: httpx.Request) -> None:
+            metrics.requests += 1
+            connected = False
+
+            async def _trace(event_name: str, info: Dict[str, Any]) -> None:
+                nonlocal connected
+                if event_name == "connection.connect_tcp.complete":
+                    connected = True
+                    metrics.new_connections += 1
+                elif event_name.endswith(".send_request_headers.started"):
+                    # Headers go out on a connection this request did not open
+                    if not connected:
+                        metrics.reused_connections += 1
+                    connected = False
+
+            request.extensions["trace"] = _trace
+
+        async def _on_response(response: httpx.Response) -> None:
+            if response.status_code >= 500 or response.status_code == 429:
+                metrics.errors += 1
+
+        client = httpx.AsyncClient(
+            transport=transport,
+            timeout=timeout,
+            headers={"User-Agent": DEFAULT_USER_AGENT, **(headers or {})},
+            event_hooks={"request": [_on_request], "response": [_on_response]}
+        )
+        self._httpx_clients[host] = (client, loop)
+        logger.debug(f"Created shared HTTP client for {host} (http2={HTTP2_AVAILABLE}, limit={limit})")
+        return client
+
+    async def aiohttp_session(
+        self,
+        url: str,
+        timeout: float = 30.0,
+        headers: Optional[Dict[str, str]] = None
+    ) -> aiohttp.ClientSession:
+        """
+        Get the shared aiohttp session for a URL's host.
+
+        Like httpx_client(), the session belongs to the manager and must not
+        be closed by the caller.
+        """
+        host = host_of(url)
+        loop = asyncio.get_running_loop()
+        entry = self._aiohttp_sessions.get(host)
+        if entry is not None and not entry[0].closed and entry[1] is loop:
+            return entry[0]
+
+        metrics = self._host_metrics(host, "aiohttp")
+        trace_config = aiohttp.TraceConfig()
+
+        async def _on_request_start(session, context, params) -> None:
+            metrics.requests += 1
+
+        async def _on_connection_create_end(session, context, params) -> None:
+            metrics.new_connections += 1
+
+        async def _on_connection_reuseconn(session, context, params) -> None:
+            metrics.reused_connections += 1
+
+        async def _on_request_exception(session, context, params) -> None:
+            metrics.errors += 1
+
+        trace_config.on_request_start.append(_on_request_start)
+        trace_config.on_connection_create_end.append(_on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(_on_connection_reuseconn)
+        trace_config.on_request_exception.append(_on_request_exception)
+
+        limit = self.connection_limit(host)
+        session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            connector=aiohttp.TCPConnector(
+                limit=limit,
+                limit_per_host=limit,
+                ttl_dns_cache=DNS_CACHE_TTL_SECONDS,
+                keepalive_timeout=KEEPALIVE_EXPIRY_SECONDS
+            ),
+            headers={"User-Agent": DEFAULT_USER_AGENT, **(headers or {})},
+            trace_configs=[trace_config]
+        )
+        self._aiohttp_sessions[host] = (session, loop)
+        logger.debug(f"Created shared aiohttp session for {host} (limit={limit})")
+        return session
+
+    def sync_session(self, name: str) -> Optional[Any]:
+        """
+        Get a shared curl_cffi session for blocking libraries (yfinance).
+
+        Returns None when curl_cffi is not installed, in which case the
+        library keeps its own session.
+        """
+        with self._sync_lock:
+            if name in self._sync_sessions:
+                return self._sync_sessions[name]
+            try:
+                from curl_cffi import requests as curl_requests
+                session = curl_requests.Session(impersonate="chrome")
+            except Exception:
+                session = None
+            self._sync_sessions[name] = session
+            return session
+
+    def record_request(self, host: str, client: str, error: bool = False) -> None:
+        """Count a request made through a client the manager cannot trace."""
+        metrics = self._host_metrics(host, client)
+        metrics.requests += 1
+        if error:
+            metrics.errors += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-host connection usage."""
+        hosts = {}
+        for host, metrics in self._metrics.items():
+            stats = metrics.to_dict()
+            stats["open"] = (
+                host in self._httpx_clients and not self._httpx_clients[host][0].is_closed
+            ) or (
+                host in self._aiohttp_sessions and not self._aiohttp_sessions[host][0].closed
+            )
+            stats["max_connections"] = self.connection_limit(host)
+            hosts[host] = stats
+        return {
+            "http2": HTTP2_AVAILABLE,
+            "dns_cache": {"hits": self._dns_cache.hits, "misses": self._dns_cache.misses},
+            "hosts": hosts
+        }
+
+    async def aclose(self) -> None:
+        """Close every client; later calls create new ones."""
+        httpx_clients, self._httpx_clients = self._httpx_clients, {}
+        aiohttp_sessions, self._aiohttp_sessions = self._aiohttp_sessions, {}
+        loop = asyncio.get_running_loop()
+
+        for host, (client, client_loop) in httpx_clients.items():
+            if client_loop is not loop:
+                continue
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP client for {host}: {e}")
+
+        for host, (session, session_loop) in aiohttp_sessions.items():
+            if session_loop is not loop:
+                continue
+            try:
+                await session.close()
+            except Exception as e:
+                logger.warning(f"Error closing aiohttp session for {host}: {e}")
+
+        with self._sync_lock:
+            sync_sessions, self._sync_sessions = self._sync_sessions, {}
+        for name, session in sync_sessions.items():
+            if session is not None:
+                try:
+                    session.close()
+                except Exception as e:
+                    logger.warning(f"Error closing {name} session: {e}")
+
+        logger.info("HTTP transport closed")
+
+    def _host_metrics(self, host: str, client: str) -> HostMetrics:
+        metrics = self._metrics.get(host)
+        if metrics is None:
+            metrics = self._metrics[host] = HostMetrics(client=client)
+        return metrics
+
+
+_http_transport: Optional[HTTPTransportManager] = None
+
+
+def get_http_transport() -> HTTPTransportManager:
+    """Get the process-wide HTTP transport manager."""
+    global _http_transport
+    if _http_transport is None:
+        _http_transport = HTTPTransportManager()
+    return _http_transport
@@ -13,9 +13,14 @@ This module follows the FYP security requirements with:
 from .auth_service import AuthService
 from .jwt_handler import JWTHandler
 from .security_utils import SecurityUtils
+from .token_cache import TokenVerificationCache, get_token_cache
+from .token_revocation import get_revocation_store
 
 __all__ = [
     "AuthService",
     "JWTHandler", 
     "SecurityUtils",
+    "TokenVerificationCache",
+    "get_token_cache",
+    "get_revocation_store",
 ]
\ No newline at end of file
@@ -19,6 +19,8 @@ from app.utils.timezone import utc_now
 
 from .jwt_handler import JWTHandler
 from .security_utils import SecurityUtils
+from .token_cache import CachedPrincipal, get_token_cache
+from .token_revocation import get_revocation_store
 from app.infrastructure.config.settings import Settings
 
 # Use centralized logging system
@@ -57,7 +59,7 @@ class AuthService:
             "admin@example.com": AdminUser("admin_1", "admin@example.com")
         }
     
-    async def validate_admin_token(self, token: str) -> Optional[AdminUser]:
+    async def validate_admin_token(self, token: str, event_stream: bool = False) -> Optional[AdminUser]:
         """
         Validate JWT token from frontend authentication
         
@@ -66,6 +68,8 @@ class AuthService:
         
         Args:
             token: JWT token from frontend
+            event_stream: Validate an event stream token (see
+                create_event_stream_token) instead of a session token
             
         Returns:
             AdminUser if token is valid, None otherwise
@@ -75,12 +79,35 @@ class AuthService:
             if token.startswith('Bearer '):
                 token = token[7:]
             
+            # Revocations by other workers are checked for cached tokens too,
+            # at most once per revocation_check_interval
+            token_cache = get_token_cache()
+            digest = token_cache.digest(token, self.settings.jwt_secret_key)
+            if token_cache.is_revoked(digest) or (
+                token_cache.revocation_check_due(digest) and await self._revoked_elsewhere(digest)
+            ):
+                logger.warning("Revoked JWT token provided")
+                return None
+            
+            # Tokens verified earlier are served from the cache; event stream
+            # tokens are never cached, so they are always verified in full
+            cached = token_cache.get(digest) if not event_stream else None
+            if cached is not None:
+                admin_user = AdminUser(cached.user_id, cached.email)
+                admin_user.last_login = utc_now()
+                return admin_user
+            
             # Verify token signature and expiration
             payload = self.jwt_handler.verify_token(token)
             if not payload:
                 logger.warning("Invalid JWT token provided")
                 return None
             
+            # Event stream tokens appear in URLs, so they open the stream and nothing else
+            if (payload.get("type") == "event_stream") != event_stream:
+                logger.warning(f"JWT token of type '{payload.get('type')}' used for the wrong endpoint")
+                return None
+            
             # Extract user information from token
             user_email = payload.get("sub") or payload.get("email")
             user_id = payload.get("user_id") or payload.get("sub")
@@ -95,6 +122,17 @@ class AuthService:
                 logger.warning(f"User {user_email} does not have admin permissions")
                 return None
             
+            # Re-checked whenever the cache entry goes stale, so removing an
+            # address from ADMIN_EMAILS revokes its sessions within max_age
+            admin_emails = [email.lower() for email in self.settings.admin_emails or []]
+            if admin_emails and str(user_email).lower() not in admin_emails:
+                logger.warning(f"User {user_email} is no longer a configured admin")
+                return None
+            
+            # Only tokens with an expiry are cached, and never past it
+            if not event_stream and isinstance(payload.get("exp"), (int, float)):
+                token_cache.put(digest, CachedPrincipal(str(user_id), str(user_email), float(payload["exp"])))
+            
             # Create or update admin user
             admin_user = AdminUser(user_id, user_email)
             admin_user.last_login = utc_now()
@@ -107,6 +145,76 @@ class AuthService:
             logger.error(f"Error validating admin token: {str(e)}")
             return None
     
+    def create_event_stream_token(self, admin_user: AdminUser) -> Dict[str, Any]:
+        """
+        Issue a short-lived token for opening the admin event stream
+        
+        Args:
+            admin_user: Authenticated admin requesting the stream
+            
+        Returns:
+            Dictionary with the token and its lifetime in seconds
+        """
+        token = self.jwt_handler.create_event_stream_token({
+            "sub": admin_user.email,
+            "user_id": admin_user.user_id,
+            "email": admin_user.email,
+            "permissions": ["admin"]
+        })
+        return {
+            "token": token,
+            "expires_in": self.jwt_handler.event_stream_token_expire_seconds
+        }
+    
+    async def revoke_token(self, token: str) -> bool:
+        """
+        Revoke a token before it expires (e.g. on logout)
+        
+        The token is dropped from the verification cache and rejected
+        until its exp passes, by this worker and (through the shared
+        revocation store) by the others.
+        
+        Args:
+            token: JWT token string
+            
+        Returns:
+            True if the token was valid and is now revoked, False otherwise
+        """
+        if token.startswith('Bearer '):
+            token = token[7:]
+        
+        payload = self.jwt_handler.verify_token(token)
+        if not payload or not isinstance(payload.get("exp"), (int, float)):
+            return False
+        
+        token_cache = get_token_cache()
+        digest = token_cache.digest(token, self.settings.jwt_secret_key)
+        token_cache.revoke(digest, float(payload["exp"]))
+        store = get_revocation_store()
+        if store is not None:
+            try:
+                await store.revoke(digest, float(payload["exp"]))
+            except Exception as e:
+                logger.warning(f"Token revocation not shared with other workers ({store.name} store failed): {e}")
+        logger.info(f"Token revoked for {payload.get('sub') or payload.get('email')}")
+        return True
+    
+    async def _revoked_elsewhere(self, digest: str) -> bool:
+        """Whether another worker revoked the token (recorded in the shared store)."""
+        store = get_revocation_store()
+        if store is None:
+            return False
+        try:
+            expires_at = await store.revoked_until(digest)
+        except Exception as e:
+            logger.warning(f"Token revocation store '{store.name}' failed, using local revocations: {e}")
+            return False
+        if expires_at is None:
+            return False
+        # Remember locally so this process stops serving the token from its cache
+        get_token_cache().revoke(digest, expires_at)
+        return True
+    
     async def get_admin_from_token(self, token: str) -> Optional[AdminUser]:
         """
         Get admin user from valid token
@@ -0,0 +1,321 @@
+"""
+Client Rate Limiter
+===================
+
+Per-client request limiting for the API, using GCRA (generic cell rate
+algorithm).
+
+The old limiter kept every request timestamp of every client IP for the
+whole window and never forgot IPs that stopped calling, so memory grew with
+traffic and with the number of distinct clients. It was also per-process:
+N uvicorn workers allowed N times the configured rate.
+
+GCRA stores a single float per client, its theoretical arrival time (TAT).
+A client may send `limit` requests in a burst, after which it gets one
+request per `window / limit` seconds. Once the TAT is in the past the state
+is identical to a fresh client, so idle clients can be dropped at any time.
+
+Stores:
+- memory: in-process, bounded; the default for single-worker deployments
+- sqlite: a small SQLite file shared by every worker on the host
+- redis: any Redis-compatible server (needs the redis package), shared
+  across hosts; keys expire on their own once idle
+
+A failing shared store never takes the API down: the limiter falls back to
+an in-process store and logs a warning.
+"""
+
+import asyncio
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from app.infrastructure.log_system import get_logger
+
+logger = get_logger()
+
+try:
+    import redis.asyncio as redis_asyncio
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis_asyncio = None
+    REDIS_AVAILABLE = False
+
+DEFAULT_MAX_CLIENTS = 10000
+SWEEP_EVERY = 1000  # Requests between sweeps of idle clients
+REDIS_KEY_PREFIX = "ratelimit:"
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """Outcome of one rate limit check."""
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float  # Seconds until the next request is allowed (0 when allowed)
+    reset_after: float  # Seconds until the client is back to a full burst
+
+
+def gcra(tat: Optional[float], now: float, limit: int, window: float) -> Tuple[bool, float, float]:
+    """
+    One GCRA step.
+
+    Args:
+        tat: Stored theoretical arrival time (None for an unknown client)
+        now: Current time, epoch seconds
+        limit: Requests allowed per window (also the burst size)
+        window: Window length in seconds
+
+    Returns:
+        (allowed, tat to store, retry_after)
+    """
+    interval = window / limit
+    tat = max(tat or now, now)
+    new_tat = tat + interval
+    allow_at = new_tat - window
+    if now < allow_at:
+        return False, tat, allow_at - now
+    return True, new_tat, 0.0
+
+
+def _decision(allowed: bool, tat: float, retry_after: float, now: float, limit: int, window: float) -> RateLimitDecision:
+    interval = window / limit
+    remaining = max(0, int(math.floor((now + window - tat) / interval + 1e-9)))
+    return RateLimitDecision(
+        allowed=allowed,
+        limit=limit,
+        remaining=remaining,
+        retry_after=retry_after,
+        reset_after=max(0.0, tat - now),
+    )
+
+
+class InMemoryRateLimitStore:
+    """Process-local store: one float per active client, bounded."""
+
+    name = "memory"
+
+    def __init__(self, max_clients: int = DEFAULT_MAX_CLIENTS):
+        self.max_clients = max_clients
+        self._tats: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._calls = 0
+
+    async def acquire(self, key: str, limit: int, window: float) -> RateLimitDecision:
+        now = time.time()
+        with self._lock:
+            allowed, tat, retry_after = gcra(self._tats.get(key), now, limit, window)
+            if allowed:
+                self._tats[key] = tat
+                self._tats.move_to_end(key)
+            self._calls += 1
+            if self._calls % SWEEP_EVERY == 0 or len(self._tats) > self.max_clients:
+                self._evict(now)
+        return _decision(allowed, tat, retry_after, now, limit, window)
+
+    def _evict(self, now: float) -> None:
+        # Clients are ordered by their last allowed request, so the idle ones
+        # (TAT in the past, indistinguishable from new clients) collect at the
+        # front. Popping from the front only keeps eviction amortized O(1);
+        # past the bound the least recently allowed client goes, idle or not
+        while self._tats:
+            key = next(iter(self._tats))
+            if self._tats[key] > now and len(self._tats) <= self.max_clients:
+                break
+            self._tats.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._tats)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class SQLiteRateLimitStore:
+    """Store shared by every worker on a host through one SQLite file."""
+
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS rate_limits (key TEXT PRIMARY KEY, tat REAL NOT NULL)")
+        self._lock = threading.Lock()
+        self._calls = 0
+
+    def _acquire_sync(self, key: str, limit: int, window: float) -> RateLimitDecision:
+        with self._lock:
+            now = time.time()
+            # IMMEDIATE takes the write lock up front, so read-modify-write
+            # is atomic across processes
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute("SELECT tat FROM rate_limits WHERE key = ?", (key,)).fetchone()
+                allowed, tat, retry_after = gcra(row[0] if row else None, now, limit, window)
+                if allowed:
+                    self._conn.execute(
+                        "INSERT INTO rate_limits (key, tat) VALUES (?, ?) "
+                        "ON CONFLICT(key) DO UPDATE SET tat = excluded.tat",
+                        (key, tat)
+                    )
+                self._calls += 1
+                if self._calls % SWEEP_EVERY == 0:
+                    self._conn.execute("DELETE FROM rate_limits WHERE tat <= ?", (now,))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return _decision(allowed, tat, retry_after, now, limit, window)
+
+    async def acquire(self, key: str, limit: int, window: float) -> RateLimitDecision:
+        return await asyncio.to_thread(self._acquire_sync, key, limit, window)
+
+    async def aclose(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# Same step as gcra(), run atomically on the server
+_REDIS_GCRA = """
+local now = tonumber(ARGV[1])
+local interval = tonumber(ARGV[2])
+local window = tonumber(ARGV[3])
+local tat = tonumber(redis.call('GET', KEYS[1]) or ARGV[1])
+if tat < now then tat = now end
+local new_tat = tat + interval
+local allow_at = new_tat - window
+if now < allow_at then
+    return {0, tostring(tat), tostring(allow_at - now)}
+end
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil((new_tat - now) * 1000))
+return {1, tostring(new_tat), '0'}
+"""
+
+
+class RedisRateLimitStore:
+    """Store in a Redis-compatible server; idle keys expire by themselves."""
+
+    name = "redis"
+
+    def __init__(self, url: str):
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("The redis package is required for the redis rate limit store")
+        self.url = url
+        self._client = redis_asyncio.from_url(url, socket_timeout=1.0)
+        self._script = self._client.register_script(_REDIS_GCRA)
+
+    async def acquire(self, key: str, limit: int, window: float) -> RateLimitDecision:
+        now = time.time()
+        allowed, tat, retry_after = await self._script(
+            keys=[REDIS_KEY_PREFIX + key],
+            args=[repr(now), repr(window / limit), repr(float(window))]
+        )
+        return _decision(bool(int(allowed)), float(tat), float(retry_after), now, limit, window)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+class ClientRateLimiter:
+    """
+    Rate limits clients against a pluggable store.
+
+    Falls back to a process-local store while the configured store is failing.
+    """
+
+    def __init__(self, store, limit: int, window: float, max_clients: int = DEFAULT_MAX_CLIENTS):
+        self.store = store
+        self.limit = limit
+        self.window = float(window)
+        self._fallback = store if isinstance(store, InMemoryRateLimitStore) else InMemoryRateLimitStore(max_clients)
+        self._store_errors = 0
+        self._allowed = 0
+        self._limited = 0
+
+    async def acquire(self, client_key: str) -> RateLimitDecision:
+        try:
+            decision = await self.store.acquire(client_key, self.limit, self.window)
+        except Exception as e:
+            self._store_errors += 1
+            if self._store_errors == 1 or self._store_errors % 100 == 0:
+                logger.warning(f"Rate limit store '{self.store.name}' failed, using in-process limits: {e}")
+            decision = await self._fallback.acquire(client_key, self.limit, self.window)
+
+        if decision.allowed:
+            self._allowed += 1
+        else:
+            self._limited += 1
+        return decision
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {
+            "store": self.store.name,
+            "limit": self.limit,
+            "window_seconds": self.window,
+            "allowed": self._allowed,
+            "limited": self._limited,
+            "store_errors": self._store_errors,
+        }
+        if isinstance(self.store, InMemoryRateLimitStore):
+            stats["tracked_clients"] = len(self.store)
+        return stats
+
+    async def aclose(self) -> None:
+        await self.store.aclose()
+
+
+def create_rate_limit_store(backend: str, redis_url: str = "", sqlite_path: str = "",
+                            max_clients: int = DEFAULT_MAX_CLIENTS):
+    """
+    Build the configured store, falling back to memory when it is unusable.
+
+    Args:
+        backend: "memory", "sqlite" or "redis"
+        redis_url: Server URL for the redis store
+        sqlite_path: Database file for the sqlite store
+        max_clients: Bound of the in-memory store
+    """
+    backend = (backend or "memory").lower()
+    try:
+        if backend == "redis":
+            return RedisRateLimitStore(redis_url)
+        if backend == "sqlite":
+            return SQLiteRateLimitStore(sqlite_path)
+        if backend != "memory":
+            logger.warning(f"Unknown rate limit backend '{backend}', using memory")
+    except Exception as e:
+        logger.warning(f"Rate limit backend '{backend}' unavailable, using memory: {e}")
+    return InMemoryRateLimitStore(max_clients)
+
+
+_client_rate_limiter: Optional[ClientRateLimiter] = None
+
+
+def get_client_rate_limiter() -> ClientRateLimiter:
+    """Get the process-wide API rate limiter, configured from settings."""
+    global _client_rate_limiter
+    if _client_rate_limiter is None:
+        from app.infrastructure.config.settings import get_settings
+        settings = get_settings()
+        store = create_rate_limit_store(
+            settings.rate_limit_backend,
+            redis_url=settings.redis_url,
+            sqlite_path=settings.rate_limit_sqlite_path,
+            max_clients=settings.rate_limit_max_clients
+        )
+        _client_rate_limiter = ClientRateLimiter(
+            store,
+            limit=settings.rate_limit_requests,
+            window=settings.rate_limit_window,
+            max_clients=settings.rate_limit_max_clients
+        )
+    return _client_rate_limiter
@@ -31,6 +31,7 @@ class JWTHandler:
         self.algorithm = "HS256"
         self.access_token_expire_minutes = 30
         self.refresh_token_expire_days = 7
+        self.event_stream_token_expire_seconds = 60
         
     def create_access_token(self, data: Dict[str, Any]) -> str:
         """
@@ -74,6 +75,31 @@ class JWTHandler:
         )
         return encoded_jwt
     
+    def create_event_stream_token(self, data: Dict[str, Any]) -> str:
+        """
+        Create a short-lived token for opening the admin event stream
+        
+        Browser EventSource cannot send an Authorization header, so the
+        token travels in the stream URL. It is typed "event_stream", which
+        the stream accepts and every other admin endpoint rejects.
+        
+        Args:
+            data: Token payload data
+            
+        Returns:
+            Encoded JWT token string
+        """
+        to_encode = data.copy()
+        expire = utc_now() + timedelta(seconds=self.event_stream_token_expire_seconds)
+        to_encode.update({"exp": expire, "type": "event_stream"})
+        
+        encoded_jwt = jwt.encode(
+            to_encode,
+            self.settings.jwt_secret_key,
+            algorithm=self.algorithm
+        )
+        return encoded_jwt
+    
     def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
         """
         Verify and decode JWT token
@@ -93,7 +119,7 @@ class JWTHandler:
             return payload
         except jwt.ExpiredSignatureError:
             return None
-        except jwt.JWTError:
+        except jwt.InvalidTokenError:
             return None
     
     def is_token_expired(self, token: str) -> bool:
@@ -117,7 +143,7 @@ class JWTHandler:
             if exp:
                 return utc_now() > datetime.fromtimestamp(exp)
             return True
-        except jwt.JWTError:
+        except jwt.InvalidTokenError:
             return True
     
     def get_token_subject(self, token: str) -> Optional[str]:
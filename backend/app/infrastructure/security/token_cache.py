@@ -0,0 +1,192 @@
+"""
+Token Verification Cache
+
+Admin dashboards poll several admin endpoints per second, and every request
+used to decode and verify its JWT from scratch. Verified tokens are cached
+here, so repeat requests with the same token cost a dictionary lookup.
+
+- Keyed by an HMAC of the token under the signing secret: raw tokens are
+  never held in memory, and rotating the secret orphans every entry
+- An entry never outlives its token's exp claim, nor max_age: past it the
+  token is verified again, including the admin-email check, so an admin
+  removed from the configuration loses access within max_age
+- Bounded; the least recently used entry is evicted first
+- Revoked tokens are remembered until they expire, so a revoked token is
+  rejected without being verified again; token_revocation.py shares the
+  revocations with the other workers. The shared store is asked about a
+  cached token at most once per revocation_check_interval, so a logout on
+  another worker takes effect within that interval without a store round
+  trip on every request
+"""
+
+import hashlib
+import hmac
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_MAX_AGE_SECONDS = 60.0
+DEFAULT_REVOCATION_CHECK_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class CachedPrincipal:
+    """Identity extracted from a verified token."""
+    user_id: str
+    email: str
+    expires_at: float  # Token exp, epoch seconds
+
+
+class _CacheEntry:
+    """A cached principal with the times it was verified and checked for revocation."""
+
+    __slots__ = ("principal", "stale_at", "revocation_checked_at")
+
+    def __init__(self, principal: CachedPrincipal, stale_at: float, revocation_checked_at: float):
+        self.principal = principal
+        self.stale_at = stale_at
+        self.revocation_checked_at = revocation_checked_at
+
+
+class TokenVerificationCache:
+    """Bounded LRU of verified tokens with explicit revocation."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_age: float = DEFAULT_MAX_AGE_SECONDS,
+        revocation_check_interval: float = DEFAULT_REVOCATION_CHECK_SECONDS
+    ):
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.revocation_check_interval = revocation_check_interval
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._revoked: Dict[str, float] = {}  # digest -> token exp
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def digest(token: str, secret: str) -> str:
+        return hmac.new(secret.encode(), token.encode(), hashlib.sha256).hexdigest()
+
+    def get(self, digest: str) -> Optional[CachedPrincipal]:
+        """Cached principal of a still-valid token, or None on a miss."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None and entry.stale_at <= now:
+                del self._entries[digest]
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self._hits += 1
+            return entry.principal
+
+    def put(self, digest: str, principal: CachedPrincipal) -> None:
+        """
+        Cache a verified token (ignored when already expired or revoked).
+
+        The caller has just checked the token for revocation, so the next
+        check is due a revocation_check_interval from now.
+        """
+        now = time.time()
+        if principal.expires_at <= now:
+            return
+        with self._lock:
+            if digest in self._revoked:
+                return
+            stale_at = min(principal.expires_at, now + self.max_age)
+            self._entries[digest] = _CacheEntry(principal, stale_at, now)
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def revocation_check_due(self, digest: str) -> bool:
+        """
+        Whether the shared revocation store should be asked about a token.
+
+        Always true for tokens that are not cached; for cached ones once per
+        revocation_check_interval. Marks the check as done, so concurrent
+        requests with the same token do not all query the store.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return True
+            if now - entry.revocation_checked_at < self.revocation_check_interval:
+                return False
+            entry.revocation_checked_at = now
+            return True
+
+    def is_revoked(self, digest: str) -> bool:
+        with self._lock:
+            expires_at = self._revoked.get(digest)
+            if expires_at is None:
+                return False
+            if expires_at <= time.time():
+                # The token is rejected as expired from now on
+                del self._revoked[digest]
+                return False
+            return True
+
+    def revoke(self, digest: str, expires_at: float) -> None:
+        """Drop a token from the cache and reject it until it expires."""
+        now = time.time()
+        with self._lock:
+            self._entries.pop(digest, None)
+            self._revoked = {d: exp for d, exp in self._revoked.items() if exp > now}
+            if expires_at > now:
+                self._revoked[digest] = expires_at
+
+    def invalidate_user(self, user_id: str) -> int:
+        """
+        Drop every cached token of a user, forcing full verification.
+
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            stale = [d for d, entry in self._entries.items() if entry.principal.user_id == user_id]
+            for d in stale:
+                del self._entries[d]
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._revoked.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "max_age_seconds": self.max_age,
+                "revocation_check_seconds": self.revocation_check_interval,
+                "revoked": len(self._revoked),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_token_cache: Optional[TokenVerificationCache] = None
+
+
+def get_token_cache() -> TokenVerificationCache:
+    """Get the process-wide token verification cache."""
+    global _token_cache
+    if _token_cache is None:
+        _token_cache = TokenVerificationCache()
+    return _token_cache
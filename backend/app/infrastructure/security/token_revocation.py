@@ -0,0 +1,137 @@
+"""
+Token Revocation Store
+
+Revoked tokens must be rejected by every worker, not only by the one that
+handled the logout. The digests of revoked tokens (see token_cache.py) are
+kept in the same shared store as the client rate limits
+(settings.rate_limit_backend), until the token would have expired anyway:
+
+- memory: nothing is shared; the process's token cache is the only record
+- sqlite: a revoked_tokens table next to the rate limits, shared by every
+  worker on the host
+- redis: one key per digest, expiring with the token
+
+A failing store does not take authentication down: revocations are still
+recorded in the process's token cache, and the failure is logged.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from app.infrastructure.log_system import get_logger
+from .client_rate_limiter import REDIS_AVAILABLE, redis_asyncio
+
+logger = get_logger()
+
+REDIS_KEY_PREFIX = "revoked:"
+
+
+class SQLiteRevocationStore:
+    """Revoked digests in a SQLite file shared by the workers on a host."""
+
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS revoked_tokens (digest TEXT PRIMARY KEY, expires_at REAL NOT NULL)"
+        )
+        self._lock = threading.Lock()
+
+    def _revoke_sync(self, digest: str, expires_at: float) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM revoked_tokens WHERE expires_at <= ?", (time.time(),))
+            self._conn.execute(
+                "INSERT INTO revoked_tokens (digest, expires_at) VALUES (?, ?) "
+                "ON CONFLICT(digest) DO UPDATE SET expires_at = excluded.expires_at",
+                (digest, expires_at)
+            )
+
+    def _revoked_until_sync(self, digest: str) -> Optional[float]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT expires_at FROM revoked_tokens WHERE digest = ? AND expires_at > ?",
+                (digest, time.time())
+            ).fetchone()
+        return row[0] if row else None
+
+    async def revoke(self, digest: str, expires_at: float) -> None:
+        await asyncio.to_thread(self._revoke_sync, digest, expires_at)
+
+    async def revoked_until(self, digest: str) -> Optional[float]:
+        """Expiry of the revoked token, or None when it is not revoked."""
+        return await asyncio.to_thread(self._revoked_until_sync, digest)
+
+    async def aclose(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RedisRevocationStore:
+    """Revoked digests in a Redis-compatible server; keys expire with the token."""
+
+    name = "redis"
+
+    def __init__(self, url: str):
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("The redis package is required for the redis revocation store")
+        self.url = url
+        self._client = redis_asyncio.from_url(url, socket_timeout=1.0)
+
+    async def revoke(self, digest: str, expires_at: float) -> None:
+        ttl_ms = int((expires_at - time.time()) * 1000)
+        if ttl_ms > 0:
+            await self._client.set(REDIS_KEY_PREFIX + digest, repr(expires_at), px=ttl_ms)
+
+    async def revoked_until(self, digest: str) -> Optional[float]:
+        """Expiry of the revoked token, or None when it is not revoked."""
+        value = await self._client.get(REDIS_KEY_PREFIX + digest)
+        return float(value) if value is not None else None
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+def create_revocation_store(backend: str, redis_url: str = "", sqlite_path: str = ""):
+    """
+    Build the shared store for the configured backend.
+
+    Returns:
+        The store, or None for the memory backend (or when the store is unusable)
+    """
+    backend = (backend or "memory").lower()
+    try:
+        if backend == "redis":
+            return RedisRevocationStore(redis_url)
+        if backend == "sqlite":
+            return SQLiteRevocationStore(sqlite_path)
+    except Exception as e:
+        logger.warning(f"Token revocation store '{backend}' unavailable, revocations stay in-process: {e}")
+    return None
+
+
+_revocation_store = None
+_revocation_store_created = False
+
+
+def get_revocation_store():
+    """Get the process-wide revocation store (None when revocations are not shared)."""
+    global _revocation_store, _revocation_store_created
+    if not _revocation_store_created:
+        from app.infrastructure.config.settings import get_settings
+        settings = get_settings()
+        _revocation_store = create_revocation_store(
+            settings.rate_limit_backend,
+            redis_url=settings.redis_url,
+            sqlite_path=settings.rate_limit_sqlite_path
+        )
+        _revocation_store_created = True
+    return _revocation_store
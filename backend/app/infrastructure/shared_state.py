@@ -0,0 +1,199 @@
+"""
+Shared State Store
+==================
+
+A small SQLite file through which the API workers of a multi-worker
+deployment share what only the leader process knows:
+
+- state: JSON snapshots keyed by name (leader heartbeat, scheduler jobs,
+  price service status)
+- events: the leader's event bus traffic, relayed by followers to their own
+  SSE subscribers
+- commands: actions a follower asks the leader to run (start a pipeline,
+  enable a job, ...), with their results
+
+It lives in its own file, not the application database, so frequent
+progress writes never contend with the pipeline's bulk inserts.
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+MAX_SHARED_EVENTS = 1000
+COMMAND_RETENTION_SECONDS = 3600
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT NOT NULL, updated_at REAL NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS events (seq INTEGER PRIMARY KEY AUTOINCREMENT, topic TEXT NOT NULL, "
+    "type TEXT NOT NULL, data TEXT NOT NULL, timestamp TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS commands (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, "
+    "payload TEXT NOT NULL, status TEXT NOT NULL DEFAULT 'pending', result TEXT, error TEXT, "
+    "created_at REAL NOT NULL, finished_at REAL)",
+)
+
+
+class SharedStateStore:
+    """State, event and command tables in one SQLite file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+        self._lock = threading.Lock()
+
+    def _run(self, fn, *args):
+        def call():
+            with self._lock:
+                return fn(*args)
+        return asyncio.to_thread(call)
+
+    # State snapshots
+
+    def _put(self, key: str, value: Any) -> None:
+        self._conn.execute(
+            "INSERT INTO state (key, value, updated_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at",
+            (key, json.dumps(value, default=str), time.time())
+        )
+
+    def _get(self, key: str) -> Tuple[Optional[Any], Optional[float]]:
+        row = self._conn.execute("SELECT value, updated_at FROM state WHERE key = ?", (key,)).fetchone()
+        return (json.loads(row[0]), row[1]) if row else (None, None)
+
+    async def put(self, key: str, value: Any) -> None:
+        await self._run(self._put, key, value)
+
+    async def get(self, key: str) -> Tuple[Optional[Any], Optional[float]]:
+        """Snapshot and the epoch time it was written (None, None when absent)."""
+        return await self._run(self._get, key)
+
+    # Events
+
+    def _append_events(self, events: List[Dict[str, Any]]) -> None:
+        if not events:
+            return
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.executemany(
+                "INSERT INTO events (topic, type, data, timestamp) VALUES (?, ?, ?, ?)",
+                [(e["topic"], e["type"], json.dumps(e["data"], default=str), e["timestamp"]) for e in events]
+            )
+            self._conn.execute(
+                "DELETE FROM events WHERE seq <= (SELECT MAX(seq) FROM events) - ?", (MAX_SHARED_EVENTS,)
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def _events_after(self, seq: int, limit: int) -> List[Dict[str, Any]]:
+        rows = self._conn.execute(
+            "SELECT seq, topic, type, data, timestamp FROM events WHERE seq > ? ORDER BY seq LIMIT ?",
+            (seq, limit)
+        ).fetchall()
+        return [
+            {"seq": row[0], "topic": row[1], "type": row[2], "data": json.loads(row[3]), "timestamp": row[4]}
+            for row in rows
+        ]
+
+    def _last_event_seq(self) -> int:
+        return self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM events").fetchone()[0]
+
+    async def append_events(self, events: List[Dict[str, Any]]) -> None:
+        await self._run(self._append_events, events)
+
+    async def events_after(self, seq: int, limit: int = 500) -> List[Dict[str, Any]]:
+        return await self._run(self._events_after, seq, limit)
+
+    async def last_event_seq(self) -> int:
+        return await self._run(self._last_event_seq)
+
+    # Commands
+
+    def _submit(self, name: str, payload: Dict[str, Any]) -> int:
+        cursor = self._conn.execute(
+            "INSERT INTO commands (name, payload, created_at) VALUES (?, ?, ?)",
+            (name, json.dumps(payload, default=str), time.time())
+        )
+        return cursor.lastrowid
+
+    def _claim(self, limit: int) -> List[Tuple[int, str, Dict[str, Any]]]:
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = self._conn.execute(
+                "SELECT id, name, payload FROM commands WHERE status = 'pending' ORDER BY id LIMIT ?", (limit,)
+            ).fetchall()
+            self._conn.executemany("UPDATE commands SET status = 'running' WHERE id = ?", [(row[0],) for row in rows])
+            self._conn.execute(
+                "DELETE FROM commands WHERE finished_at IS NOT NULL AND finished_at < ?",
+                (time.time() - COMMAND_RETENTION_SECONDS,)
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        return [(row[0], row[1], json.loads(row[2])) for row in rows]
+
+    def _finish(self, command_id: int, result: Any, error: Optional[str]) -> None:
+        self._conn.execute(
+            "UPDATE commands SET status = ?, result = ?, error = ?, finished_at = ? WHERE id = ?",
+            ("failed" if error else "done", json.dumps(result, default=str), error, time.time(), command_id)
+        )
+
+    def _command(self, command_id: int) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute(
+            "SELECT status, result, error FROM commands WHERE id = ?", (command_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {"status": row[0], "result": json.loads(row[1]) if row[1] else None, "error": row[2]}
+
+    def _abandon_running(self) -> int:
+        cursor = self._conn.execute(
+            "UPDATE commands SET status = 'failed', error = 'Leader exited before finishing', "
+            "finished_at = ? WHERE status = 'running'",
+            (time.time(),)
+        )
+        return cursor.rowcount
+
+    async def submit_command(self, name: str, payload: Dict[str, Any]) -> int:
+        return await self._run(self._submit, name, payload)
+
+    async def claim_commands(self, limit: int = 20) -> List[Tuple[int, str, Dict[str, Any]]]:
+        """Pending commands, marked running so no other process takes them."""
+        return await self._run(self._claim, limit)
+
+    async def finish_command(self, command_id: int, result: Any = None, error: Optional[str] = None) -> None:
+        await self._run(self._finish, command_id, result, error)
+
+    async def get_command(self, command_id: int) -> Optional[Dict[str, Any]]:
+        return await self._run(self._command, command_id)
+
+    async def abandon_running(self) -> int:
+        """Fail commands a previous leader claimed but never finished."""
+        return await self._run(self._abandon_running)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_shared_state: Optional[SharedStateStore] = None
+
+
+def get_shared_state() -> SharedStateStore:
+    """Get the process's handle on the shared state file."""
+    global _shared_state
+    if _shared_state is None:
+        from app.infrastructure.config.settings import get_settings
+        _shared_state = SharedStateStore(get_settings().shared_state_path)
+    return _shared_state
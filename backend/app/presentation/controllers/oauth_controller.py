@@ -6,14 +6,16 @@ FastAPI controller for OAuth2 authentication endpoints.
 Handles Google OAuth2 authentication flow for admin users.
 """
 
-from typing import Annotated
+from typing import Annotated, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
 from pydantic import BaseModel
 import httpx
 import structlog
 
 from app.infrastructure.security.auth_service import AuthService
 from app.infrastructure.config.settings import Settings, get_settings
+from app.presentation.dependencies.auth_dependencies import security
 
 
 logger = structlog.get_logger()
@@ -35,6 +37,11 @@ class OAuth2TokenResponse(BaseModel):
     user: dict
 
 
+class LogoutRequest(BaseModel):
+    """Logout request; the refresh token is revoked too when given"""
+    refresh_token: Optional[str] = None
+
+
 class TOTPVerificationRequest(BaseModel):
     """TOTP verification request"""
     email: str
@@ -151,6 +158,29 @@ async def google_oauth_callback(
         )
 
 
+@router.post("/auth/logout")
+async def logout(
+    credentials: Annotated[Optional[HTTPAuthorizationCredentials], Depends(security)],
+    settings: Annotated[Settings, Depends(get_settings)],
+    request: Optional[LogoutRequest] = None
+):
+    """
+    Revoke the caller's tokens
+    
+    The access token (and refresh token, if sent) stop being accepted
+    immediately instead of at their expiry.
+    """
+    auth_service = AuthService(settings)
+    revoked = 0
+    if credentials and await auth_service.revoke_token(credentials.credentials):
+        revoked += 1
+    if request and request.refresh_token and await auth_service.revoke_token(request.refresh_token):
+        revoked += 1
+    
+    logger.info("Admin logout", revoked_tokens=revoked)
+    return {"success": True, "revoked_tokens": revoked}
+
+
 @router.post("/auth/totp/verify", response_model=TOTPVerificationResponse)
 async def verify_totp(
     request: TOTPVerificationRequest,
@@ -16,7 +16,7 @@ Following FYP security requirements.
 
 from typing import Optional, Annotated
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from app.infrastructure.config.settings import Settings, get_settings
@@ -72,7 +72,50 @@ async def get_current_admin_user(
     
     # Validate token and get admin user
     admin_user = await auth_service.validate_admin_token(credentials.credentials)
+    return _require_active_admin(admin_user)
+
+
+async def get_event_stream_admin(
+    credentials: Annotated[Optional[HTTPAuthorizationCredentials], Depends(security)],
+    auth_service: Annotated[AuthService, Depends(get_auth_service)],
+    token: Annotated[Optional[str], Query(description="Event stream token from POST /api/admin/events/token")] = None
+) -> AdminUser:
+    """
+    Dependency for the admin event stream
+    
+    Browser EventSource cannot set an Authorization header, so besides the
+    usual Bearer token the stream accepts a short-lived event stream token
+    in the query string. Session tokens are not accepted there: URLs end
+    up in access logs and browser history.
     
+    Args:
+        credentials: HTTP Bearer token credentials
+        auth_service: Authentication service instance
+        token: Event stream token
+        
+    Returns:
+        AdminUser object if authentication successful
+        
+    Raises:
+        HTTPException: If authentication fails
+    """
+    if credentials:
+        return await get_current_admin_user(credentials, auth_service)
+    
+    if not token:
+        logger.warning("No event stream token provided")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentication required",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    admin_user = await auth_service.validate_admin_token(token, event_stream=True)
+    return _require_active_admin(admin_user)
+
+
+def _require_active_admin(admin_user: Optional[AdminUser]) -> AdminUser:
+    """Turn a failed or inactive validation into the matching HTTP error."""
     if not admin_user:
         logger.warning("Invalid or expired authentication token")
         raise HTTPException(
@@ -11,15 +11,19 @@ This module implements comprehensive security middleware including:
 Following FYP security requirements and best practices.
 """
 
-import time
-from typing import Dict
-from collections import defaultdict, deque
+import math
+from typing import Optional
 
 from fastapi import Request, Response, HTTPException
+from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.cors import CORSMiddleware
 
 from app.infrastructure.config.settings import Settings
+from app.infrastructure.security.client_rate_limiter import (
+    ClientRateLimiter,
+    InMemoryRateLimitStore,
+)
 from app.infrastructure.security.security_utils import SecurityUtils
 
 # Use centralized logging system
@@ -31,14 +35,19 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     """
     Rate limiting middleware to prevent API abuse
     
-    Implements sliding window rate limiter with per-IP tracking
+    Per-IP GCRA limits (see client_rate_limiter): constant memory per
+    active client, idle clients evicted, and an optional shared store so
+    every worker enforces the same limit
     """
     
-    def __init__(self, app, requests_per_window: int = 100, window_seconds: int = 3600):
+    def __init__(self, app, requests_per_window: int = 100, window_seconds: int = 3600,
+                 limiter: Optional[ClientRateLimiter] = None):
         super().__init__(app)
         self.requests_per_window = requests_per_window
         self.window_seconds = window_seconds
-        self.client_requests: Dict[str, deque] = defaultdict(deque)
+        self.limiter = limiter or ClientRateLimiter(
+            InMemoryRateLimitStore(), requests_per_window, window_seconds
+        )
     
     async def dispatch(self, request: Request, call_next):
         """Process request with rate limiting"""
@@ -52,25 +61,26 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             response = await call_next(request)
             return response
         
-        current_time = time.time()
-        
-        # Clean old requests outside the window
-        self.cleanup_old_requests(client_ip, current_time)
+        decision = await self.limiter.acquire(client_ip)
+        headers = {
+            "X-RateLimit-Limit": str(decision.limit),
+            "X-RateLimit-Remaining": str(decision.remaining),
+            "X-RateLimit-Reset": str(math.ceil(decision.reset_after)),
+        }
         
         # Check if client has exceeded rate limit
-        if len(self.client_requests[client_ip]) >= self.requests_per_window:
+        if not decision.allowed:
             logger.warning(f"Rate limit exceeded for IP: {client_ip}")
-            raise HTTPException(
+            headers["Retry-After"] = str(max(1, math.ceil(decision.retry_after)))
+            return JSONResponse(
                 status_code=429,
-                detail="Rate limit exceeded. Please try again later.",
-                headers={"Retry-After": str(self.window_seconds)}
+                content={"detail": "Rate limit exceeded. Please try again later."},
+                headers=headers
             )
         
-        # Add current request timestamp
-        self.client_requests[client_ip].append(current_time)
-        
         # Process request
         response = await call_next(request)
+        response.headers.update(headers)
         return response
     
     def get_client_ip(self, request: Request) -> str:
@@ -87,14 +97,6 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         
         # Direct connection
         return request.client.host if request.client else "unknown"
-    
-    def cleanup_old_requests(self, client_ip: str, current_time: float):
-        """Remove requests older than the time window"""
-        window_start = current_time - self.window_seconds
-        client_deque = self.client_requests[client_ip]
-        
-        while client_deque and client_deque[0] < window_start:
-            client_deque.popleft()
 
 
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
@@ -258,10 +260,12 @@ def setup_security_middleware(app, settings: Settings):
     app.add_middleware(InputValidationMiddleware, settings=settings)
     
     # Rate limiting (innermost)
+    from app.infrastructure.security.client_rate_limiter import get_client_rate_limiter
     app.add_middleware(
         RateLimitMiddleware,
         requests_per_window=settings.rate_limit_requests,
-        window_seconds=settings.rate_limit_window
+        window_seconds=settings.rate_limit_window,
+        limiter=get_client_rate_limiter()
     )
     
     # CORS
@@ -12,15 +12,19 @@ This module provides REST API endpoints for:
 - Data storage settings (U-FR9)
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, desc, and_, or_, delete, inspect
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 from app.utils.timezone import utc_now, to_naive_utc
 from app.data_access.database import get_db
-from app.presentation.dependencies.auth_dependencies import get_current_admin_user as get_current_admin
-from app.infrastructure.security.auth_service import AdminUser
+from app.presentation.dependencies.auth_dependencies import (
+    get_auth_service,
+    get_current_admin_user as get_current_admin,
+    get_event_stream_admin
+)
+from app.infrastructure.security.auth_service import AdminUser, AuthService
 from app.presentation.schemas.admin_schemas import (
     # Model accuracy schemas
     ModelAccuracyResponse,
@@ -142,8 +146,9 @@ async def trigger_manual_collection(
         )
         
         # Execute COMPLETE pipeline (Collection → Processing → Sentiment → Storage)
+        from app.business.worker_coordinator import get_worker_coordinator
         pipeline = DataPipeline()
-        result = await pipeline.run_pipeline(config)
+        result = await get_worker_coordinator().run_pipeline(pipeline, config)
         
         # Build comprehensive response
         response = {
@@ -342,6 +347,131 @@ async def run_benchmark_evaluation(
         )
 
 
+@router.post("/models/benchmark/configurations/run")
+async def run_configuration_benchmarks(
+    current_admin: AdminUser = Depends(get_current_admin)
+) -> Dict[str, Any]:
+    """
+    Compare accuracy and throughput across model configurations.
+
+    Runs single FinBERT and the FinBERT ensemble, with calibration on/off and
+    different thread counts, over Financial PhraseBank. Reports texts/sec,
+    batch latency percentiles, peak RSS and model load time per configuration.
+
+    Runs in the background; poll GET /models/benchmark/configurations/{job_id}
+    for progress and results.
+    """
+    try:
+        logger.info("Admin triggering configuration benchmarks", admin_user=current_admin.email)
+
+        from app.service.benchmark_service import get_benchmark_service
+
+        benchmark_service = get_benchmark_service()
+
+        if not benchmark_service.check_dataset_available():
+            dataset_info = benchmark_service.get_dataset_info()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Benchmark dataset not available: {dataset_info.get('message', 'Unknown error')}"
+            )
+
+        try:
+            job = benchmark_service.start_configuration_benchmarks()
+        except RuntimeError as e:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+        from dataclasses import asdict
+        return {
+            "success": True,
+            "message": "Configuration benchmarks started",
+            "job": asdict(job)
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error starting configuration benchmarks", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to start configuration benchmarks. Check server logs for details."
+        )
+
+
+@router.get("/models/benchmark/configurations/{job_id}")
+async def get_configuration_benchmarks_job(
+    job_id: str,
+    current_admin: AdminUser = Depends(get_current_admin)
+) -> Dict[str, Any]:
+    """Progress, and once finished the results, of a configuration benchmark sweep."""
+    from dataclasses import asdict
+    from app.service.benchmark_service import get_benchmark_service
+
+    job = get_benchmark_service().get_configuration_job(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Configuration benchmark job {job_id} not found"
+        )
+    return asdict(job)
+
+
+@router.post("/models/reprocess")
+async def start_sentiment_reprocessing(
+    with_ai: bool = Query(False, description="Verify uncertain predictions with Gemma"),
+    dry_run: bool = Query(False, description="Score without writing to the database"),
+    limit: Optional[int] = Query(None, ge=1, description="Maximum records to process"),
+    batch_size: int = Query(64, ge=1, le=1000, description="Records per batch"),
+    resume: bool = Query(True, description="Continue from the checkpoint of an interrupted run"),
+    current_admin: AdminUser = Depends(get_current_admin)
+) -> Dict[str, Any]:
+    """
+    Re-score stored sentiment data with the current model pipeline.
+
+    Runs in the background; poll GET /models/reprocess/status for progress.
+    """
+    from app.service.reprocessing_service import ReprocessingOptions, get_reprocessing_service
+
+    logger.info("Admin starting sentiment reprocessing",
+               admin_user=current_admin.email,
+               with_ai=with_ai,
+               dry_run=dry_run)
+    try:
+        return get_reprocessing_service().start(ReprocessingOptions(
+            batch_size=batch_size,
+            dry_run=dry_run,
+            with_ai=with_ai,
+            limit=limit,
+            resume=resume
+        ))
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+
+@router.get("/models/reprocess/status")
+async def get_sentiment_reprocessing_status(
+    current_admin: AdminUser = Depends(get_current_admin)
+) -> Dict[str, Any]:
+    """Progress of the current or last sentiment reprocessing run."""
+    from app.service.reprocessing_service import get_reprocessing_service
+    return get_reprocessing_service().get_progress()
+
+
+@router.post("/models/reprocess/cancel")
+async def cancel_sentiment_reprocessing(
+    current_admin: AdminUser = Depends(get_current_admin)
+) -> Dict[str, Any]:
+    """Stop the running reprocessing job after its in-flight batches; it can be resumed later."""
+    from app.service.reprocessing_service import get_reprocessing_service
+
+    if not get_reprocessing_service().cancel():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="No sentiment reprocessing run in progress"
+        )
+    logger.info("Admin cancelled sentiment reprocessing", admin_user=current_admin.email)
+    return {"success": True, "message": "Cancellation requested"}
+
+
 # U-FR7: API Configuration Management
 @router.get("/config/apis")
 async def get_api_configuration(
@@ -831,33 +961,14 @@ async def get_storage_metrics(
             auto_cleanup_enabled=True
         )
         
-        # Get actual database file size information
-        import os
+        # Database size as reported by the database itself (dbstat / pg_total_relation_size)
+        db_size_mb = metrics.storage_size_mb
+        db_size_gb = db_size_mb / 1024
         
-        try:
-            # Get actual database file size - backend/data/insight_stock.db
-            db_file_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), "data", "insight_stock.db")
-            if os.path.exists(db_file_path):
-                db_size_bytes = os.path.getsize(db_file_path)
-                db_size_gb = db_size_bytes / (1024 ** 3)
-                db_size_mb = db_size_bytes / (1024 ** 2)
-            else:
-                db_size_gb = 0.0
-                db_size_mb = 0.0
-            
-            # Set reasonable limits for database growth (configurable in production)
-            max_db_size_gb = 5.0  # 5GB limit for database
-            available_space_gb = max_db_size_gb - db_size_gb
-            usage_percentage = (db_size_gb / max_db_size_gb) * 100 if max_db_size_gb > 0 else 0
-            
-        except Exception as e:
-            logger.warning(f"Could not get database file size: {e}, using estimates")
-            # Fallback to estimates based on record counts
-            db_size_mb = metrics.storage_size_mb
-            db_size_gb = db_size_mb / 1024
-            max_db_size_gb = 5.0
-            available_space_gb = max_db_size_gb - db_size_gb
-            usage_percentage = (db_size_gb / max_db_size_gb) * 100 if max_db_size_gb > 0 else 0
+        # Set reasonable limits for database growth (configurable in production)
+        max_db_size_gb = 5.0  # 5GB limit for database
+        available_space_gb = max_db_size_gb - db_size_gb
+        usage_percentage = (db_size_gb / max_db_size_gb) * 100 if max_db_size_gb > 0 else 0
         
         return {
             "current_usage": {
@@ -956,6 +1067,7 @@ async def get_system_logs(
     end_date: Optional[str] = Query(None, description="End date filter (YYYY-MM-DD)"),
     limit: int = Query(100, ge=1, le=1000, description="Number of logs to return"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor (next_cursor of the previous page)"),
     db: AsyncSession = Depends(get_db),
     current_admin: AdminUser = Depends(get_current_admin)
 ) -> SystemLogsResponse:
@@ -1011,12 +1123,19 @@ async def get_system_logs(
             module=component,  # Map component to module (which filters by component column)
             search_term=search_term,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor
         )
         logs_data = await admin_service.get_system_logs(filters)
         
         return logs_data
         
+    except ValueError as e:
+        # Malformed pagination cursor
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error("Error retrieving system logs", error=str(e))
         raise HTTPException(
@@ -1032,23 +1151,31 @@ async def download_system_logs(
     component: Optional[str] = Query(None, description="Filter by component"),
     start_date: Optional[str] = Query(None, description="Start date filter (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="End date filter (YYYY-MM-DD)"),
-    db: AsyncSession = Depends(get_db),
+    format: str = Query("csv", pattern="^(csv|ndjson)$", description="Export format (csv or ndjson)"),
+    compress: bool = Query(False, description="Gzip the download"),
     current_admin: AdminUser = Depends(get_current_admin)
 ):
     """
-    Download system logs as CSV file - Simplified version.
+    Download system logs as a streamed CSV or NDJSON file.
     """
     try:
         from fastapi.responses import StreamingResponse
-        import csv
-        import io
         from datetime import datetime as dt
         from app.data_access.models import SystemLog
+        from app.service.export_service import export_filename, export_media_type, stream_export
         
         logger.info("Administrator initiated system logs export", admin_user=current_admin.email)
         
-        # Build direct database query
-        query = select(SystemLog).order_by(SystemLog.timestamp.desc())
+        # Project only the exported columns
+        query = select(
+            SystemLog.timestamp,
+            SystemLog.level,
+            SystemLog.component,
+            SystemLog.logger,
+            SystemLog.message,
+            SystemLog.function,
+            SystemLog.line_number
+        ).order_by(SystemLog.timestamp.desc())
         
         # Apply filters directly
         if level:
@@ -1066,43 +1193,20 @@ async def download_system_logs(
         # Limit for export
         query = query.limit(10000)
         
-        # Execute query
-        result = await db.execute(query)
-        logs = result.scalars().all()
-        
-        logger.info(f"Retrieved {len(logs)} logs for download")
-        
-        # Create CSV content
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        writer.writerow(['Timestamp', 'Level', 'Component', 'Logger', 'Message', 'Function', 'Line'])
-        
-        # Handle empty logs case
-        if not logs:
-            writer.writerow(['No logs found', '', '', '', 'No logs match the current filters', '', ''])
-        else:
-            # Write log entries directly from database models
-            for log in logs:
-                writer.writerow([
-                    log.timestamp.isoformat() if log.timestamp else '',
-                    log.level or '',
-                    log.component or '',
-                    log.logger or '',
-                    log.message or '',
-                    log.function or '',
-                    str(log.line_number) if log.line_number else ''
-                ])
-        
-        output.seek(0)
-        
         # Generate filename with timestamp using utc_now()
-        filename = f"system_logs_{utc_now().strftime('%Y%m%d_%H%M%S')}.csv"
+        filename = export_filename(f"system_logs_{utc_now().strftime('%Y%m%d_%H%M%S')}", format, compress)
         
         return StreamingResponse(
-            io.BytesIO(output.getvalue().encode('utf-8')),
-            media_type="text/csv",
+            stream_export(
+                query,
+                fieldnames=['timestamp', 'level', 'component', 'logger', 'message', 'function', 'line_number'],
+                fmt=format,
+                compress=compress,
+                csv_header=['Timestamp', 'Level', 'Component', 'Logger', 'Message', 'Function', 'Line'],
+                empty_row=['No logs found', '', '', '', 'No logs match the current filters', '', ''],
+                label="system logs export"
+            ),
+            media_type=export_media_type(format, compress),
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
         
@@ -1150,6 +1254,11 @@ async def clear_system_logs(
         await db.execute(delete_stmt)
         await db.commit()
         
+        from app.service.table_statistics_service import get_table_statistics_service
+        from app.data_access.repositories.system_log_repository import invalidate_log_counts
+        get_table_statistics_service().invalidate()
+        invalidate_log_counts()
+        
         logger.warning(f"System logs cleared by admin", 
                       admin_user=current_admin.email,
                       logs_deleted=logs_count,
@@ -1186,6 +1295,20 @@ async def get_system_status(
         system_service = SystemService(db)
         status_data = await system_service.get_system_status()
         
+        from app.infrastructure.security.token_cache import get_token_cache
+        from app.infrastructure.security.client_rate_limiter import get_client_rate_limiter
+        from app.business.worker_coordinator import get_worker_coordinator
+        status_data["auth_cache"] = get_token_cache().get_stats()
+        status_data["rate_limiter"] = get_client_rate_limiter().get_stats()
+        coordinator = get_worker_coordinator()
+        status_data["workers"] = coordinator.get_status()
+        status_data["pipeline_runs"] = await coordinator.leader_state("pipeline_runs")
+        from app.business.watchlist_observer import watchlist_dispatcher
+        status_data["watchlist_observers"] = watchlist_dispatcher.get_stats()
+        if coordinator.pipeline_workers:
+            from app.service.pipeline_job_queue import get_pipeline_job_queue
+            status_data["pipeline_jobs"] = await get_pipeline_job_queue().get_status()
+        
         return status_data
         
     except Exception as e:
@@ -1244,37 +1367,11 @@ async def get_scheduled_jobs(
     try:
         logger.info("Admin requesting scheduled jobs", admin_user=current_admin.email)
         
-        from app.business.scheduler import Scheduler
-        scheduler = Scheduler()
+        # The scheduler runs on the leader worker; followers see its last snapshot
+        from app.business.worker_coordinator import get_worker_coordinator
+        snapshot = await get_worker_coordinator().leader_state("scheduler")
         
-        jobs = scheduler.list_jobs()
-        
-        # Convert jobs to serializable format
-        jobs_data = []
-        for job in jobs:
-            jobs_data.append({
-                "job_id": job.job_id,
-                "name": job.name,
-                "job_type": job.job_type,
-                "trigger_config": job.trigger_config,
-                "parameters": job.parameters,
-                "status": job.status.value,
-                "created_at": job.created_at.isoformat(),
-                "last_run": job.last_run.isoformat() if job.last_run else None,
-                "next_run": job.next_run.isoformat() if job.next_run else None,
-                "run_count": job.run_count,
-                "error_count": job.error_count,
-                "last_error": job.last_error,
-                "enabled": job.enabled,
-                "today_run_count": getattr(job, 'today_run_count', 0),
-                "last_duration_seconds": getattr(job, 'last_duration_seconds', None)
-            })
-        
-        return {
-            "jobs": jobs_data,
-            "total_jobs": len(jobs_data),
-            "scheduler_running": scheduler._is_running
-        }
+        return snapshot or {"jobs": [], "total_jobs": 0, "scheduler_running": False}
         
     except Exception as e:
         logger.error("Error retrieving scheduled jobs", error=str(e))
@@ -1312,6 +1409,104 @@ async def get_job_events(
         )
 
 
+# Seconds between keep-alive comments on idle event streams
+EVENT_STREAM_HEARTBEAT_SECONDS = 15
+# Client reconnect delay advertised to EventSource
+EVENT_STREAM_RETRY_MS = 3000
+
+
+@router.post("/events/token")
+async def create_event_stream_token(
+    current_admin: AdminUser = Depends(get_current_admin),
+    auth_service: AuthService = Depends(get_auth_service)
+) -> Dict[str, Any]:
+    """
+    Issue a short-lived token for opening /events/stream with EventSource.
+    
+    EventSource cannot send the Authorization header, so the client passes
+    this token as ?token=... instead. Request a new one for each
+    (re)connect; it only opens the event stream.
+    """
+    return auth_service.create_event_stream_token(current_admin)
+
+
+@router.get("/events/stream")
+async def stream_events(
+    request: Request,
+    topics: Optional[str] = Query(None, description="Comma-separated topics (pipeline, jobs); all when omitted"),
+    last_event_id: Optional[int] = Query(None, ge=0, description="Resume after this event id (or send Last-Event-ID)"),
+    current_admin: AdminUser = Depends(get_event_stream_admin)
+):
+    """
+    Server-Sent Events stream of pipeline progress and scheduler job events.
+    
+    Replaces polling /pipeline/status and /scheduler/events. Each message has
+    the event sequence number as its id and the topic as its event name. In
+    multi_worker mode the ids come from the shared state store, so a client
+    can resume on any worker. A client resuming with an id that is no longer
+    buffered receives a "resync" event and should reload its state once.
+    
+    Authenticates with the Bearer header or, for browser EventSource, with
+    ?token= from POST /events/token.
+    """
+    from fastapi.responses import StreamingResponse
+    from app.business.worker_coordinator import get_worker_coordinator
+    from app.infrastructure.event_bus import ResyncRequired
+    import asyncio
+    import json
+    
+    resume_after = last_event_id
+    header_id = request.headers.get("last-event-id", "")
+    if resume_after is None and header_id.isdigit():
+        resume_after = int(header_id)
+    topic_list = [topic.strip() for topic in topics.split(",") if topic.strip()] if topics else None
+    bus = get_worker_coordinator().event_stream
+    
+    def _format(event_name: str, payload: Dict[str, Any], event_id: Optional[int] = None) -> str:
+        lines = [f"id: {event_id}"] if event_id is not None else []
+        lines.append(f"event: {event_name}")
+        lines.append(f"data: {json.dumps(payload, default=str)}")
+        return "\n".join(lines) + "\n\n"
+    
+    async def event_stream():
+        yield f"retry: {EVENT_STREAM_RETRY_MS}\n\n"
+        yield _format("ready", {"last_seq": bus.last_seq})
+        after = resume_after
+        while True:
+            subscription = bus.subscribe(topic_list, after)
+            next_event = None
+            try:
+                while True:
+                    if next_event is None:
+                        next_event = asyncio.ensure_future(subscription.__anext__())
+                    done, _ = await asyncio.wait({next_event}, timeout=EVENT_STREAM_HEARTBEAT_SECONDS)
+                    if not done:
+                        if await request.is_disconnected():
+                            return
+                        yield ": keep-alive\n\n"
+                        continue
+                    event = next_event.result()
+                    next_event = None
+                    yield _format(event.topic, event.to_dict(), event.seq)
+            except ResyncRequired:
+                yield _format("resync", {"last_seq": bus.last_seq})
+                after = None
+            finally:
+                # A pending read owns the generator: cancelling it runs the
+                # generator's cleanup; otherwise close the generator directly
+                if next_event is not None:
+                    next_event.cancel()
+                else:
+                    await subscription.aclose()
+    
+    logger.info("Admin opened event stream", admin_user=current_admin.email, topics=topic_list)
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/scheduler/history")
 async def get_scheduler_history(
     days: int = Query(7, ge=1, le=30, description="Number of days of history to retrieve"),
@@ -1383,23 +1578,22 @@ async def update_scheduled_job(
                    job_id=job_id,
                    action=action)
         
-        from app.business.scheduler import Scheduler
-        scheduler = Scheduler()
+        from app.business.worker_coordinator import get_worker_coordinator
         
-        if action == "enable":
-            success = scheduler.enable_job(job_id)
-            message = "Job enabled successfully"
-        elif action == "disable":
-            success = scheduler.disable_job(job_id)
-            message = "Job disabled successfully"
-        elif action == "cancel":
-            success = scheduler.cancel_job(job_id)
-            message = "Job cancelled successfully"
-        else:
+        messages = {
+            "enable": "Job enabled successfully",
+            "disable": "Job disabled successfully",
+            "cancel": "Job cancelled successfully"
+        }
+        if action not in messages:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Unknown action: {action}"
             )
+        message = messages[action]
+        
+        result = await get_worker_coordinator().call_leader("scheduler.job_action", job_id=job_id, action=action)
+        success = result["success"]
         
         if not success:
             logger.warning(f"Failed to {action} job {job_id} - job not found", 
@@ -1444,10 +1638,10 @@ async def get_job_status(
                    admin_user=current_admin.email,
                    job_id=job_id)
         
-        from app.business.scheduler import Scheduler
-        scheduler = Scheduler()
+        from app.business.worker_coordinator import get_worker_coordinator
+        snapshot = await get_worker_coordinator().leader_state("scheduler") or {}
         
-        job = scheduler.get_job_status(job_id)
+        job = next((job for job in snapshot.get("jobs", []) if job["job_id"] == job_id), None)
         
         if not job:
             raise HTTPException(
@@ -1455,21 +1649,7 @@ async def get_job_status(
                 detail=f"Job {job_id} not found"
             )
         
-        return {
-            "job_id": job.job_id,
-            "name": job.name,
-            "job_type": job.job_type,
-            "trigger_config": job.trigger_config,
-            "parameters": job.parameters,
-            "status": job.status.value,
-            "created_at": job.created_at.isoformat(),
-            "last_run": job.last_run.isoformat() if job.last_run else None,
-            "next_run": job.next_run.isoformat() if job.next_run else None,
-            "run_count": job.run_count,
-            "error_count": job.error_count,
-            "last_error": job.last_error,
-            "enabled": job.enabled
-        }
+        return job
         
     except HTTPException:
         raise
@@ -1494,10 +1674,8 @@ async def refresh_scheduled_jobs(
     try:
         logger.info("Admin refreshing scheduled jobs", admin_user=current_admin.email)
         
-        from app.business.scheduler import Scheduler
-        scheduler = Scheduler()
-        
-        await scheduler.refresh_scheduled_jobs()
+        from app.business.worker_coordinator import get_worker_coordinator
+        await get_worker_coordinator().call_leader("scheduler.refresh")
         
         return {
             "success": True,
@@ -1534,6 +1712,7 @@ async def get_collector_health(
         from sqlalchemy import select, func
         from datetime import timedelta
         from app.infrastructure.security.api_key_manager import SecureAPIKeyLoader
+        from app.infrastructure.http_transport import get_http_transport
         from fastapi import status as http_status
         
         collector_health = []
@@ -1647,7 +1826,8 @@ async def get_collector_health(
                 "error": len([c for c in collector_health if c["status"] == "error"]),
                 "coverage_percentage": coverage_percentage,
                 "total_items_24h": total_items
-            }
+            },
+            "http_transport": get_http_transport().get_stats()
         }
         
     except Exception as e:
@@ -1668,16 +1848,15 @@ async def start_realtime_price_service(
     try:
         logger.info("Admin starting real-time price service", admin_user=current_admin.email)
         
-        from app.service.price_service import price_service
+        from app.business.worker_coordinator import get_worker_coordinator
         
-        if price_service.is_running:
+        result = await get_worker_coordinator().call_leader("price_service.start")
+        if not result["started"]:
             return {
                 "success": False,
                 "message": "Real-time price service is already running"
             }
         
-        await price_service.start()
-        
         logger.info(f"Real-time price service started by admin {current_admin.email}")
         
         return {
@@ -1709,9 +1888,9 @@ async def get_realtime_price_service_status(
     try:
         logger.info("Admin requesting real-time price service status", admin_user=current_admin.email)
         
-        from app.service.price_service import price_service
+        from app.business.worker_coordinator import get_worker_coordinator
         
-        status_data = price_service.get_service_status()
+        status_data = await get_worker_coordinator().leader_state("price_service")
         
         return {
             "success": True,
@@ -1736,16 +1915,15 @@ async def stop_realtime_price_service(
     try:
         logger.info("Admin stopping real-time price service", admin_user=current_admin.email)
         
-        from app.service.price_service import price_service
+        from app.business.worker_coordinator import get_worker_coordinator
         
-        if not price_service.is_running:
+        result = await get_worker_coordinator().call_leader("price_service.stop")
+        if not result["stopped"]:
             return {
                 "success": False,
                 "message": "Real-time price service is not running"
             }
         
-        await price_service.stop()
-        
         logger.info(f"Real-time price service stopped by admin {current_admin.email}")
         
         return {
@@ -2276,30 +2454,34 @@ async def get_table_data(
 async def export_table_to_csv(
     table_name: str,
     limit: int = Query(10000, ge=1, le=100000, description="Maximum number of records to export"),
-    db: AsyncSession = Depends(get_db),
+    format: str = Query("csv", pattern="^(csv|ndjson)$", description="Export format (csv or ndjson)"),
+    compress: bool = Query(False, description="Gzip the download"),
     current_admin: AdminUser = Depends(get_current_admin)
 ):
     """
-    Export table data to CSV format for download.
+    Export table data for download, streamed as CSV (default) or NDJSON.
     
     Args:
         table_name: Name of the table to export
         limit: Maximum number of records to export (default 10000, max 100000)
+        format: csv or ndjson
+        compress: Gzip the stream
     """
     try:
-        logger.info("Admin exporting table to CSV", 
+        logger.info("Admin exporting table", 
                    admin_user=current_admin.email,
                    table_name=table_name,
-                   limit=limit)
+                   limit=limit,
+                   format=format,
+                   compress=compress)
         
         from app.data_access.models import (
             StocksWatchlist, SentimentData, StockPrice, NewsArticle,
             HackerNewsPost, SystemLog
         )
         from sqlalchemy import select
-        import csv
-        import io
         from fastapi.responses import StreamingResponse
+        from app.service.export_service import export_filename, export_media_type, stream_export
         
         # Define model mapping
         model_mapping = {
@@ -2318,9 +2500,10 @@ async def export_table_to_csv(
             )
         
         model = model_mapping[table_name]
+        columns = list(model.__table__.columns)
         
-        # Get data with limit
-        query = select(model).limit(limit)
+        # Plain column rows instead of ORM entities
+        query = select(*columns).limit(limit)
         
         # Add ordering by id or created_at if available
         if hasattr(model, 'created_at'):
@@ -2328,47 +2511,18 @@ async def export_table_to_csv(
         elif hasattr(model, 'id'):
             query = query.order_by(model.id.desc())
         
-        result = await db.execute(query)
-        records = result.scalars().all()
-        
-        # Create CSV in memory
-        output = io.StringIO()
-        
-        if records:
-            # Get column names from the first record
-            column_names = [column.name for column in model.__table__.columns]
-            writer = csv.DictWriter(output, fieldnames=column_names)
-            writer.writeheader()
-            
-            # Write data rows
-            for record in records:
-                row_dict = {}
-                for column_name in column_names:
-                    value = getattr(record, column_name)
-                    # Convert datetime objects to ISO strings
-                    if hasattr(value, 'isoformat'):
-                        value = value.isoformat()
-                    # Convert UUID objects to strings
-                    elif hasattr(value, 'hex'):
-                        value = str(value)
-                    # Handle None values
-                    elif value is None:
-                        value = ''
-                    row_dict[column_name] = value
-                writer.writerow(row_dict)
-        
-        # Prepare response
-        output.seek(0)
-        
-        logger.info(f"Exported {len(records)} records from {table_name} to CSV")
-        
-        from datetime import datetime
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{table_name}_{timestamp}.csv"
+        timestamp = utc_now().strftime('%Y%m%d_%H%M%S')
+        filename = export_filename(f"{table_name}_{timestamp}", format, compress)
         
         return StreamingResponse(
-            iter([output.getvalue()]),
-            media_type="text/csv",
+            stream_export(
+                query,
+                fieldnames=[column.name for column in columns],
+                fmt=format,
+                compress=compress,
+                label=f"{table_name} export"
+            ),
+            media_type=export_media_type(format, compress),
             headers={
                 "Content-Disposition": f"attachment; filename={filename}",
                 "Access-Control-Expose-Headers": "Content-Disposition"
@@ -2378,7 +2532,7 @@ async def export_table_to_csv(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error("Error exporting table to CSV", error=str(e))
+        logger.error("Error exporting table", error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to export table. Check server logs for details."
@@ -76,8 +76,8 @@ async def get_sentiment_history(
         end_date = to_naive_utc(utc_now())
         
         # Get sentiment and price data
-        sentiment_data = await sentiment_repo.get_sentiment_by_date_range(
-            symbol, start_date, end_date
+        sentiment_data = await sentiment_repo.get_sentiment_points_by_date_range(
+            symbol, start_date, end_date, limit=limit
         )
         
         # Build time series data points
@@ -265,7 +265,7 @@ async def _get_correlation_data(
     """Get paired sentiment and price data for correlation analysis"""
     
     # Get sentiment data
-    sentiment_records = await sentiment_repo.get_sentiment_by_date_range(
+    sentiment_records = await sentiment_repo.get_sentiment_points_by_date_range(
         symbol, start_date, end_date
     )
     
@@ -117,18 +117,16 @@ async def _get_market_sentiment_overview(
     # Get recent sentiment data (last 24 hours)
     cutoff_time = to_naive_utc(utc_now() - timedelta(hours=24))
     
-    # Calculate average sentiment across ACTIVE stocks only
-    all_recent_sentiments = await sentiment_repo.get_recent_sentiment_scores(
-        since=cutoff_time,
-        limit=1000
-    )
-    
     # Get active stocks to filter sentiments
     all_stocks = await stock_repo.get_all()
     active_stock_ids = {s.id for s in all_stocks if s.is_active}
     
-    # Filter sentiments to only include those from ACTIVE stocks
-    recent_sentiments = [s for s in all_recent_sentiments if s.stock_id in active_stock_ids]
+    # Calculate average sentiment across ACTIVE stocks only (filtered in the query)
+    recent_sentiments = await sentiment_repo.get_recent_sentiment_points(
+        since=cutoff_time,
+        limit=1000,
+        stock_ids=active_stock_ids
+    )
     
     if not recent_sentiments:
         # If no data in last 24 hours, try to get latest available sentiment data
@@ -137,14 +135,12 @@ async def _get_market_sentiment_overview(
         
         # Try fetching sentiment from last 7 days as fallback
         fallback_cutoff = to_naive_utc(utc_now() - timedelta(days=7))
-        fallback_sentiments = await sentiment_repo.get_recent_sentiment_scores(
+        recent_sentiments = await sentiment_repo.get_recent_sentiment_points(
             since=fallback_cutoff,
-            limit=1000
+            limit=1000,
+            stock_ids=active_stock_ids
         )
         
-        # Filter to active stocks only
-        recent_sentiments = [s for s in fallback_sentiments if s.stock_id in active_stock_ids]
-        
         if not recent_sentiments:
             # Still no data - return default values
             # Only count ACTIVE stocks (not deactivated ones)
@@ -230,7 +226,7 @@ async def _get_top_stocks_by_sentiment(
     for stock in active_stocks[:limit]:  # Limit processing for performance
         # Get 24h average sentiment instead of just latest point for stability
         cutoff_time = to_naive_utc(utc_now() - timedelta(hours=24))
-        sentiment_records = await sentiment_repo.get_sentiment_by_date_range(
+        sentiment_records = await sentiment_repo.get_sentiment_points_by_date_range(
             stock.symbol, cutoff_time, to_naive_utc(utc_now())
         )
         
@@ -380,7 +376,7 @@ async def _get_recent_price_movers(
             if abs(price_change) > 2.0:
                 # Get 24h average sentiment instead of just latest point for stability
                 cutoff_time = to_naive_utc(utc_now() - timedelta(hours=24))
-                sentiment_records = await sentiment_repo.get_sentiment_by_date_range(
+                sentiment_records = await sentiment_repo.get_sentiment_points_by_date_range(
                     stock.symbol, cutoff_time, to_naive_utc(utc_now())
                 )
                 
@@ -447,7 +443,7 @@ async def _get_recent_price_movers(
                 if abs(price_change) > 2.0:
                     # Get 24h average sentiment instead of just latest point for stability
                     cutoff_time = to_naive_utc(utc_now() - timedelta(hours=24))
-                    sentiment_records = await sentiment_repo.get_sentiment_by_date_range(
+                    sentiment_records = await sentiment_repo.get_sentiment_points_by_date_range(
                         stock.symbol, cutoff_time, to_naive_utc(utc_now())
                     )
                     
@@ -19,6 +19,7 @@ from app.utils.timezone import utc_now, to_naive_utc
 
 from ...business.pipeline import DataPipeline, PipelineConfig, PipelineResult, PipelineStatus
 from ...business.processor import ProcessingConfig
+from ...business.worker_coordinator import get_worker_coordinator
 from ...infrastructure.collectors.base_collector import DateRange
 from ...infrastructure.rate_limiter import RateLimitHandler
 from app.presentation.dependencies.auth_dependencies import get_current_admin_user as get_current_admin
@@ -148,8 +149,13 @@ async def run_pipeline(
     **Admin only** - Trigger manual pipeline execution with custom configuration.
     """
     try:
-        # Check if pipeline is already running
-        if pipeline.current_status == PipelineStatus.RUNNING:
+        # Check if pipeline is already running (on the leader or a pipeline worker when not here)
+        coordinator = get_worker_coordinator()
+        if coordinator.runs_pipelines_locally:
+            is_running = pipeline.current_status == PipelineStatus.RUNNING
+        else:
+            is_running = bool((coordinator.pipeline_state() or {}).get("is_running"))
+        if is_running:
             raise HTTPException(
                 status_code=409, 
                 detail="Pipeline is already running. Cancel current run first."
@@ -189,7 +195,7 @@ async def run_pipeline(
         
         # Start pipeline in background
         if background_tasks:
-            background_tasks.add_task(pipeline.run_pipeline, pipeline_config)
+            background_tasks.add_task(coordinator.run_pipeline, pipeline, pipeline_config)
             return {
                 "status": "started",
                 "message": "Pipeline execution started in background",
@@ -198,7 +204,7 @@ async def run_pipeline(
             }
         else:
             # Synchronous execution (not recommended for production)
-            result = await pipeline.run_pipeline(pipeline_config)
+            result = await coordinator.run_pipeline(pipeline, pipeline_config)
             return {
                 "status": "completed",
                 "pipeline_id": result.pipeline_id,
@@ -221,6 +227,19 @@ async def get_pipeline_status(
     **Admin only** - View current pipeline execution status and statistics.
     """
     try:
+        coordinator = get_worker_coordinator()
+        if not coordinator.runs_pipelines_locally:
+            # Runs happen on the leader or in pipeline workers; report the last published state
+            state = coordinator.pipeline_state() or {}
+            return PipelineStatusResponse(
+                status=state.get("status", PipelineStatus.IDLE.value),
+                is_running=state.get("is_running", False),
+                progress=state.get("progress"),
+                current_result=None,
+                available_collectors=list(pipeline.get_status()["available_collectors"]),
+                rate_limiter_status={}
+            )
+        
         status = pipeline.get_status()
         return PipelineStatusResponse(**status)
         
@@ -274,14 +293,13 @@ async def cancel_pipeline(
     **Admin only** - Stop pipeline execution gracefully.
     """
     try:
-        if pipeline.current_status != PipelineStatus.RUNNING:
+        result = await get_worker_coordinator().call_leader("pipeline.cancel")
+        if not result["cancelled"]:
             raise HTTPException(
                 status_code=409,
                 detail="No pipeline is currently running"
             )
         
-        pipeline.cancel_pipeline()
-        
         return {
             "status": "cancelled",
             "message": "Pipeline cancellation requested"
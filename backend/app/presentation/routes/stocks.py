@@ -34,6 +34,8 @@ from app.data_access.repositories import (
     SentimentDataRepository,
     StockPriceRepository
 )
+from app.service.quote_service import quote_service
+from app.service.watchlist_analytics_service import get_watchlist_analytics_service
 
 router = APIRouter(prefix="/api/stocks", tags=["stocks"])
 
@@ -82,11 +84,14 @@ async def get_stock_analysis_dashboard(
         # Get sentiment distribution for this stock
         sentiment_distribution = await _get_sentiment_distribution(sentiment_repo, symbol, start_date)
         
+        # Watchlist-wide aggregates are computed once per timeframe and shared
+        watchlist_snapshot = await get_watchlist_analytics_service().get_snapshot(timeframe, sentiment_repo)
+        
         # Get top sentiment performers (comparison with other stocks)
-        top_performers = await _get_top_sentiment_performers(stock_repo, sentiment_repo, start_date)
+        top_performers = watchlist_snapshot.top_performers
         
         # Get watchlist overview
-        watchlist_overview = await _get_watchlist_overview(stock_repo, sentiment_repo, price_repo, start_date)
+        watchlist_overview = _get_watchlist_overview(watchlist_snapshot)
         
         return {
             "symbol": symbol,
@@ -323,7 +328,7 @@ async def _get_sentiment_history(
 ) -> List[SentimentDataPoint]:
     """Get formatted sentiment history for the stock"""
     
-    sentiment_records = await sentiment_repo.get_sentiment_by_date_range(
+    sentiment_records = await sentiment_repo.get_sentiment_points_by_date_range(
         symbol, start_date, to_naive_utc(utc_now())
     )
     
@@ -395,46 +400,19 @@ def _calculate_standard_deviation(values: List[float]) -> float:
 async def _get_stock_overview(stock, sentiment_repo, price_repo, start_date):
     """Get stock overview metrics for the analysis dashboard"""
     
-    # Import Yahoo Finance for live data
-    import yfinance as yf
-    
-    current_price = 0.0
-    price_change_24h = 0.0
+    # Live price from the quote cache only; stale/missing quotes refresh in the background
+    quote = quote_service.get_cached(stock.symbol)
     
-    try:
-        # Fetch live data from Yahoo Finance
-        ticker = yf.Ticker(stock.symbol)
-        info = ticker.info
-        
-        # Get current/latest price
-        live_price = (
-            info.get('currentPrice') or
-            info.get('regularMarketPrice') or
-            info.get('previousClose')
-        )
-        
-        if live_price:
-            current_price = float(live_price)
-            
-            # Calculate 24-hour change
-            previous_close = float(info.get('previousClose', current_price))
-            if previous_close and previous_close > 0:
-                price_change_24h = ((current_price - previous_close) / previous_close) * 100
-                
-    except Exception as e:
-        # Fallback to database
-        latest_price = await price_repo.get_latest_price_for_stock(stock.symbol)
-        current_price = float(latest_price.close_price) if latest_price else 0.0
-        
-        # Get 24h price change
-        yesterday = to_naive_utc(utc_now() - timedelta(days=1))
-        yesterday_price = await price_repo.get_price_at_time(stock.symbol, yesterday)
-        
-        if yesterday_price and latest_price:
-            price_change_24h = ((current_price - float(yesterday_price.close_price)) / float(yesterday_price.close_price)) * 100
+    if quote is not None:
+        current_price = quote.current_price
+        price_change_24h = quote.change_percent
+    else:
+        # Not cached yet: last price written by the price service
+        current_price = float(stock.current_price) if stock.current_price else 0.0
+        price_change_24h = 0.0
     
     # Get average sentiment score
-    sentiment_records = await sentiment_repo.get_sentiment_by_date_range(
+    sentiment_records = await sentiment_repo.get_sentiment_points_by_date_range(
         stock.symbol, start_date, to_naive_utc(utc_now())
     )
     
@@ -480,7 +458,7 @@ async def _get_stock_overview(stock, sentiment_repo, price_repo, start_date):
 async def _get_sentiment_distribution(sentiment_repo, symbol, start_date):
     """Get sentiment distribution for pie chart"""
     
-    sentiment_records = await sentiment_repo.get_sentiment_by_date_range(
+    sentiment_records = await sentiment_repo.get_sentiment_points_by_date_range(
         symbol, start_date, to_naive_utc(utc_now())
     )
     
@@ -519,99 +497,26 @@ async def _get_sentiment_distribution(sentiment_repo, symbol, start_date):
     }
 
 
-async def _get_top_sentiment_performers(stock_repo, sentiment_repo, start_date):
-    """Get top sentiment performers for bar chart"""
-    
-    # Get all active stocks
-    active_stocks = await stock_repo.get_active_stocks()
-    
-    performers = []
-    
-    for stock in active_stocks:  # Check all active stocks
-        sentiment_records = await sentiment_repo.get_sentiment_by_date_range(
-            stock.symbol, start_date, to_naive_utc(utc_now())
-        )
-        
-        if sentiment_records:
-            sentiment_scores = [float(s.sentiment_score) for s in sentiment_records]
-            avg_sentiment = sum(sentiment_scores) / len(sentiment_scores)
-            
-            performers.append({
-                "symbol": stock.symbol,
-                "company_name": stock.name,
-                "sentiment_score": round(avg_sentiment, 3),
-                "data_points": len(sentiment_records)
-            })
-    
-    # Sort by sentiment score descending
-    performers.sort(key=lambda x: x["sentiment_score"], reverse=True)
-    
-    return performers[:5]  # Return top 5
-
-
-async def _get_watchlist_overview(stock_repo, sentiment_repo, price_repo, start_date):
-    """Get watchlist overview for table"""
-    
-    # Import Yahoo Finance for live data
-    import yfinance as yf
-    
-    # Get all active stocks
-    active_stocks = await stock_repo.get_active_stocks()
+def _get_watchlist_overview(watchlist_snapshot):
+    """Get watchlist overview for table (live prices overlaid from the quote cache)"""
     
     watchlist_data = []
     
-    for stock in active_stocks:
-        current_price = 0.0
-        price_change = 0.0
-        
-        try:
-            # Fetch live data from Yahoo Finance
-            ticker = yf.Ticker(stock.symbol)
-            info = ticker.info
-            
-            # Get current/latest price
-            live_price = (
-                info.get('currentPrice') or
-                info.get('regularMarketPrice') or
-                info.get('previousClose')
-            )
-            
-            if live_price:
-                current_price = float(live_price)
-                
-                # Calculate 24-hour change
-                previous_close = float(info.get('previousClose', current_price))
-                if previous_close and previous_close > 0:
-                    price_change = ((current_price - previous_close) / previous_close) * 100
-                    
-        except Exception as e:
-            # Fallback to database
-            latest_price = await price_repo.get_latest_price_for_stock(stock.symbol)
-            current_price = float(latest_price.close_price) if latest_price else 0.0
-            
-            # Get 24h price change
-            yesterday = to_naive_utc(utc_now() - timedelta(days=1))
-            yesterday_price = await price_repo.get_price_at_time(stock.symbol, yesterday)
-            
-            if yesterday_price and latest_price:
-                price_change = ((current_price - float(yesterday_price.close_price)) / float(yesterday_price.close_price)) * 100
-        
-        # Get sentiment
-        sentiment_records = await sentiment_repo.get_sentiment_by_date_range(
-            stock.symbol, start_date, to_naive_utc(utc_now())
-        )
-        
-        avg_sentiment = 0.0
-        if sentiment_records:
-            sentiment_scores = [float(s.sentiment_score) for s in sentiment_records]
-            avg_sentiment = sum(sentiment_scores) / len(sentiment_scores)
+    for stock in watchlist_snapshot.stocks:
+        quote = quote_service.get_cached(stock["symbol"])
+        if quote is not None:
+            current_price = quote.current_price
+            price_change = quote.change_percent
+        else:
+            current_price = stock["current_price"] or 0.0
+            price_change = 0.0
         
         watchlist_data.append({
-            "symbol": stock.symbol,
-            "company_name": stock.name,
+            "symbol": stock["symbol"],
+            "company_name": stock["company_name"],
             "price": round(current_price, 2),
             "change": round(price_change, 2),
-            "sentiment": round(avg_sentiment, 2),
+            "sentiment": round(stock["sentiment_score"], 2),
             "status": "Active"
         })
     
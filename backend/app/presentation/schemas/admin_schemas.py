@@ -196,7 +196,8 @@ class LogFilters(BaseModel):
     module: Optional[str] = Field(None, description="Module name filter")
     search_term: Optional[str] = Field(None, description="Search term in message")
     limit: int = Field(100, ge=1, le=1000, description="Maximum number of logs to return")
-    offset: int = Field(0, ge=0, description="Offset for pagination")
+    offset: int = Field(0, ge=0, description="Offset for pagination (ignored when cursor is set)")
+    cursor: Optional[str] = Field(None, description="Keyset cursor from the previous page's next_cursor")
 
 
 class SystemLogsResponse(BaseModel):
@@ -206,6 +207,7 @@ class SystemLogsResponse(BaseModel):
     filtered_count: int = Field(..., ge=0, description="Number of logs after filtering")
     filters_applied: LogFilters = Field(..., description="Applied filters")
     has_more: bool = Field(..., description="Whether there are more logs available")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page (None on the last page)")
 
 
 # System Management Schemas
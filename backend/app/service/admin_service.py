@@ -6,14 +6,15 @@ Business logic for admin panel operations.
 Implements FYP Report Phase 8 requirements U-FR6 through U-FR10.
 """
 
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
-import asyncio
 
 from app.utils.timezone import utc_now, ensure_utc, to_naive_utc
-from app.data_access.models import StocksWatchlist, SentimentData, StockPrice, SystemLog
+from app.data_access.models import StocksWatchlist, SentimentData, StockPrice
+from app.data_access.repositories.sentiment_repository import SentimentDataRepository
+from app.data_access.repositories.system_log_repository import SystemLogRepository
 from app.infrastructure.log_system import get_logger
 from app.presentation.schemas.admin_schemas import *
 from app.service.watchlist_service import get_watchlist_service, get_current_stock_symbols
@@ -22,9 +23,6 @@ from app.business.watchlist_observer import (
     WatchlistSubject, WatchlistEvent, WatchlistEventType, observer_manager
 )
 
-if TYPE_CHECKING:
-    from app.business.pipeline import DataPipeline, PipelineConfig
-
 
 logger = get_logger()
 
@@ -67,12 +65,11 @@ class AdminService(WatchlistSubject):
             thirty_days_ago = to_naive_utc(utc_now() - timedelta(days=30))
             
             # Query sentiment data for accuracy calculation
-            result = await self.db.execute(
-                select(SentimentData)
-                .where(SentimentData.created_at >= thirty_days_ago)
-                .limit(5000)  # Increased sample for better per-source stats
+            # Only the columns the metrics read (no raw_text / metadata)
+            recent_sentiment_data = await SentimentDataRepository(self.db).get_recent_sentiment_points(
+                since=thirty_days_ago,
+                limit=5000  # Increased sample for better per-source stats
             )
-            recent_sentiment_data = result.scalars().all()
             
             # All data is now processed by FinBERT-Tone
             finbert_data = recent_sentiment_data  # All records use FinBERT-Tone
@@ -763,11 +760,11 @@ class AdminService(WatchlistSubject):
                 }
             )
             
-            # Notify all observers
+            # Queue for observers; bulk edits are delivered as one debounced diff
             await self.notify(event)
             
             self.logger.info(
-                "Watchlist observers notified",
+                "Watchlist observers notification queued",
                 action=action,
                 symbol=symbol,
                 event_type=event_type.value,
@@ -853,44 +850,40 @@ class AdminService(WatchlistSubject):
             
             # Real logs will now be automatically written to database by LogSystem
             
-            # Build query for system logs
-            query = select(SystemLog).order_by(SystemLog.timestamp.desc())
+            log_repo = SystemLogRepository(self.db)
             
             # Apply filters
+            level_names = None
             if filters.level:
                 level_order = {"DEBUG": 0, "INFO": 1, "WARNING": 2, "ERROR": 3, "CRITICAL": 4}
                 min_level = level_order.get(filters.level.value, 0)
                 # Filter for logs at or above the specified level
                 level_names = [level for level, order in level_order.items() if order >= min_level]
-                query = query.where(SystemLog.level.in_(level_names))
             
-            if filters.start_time:
-                query = query.where(SystemLog.timestamp >= filters.start_time)
-            
-            if filters.end_time:
-                query = query.where(SystemLog.timestamp <= filters.end_time)
-                
-            if filters.logger:
-                from app.utils.sql import escape_like
-                query = query.where(SystemLog.logger.ilike(f"%{escape_like(filters.logger)}%"))
-                
-            if filters.module:
-                from app.utils.sql import escape_like
-                query = query.where(SystemLog.component.ilike(f"%{escape_like(filters.module)}%"))
-                
-            if filters.search_term:
-                from app.utils.sql import escape_like
-                query = query.where(SystemLog.message.ilike(f"%{escape_like(filters.search_term)}%"))
+            conditions = log_repo.build_conditions(
+                levels=level_names,
+                start_time=filters.start_time,
+                end_time=filters.end_time,
+                logger_name=filters.logger,
+                component=filters.module,
+                search_term=filters.search_term
+            )
             
-            # Get total count for filtered results
-            count_query = select(func.count()).select_from(query.subquery())
-            total_result = await self.db.execute(count_query)
-            filtered_count = total_result.scalar()
+            # Keyset page (cursor) or offset page for the first page / legacy clients
+            system_logs, next_cursor = await log_repo.get_page(
+                conditions, filters.limit, cursor=filters.cursor, offset=filters.offset
+            )
             
-            # Apply pagination
-            paginated_query = query.offset(filters.offset).limit(filters.limit)
-            result = await self.db.execute(paginated_query)
-            system_logs = result.scalars().all()
+            # Counts are cached briefly so paging does not rescan the table
+            total_count = await log_repo.count([])
+            if conditions:
+                filter_key = (
+                    tuple(level_names or ()), filters.start_time, filters.end_time,
+                    filters.logger, filters.module, filters.search_term
+                )
+                filtered_count = await log_repo.count(conditions, cache_key=filter_key)
+            else:
+                filtered_count = total_count
             
             # Convert SystemLog models to LogEntry schemas
             from app.utils.timezone import utc_to_malaysia, malaysia_now
@@ -924,17 +917,13 @@ class AdminService(WatchlistSubject):
                     extra_data=log.extra_data
                 ))
             
-            # Get total count of all logs (unfiltered)
-            total_count_query = select(func.count()).select_from(SystemLog)
-            total_count_result = await self.db.execute(total_count_query)
-            total_count = total_count_result.scalar()
-            
             return SystemLogsResponse(
                 logs=log_entries,
                 total_count=total_count,
                 filtered_count=filtered_count,
                 filters_applied=filters,
-                has_more=filters.offset + filters.limit < filtered_count
+                has_more=next_cursor is not None,
+                next_cursor=next_cursor
             )
             
         except Exception as e:
@@ -989,27 +978,30 @@ class AdminService(WatchlistSubject):
                 include_comments=True
             )
             
-            # Create job ID for tracking
-            job_id = f"manual_job_{int(utc_now().timestamp())}"
-            
-            # Start pipeline execution as background task
-            asyncio.create_task(
-                self._execute_manual_collection(pipeline, symbols, job_id, config)
-            )
+            # Hand the run to the leader's run coordinator; an overlapping
+            # request joins or merges with it and gets the same run id
+            from app.business.worker_coordinator import get_worker_coordinator
+            run = await get_worker_coordinator().submit_pipeline(pipeline, config, source="manual")
+            job_id = run["run_id"]
+            coalesced = len(run["requesters"]) > 1
             
             self.logger.info(
-                f"Manual data collection job {job_id} started",
+                f"Manual data collection job {job_id} {'coalesced' if coalesced else run['state']}",
                 symbols_count=len(symbols),
                 sources=selected_sources,
                 days_back=days_back
             )
             
+            if coalesced:
+                message = f"Manual data collection merged into pipeline run {job_id} ({run['state']})"
+            else:
+                message = f"Manual data collection initiated for {len(symbols)} symbols using {len(selected_sources)} sources"
             return ManualDataCollectionResponse(
                 success=True,
                 job_id=job_id,
                 estimated_completion="5-10 minutes",
-                symbols_targeted=symbols,
-                message=f"Manual data collection initiated for {len(symbols)} symbols using {len(selected_sources)} sources"
+                symbols_targeted=run["symbols"] or symbols,
+                message=message
             )
             
         except Exception as e:
@@ -1031,13 +1023,10 @@ class AdminService(WatchlistSubject):
             last_24_hours = to_naive_utc(utc_now() - timedelta(hours=24))
             self.logger.info(f"Querying for data since: {last_24_hours}")
             
-            result = await self.db.execute(
-                select(SentimentData)
-                .where(SentimentData.created_at >= last_24_hours)
-                .order_by(SentimentData.created_at.desc())
-                .limit(2000)  # Increased for per-source analysis
+            latest_sentiment_data = await SentimentDataRepository(self.db).get_recent_sentiment_points(
+                since=last_24_hours,
+                limit=2000  # Increased for per-source analysis
             )
-            latest_sentiment_data = result.scalars().all()
             self.logger.info(f"Found {len(latest_sentiment_data)} records in last 24 hours")
             
             if not latest_sentiment_data:
@@ -1264,37 +1253,3 @@ class AdminService(WatchlistSubject):
         except Exception as e:
             self.logger.error(f"Error calculating per-source metrics", extra={"error": str(e)})
             return {}
-    
-    async def _execute_manual_collection(
-        self, 
-        pipeline: 'DataPipeline', 
-        symbols: List[str], 
-        job_id: str,
-        config: Optional['PipelineConfig'] = None
-    ):
-        """
-        Execute manual data collection in background.
-        
-        Args:
-            pipeline: DataPipeline instance
-            symbols: List of stock symbols to process
-            job_id: Unique job identifier
-            config: Optional PipelineConfig with source selections
-        """
-        try:
-            self.logger.info(f"Starting manual collection job {job_id}")
-            
-            # Execute pipeline for each symbol with config
-            if config:
-                # Use run method with config for source filtering
-                results = await pipeline.run(config)
-            else:
-                # Fallback to batch processing without config
-                results = await pipeline.process_stock_batch(symbols)
-            
-            self.logger.info(f"Manual collection job {job_id} completed successfully", 
-                           results={"processed_stocks": len(symbols), "job_id": job_id})
-            
-        except Exception as e:
-            self.logger.error(f"Manual collection job {job_id} failed", extra={"error": str(e), "job_id": job_id})
-            raise
\ No newline at end of file
@@ -6,17 +6,22 @@ Service for running sentiment model benchmarks on Financial PhraseBank dataset.
 Provides real-time accuracy evaluation that can be triggered from the admin dashboard.
 """
 
+import asyncio
 import torch
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Callable
 import time
+import uuid
+import numpy as np
 import pandas as pd
 import os
+import sys
 import json
+import tempfile
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 
 from app.infrastructure.log_system import get_logger
+from app.service.sentiment_processing.models.model_registry import get_model_registry
 from app.utils.timezone import utc_now, to_iso_string
 
 logger = get_logger()
@@ -31,6 +36,68 @@ class ClassMetrics:
     support: int
 
 
+@dataclass
+class ThroughputMetrics:
+    """Speed and resource usage measured for one benchmark configuration."""
+    batch_size: int
+    num_threads: int
+    model_load_seconds: float
+    inference_seconds: float
+    texts_per_second: float
+    batch_latency_p50_ms: float
+    batch_latency_p90_ms: float
+    batch_latency_p99_ms: float
+    rss_mb: Optional[float]
+
+
+@dataclass
+class BenchmarkConfiguration:
+    """
+    One model setup to evaluate in a throughput sweep.
+    
+    Attributes:
+        name: Label shown in the results
+        model: "finbert" for single ProsusAI/finbert, "ensemble" for EnsembleFinBERTModel
+        use_calibration: Apply temperature scaling before softmax
+        num_threads: torch intra-op threads (None keeps the current setting)
+        batch_size: Texts per forward pass
+        quantize: Use dynamic INT8 weights (CPU only)
+    """
+    name: str
+    model: str = "finbert"
+    use_calibration: bool = False
+    num_threads: Optional[int] = None
+    batch_size: int = 32
+    quantize: bool = False
+
+
+@dataclass
+class ConfigurationResult:
+    """Accuracy and throughput for one benchmark configuration."""
+    configuration: Dict[str, Any]
+    accuracy: float
+    macro_f1: float
+    weighted_f1: float
+    avg_confidence: float
+    ai_verification_candidates_percent: float
+    throughput: Dict[str, Any]
+    # Filled for INT8 configurations when the FP32 twin ran in the same sweep
+    accuracy_delta_vs_fp32: Optional[float] = None
+    speedup_vs_fp32: Optional[float] = None
+
+
+@dataclass
+class ConfigurationBenchmarkJob:
+    """A configuration sweep running in the background."""
+    job_id: str
+    status: str = "running"  # running, completed, failed
+    progress: Dict[str, Any] = field(default_factory=dict)
+    results: Optional[List[Dict[str, Any]]] = None
+    error: Optional[str] = None
+    started_at: str = field(default_factory=lambda: to_iso_string(utc_now()))
+    finished_at: Optional[str] = None
+
+
 @dataclass
 class BenchmarkResult:
     """Complete benchmark result."""
@@ -50,11 +117,15 @@ class BenchmarkResult:
     avg_confidence: float
     comparison_with_previous: Optional[Dict[str, Any]] = None
     ai_verification: Optional[Dict[str, Any]] = None
+    throughput: Optional[Dict[str, Any]] = None
+    configuration_benchmarks: Optional[Dict[str, Any]] = None
 
 
 class ModelBenchmarkService:
     """Service for benchmarking sentiment analysis models."""
     
+    BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    
     BENCHMARK_FILE = os.path.join(
         os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
         "data", "benchmark_results.json"
@@ -72,12 +143,35 @@ class ModelBenchmarkService:
     
     # ProsusAI/finbert label mapping: 0=positive, 1=negative, 2=neutral
     LABEL_MAP = {0: "positive", 1: "negative", 2: "neutral"}
+    CLASSES = ["positive", "negative", "neutral"]
+    CLASS_INDEX = {label: i for i, label in enumerate(CLASSES)}
+    
+    MAX_LENGTH = 128
+    DEFAULT_BATCH_SIZE = 32
+    CALIBRATION_TEMPERATURE = 1.5
+    
+    # Configurations compared by run_configuration_benchmarks() when none are given
+    DEFAULT_CONFIGURATIONS = [
+        BenchmarkConfiguration(name="FinBERT", model="finbert"),
+        BenchmarkConfiguration(name="FinBERT (calibrated)", model="finbert", use_calibration=True),
+        BenchmarkConfiguration(name="FinBERT (1 thread)", model="finbert", num_threads=1),
+        BenchmarkConfiguration(name="FinBERT Ensemble", model="ensemble"),
+        BenchmarkConfiguration(name="FinBERT Ensemble (calibrated)", model="ensemble", use_calibration=True),
+        BenchmarkConfiguration(name="FinBERT (INT8)", model="finbert", quantize=True),
+        BenchmarkConfiguration(name="FinBERT Ensemble (INT8)", model="ensemble", quantize=True),
+    ]
     
     def __init__(self):
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         self.model = None
         self.tokenizer = None
         self._is_loaded = False
+        self._model_load_seconds = 0.0
+        self._model_handle = None
+        self._quantized_handle = None
+        self._quantized_load_seconds = 0.0
+        self._configuration_job: Optional[ConfigurationBenchmarkJob] = None
+        self._configuration_task: Optional[asyncio.Task] = None
     
     def _get_ai_config(self) -> Dict[str, Any]:
         """Load AI verification config from collector_config.json."""
@@ -112,14 +206,27 @@ class ModelBenchmarkService:
         logger.info("Loading ProsusAI/finbert model for benchmark...", 
                    extra={"device": str(self.device)})
         
-        self.tokenizer = AutoTokenizer.from_pretrained("ProsusAI/finbert")
-        self.model = AutoModelForSequenceClassification.from_pretrained("ProsusAI/finbert")
-        self.model.to(self.device)
-        self.model.eval()
+        # Shared with the sentiment engine; near-instant if the API already loaded it
+        load_start = time.perf_counter()
+        self._model_handle = get_model_registry().acquire("ProsusAI/finbert", self.device)
+        self.tokenizer = self._model_handle.tokenizer
+        self.model = self._model_handle.model
+        self._model_load_seconds = time.perf_counter() - load_start
         self._is_loaded = True
         
         logger.info("Model loaded successfully for benchmarking")
     
+    def _release_models(self) -> None:
+        """Drop registry references; the weights stay warm for the next run."""
+        registry = get_model_registry()
+        registry.release(self._model_handle)
+        registry.release(self._quantized_handle)
+        self._model_handle = None
+        self._quantized_handle = None
+        self.model = None
+        self.tokenizer = None
+        self._is_loaded = False
+    
     def _load_phrasebank(self) -> List[Tuple[str, str]]:
         """Load Financial PhraseBank dataset."""
         if not os.path.exists(self.PHRASEBANK_FILE):
@@ -129,95 +236,222 @@ class ModelBenchmarkService:
             )
         
         df = pd.read_csv(self.PHRASEBANK_FILE)
-        samples = [(row['text'], row['label'].lower()) for _, row in df.iterrows()]
+        samples = list(zip(df['text'].astype(str).tolist(), df['label'].str.lower().tolist()))
         
         logger.info(f"Loaded {len(samples)} samples from Financial PhraseBank",
                    extra={"distribution": df['label'].value_counts().to_dict()})
         
         return samples
     
-    def _predict(self, text: str) -> Tuple[str, float, Dict[str, float]]:
-        """Get prediction for a single text."""
-        encodings = self.tokenizer(
-            text,
-            truncation=True,
-            padding=True,
-            max_length=128,
-            return_tensors='pt'
-        )
+    def _finbert_members(self, model: Any = None, tokenizer: Any = None) -> List[Dict[str, Any]]:
+        """Describe a FinBERT (the loaded FP32 one by default) in the member format EnsembleFinBERTModel uses."""
+        return [{
+            'name': "ProsusAI/finbert",
+            'model': model if model is not None else self.model,
+            'tokenizer': tokenizer if tokenizer is not None else self.tokenizer,
+            'weight': 1.0,
+            'label_map': {label: label for label in self.LABEL_MAP.values()}
+        }]
+    
+    def _length_buckets(self, lengths: np.ndarray, batch_size: int) -> List[np.ndarray]:
+        """
+        Group sample indices into batches of similar token length.
         
-        with torch.no_grad():
-            outputs = self.model(
-                input_ids=encodings['input_ids'].to(self.device),
-                attention_mask=encodings['attention_mask'].to(self.device)
-            )
-            probs = torch.softmax(outputs.logits, dim=-1)[0]
+        Sorting by length before batching keeps dynamic padding short, so most
+        batches pad to a length close to their longest real sentence instead of
+        MAX_LENGTH.
+        """
+        order = np.argsort(lengths, kind="stable")
+        return [order[start:start + batch_size] for start in range(0, len(order), batch_size)]
+    
+    def _predict_proba_batched(
+        self,
+        members: List[Dict[str, Any]],
+        texts: List[str],
+        batch_size: int,
+        calibrator=None,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None
+    ) -> Tuple[np.ndarray, List[float]]:
+        """
+        Predict class probabilities for all texts with batched, dynamically padded inference.
         
-        pred_id = torch.argmax(probs).item()
-        pred_label = self.LABEL_MAP[pred_id]
-        confidence = probs[pred_id].item()
+        Each member model tokenizes the full dataset once without padding; batches
+        are then padded only to their own longest sequence. Member probabilities are
+        combined by weight, matching EnsembleFinBERTModel._ensemble_fusion.
         
-        scores = {
-            'positive': probs[0].item(),
-            'negative': probs[1].item(),
-            'neutral': probs[2].item()
-        }
+        Args:
+            members: Model dicts with 'model', 'tokenizer', 'weight' and 'label_map'
+            texts: Texts to classify
+            batch_size: Texts per forward pass
+            calibrator: Optional ConfidenceCalibrator applied to the logits
+            progress_callback: Optional callback function(current, total, message)
         
-        return pred_label, confidence, scores
-    
-    def _calculate_metrics(
-        self,
-        confusion: Dict[str, Dict[str, int]],
-        total_samples: int
-    ) -> Tuple[float, float, float, float, float]:
-        """Calculate precision, recall, F1 scores from confusion matrix."""
-        classes = ['positive', 'negative', 'neutral']
-        
-        precisions = []
-        recalls = []
-        f1_scores = []
-        supports = []
-        
-        for cls in classes:
-            # True positives
-            tp = confusion[cls][cls]
-            
-            # False positives (predicted as cls but was something else)
-            fp = sum(confusion[other][cls] for other in classes if other != cls)
-            
-            # False negatives (was cls but predicted as something else)
-            fn = sum(confusion[cls][other] for other in classes if other != cls)
+        Returns:
+            (probabilities [n_texts, 3] in CLASSES order, per-batch latencies in seconds)
+        """
+        total = len(texts)
+        encodings = [
+            member['tokenizer'](texts, truncation=True, max_length=self.MAX_LENGTH)
+            for member in members
+        ]
+        # Column i of a member's output maps to the i-th label_map entry (see _predict_single_model)
+        columns = [
+            [self.CLASS_INDEX[label] for label in member['label_map'].values()]
+            for member in members
+        ]
+        lengths = np.fromiter(
+            (len(ids) for ids in encodings[0]['input_ids']), dtype=np.int32, count=total
+        )
+        
+        probs = np.zeros((total, len(self.CLASSES)), dtype=np.float64)
+        latencies: List[float] = []
+        processed = 0
+        
+        for batch_indices in self._length_buckets(lengths, batch_size):
+            batch_start = time.perf_counter()
+            index_list = batch_indices.tolist()
             
-            # Support (total samples of this class)
-            support = sum(confusion[cls].values())
+            for member, encoding, member_columns in zip(members, encodings, columns):
+                features = {
+                    key: [values[i] for i in index_list]
+                    for key, values in encoding.items()
+                }
+                padded = member['tokenizer'].pad(features, padding="longest", return_tensors="pt")
+                # INT8 members live on CPU even when self.device is a GPU
+                device = getattr(member['model'], 'device', self.device)
+                padded = {key: value.to(device) for key, value in padded.items()}
+                
+                with torch.no_grad():
+                    logits = member['model'](**padded).logits
+                    if calibrator is not None:
+                        member_probs = calibrator.calibrate_scores(logits)
+                    else:
+                        member_probs = torch.softmax(logits, dim=-1)
+                
+                probs[np.ix_(batch_indices, member_columns)] += (
+                    member['weight'] * member_probs.cpu().numpy()
+                )
             
-            # Calculate metrics
-            precision = tp / (tp + fp) if (tp + fp) > 0 else 0
-            recall = tp / (tp + fn) if (tp + fn) > 0 else 0
-            f1 = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0
+            latencies.append(time.perf_counter() - batch_start)
             
-            precisions.append(precision)
-            recalls.append(recall)
-            f1_scores.append(f1)
-            supports.append(support)
+            # Report progress every 500 samples
+            previous = processed
+            processed += len(index_list)
+            if progress_callback and processed // 500 > previous // 500:
+                progress_callback(processed, total, f"Processed {processed}/{total} samples")
         
-        # Macro averages
-        macro_precision = sum(precisions) / len(precisions)
-        macro_recall = sum(recalls) / len(recalls)
-        macro_f1 = sum(f1_scores) / len(f1_scores)
+        return probs, latencies
+    
+    def _confusion_matrix(self, y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+        """Build a [true, predicted] confusion matrix over CLASSES."""
+        n_classes = len(self.CLASSES)
+        return np.bincount(
+            y_true * n_classes + y_pred, minlength=n_classes * n_classes
+        ).reshape(n_classes, n_classes)
+    
+    def _calculate_metrics(
+        self,
+        confusion: np.ndarray
+    ) -> Tuple[float, float, float, float, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Calculate precision, recall, F1 scores from a [true, predicted] confusion matrix."""
+        confusion = confusion.astype(np.float64)
+        tp = np.diag(confusion)
+        predicted = confusion.sum(axis=0)  # tp + fp
+        supports = confusion.sum(axis=1)   # tp + fn
+        
+        precisions = np.divide(tp, predicted, out=np.zeros_like(tp), where=predicted > 0)
+        recalls = np.divide(tp, supports, out=np.zeros_like(tp), where=supports > 0)
+        pr_sum = precisions + recalls
+        f1_scores = np.divide(
+            2 * precisions * recalls, pr_sum, out=np.zeros_like(tp), where=pr_sum > 0
+        )
         
-        # Weighted F1
-        total = sum(supports)
-        weighted_f1 = sum(f1 * sup / total for f1, sup in zip(f1_scores, supports))
+        total = supports.sum()
+        weighted_f1 = float((f1_scores * supports).sum() / total) if total > 0 else 0.0
         
-        return macro_precision, macro_recall, macro_f1, weighted_f1, precisions, recalls, f1_scores, supports
+        return (
+            float(precisions.mean()), float(recalls.mean()), float(f1_scores.mean()), weighted_f1,
+            precisions, recalls, f1_scores, supports.astype(np.int64)
+        )
     
-    async def run_benchmark(self, progress_callback=None) -> BenchmarkResult:
+    @staticmethod
+    def _get_rss_mb() -> Optional[float]:
+        """
+        Current resident set size of this process in MB (None where unsupported).
+        
+        Unlike ru_maxrss this is not a lifetime peak, so transient allocations
+        made while loading (an FP32 skeleton built for a cached INT8 model) are
+        not counted against the configuration.
+        """
+        try:
+            import psutil
+            return round(psutil.Process().memory_info().rss / (1024 * 1024), 1)
+        except ImportError:
+            pass
+        
+        try:
+            with open("/proc/self/statm") as f:
+                resident_pages = int(f.read().split()[1])
+            return round(resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024), 1)
+        except (OSError, ValueError, IndexError, AttributeError):
+            return None
+    
+    def _summarize_throughput(
+        self,
+        latencies: List[float],
+        total_samples: int,
+        batch_size: int,
+        model_load_seconds: float,
+        rss_mb: Optional[float]
+    ) -> ThroughputMetrics:
+        """Reduce per-batch latencies to throughput metrics; rss_mb is measured right after loading."""
+        latency_ms = np.asarray(latencies, dtype=np.float64) * 1000
+        inference_seconds = float(latency_ms.sum() / 1000)
+        p50, p90, p99 = (
+            np.percentile(latency_ms, [50, 90, 99]) if latency_ms.size else (0.0, 0.0, 0.0)
+        )
+        
+        return ThroughputMetrics(
+            batch_size=batch_size,
+            num_threads=torch.get_num_threads(),
+            model_load_seconds=round(model_load_seconds, 2),
+            inference_seconds=round(inference_seconds, 2),
+            texts_per_second=round(total_samples / inference_seconds, 1) if inference_seconds > 0 else 0.0,
+            batch_latency_p50_ms=round(float(p50), 1),
+            batch_latency_p90_ms=round(float(p90), 1),
+            batch_latency_p99_ms=round(float(p99), 1),
+            rss_mb=rss_mb
+        )
+    
+    def _ai_trigger_counts(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        confidences: np.ndarray,
+        confidence_threshold: float
+    ) -> Tuple[int, int, int]:
+        """
+        Count predictions that would trigger AI verification.
+        
+        Returns:
+            (low_confidence_count, low_confidence_wrong, neutral_count)
+        """
+        low_confidence = confidences < confidence_threshold
+        wrong = y_pred != y_true
+        neutral = (~low_confidence) & (y_pred == self.CLASS_INDEX['neutral'])
+        return int(low_confidence.sum()), int((low_confidence & wrong).sum()), int(neutral.sum())
+    
+    async def run_benchmark(
+        self,
+        progress_callback=None,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> BenchmarkResult:
         """
         Run full benchmark on Financial PhraseBank dataset.
         
         Args:
             progress_callback: Optional callback function(current, total, message)
+            batch_size: Texts per forward pass
         
         Returns:
             BenchmarkResult with full metrics
@@ -226,15 +460,11 @@ class ModelBenchmarkService:
         
         # Load model and data
         self._load_model()
+        rss_mb = self._get_rss_mb()
         samples = self._load_phrasebank()
         total_samples = len(samples)
-        
-        # Initialize tracking
-        confusion = {
-            'positive': {'positive': 0, 'negative': 0, 'neutral': 0},
-            'negative': {'positive': 0, 'negative': 0, 'neutral': 0},
-            'neutral': {'positive': 0, 'negative': 0, 'neutral': 0}
-        }
+        texts = [text for text, _ in samples]
+        y_true = np.array([self.CLASS_INDEX[label] for _, label in samples], dtype=np.int64)
         
         # Load AI verification config from collector_config.json
         ai_config = self._get_ai_config()
@@ -243,73 +473,60 @@ class ModelBenchmarkService:
         ai_enabled = ai_config['enabled']
         ai_display_name = ai_config['display_name']
         
-        correct = 0
-        total_confidence = 0.0
-        low_confidence_count = 0  # Track predictions that would trigger AI verification
-        low_confidence_wrong = 0  # Track wrong predictions that AI could correct
-        neutral_count = 0  # Track neutral predictions that would trigger AI verification
         start_time = time.time()
         
-        # Process all samples
-        for i, (text, true_label) in enumerate(samples):
-            pred_label, confidence, _ = self._predict(text)
-            
-            confusion[true_label][pred_label] += 1
-            total_confidence += confidence
-            
-            is_correct = pred_label == true_label
-            if is_correct:
-                correct += 1
-            
-            # Track predictions that would trigger AI verification
-            would_trigger_ai = confidence < confidence_threshold or pred_label == 'neutral'
-            if would_trigger_ai:
-                if confidence < confidence_threshold:
-                    low_confidence_count += 1
-                    if not is_correct:
-                        low_confidence_wrong += 1
-                elif pred_label == 'neutral':
-                    neutral_count += 1
-            
-            # Report progress every 500 samples
-            if progress_callback and (i + 1) % 500 == 0:
-                progress_callback(i + 1, total_samples, f"Processed {i+1}/{total_samples} samples")
+        # Process all samples in length-bucketed batches
+        try:
+            probs, latencies = self._predict_proba_batched(
+                self._finbert_members(), texts, batch_size, progress_callback=progress_callback
+            )
+        finally:
+            self._release_models()
         
         processing_time = time.time() - start_time
         
+        y_pred = probs.argmax(axis=1)
+        confidences = probs.max(axis=1)
+        confusion_np = self._confusion_matrix(y_true, y_pred)
+        
         # Calculate metrics
+        correct = int(np.trace(confusion_np))
         accuracy = correct / total_samples
-        avg_confidence = total_confidence / total_samples
+        avg_confidence = float(confidences.mean())
         
         (macro_precision, macro_recall, macro_f1, weighted_f1, 
-         precisions, recalls, f1_scores, supports) = self._calculate_metrics(confusion, total_samples)
+         precisions, recalls, f1_scores, supports) = self._calculate_metrics(confusion_np)
         
-        # Build class metrics
-        classes = ['positive', 'negative', 'neutral']
+        # Build class metrics and the label-keyed confusion matrix stored in BENCHMARK_FILE
+        classes = self.CLASSES
         class_metrics = {}
         for i, cls in enumerate(classes):
             class_metrics[cls] = {
-                'precision': precisions[i],
-                'recall': recalls[i],
-                'f1_score': f1_scores[i],
-                'support': supports[i]
+                'precision': float(precisions[i]),
+                'recall': float(recalls[i]),
+                'f1_score': float(f1_scores[i]),
+                'support': int(supports[i])
             }
+        confusion = {
+            true_cls: {pred_cls: int(confusion_np[i, j]) for j, pred_cls in enumerate(classes)}
+            for i, true_cls in enumerate(classes)
+        }
         
         # Load previous results for comparison
+        previous = self._read_benchmark_file()
         comparison = None
-        if os.path.exists(self.BENCHMARK_FILE):
-            try:
-                with open(self.BENCHMARK_FILE, 'r') as f:
-                    prev = json.load(f)
-                    if prev.get('accuracy'):
-                        comparison = {
-                            'previous_model': prev.get('model_name', 'Unknown'),
-                            'previous_accuracy': prev['accuracy'],
-                            'accuracy_improvement': accuracy - prev['accuracy'],
-                            'improvement_percentage': ((accuracy - prev['accuracy']) / prev['accuracy']) * 100
-                        }
-            except Exception as e:
-                logger.warning(f"Could not load previous benchmark: {e}")
+        if previous.get('accuracy'):
+            comparison = {
+                'previous_model': previous.get('model_name', 'Unknown'),
+                'previous_accuracy': previous['accuracy'],
+                'accuracy_improvement': accuracy - previous['accuracy'],
+                'improvement_percentage': ((accuracy - previous['accuracy']) / previous['accuracy']) * 100
+            }
+        
+        # Track predictions that would trigger AI verification
+        low_confidence_count, low_confidence_wrong, neutral_count = self._ai_trigger_counts(
+            y_true, y_pred, confidences, confidence_threshold
+        )
         
         # Calculate estimated AI-enhanced accuracy
         # AI verification corrects ~85% of wrong low-confidence predictions (conservative estimate)
@@ -322,6 +539,10 @@ class ModelBenchmarkService:
         ai_verification_candidates = low_confidence_count + neutral_count
         ai_verification_percentage = (ai_verification_candidates / total_samples) * 100
         
+        throughput = self._summarize_throughput(
+            latencies, total_samples, batch_size, self._model_load_seconds, rss_mb
+        )
+        
         # Build result
         result = BenchmarkResult(
             dataset_name="Financial PhraseBank",
@@ -350,7 +571,10 @@ class ModelBenchmarkService:
                 "potential_corrections": potential_corrections,
                 "verification_candidates_percent": round(ai_verification_percentage, 1),
                 "note": "Settings from collector_config.json"
-            }
+            },
+            throughput=asdict(throughput),
+            # Keep the last configuration sweep next to the accuracy metrics
+            configuration_benchmarks=previous.get('configuration_benchmarks')
         )
         
         # Save results
@@ -361,21 +585,286 @@ class ModelBenchmarkService:
             extra={
                 "accuracy": f"{accuracy:.1%}",
                 "samples": total_samples,
-                "time": f"{processing_time:.1f}s"
+                "time": f"{processing_time:.1f}s",
+                "texts_per_second": throughput.texts_per_second
             }
         )
         
         return result
     
-    def _save_results(self, result: BenchmarkResult) -> None:
-        """Save benchmark results to file."""
-        result_dict = asdict(result)
+    async def _load_configuration_members(
+        self,
+        configuration: BenchmarkConfiguration
+    ) -> Tuple[List[Dict[str, Any]], Any, float, Optional[Any]]:
+        """
+        Load the models for a configuration.
+        
+        Returns:
+            (members, calibrator, model_load_seconds, owner) where owner is the
+            EnsembleFinBERTModel to clean up afterwards (None for single FinBERT)
+        """
+        from app.service.sentiment_processing.models.finbert_model import (
+            ConfidenceCalibrator,
+            EnsembleFinBERTModel
+        )
+        
+        if configuration.model == "ensemble":
+            ensemble = EnsembleFinBERTModel(
+                use_gpu=self.device.type == "cuda",
+                max_length=self.MAX_LENGTH,
+                use_calibration=configuration.use_calibration,
+                quantize=configuration.quantize
+            )
+            load_start = time.perf_counter()
+            await ensemble.ensure_loaded()
+            return ensemble.models, ensemble.calibrator, time.perf_counter() - load_start, ensemble
+        
+        if configuration.model != "finbert":
+            raise ValueError(f"Unknown benchmark model '{configuration.model}'")
+        
+        calibrator = (
+            ConfidenceCalibrator(temperature=self.CALIBRATION_TEMPERATURE)
+            if configuration.use_calibration else None
+        )
+        
+        # The INT8 configuration never needs the FP32 model; loading it too
+        # would count its weights against the INT8 memory figure
+        if configuration.quantize:
+            return self._quantized_finbert_members(), calibrator, self._quantized_load_seconds, None
+        
+        self._load_model()
+        return self._finbert_members(), calibrator, self._model_load_seconds, None
+    
+    def _quantized_finbert_members(self) -> List[Dict[str, Any]]:
+        """Load (once) the INT8 FinBERT and describe it as a single ensemble member."""
+        if self._quantized_handle is None:
+            load_start = time.perf_counter()
+            self._quantized_handle = get_model_registry().acquire("ProsusAI/finbert", quantize=True)
+            self._quantized_load_seconds = time.perf_counter() - load_start
+        
+        return self._finbert_members(self._quantized_handle.model, self._quantized_handle.tokenizer)
+    
+    def _compare_with_fp32(self, results: List[ConfigurationResult]) -> None:
+        """
+        Fill accuracy delta and speedup of each INT8 result against its FP32 twin.
+        
+        The twin is the configuration with identical settings apart from quantize.
+        """
+        def twin_key(configuration: Dict[str, Any]) -> Tuple:
+            return (
+                configuration['model'], configuration['use_calibration'],
+                configuration['num_threads'], configuration['batch_size']
+            )
+        
+        fp32_results = {
+            twin_key(r.configuration): r for r in results if not r.configuration['quantize']
+        }
+        for result in results:
+            if not result.configuration['quantize']:
+                continue
+            fp32 = fp32_results.get(twin_key(result.configuration))
+            if fp32 is None:
+                continue
+            result.accuracy_delta_vs_fp32 = round(result.accuracy - fp32.accuracy, 4)
+            fp32_speed = fp32.throughput['texts_per_second']
+            if fp32_speed:
+                result.speedup_vs_fp32 = round(result.throughput['texts_per_second'] / fp32_speed, 2)
+    
+    async def run_configuration_benchmarks(
+        self,
+        configurations: Optional[List[BenchmarkConfiguration]] = None,
+        progress_callback=None
+    ) -> List[ConfigurationResult]:
+        """
+        Compare accuracy and throughput across model configurations.
+        
+        Runs every configuration (single FinBERT, EnsembleFinBERTModel, calibration
+        on/off, thread counts, INT8 quantization) over the full PhraseBank and stores
+        the results under "configuration_benchmarks" in BENCHMARK_FILE, next to the
+        accuracy metrics. INT8 results report their accuracy delta and speedup
+        against the matching FP32 configuration.
+        
+        Each configuration runs in a child process of its own: torch's thread
+        count is process-wide and models cached by earlier configurations would
+        stay resident, so only a fresh process measures one configuration
+        without touching the others (or the pipeline's inference in this process).
+        
+        Args:
+            configurations: Configurations to run (DEFAULT_CONFIGURATIONS if None)
+            progress_callback: Optional callback function(current, total, message)
+        
+        Returns:
+            One ConfigurationResult per configuration
+        """
+        configurations = configurations or self.DEFAULT_CONFIGURATIONS
+        total_samples = len(self._load_phrasebank())
+        
+        results: List[ConfigurationResult] = []
+        for index, configuration in enumerate(configurations, start=1):
+            logger.info("Running benchmark configuration", extra=asdict(configuration))
+            if progress_callback:
+                progress_callback(
+                    index - 1, len(configurations),
+                    f"Configuration {index}/{len(configurations)}: {configuration.name}"
+                )
+            try:
+                results.append(await self._run_configuration_process(configuration))
+            except Exception as e:
+                logger.error(f"Benchmark configuration '{configuration.name}' failed: {e}")
+        
+        self._compare_with_fp32(results)
+        
+        stored = self._read_benchmark_file()
+        stored['configuration_benchmarks'] = {
+            "evaluated_at": to_iso_string(utc_now()),
+            "dataset_size": total_samples,
+            "results": [asdict(r) for r in results]
+        }
+        self._write_benchmark_file(stored)
+        
+        logger.info(
+            "Configuration benchmarks completed",
+            extra={"configurations": len(results)}
+        )
+        
+        return results
+    
+    async def _run_configuration_process(self, configuration: BenchmarkConfiguration) -> ConfigurationResult:
+        """Benchmark one configuration in a child process (see __main__ below)."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = os.path.join(temp_dir, "result.json")
+            process = await asyncio.create_subprocess_exec(
+                sys.executable, "-m", "app.service.benchmark_service",
+                json.dumps(asdict(configuration)), output_file,
+                cwd=self.BACKEND_DIR
+            )
+            return_code = await process.wait()
+            if return_code != 0 or not os.path.exists(output_file):
+                raise RuntimeError(f"benchmark process exited with code {return_code}")
+            with open(output_file, 'r') as f:
+                return ConfigurationResult(**json.load(f))
+    
+    async def benchmark_configuration(self, configuration: BenchmarkConfiguration) -> ConfigurationResult:
+        """
+        Measure accuracy and throughput of one configuration in this process.
+        
+        Changes torch's thread count for the duration, so run it in a process
+        of its own (run_configuration_benchmarks() does).
+        """
+        samples = self._load_phrasebank()
+        total_samples = len(samples)
+        texts = [text for text, _ in samples]
+        y_true = np.array([self.CLASS_INDEX[label] for _, label in samples], dtype=np.int64)
+        confidence_threshold = self._get_ai_config()['confidence_threshold']
+        
+        owner = None
+        try:
+            if configuration.num_threads:
+                torch.set_num_threads(configuration.num_threads)
+            
+            members, calibrator, load_seconds, owner = await self._load_configuration_members(configuration)
+            rss_mb = self._get_rss_mb()
+            probs, latencies = self._predict_proba_batched(
+                members, texts, configuration.batch_size, calibrator=calibrator
+            )
+            
+            y_pred = probs.argmax(axis=1)
+            confidences = probs.max(axis=1)
+            confusion_np = self._confusion_matrix(y_true, y_pred)
+            _, _, macro_f1, weighted_f1, *_ = self._calculate_metrics(confusion_np)
+            low_confidence_count, _, neutral_count = self._ai_trigger_counts(
+                y_true, y_pred, confidences, confidence_threshold
+            )
+            throughput = self._summarize_throughput(
+                latencies, total_samples, configuration.batch_size, load_seconds, rss_mb
+            )
+            
+            return ConfigurationResult(
+                configuration=asdict(configuration),
+                accuracy=round(float(np.trace(confusion_np)) / total_samples, 4),
+                macro_f1=round(macro_f1, 4),
+                weighted_f1=round(weighted_f1, 4),
+                avg_confidence=round(float(confidences.mean()), 4),
+                ai_verification_candidates_percent=round(
+                    (low_confidence_count + neutral_count) / total_samples * 100, 1
+                ),
+                throughput=asdict(throughput)
+            )
+        finally:
+            if owner is not None:
+                await owner.cleanup()
+            self._release_models()
+    
+    def start_configuration_benchmarks(
+        self,
+        configurations: Optional[List[BenchmarkConfiguration]] = None
+    ) -> ConfigurationBenchmarkJob:
+        """
+        Start run_configuration_benchmarks() in the background.
         
+        The sweep waits minutes for its child processes; it gets a worker
+        thread with its own event loop so the API keeps serving requests.
+        
+        Raises:
+            RuntimeError: A sweep is already running
+        """
+        if self._configuration_job is not None and self._configuration_job.status == "running":
+            raise RuntimeError("Configuration benchmarks are already running")
+        
+        job = ConfigurationBenchmarkJob(job_id=str(uuid.uuid4()))
+        self._configuration_job = job
+        self._configuration_task = asyncio.create_task(self._run_configuration_job(job, configurations))
+        return job
+    
+    async def _run_configuration_job(
+        self,
+        job: ConfigurationBenchmarkJob,
+        configurations: Optional[List[BenchmarkConfiguration]]
+    ) -> None:
+        def on_progress(current: int, total: int, message: str) -> None:
+            job.progress = {"current": current, "total": total, "message": message}
+        
+        try:
+            results = await asyncio.to_thread(
+                lambda: asyncio.run(self.run_configuration_benchmarks(configurations, progress_callback=on_progress))
+            )
+            job.results = [asdict(result) for result in results]
+            job.status = "completed"
+        except Exception as e:
+            logger.error(f"Configuration benchmarks failed: {e}")
+            job.error = str(e)
+            job.status = "failed"
+        finally:
+            job.finished_at = to_iso_string(utc_now())
+    
+    def get_configuration_job(self, job_id: str) -> Optional[ConfigurationBenchmarkJob]:
+        """The background sweep with this id (only the latest one is kept)."""
+        job = self._configuration_job
+        return job if job is not None and job.job_id == job_id else None
+    
+    def _read_benchmark_file(self) -> Dict[str, Any]:
+        """Read the stored benchmark JSON (empty dict if missing or unreadable)."""
+        if not os.path.exists(self.BENCHMARK_FILE):
+            return {}
+        try:
+            with open(self.BENCHMARK_FILE, 'r') as f:
+                return json.load(f) or {}
+        except Exception as e:
+            logger.warning(f"Could not load previous benchmark: {e}")
+            return {}
+    
+    def _write_benchmark_file(self, data: Dict[str, Any]) -> None:
+        """Write the benchmark JSON."""
         with open(self.BENCHMARK_FILE, 'w') as f:
-            json.dump(result_dict, f, indent=2)
+            json.dump(data, f, indent=2)
+    
+    def _save_results(self, result: BenchmarkResult) -> None:
+        """Save benchmark results to file."""
+        self._write_benchmark_file(asdict(result))
         
         logger.info(f"Benchmark results saved to {self.BENCHMARK_FILE}")
     
+
     def get_last_benchmark(self) -> Optional[Dict[str, Any]]:
         """Get the last benchmark results with current AI verification config."""
         if not os.path.exists(self.BENCHMARK_FILE):
@@ -445,3 +934,11 @@ def get_benchmark_service() -> ModelBenchmarkService:
     if _benchmark_service is None:
         _benchmark_service = ModelBenchmarkService()
     return _benchmark_service
+
+
+if __name__ == "__main__":
+    # Child process of run_configuration_benchmarks(): benchmark_service <configuration json> <output file>
+    _configuration = BenchmarkConfiguration(**json.loads(sys.argv[1]))
+    _result = asyncio.run(ModelBenchmarkService().benchmark_configuration(_configuration))
+    with open(sys.argv[2], 'w') as _f:
+        json.dump(asdict(_result), _f)
@@ -9,8 +9,11 @@ Implements dashboard data aggregation and presentation services.
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, text, and_, desc
+from sqlalchemy import select, func, and_, desc
 from app.utils.timezone import utc_now, to_iso_string, to_naive_utc
+from app.utils.time_buckets import (
+    bucket_unit_for_days, dialect_name, exchange_utc_offset_minutes, parse_bucket, time_bucket
+)
 
 from app.data_access.models import Stock, SentimentData, StockPrice, NewsArticle, HackerNewsPost
 from app.infrastructure.log_system import get_logger
@@ -194,64 +197,29 @@ class DashboardService:
     async def _get_sentiment_trends(self, cutoff_date: datetime, days: int) -> List[Dict[str, Any]]:
         """Get sentiment trends over time."""
         try:
-            # Create date buckets based on time period
-            if days <= 1:
-                interval = "1 hour"
-                date_format = "%Y-%m-%d %H:00"
-            elif days <= 7:
-                interval = "1 day"
-                date_format = "%Y-%m-%d"
-            else:
-                interval = "1 week"
-                date_format = "%Y-W%U"
-            
-            # Get sentiment trends grouped by time intervals (SQLite compatible)
-            if days <= 1:
-                # Group by hour for 1 day
-                sql_query = """
-                    SELECT 
-                        strftime('%Y-%m-%d %H:00:00', created_at) as time_bucket,
-                        AVG(sentiment_score) as avg_sentiment,
-                        AVG(confidence) as avg_confidence,
-                        COUNT(*) as data_points
-                    FROM sentiment_data 
-                    WHERE created_at >= :cutoff_date
-                    GROUP BY strftime('%Y-%m-%d %H', created_at)
-                    ORDER BY time_bucket
-                """
-            elif days <= 7:
-                # Group by day for 7 days
-                sql_query = """
-                    SELECT 
-                        strftime('%Y-%m-%d', created_at) as time_bucket,
-                        AVG(sentiment_score) as avg_sentiment,
-                        AVG(confidence) as avg_confidence,
-                        COUNT(*) as data_points
-                    FROM sentiment_data 
-                    WHERE created_at >= :cutoff_date
-                    GROUP BY strftime('%Y-%m-%d', created_at)
-                    ORDER BY time_bucket
-                """
-            else:
-                # Group by week for longer periods
-                sql_query = """
-                    SELECT 
-                        strftime('%Y-W%W', created_at) as time_bucket,
-                        AVG(sentiment_score) as avg_sentiment,
-                        AVG(confidence) as avg_confidence,
-                        COUNT(*) as data_points
-                    FROM sentiment_data 
-                    WHERE created_at >= :cutoff_date
-                    GROUP BY strftime('%Y-%W', created_at)
-                    ORDER BY time_bucket
-                """
+            # Bucket by hour, day or week in the database (SQLite and PostgreSQL),
+            # with days starting at midnight exchange time
+            bucket = time_bucket(
+                SentimentData.created_at, bucket_unit_for_days(days), dialect_name(self.db),
+                exchange_utc_offset_minutes()
+            )
             
-            result = await self.db.execute(text(sql_query), {"cutoff_date": cutoff_date})
+            result = await self.db.execute(
+                select(
+                    bucket.label('time_bucket'),
+                    func.avg(SentimentData.sentiment_score).label('avg_sentiment'),
+                    func.avg(SentimentData.confidence).label('avg_confidence'),
+                    func.count().label('data_points')
+                )
+                .where(SentimentData.created_at >= cutoff_date)
+                .group_by(bucket)
+                .order_by(bucket)
+            )
             
             trends = []
             for row in result:
                 trends.append({
-                    "timestamp": str(row.time_bucket),  # time_bucket is already a string from strftime
+                    "timestamp": to_iso_string(parse_bucket(row.time_bucket)),
                     "sentiment_score": round(float(row.avg_sentiment), 3),
                     "confidence": round(float(row.avg_confidence), 3),
                     "data_points": int(row.data_points)
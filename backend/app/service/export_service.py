@@ -0,0 +1,170 @@
+"""
+Export Service
+==============
+
+Streaming CSV / NDJSON exports for admin downloads.
+
+Rows are read through a server-side cursor in yield_per chunks and encoded
+chunk by chunk, optionally through an incremental gzip compressor, so the
+first bytes (the CSV header) go out immediately and memory stays flat no
+matter how many rows are exported.
+
+The stream opens its own database session: request-scoped sessions from
+get_db are closed before a StreamingResponse body is iterated. A database
+error mid-stream aborts the response (NDJSON exports first get a final
+{"error": ...} record), so a truncated export never looks complete.
+"""
+
+import csv
+import io
+import json
+import uuid
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, Optional, Sequence
+
+from sqlalchemy.sql import Select
+
+from app.data_access.database import get_db_session
+from app.infrastructure.log_system import get_logger
+
+logger = get_logger()
+
+EXPORT_FORMATS = ("csv", "ndjson")
+
+# Rows fetched from the cursor and encoded per chunk
+DEFAULT_CHUNK_ROWS = 1000
+
+_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson"
+}
+
+
+def export_media_type(fmt: str, compress: bool = False) -> str:
+    """Media type for an export response."""
+    return "application/gzip" if compress else _MEDIA_TYPES[fmt]
+
+
+def export_filename(base_name: str, fmt: str, compress: bool = False) -> str:
+    """Download filename, e.g. system_logs_20250101_120000.csv.gz"""
+    return f"{base_name}.{fmt}" + (".gz" if compress else "")
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    return _json_value(value)
+
+
+class _ChunkEncoder:
+    """Encodes row chunks as CSV or NDJSON bytes, optionally gzip-compressed."""
+
+    def __init__(self, fmt: str, compress: bool):
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format: {fmt}")
+        self.fmt = fmt
+        # wbits=31 writes a gzip header so the output is a standard .gz file
+        self._compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+
+    def encode_rows(self, rows: Sequence[Sequence[Any]], fieldnames: Sequence[str]) -> bytes:
+        if self.fmt == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerows([_csv_value(value) for value in row] for row in rows)
+            text = buffer.getvalue()
+        else:
+            text = "".join(
+                json.dumps(dict(zip(fieldnames, map(_json_value, row))), default=str) + "\n"
+                for row in rows
+            )
+        return self._output(text.encode("utf-8"))
+
+    def header(self, csv_header: Sequence[str]) -> bytes:
+        if self.fmt != "csv":
+            return b""
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(csv_header)
+        data = self._output(buffer.getvalue().encode("utf-8"))
+        # Push the header out now so time-to-first-byte does not wait for the query
+        if self._compressor is not None:
+            data += self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        return data
+
+    def finish(self) -> bytes:
+        return self._compressor.flush() if self._compressor is not None else b""
+
+    def _output(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) if self._compressor is not None else data
+
+
+async def stream_export(
+    query: Select,
+    fieldnames: Sequence[str],
+    fmt: str = "csv",
+    compress: bool = False,
+    csv_header: Optional[Sequence[str]] = None,
+    empty_row: Optional[Sequence[Any]] = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    label: str = "export"
+) -> AsyncIterator[bytes]:
+    """
+    Stream the rows of a column query as encoded bytes.
+
+    Args:
+        query: Select over plain columns, in fieldnames order
+        fieldnames: NDJSON keys (and the CSV header unless csv_header is given)
+        fmt: "csv" or "ndjson"
+        compress: gzip the stream
+        csv_header: Display header for CSV output
+        empty_row: CSV row written when the query returns nothing
+        chunk_rows: Rows per cursor fetch and encoded chunk
+        label: Name used in log messages
+
+    Yields:
+        Encoded (and possibly compressed) byte chunks
+    """
+    encoder = _ChunkEncoder(fmt, compress)
+    header = encoder.header(csv_header or fieldnames)
+    if header:
+        yield header
+
+    exported = 0
+    try:
+        async with get_db_session() as session:
+            result = await session.stream(query.execution_options(yield_per=chunk_rows))
+            async for partition in result.partitions(chunk_rows):
+                exported += len(partition)
+                data = encoder.encode_rows(partition, fieldnames)
+                if data:
+                    yield data
+    except Exception as e:
+        # Headers are already sent, so the status cannot change. Re-raising
+        # aborts the response before its final chunk, so the client sees a
+        # failed download rather than a short file; NDJSON readers that
+        # consume records as they arrive also get an error record
+        logger.error(f"Streaming {label} failed after {exported} rows", error=str(e))
+        if fmt == "ndjson":
+            yield encoder.encode_rows([[f"Export failed after {exported} rows"]], ["error"])
+            yield encoder.finish()
+        raise
+
+    if exported == 0 and empty_row is not None and fmt == "csv":
+        yield encoder.encode_rows([empty_row], fieldnames)
+
+    yield encoder.finish()
+    logger.info(f"Streamed {exported} rows for {label}", extra={"format": fmt, "compressed": compress})
+
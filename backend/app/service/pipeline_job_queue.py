@@ -0,0 +1,255 @@
+"""
+Pipeline Job Queue
+==================
+
+Hands pipeline runs to out-of-process workers (settings.pipeline_execution
+= "worker").
+
+A pipeline run collects from every source, runs FinBERT inference and bulk
+inserts for minutes at a time. Inside the API process it shares the event
+loop and the GIL with request handling, so API latency climbs for the whole
+run. With the queue, the API process only inserts a row into pipeline_jobs
+and polls it; scripts/run_pipeline_worker.py processes claim the rows and
+do the work (app/business/pipeline_worker.py).
+
+- The queue is the application database, so it survives restarts of both
+  sides and needs no extra infrastructure
+- With pipeline_worker_shard_size set, a run over a large watchlist is split
+  into several jobs sharing a run_id. On PostgreSQL several workers run them
+  side by side; on SQLite they run one after another (one writer per file)
+- Workers report progress and read cancellation through their job rows;
+  the waiting API process republishes the progress as "pipeline" events, so
+  the admin UI sees the same stream as for an in-process run
+"""
+
+import asyncio
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from app.business.pipeline import CollectorStats, PipelineConfig, PipelineResult, PipelineStatus
+from app.data_access.database import get_db_session
+from app.data_access.repositories import PipelineJobRepository
+from app.data_access.repositories.pipeline_job_repository import FINISHED_STATUSES
+from app.infrastructure.event_bus import get_event_bus
+from app.infrastructure.log_system import get_logger
+from app.utils.timezone import ensure_utc, utc_now
+
+logger = get_logger()
+
+POLL_SECONDS = 1.0
+
+
+class PipelineJobQueue:
+    """Submits pipeline runs to the pipeline_jobs table and waits for them."""
+
+    def __init__(self, shard_size: int = 0):
+        self.shard_size = shard_size
+
+    async def submit(self, config: PipelineConfig, source: str = "manual") -> str:
+        """
+        Queue a run.
+
+        Args:
+            config: Pipeline configuration (empty symbols = current watchlist)
+            source: What asked for the run (manual, scheduled, api)
+
+        Returns:
+            Run id shared by the run's jobs
+        """
+        run_id = str(uuid.uuid4())
+        shards = await self._shard(config)
+        async with get_db_session() as session:
+            repo = PipelineJobRepository(session)
+            for shard in shards:
+                await repo.enqueue(run_id, shard.to_dict(), source=source)
+        logger.info(f"Queued pipeline run {run_id} as {len(shards)} job(s)")
+        return run_id
+
+    async def _shard(self, config: PipelineConfig) -> List[PipelineConfig]:
+        if self.shard_size <= 0:
+            return [config]
+
+        symbols = config.symbols
+        if not symbols:
+            # Shards need the symbol list up front
+            from app.service.watchlist_service import get_current_stock_symbols
+            async with get_db_session() as session:
+                symbols = await get_current_stock_symbols(session)
+        if len(symbols) <= self.shard_size:
+            return [config]
+
+        shards = []
+        for start in range(0, len(symbols), self.shard_size):
+            shard = PipelineConfig.from_dict(config.to_dict())
+            shard.symbols = list(symbols[start:start + self.shard_size])
+            shards.append(shard)
+        return shards
+
+    async def wait(self, run_id: str, timeout: Optional[float] = None) -> PipelineResult:
+        """
+        Wait for every job of a run to finish, publishing its progress.
+
+        Raises:
+            TimeoutError: The run did not finish within timeout seconds
+        """
+        deadline = time.monotonic() + timeout if timeout else None
+        last_state = None
+        while True:
+            async with get_db_session() as session:
+                jobs = await PipelineJobRepository(session).get_run(run_id)
+            if not jobs:
+                raise ValueError(f"Unknown pipeline run: {run_id}")
+
+            state = self._run_state(run_id, jobs)
+            if state != last_state:
+                last_state = state
+                finished = all(job.status in FINISHED_STATUSES for job in jobs)
+                get_event_bus().publish("pipeline", "status" if finished else "progress", state)
+
+            if all(job.status in FINISHED_STATUSES for job in jobs):
+                return self._merge_results(run_id, jobs)
+            if deadline and time.monotonic() > deadline:
+                raise TimeoutError(f"Pipeline run {run_id} did not finish within {timeout:.0f}s")
+            await asyncio.sleep(POLL_SECONDS)
+
+    async def run(self, config: PipelineConfig, source: str = "manual",
+                  timeout: Optional[float] = None) -> PipelineResult:
+        """Queue a run and wait for its result."""
+        return await self.wait(await self.submit(config, source=source), timeout=timeout)
+
+    async def cancel(self, run_id: Optional[str] = None) -> int:
+        """
+        Cancel queued jobs and ask workers to stop running ones.
+
+        Args:
+            run_id: Only this run (every unfinished job when None)
+
+        Returns:
+            Number of jobs cancelled or flagged
+        """
+        async with get_db_session() as session:
+            return await PipelineJobRepository(session).request_cancel(run_id)
+
+    async def get_status(self, limit: int = 10) -> Dict[str, Any]:
+        async with get_db_session() as session:
+            repo = PipelineJobRepository(session)
+            counts = await repo.count_by_status()
+            recent = await repo.list_recent(limit)
+        return {
+            "shard_size": self.shard_size,
+            "jobs_by_status": counts,
+            "recent_jobs": [
+                {
+                    "id": job.id,
+                    "run_id": job.run_id,
+                    "status": job.status,
+                    "source": job.source,
+                    "symbols": len(job.config.get("symbols") or []),
+                    "worker_id": job.worker_id,
+                    "attempts": job.attempts,
+                    "created_at": job.created_at.isoformat() if job.created_at else None,
+                    "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+                    "error": job.error,
+                }
+                for job in recent
+            ],
+        }
+
+    # Progress and results across the jobs of a run
+
+    @staticmethod
+    def _run_state(run_id: str, jobs: List[Any]) -> Dict[str, Any]:
+        """Same shape as the events DataPipeline publishes for an in-process run."""
+        statuses = [job.status for job in jobs]
+        progresses = [job.progress or {} for job in jobs]
+        finished = sum(1 for status in statuses if status in FINISHED_STATUSES)
+
+        if len(jobs) == 1:
+            progress = dict(progresses[0])
+        else:
+            running = next((p for job, p in zip(jobs, progresses) if job.status == "running"), {})
+            progress = {
+                "current_stage": running.get("current_stage", "queued"),
+                "stage_progress": running.get("stage_progress", 0),
+                "overall_progress": sum(
+                    100 if job.status in FINISHED_STATUSES else p.get("overall_progress", 0)
+                    for job, p in zip(jobs, progresses)
+                ) // len(jobs),
+                "message": f"{finished}/{len(jobs)} shards finished",
+                "items_collected": sum(p.get("items_collected", 0) for p in progresses),
+                "items_analyzed": sum(p.get("items_analyzed", 0) for p in progresses),
+                "items_stored": sum(p.get("items_stored", 0) for p in progresses),
+            }
+        if all(status == "queued" for status in statuses):
+            progress.setdefault("current_stage", "queued")
+            progress["message"] = "Waiting for a pipeline worker"
+
+        if finished < len(jobs):
+            status = PipelineStatus.RUNNING.value
+        else:
+            status = PipelineJobQueue._run_status(statuses).value
+        errors = [job.error for job in jobs if job.error]
+        return {
+            "pipeline_id": run_id,
+            "status": status,
+            "is_running": finished < len(jobs),
+            "progress": progress,
+            "error_message": "; ".join(errors) if errors else None,
+            "jobs": len(jobs),
+        }
+
+    @staticmethod
+    def _run_status(statuses: List[str]) -> PipelineStatus:
+        if all(status == "completed" for status in statuses):
+            return PipelineStatus.COMPLETED
+        if "cancelled" in statuses:
+            return PipelineStatus.CANCELLED
+        return PipelineStatus.FAILED
+
+    @staticmethod
+    def _merge_results(run_id: str, jobs: List[Any]) -> PipelineResult:
+        results = []
+        for job in jobs:
+            if job.result:
+                results.append(PipelineResult.from_dict(job.result))
+            else:
+                # Cancelled before start, or its worker died
+                results.append(PipelineResult(
+                    pipeline_id=f"job_{job.id}",
+                    status=PipelineStatus(job.status) if job.status in FINISHED_STATUSES else PipelineStatus.FAILED,
+                    start_time=ensure_utc(job.started_at or job.created_at or utc_now()),
+                    end_time=ensure_utc(job.finished_at) if job.finished_at else None,
+                    error_message=job.error
+                ))
+        if len(results) == 1:
+            return results[0]
+
+        errors = [r.error_message for r in results if r.error_message]
+        collector_stats: List[CollectorStats] = [stat for r in results for stat in r.collector_stats]
+        return PipelineResult(
+            pipeline_id=f"pipeline_run_{run_id}",
+            status=PipelineJobQueue._run_status([r.status.value for r in results]),
+            start_time=min(r.start_time for r in results),
+            end_time=max((r.end_time for r in results if r.end_time), default=None),
+            total_items_collected=sum(r.total_items_collected for r in results),
+            total_items_processed=sum(r.total_items_processed for r in results),
+            total_items_stored=sum(r.total_items_stored for r in results),
+            total_items_analyzed=sum(r.total_items_analyzed for r in results),
+            collector_stats=collector_stats,
+            processing_stats={"shards": [r.processing_stats for r in results]},
+            sentiment_stats={"shards": [r.sentiment_stats for r in results]},
+            error_message="; ".join(errors) if errors else None
+        )
+
+
+_pipeline_job_queue: Optional[PipelineJobQueue] = None
+
+
+def get_pipeline_job_queue() -> PipelineJobQueue:
+    """Get the process-wide pipeline job queue."""
+    global _pipeline_job_queue
+    if _pipeline_job_queue is None:
+        from app.infrastructure.config.settings import get_settings
+        _pipeline_job_queue = PipelineJobQueue(get_settings().pipeline_worker_shard_size)
+    return _pipeline_job_queue
@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session
 from ..data_access.models import StocksWatchlist, StockPrice
 from ..data_access.database import get_db_session
 from ..infrastructure.log_system import get_logger
+from .quote_service import quote_service
 
 logger = get_logger()
 
@@ -286,6 +287,8 @@ class RealTimeStockPriceService:
                 try:
                     result = await loop.run_in_executor(None, fetch_prices)
                     if result:  # If we got some data, return it
+                        # Share live prices with request handlers (mock data is never cached)
+                        quote_service.update_from_prices(result)
                         return result
                     elif attempt == self.max_retries - 1:
                         # Last attempt and no data, fall back to mock
@@ -371,6 +374,9 @@ class RealTimeStockPriceService:
                 
             await db.commit()
             
+            from app.service.table_statistics_service import get_table_statistics_service
+            get_table_statistics_service().record_writes("stock_prices", updated_count, datetime.now(timezone.utc))
+            
             # Single consolidated log entry for all price updates
             logger.info(
                 "Price update batch completed",
@@ -0,0 +1,225 @@
+"""
+Quote Service
+=============
+
+In-memory cache of live stock quotes for request handlers.
+
+Route handlers read quotes from the cache only, so page latency is bounded by
+a dictionary lookup rather than a Yahoo Finance round trip. Stale or missing
+quotes are refreshed in the background (stale-while-revalidate), and
+concurrent refreshes for the same symbol are coalesced into one fetch.
+RealTimeStockPriceService feeds every successful price batch into the same
+cache, so during market hours most reads are already fresh.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from app.infrastructure.log_system import get_logger
+from app.utils.timezone import utc_now
+
+logger = get_logger()
+
+
+@dataclass
+class Quote:
+    """Latest known price for one symbol."""
+    symbol: str
+    current_price: float
+    previous_close: float
+    source: str
+    fetched_at: datetime = field(default_factory=utc_now)
+    _monotonic_fetched_at: float = field(default_factory=time.monotonic, repr=False)
+
+    @property
+    def age_seconds(self) -> float:
+        return time.monotonic() - self._monotonic_fetched_at
+
+    @property
+    def change_percent(self) -> float:
+        """Change against the previous close, in percent."""
+        if not self.previous_close or self.previous_close <= 0:
+            return 0.0
+        return ((self.current_price - self.previous_close) / self.previous_close) * 100
+
+
+class QuoteService:
+    """
+    Stale-while-revalidate quote cache with coalesced background refreshes.
+
+    Args:
+        fresh_seconds: Age below which a cached quote is served without refreshing
+        fetch_timeout: Upper bound for a single Yahoo fetch
+        failure_backoff_seconds: Minimum delay before refetching a symbol that failed
+    """
+
+    def __init__(
+        self,
+        fresh_seconds: float = 60.0,
+        fetch_timeout: float = 15.0,
+        failure_backoff_seconds: float = 120.0
+    ):
+        self.fresh_seconds = fresh_seconds
+        self.fetch_timeout = fetch_timeout
+        self.failure_backoff_seconds = failure_backoff_seconds
+        self._quotes: Dict[str, Quote] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._failed_at: Dict[str, float] = {}
+        self._stats = {
+            "fresh_hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "fetches": 0,
+            "fetch_failures": 0,
+            "coalesced": 0,
+            "price_service_updates": 0
+        }
+
+    def get_cached(self, symbol: str, revalidate: bool = True) -> Optional[Quote]:
+        """
+        Read a quote from the cache without any I/O.
+
+        Args:
+            symbol: Stock symbol
+            revalidate: Schedule a background refresh when the quote is stale or missing
+
+        Returns:
+            Cached Quote (possibly stale) or None
+        """
+        symbol = symbol.upper()
+        quote = self._quotes.get(symbol)
+
+        if quote is None:
+            self._stats["misses"] += 1
+        elif quote.age_seconds < self.fresh_seconds:
+            self._stats["fresh_hits"] += 1
+            return quote
+        else:
+            self._stats["stale_hits"] += 1
+
+        if revalidate:
+            self.refresh(symbol)
+        return quote
+
+    async def get_quote(self, symbol: str, max_wait: Optional[float] = None) -> Optional[Quote]:
+        """
+        Get a quote, waiting for a fetch only when nothing is cached.
+
+        Args:
+            symbol: Stock symbol
+            max_wait: Seconds to wait on a cache miss (fetch_timeout if None)
+
+        Returns:
+            Quote or None if no price could be obtained in time
+        """
+        quote = self.get_cached(symbol)
+        if quote is not None:
+            return quote
+
+        task = self._inflight.get(symbol.upper())
+        if task is None:
+            return None
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), max_wait or self.fetch_timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def put(self, symbol: str, current_price: float, previous_close: Optional[float], source: str) -> Optional[Quote]:
+        """Store a quote; non-positive prices are ignored."""
+        if not current_price or current_price <= 0:
+            return None
+        symbol = symbol.upper()
+        quote = Quote(
+            symbol=symbol,
+            current_price=float(current_price),
+            previous_close=float(previous_close or current_price),
+            source=source
+        )
+        self._quotes[symbol] = quote
+        self._failed_at.pop(symbol, None)
+        return quote
+
+    def update_from_prices(self, price_data: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Fill the cache from a RealTimeStockPriceService batch.
+
+        Args:
+            price_data: Symbol -> price dict with current_price and previous_close
+        """
+        for symbol, data in price_data.items():
+            self.put(symbol, data.get("current_price"), data.get("previous_close"), source="price_service")
+        self._stats["price_service_updates"] += 1
+
+    def refresh(self, symbol: str) -> Optional[asyncio.Task]:
+        """
+        Start a background fetch for a symbol, joining one already in flight.
+
+        Returns:
+            The fetch task, or None while the symbol is backing off after a failure
+        """
+        symbol = symbol.upper()
+        task = self._inflight.get(symbol)
+        if task is not None:
+            self._stats["coalesced"] += 1
+            return task
+
+        failed_at = self._failed_at.get(symbol)
+        if failed_at is not None and time.monotonic() - failed_at < self.failure_backoff_seconds:
+            return None
+
+        task = asyncio.create_task(self._fetch(symbol))
+        self._inflight[symbol] = task
+        task.add_done_callback(lambda _task, key=symbol: self._inflight.pop(key, None))
+        return task
+
+    async def _fetch(self, symbol: str) -> Optional[Quote]:
+        """Fetch one quote from Yahoo Finance in a worker thread."""
+        self._stats["fetches"] += 1
+        try:
+            data = await asyncio.wait_for(
+                asyncio.to_thread(self._fetch_from_yahoo, symbol),
+                self.fetch_timeout
+            )
+        except Exception as e:
+            data = None
+            logger.warning(f"Quote refresh failed for {symbol}: {e}")
+
+        if data is None:
+            self._stats["fetch_failures"] += 1
+            self._failed_at[symbol] = time.monotonic()
+            return None
+
+        return self.put(symbol, data["current_price"], data["previous_close"], source="yahoo")
+
+    @staticmethod
+    def _fetch_from_yahoo(symbol: str) -> Optional[Dict[str, float]]:
+        """Blocking Yahoo Finance lookup (runs off the event loop)."""
+        import yfinance as yf
+
+        info = yf.Ticker(symbol).info
+        live_price = (
+            info.get('currentPrice') or
+            info.get('regularMarketPrice') or
+            info.get('previousClose')
+        )
+        if not live_price:
+            return None
+        return {
+            "current_price": float(live_price),
+            "previous_close": float(info.get('previousClose', live_price))
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache and fetch counters."""
+        return {
+            **self._stats,
+            "cached_symbols": len(self._quotes),
+            "inflight": len(self._inflight)
+        }
+
+
+# Global instance for the service
+quote_service = QuoteService()
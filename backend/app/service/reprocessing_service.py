@@ -0,0 +1,530 @@
+"""
+Sentiment Reprocessing Service
+==============================
+
+Re-scores stored sentiment_data rows with the current model pipeline
+(FinBERT, optionally with Gemma verification), e.g. after a model change.
+
+The job is a three-stage pipeline connected by bounded queues, so reading,
+inference and writing overlap instead of alternating:
+
+    reader --(batches)--> inference workers --(updates)--> writer
+
+- The reader pages with a keyset on the primary key (id > last_id) and
+  projects only the columns inference needs, joined to the stock symbol;
+  every page costs the same regardless of depth.
+- Inference workers call SentimentEngine.analyze on whole batches. The
+  models run the forward passes in a worker thread, so the reader and the
+  writer keep going (and API requests keep being served) during inference.
+- The writer applies each batch with one executemany UPDATE by primary key
+  and records a checkpoint: the highest id below which every batch is
+  written. An interrupted job resumes from it.
+- A batch whose inference fails is recorded in the checkpoint as an id
+  range. The ranges are retried once after the main pass. Ranges that fail
+  again stay in the checkpoint, and the next resumed run retries them.
+
+The service keeps live progress so the admin API can start, watch and
+cancel a run; scripts/reprocess_sentiment_data.py drives the same engine
+from the command line.
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import and_, func, select, update
+
+from app.data_access.database import get_db_session
+from app.data_access.models import SentimentData, StocksWatchlist
+from app.infrastructure.log_system import get_logger
+from app.utils.timezone import utc_now
+
+logger = get_logger()
+
+# Checkpoint file - points to backend/data directory
+CHECKPOINT_FILE = Path(__file__).parent.parent.parent / "data" / "reprocess_checkpoint.json"
+
+# Texts shorter than this are skipped, as in the collection pipeline
+MIN_TEXT_LENGTH = 5
+
+_LABEL_CHANGES = (
+    "positive_to_negative",
+    "positive_to_neutral",
+    "negative_to_positive",
+    "negative_to_neutral",
+    "neutral_to_positive",
+    "neutral_to_negative"
+)
+
+
+@dataclass
+class ReprocessingOptions:
+    """Settings for one reprocessing run."""
+    batch_size: int = 64
+    dry_run: bool = False
+    with_ai: bool = False
+    limit: Optional[int] = None
+    resume: bool = True  # Continue from the checkpoint of an interrupted run
+    inference_workers: int = 2
+    queue_depth: int = 4  # Batches buffered between stages
+
+
+@dataclass
+class ReprocessingProgress:
+    """Live progress of a reprocessing run."""
+    status: str = "idle"  # idle, running, completed, failed, cancelled
+    total_records: int = 0
+    processed: int = 0
+    updated: int = 0
+    skipped_no_text: int = 0
+    errors: int = 0
+    sentiment_changes: Dict[str, int] = field(
+        default_factory=lambda: {**{key: 0 for key in _LABEL_CHANGES}, "unchanged": 0}
+    )
+    dry_run: bool = False
+    with_ai: bool = False
+    resumed_from: Optional[str] = None
+    checkpoint_id: Optional[str] = None
+    failed_ranges: List[List[str]] = field(default_factory=list)  # [first_id, last_id] of failed batches
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    error: Optional[str] = None
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        rate = self.processed / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+        remaining = max(self.total_records - self.processed, 0)
+        data["records_per_second"] = round(rate, 2)
+        data["eta_seconds"] = round(remaining / rate) if rate > 0 and self.status == "running" else None
+        data["percent_complete"] = (
+            round(self.processed / self.total_records * 100, 1) if self.total_records else 0.0
+        )
+        return data
+
+
+@dataclass
+class _Batch:
+    sequence: int
+    last_id: uuid.UUID
+    rows: List[Any]
+    updates: List[Dict[str, Any]] = field(default_factory=list)
+    skipped: int = 0
+    failed: int = 0  # Rows whose inference failed
+
+
+def _map_source(source: Optional[str]):
+    """Map a stored source name to the DataSource used for model routing."""
+    from app.service.sentiment_processing import DataSource
+    source_map = {
+        "hackernews": DataSource.HACKERNEWS,
+        "finnhub": DataSource.FINNHUB,
+        "newsapi": DataSource.NEWSAPI,
+        "gdelt": DataSource.GDELT,
+        "reddit": DataSource.HACKERNEWS,  # Fallback
+    }
+    return source_map.get((source or "newsapi").lower(), DataSource.NEWSAPI)
+
+
+def load_checkpoint() -> Optional[Dict[str, Any]]:
+    """Checkpoint of an interrupted run, if any."""
+    try:
+        with open(CHECKPOINT_FILE, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _save_checkpoint(progress: ReprocessingProgress, options: ReprocessingOptions) -> None:
+    CHECKPOINT_FILE.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "last_id": progress.checkpoint_id,
+        "processed": progress.processed,
+        "updated": progress.updated,
+        "skipped_no_text": progress.skipped_no_text,
+        "errors": progress.errors,
+        "sentiment_changes": progress.sentiment_changes,
+        "failed_ranges": progress.failed_ranges,
+        "with_ai": options.with_ai,
+        "saved_at": utc_now().isoformat()
+    }
+    temp_file = CHECKPOINT_FILE.with_suffix(".tmp")
+    with open(temp_file, "w") as f:
+        json.dump(data, f, indent=2)
+    temp_file.replace(CHECKPOINT_FILE)
+
+
+def clear_checkpoint() -> None:
+    """Forget the checkpoint so the next run starts from the beginning."""
+    CHECKPOINT_FILE.unlink(missing_ok=True)
+
+
+class SentimentReprocessingService:
+    """Runs and tracks sentiment reprocessing jobs (one at a time)."""
+
+    def __init__(self):
+        self.progress = ReprocessingProgress()
+        self._task: Optional[asyncio.Task] = None
+        self._cancel = asyncio.Event()
+
+    @property
+    def is_running(self) -> bool:
+        return self.progress.status == "running"
+
+    def get_progress(self) -> Dict[str, Any]:
+        """Progress of the current or last run."""
+        data = self.progress.to_dict()
+        checkpoint = load_checkpoint()
+        data["resumable"] = checkpoint is not None and not self.is_running
+        return data
+
+    def start(self, options: ReprocessingOptions) -> Dict[str, Any]:
+        """
+        Start a run in the background.
+
+        Raises:
+            RuntimeError: A run is already in progress
+        """
+        if self.is_running:
+            raise RuntimeError("Sentiment reprocessing is already running")
+        # Mark running before the task is scheduled so a second call is rejected
+        self.progress = ReprocessingProgress(status="running", dry_run=options.dry_run, with_ai=options.with_ai)
+        self._cancel = asyncio.Event()
+        self._task = asyncio.create_task(self.run(options))
+        return self.get_progress()
+
+    def cancel(self) -> bool:
+        """Ask the running job to stop after the batches in flight; keeps the checkpoint."""
+        if not self.is_running:
+            return False
+        self._cancel.set()
+        return True
+
+    async def run(
+        self,
+        options: ReprocessingOptions,
+        engine: Any = None,
+        on_batch: Optional[Callable[[ReprocessingProgress], None]] = None
+    ) -> ReprocessingProgress:
+        """
+        Reprocess sentiment records.
+
+        Args:
+            options: Run settings
+            engine: Initialized SentimentEngine (one is created for the run if None)
+            on_batch: Called with the progress after each written batch
+
+        Returns:
+            Final progress
+        """
+        if not self.is_running:
+            # Called directly rather than through start()
+            self._cancel = asyncio.Event()
+        progress = ReprocessingProgress(
+            status="running",
+            dry_run=options.dry_run,
+            with_ai=options.with_ai,
+            started_at=utc_now().isoformat()
+        )
+        self.progress = progress
+        started = time.monotonic()
+
+        after_id = None
+        checkpoint = load_checkpoint() if options.resume and not options.dry_run else None
+        if checkpoint and checkpoint.get("last_id"):
+            after_id = uuid.UUID(checkpoint["last_id"])
+            progress.resumed_from = checkpoint["last_id"]
+            progress.checkpoint_id = checkpoint["last_id"]
+            for key in ("processed", "updated", "skipped_no_text", "errors"):
+                setattr(progress, key, int(checkpoint.get(key, 0)))
+            progress.sentiment_changes.update(checkpoint.get("sentiment_changes", {}))
+            progress.failed_ranges = [list(r) for r in checkpoint.get("failed_ranges", [])]
+            logger.info(f"Resuming sentiment reprocessing after {after_id}", processed=progress.processed)
+
+        owns_engine = engine is None
+        try:
+            if owns_engine:
+                engine = await self._create_engine(options)
+
+            async with get_db_session() as db:
+                progress.total_records = int(await db.scalar(
+                    select(func.count(SentimentData.id)).where(self._has_text())
+                ) or 0)
+            if options.limit:
+                progress.total_records = min(progress.total_records, progress.processed + options.limit)
+
+            await self._run_pipeline(options, engine, progress, after_id, started, on_batch)
+            if progress.failed_ranges and not self._cancel.is_set():
+                await self._retry_failed(options, engine, progress)
+
+            if self._cancel.is_set():
+                progress.status = "cancelled"
+            else:
+                progress.status = "completed"
+                if not options.dry_run and not options.limit:
+                    if progress.failed_ranges:
+                        # Keep the ranges for the next run to retry
+                        _save_checkpoint(progress, options)
+                    else:
+                        clear_checkpoint()
+        except Exception as e:
+            progress.status = "failed"
+            progress.error = str(e)
+            logger.error("Sentiment reprocessing failed", error=str(e), processed=progress.processed)
+        finally:
+            progress.elapsed_seconds = time.monotonic() - started
+            progress.finished_at = utc_now().isoformat()
+            if owns_engine and engine is not None:
+                await engine.shutdown()
+
+        logger.info(
+            f"Sentiment reprocessing {progress.status}",
+            processed=progress.processed,
+            updated=progress.updated,
+            elapsed_seconds=round(progress.elapsed_seconds, 1)
+        )
+        return progress
+
+    async def _create_engine(self, options: ReprocessingOptions):
+        from app.service.sentiment_processing import EngineConfig, SentimentEngine
+        config = EngineConfig(
+            enable_finbert=True,
+            finbert_use_gpu=False,
+            default_batch_size=options.batch_size,
+            enable_ai_verification=options.with_ai
+        )
+        engine = SentimentEngine(config)
+        await engine.initialize()
+        return engine
+
+    @staticmethod
+    def _has_text():
+        return and_(SentimentData.raw_text.isnot(None), SentimentData.raw_text != "")
+
+    def _rows_query(self):
+        return (
+            select(
+                SentimentData.id,
+                SentimentData.raw_text,
+                SentimentData.source,
+                SentimentData.sentiment_label,
+                SentimentData.additional_metadata,
+                StocksWatchlist.symbol
+            )
+            .outerjoin(StocksWatchlist, StocksWatchlist.id == SentimentData.stock_id)
+            .where(self._has_text())
+            .order_by(SentimentData.id)
+        )
+
+    async def _read_page(self, after_id: Optional[uuid.UUID], size: int) -> List[Any]:
+        query = self._rows_query().limit(size)
+        if after_id is not None:
+            query = query.where(SentimentData.id > after_id)
+        async with get_db_session() as db:
+            return list((await db.execute(query)).all())
+
+    async def _read_range(self, first_id: uuid.UUID, last_id: uuid.UUID) -> List[Any]:
+        query = self._rows_query().where(and_(SentimentData.id >= first_id, SentimentData.id <= last_id))
+        async with get_db_session() as db:
+            return list((await db.execute(query)).all())
+
+    async def _run_pipeline(
+        self,
+        options: ReprocessingOptions,
+        engine: Any,
+        progress: ReprocessingProgress,
+        after_id: Optional[uuid.UUID],
+        started: float,
+        on_batch: Optional[Callable[[ReprocessingProgress], None]]
+    ) -> None:
+        workers = max(1, options.inference_workers)
+        read_queue: asyncio.Queue = asyncio.Queue(maxsize=options.queue_depth)
+        write_queue: asyncio.Queue = asyncio.Queue(maxsize=options.queue_depth)
+
+        async def reader():
+            cursor = after_id
+            remaining = options.limit
+            sequence = 0
+            while not self._cancel.is_set():
+                size = options.batch_size if remaining is None else min(options.batch_size, remaining)
+                if size <= 0:
+                    break
+                rows = await self._read_page(cursor, size)
+                if not rows:
+                    break
+                cursor = rows[-1].id
+                await read_queue.put(_Batch(sequence, cursor, rows))
+                sequence += 1
+                if remaining is not None:
+                    remaining -= len(rows)
+            for _ in range(workers):
+                await read_queue.put(None)
+
+        async def infer():
+            while True:
+                batch = await read_queue.get()
+                if batch is None:
+                    break
+                await self._score_batch(engine, batch, progress)
+                await write_queue.put(batch)
+            await write_queue.put(None)
+
+        async def writer():
+            finished_workers = 0
+            # Batches can finish out of order; the checkpoint only advances
+            # over the contiguous prefix of written batches
+            written: Dict[int, uuid.UUID] = {}
+            next_sequence = 0
+            while finished_workers < workers:
+                batch = await write_queue.get()
+                if batch is None:
+                    finished_workers += 1
+                    continue
+                if batch.updates and not options.dry_run:
+                    await self._write_batch(batch.updates)
+                progress.updated += len(batch.updates)
+                progress.processed += len(batch.rows)
+                progress.skipped_no_text += batch.skipped
+                progress.errors += batch.failed
+                if batch.failed:
+                    progress.failed_ranges.append([str(batch.rows[0].id), str(batch.last_id)])
+
+                written[batch.sequence] = batch.last_id
+                advanced = False
+                while next_sequence in written:
+                    progress.checkpoint_id = str(written.pop(next_sequence))
+                    next_sequence += 1
+                    advanced = True
+                if advanced and not options.dry_run:
+                    _save_checkpoint(progress, options)
+
+                progress.elapsed_seconds = time.monotonic() - started
+                if on_batch is not None:
+                    on_batch(progress)
+
+        tasks = [asyncio.create_task(reader()), asyncio.create_task(writer())]
+        tasks += [asyncio.create_task(infer()) for _ in range(workers)]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                if task.exception() is not None:
+                    raise task.exception()
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _retry_failed(
+        self,
+        options: ReprocessingOptions,
+        engine: Any,
+        progress: ReprocessingProgress
+    ) -> None:
+        """Score the id ranges of failed batches once more."""
+        ranges, progress.failed_ranges = progress.failed_ranges, []
+        logger.info(f"Retrying {len(ranges)} failed reprocessing batch(es)")
+        for first_id, last_id in ranges:
+            if self._cancel.is_set():
+                progress.failed_ranges.append([first_id, last_id])
+                continue
+            rows = await self._read_range(uuid.UUID(first_id), uuid.UUID(last_id))
+            if not rows:
+                continue
+            batch = _Batch(0, rows[-1].id, rows)
+            await self._score_batch(engine, batch, progress)
+            if batch.failed:
+                progress.failed_ranges.append([first_id, last_id])
+                continue
+            if batch.updates and not options.dry_run:
+                await self._write_batch(batch.updates)
+            progress.updated += len(batch.updates)
+            progress.errors = max(progress.errors - len(batch.updates), 0)
+        if progress.failed_ranges:
+            logger.warning(
+                f"{len(progress.failed_ranges)} reprocessing batch(es) failed again; kept for the next run"
+            )
+
+    async def _score_batch(self, engine: Any, batch: _Batch, progress: ReprocessingProgress) -> None:
+        from app.service.sentiment_processing import TextInput
+        inputs = []
+        rows = []
+        for row in batch.rows:
+            text = (row.raw_text or "").strip()
+            if len(text) < MIN_TEXT_LENGTH:
+                batch.skipped += 1
+                continue
+            metadata = row.additional_metadata if isinstance(row.additional_metadata, dict) else {}
+            inputs.append(TextInput(
+                text=text,
+                source=_map_source(row.source),
+                stock_symbol=row.symbol or metadata.get("stock_symbol", "UNKNOWN")
+            ))
+            rows.append(row)
+        if not inputs:
+            return
+
+        try:
+            results = await engine.analyze(inputs)
+        except Exception as e:
+            logger.warning(f"Reprocessing batch failed: {e}", batch_size=len(inputs))
+            batch.failed = len(inputs)
+            return
+
+        reprocessed_at = utc_now().isoformat()
+        for row, result in zip(rows, results):
+            new_label = result.label.value.capitalize()
+            self._track_change(progress, row.sentiment_label, new_label)
+            metadata = dict(row.additional_metadata) if isinstance(row.additional_metadata, dict) else {}
+            metadata["reprocessed_at"] = reprocessed_at
+            metadata["reprocessed_model"] = result.model_name
+            if getattr(result, "ai_verified", False):
+                metadata["ai_verified"] = True
+            batch.updates.append({
+                "id": row.id,
+                "sentiment_score": result.score,
+                "confidence": result.confidence,
+                "sentiment_label": new_label,
+                "model_used": result.model_name,
+                "additional_metadata": metadata
+            })
+
+    async def _write_batch(self, updates: List[Dict[str, Any]]) -> None:
+        # ORM bulk UPDATE by primary key: one executemany per batch
+        async with get_db_session() as db:
+            await db.execute(update(SentimentData), updates)
+
+    @staticmethod
+    def _track_change(progress: ReprocessingProgress, old_label: Optional[str], new_label: str) -> None:
+        old = old_label.lower() if old_label else "neutral"
+        new = new_label.lower()
+        if old == new:
+            progress.sentiment_changes["unchanged"] += 1
+        else:
+            key = f"{old}_to_{new}"
+            if key in progress.sentiment_changes:
+                progress.sentiment_changes[key] += 1
+
+
+_reprocessing_service: Optional[SentimentReprocessingService] = None
+
+
+def get_reprocessing_service() -> SentimentReprocessingService:
+    """Get the global reprocessing service instance."""
+    global _reprocessing_service
+    if _reprocessing_service is None:
+        _reprocessing_service = SentimentReprocessingService()
+    return _reprocessing_service
+
+
+__all__ = [
+    "ReprocessingOptions",
+    "ReprocessingProgress",
+    "SentimentReprocessingService",
+    "clear_checkpoint",
+    "get_reprocessing_service",
+    "load_checkpoint"
+]
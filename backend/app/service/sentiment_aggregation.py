@@ -0,0 +1,297 @@
+"""
+Sentiment Aggregation
+=====================
+
+Temporal-decay weighted aggregation of sentiment records.
+
+Every record gets the weight max(exp(-ln 2 * hours_ago / half_life), 0.05)
+and the aggregates are built from six per-source sums:
+
+    count, sum(w), sum(w*s), sum(w*s^2), sum(w*c), sum(w*c*s)
+
+From these come the decay-weighted mean score, weighted variance, weighted
+mean confidence and the confidence-weighted score, both per source and
+overall. The sums can be produced in two ways:
+
+- aggregate_decayed(): a NumPy kernel over columnar arrays, fed by a query
+  that projects only (hours_ago, score, confidence, source)
+- the SQL variant in load_decayed_sentiment(push_down=True), which computes
+  the weights and sums inside the database and returns one row per source
+
+Neither path materializes SentimentData ORM objects.
+"""
+
+import math
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import DateTime, and_, extract, func, literal, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.data_access.models import SentimentData
+from app.infrastructure.log_system import get_logger
+from app.utils.time_buckets import dialect_name
+from app.utils.timezone import ensure_utc, to_naive_utc, utc_now
+
+logger = get_logger()
+
+# Floor for very old records so they never vanish from the average entirely
+MIN_DECAY_WEIGHT = 0.05
+
+# SQLite builds without SQLITE_ENABLE_MATH_FUNCTIONS have no exp(); checked once
+_sqlite_has_exp: Optional[bool] = None
+
+
+@dataclass
+class DecayedSentiment:
+    """Decay-weighted sentiment aggregates for one group of records."""
+    count: int = 0
+    total_weight: float = 0.0
+    mean_score: float = 0.0
+    score_variance: float = 0.0
+    mean_confidence: float = 0.0
+    confidence_weighted_score: float = 0.0
+    by_source: Dict[str, "DecayedSentiment"] = field(default_factory=dict)
+
+    @property
+    def score_std(self) -> float:
+        return math.sqrt(self.score_variance)
+
+    @classmethod
+    def from_sums(
+        cls,
+        count: int,
+        weight_sum: float,
+        score_sum: float,
+        score_sq_sum: float,
+        confidence_sum: float,
+        confidence_score_sum: float
+    ) -> "DecayedSentiment":
+        """Build aggregates from weighted sums (see module docstring)."""
+        if count <= 0 or weight_sum <= 0:
+            return cls(count=int(count))
+        mean = score_sum / weight_sum
+        return cls(
+            count=int(count),
+            total_weight=float(weight_sum),
+            mean_score=float(mean),
+            # E[s^2] - E[s]^2 can dip below zero by rounding
+            score_variance=float(max(score_sq_sum / weight_sum - mean * mean, 0.0)),
+            mean_confidence=float(confidence_sum / weight_sum),
+            confidence_weighted_score=float(confidence_score_sum / confidence_sum) if confidence_sum > 0 else 0.0
+        )
+
+    @classmethod
+    def from_source_sums(cls, sums: Dict[str, Sequence[float]]) -> "DecayedSentiment":
+        """Build overall and per-source aggregates from per-source sum tuples."""
+        totals = [0.0] * 6
+        by_source = {}
+        for source, source_sums in sums.items():
+            by_source[source] = cls.from_sums(*source_sums)
+            totals = [total + value for total, value in zip(totals, source_sums)]
+        overall = cls.from_sums(*totals)
+        overall.by_source = by_source
+        return overall
+
+
+def decay_weights(
+    hours_ago: Any,
+    half_life_hours: float,
+    enabled: bool = True,
+    min_weight: float = MIN_DECAY_WEIGHT
+) -> np.ndarray:
+    """
+    Exponential decay weights for record ages.
+
+    Args:
+        hours_ago: Array-like of record ages in hours
+        half_life_hours: Age at which a record counts half
+        enabled: When False every record weighs 1.0
+        min_weight: Lower bound for very old records
+
+    Returns:
+        Float64 array of weights
+    """
+    hours = np.asarray(hours_ago, dtype=np.float64)
+    if not enabled:
+        return np.ones_like(hours)
+    decay_rate = math.log(2) / half_life_hours
+    return np.maximum(np.exp(-decay_rate * hours), min_weight)
+
+
+def aggregate_decayed(
+    hours_ago: Any,
+    scores: Any,
+    confidences: Any,
+    sources: Sequence[str],
+    half_life_hours: float,
+    enabled: bool = True
+) -> DecayedSentiment:
+    """
+    Decay-weighted aggregates over columnar arrays in one vectorized pass.
+
+    Args:
+        hours_ago: Record ages in hours
+        scores: Sentiment scores
+        confidences: Model confidences
+        sources: Source name per record
+        half_life_hours: Decay half-life
+        enabled: Apply temporal decay
+
+    Returns:
+        DecayedSentiment with per-source breakdown
+    """
+    weights = decay_weights(hours_ago, half_life_hours, enabled)
+    if weights.size == 0:
+        return DecayedSentiment()
+
+    score = np.asarray(scores, dtype=np.float64)
+    confidence = np.asarray(confidences, dtype=np.float64)
+    labels, groups = np.unique(np.asarray(sources, dtype=object), return_inverse=True)
+    size = len(labels)
+
+    weighted_score = weights * score
+    weighted_confidence = weights * confidence
+    columns = (
+        np.bincount(groups, minlength=size),
+        np.bincount(groups, weights=weights, minlength=size),
+        np.bincount(groups, weights=weighted_score, minlength=size),
+        np.bincount(groups, weights=weighted_score * score, minlength=size),
+        np.bincount(groups, weights=weighted_confidence, minlength=size),
+        np.bincount(groups, weights=weighted_confidence * score, minlength=size)
+    )
+    sums = {
+        str(label): [float(column[index]) for column in columns]
+        for index, label in enumerate(labels)
+    }
+    return DecayedSentiment.from_source_sums(sums)
+
+
+def hours_since(column: Any, now: datetime, dialect: str) -> ColumnElement:
+    """
+    SQL expression for the age of a timestamp column in hours.
+
+    Args:
+        column: UTC timestamp column
+        now: Reference time
+        dialect: Dialect name ("sqlite" or "postgresql")
+    """
+    if dialect == "postgresql":
+        reference = literal(ensure_utc(now), DateTime(timezone=True))
+        return extract("epoch", reference - column) / 3600.0
+    if dialect == "sqlite":
+        return (func.julianday(to_naive_utc(now)) - func.julianday(column)) * 24.0
+    raise ValueError(f"Decay aggregation is not supported for dialect: {dialect}")
+
+
+def decay_weight_expression(
+    column: Any,
+    now: datetime,
+    dialect: str,
+    half_life_hours: float,
+    enabled: bool = True
+) -> ColumnElement:
+    """SQL expression for the decay weight of each row (see decay_weights)."""
+    if not enabled:
+        return literal(1.0)
+    decay_rate = math.log(2) / half_life_hours
+    weight = func.exp(hours_since(column, now, dialect) * -decay_rate)
+    # Scalar max() on SQLite, greatest() on PostgreSQL
+    floor = func.greatest if dialect == "postgresql" else func.max
+    return floor(weight, MIN_DECAY_WEIGHT)
+
+
+async def supports_sql_decay(db: AsyncSession) -> bool:
+    """Whether the database can evaluate exp() for the SQL variant."""
+    global _sqlite_has_exp
+    dialect = dialect_name(db)
+    if dialect == "postgresql":
+        return True
+    if dialect != "sqlite":
+        return False
+    if _sqlite_has_exp is None:
+        try:
+            await db.execute(text("SELECT exp(0)"))
+            _sqlite_has_exp = True
+        except Exception:
+            _sqlite_has_exp = False
+    return _sqlite_has_exp
+
+
+async def load_decayed_sentiment(
+    db: AsyncSession,
+    stock_id: Any,
+    since: datetime,
+    half_life_hours: float,
+    enabled: bool = True,
+    push_down: Optional[bool] = None
+) -> DecayedSentiment:
+    """
+    Decay-weighted sentiment for one stock since a cutoff.
+
+    Args:
+        db: Database session
+        stock_id: Stock primary key
+        since: Only records created at or after this time
+        half_life_hours: Decay half-life
+        enabled: Apply temporal decay
+        push_down: True computes the sums in SQL, False loads projected
+            columns into the NumPy kernel; None picks SQL when supported
+
+    Returns:
+        DecayedSentiment with per-source breakdown
+    """
+    if push_down is None:
+        push_down = await supports_sql_decay(db)
+
+    dialect = dialect_name(db)
+    now = utc_now()
+    timestamp = SentimentData.created_at
+    condition = and_(SentimentData.stock_id == stock_id, timestamp >= since)
+
+    if push_down:
+        weight = decay_weight_expression(timestamp, now, dialect, half_life_hours, enabled)
+        score = SentimentData.sentiment_score
+        confidence = SentimentData.confidence
+        rows = await db.execute(
+            select(
+                SentimentData.source,
+                func.count(),
+                func.sum(weight),
+                func.sum(weight * score),
+                func.sum(weight * score * score),
+                func.sum(weight * confidence),
+                func.sum(weight * confidence * score)
+            )
+            .where(condition)
+            .group_by(SentimentData.source)
+        )
+        sums = {
+            str(source): [float(value or 0) for value in values]
+            for source, *values in rows.all()
+        }
+        return DecayedSentiment.from_source_sums(sums)
+
+    rows = (await db.execute(
+        select(
+            hours_since(timestamp, now, dialect),
+            SentimentData.sentiment_score,
+            SentimentData.confidence,
+            SentimentData.source
+        ).where(condition)
+    )).all()
+    if not rows:
+        return DecayedSentiment()
+
+    hours_ago, scores, confidences, sources = zip(*rows)
+    return aggregate_decayed(
+        hours_ago,
+        scores,
+        [value or 0.0 for value in confidences],
+        [str(source) for source in sources],
+        half_life_hours,
+        enabled
+    )
@@ -11,7 +11,6 @@ This module handles the SY-FR3 requirement: Perform Sentiment Analysis
 """
 
 from .sentiment_engine import SentimentEngine, EngineConfig, get_sentiment_engine, reset_sentiment_engine
-from .models.finbert_model import FinBERTModel
 from .models.sentiment_model import (
     SentimentModel,
     SentimentResult,
@@ -22,6 +21,15 @@ from .models.sentiment_model import (
     SentimentModelError
 )
 
+
+def __getattr__(name):
+    # FinBERTModel imports torch; load it on first access only
+    if name == "FinBERTModel":
+        from .models.finbert_model import FinBERTModel
+        return FinBERTModel
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "SentimentEngine",
     "EngineConfig",
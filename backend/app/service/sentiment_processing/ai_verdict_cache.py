@@ -0,0 +1,222 @@
+"""
+AI Verdict Cache
+================
+
+Persistent cache of AI verification verdicts (label, confidence, reasoning),
+keyed by (normalized text hash, prompt version, model id).
+
+Borderline texts reappear in every pipeline run whose lookback window
+overlaps the previous one, and again when sentiment data is reprocessed
+with AI. Looking verdicts up here first means Gemma only sees texts it has
+not judged under the current prompt and model.
+
+- Verdicts live in the ai_verdict_cache table, so they survive restarts and
+  are shared by the pipeline and scripts/reprocess_sentiment_data.py
+- A small in-process LRU sits in front of the table
+- Verdicts expire after ttl_hours; beyond max_entries the least recently
+  used are evicted (pruned at most every PRUNE_INTERVAL_SECONDS)
+- When the database is not initialized (standalone analyzer use) only the
+  in-process layer is used
+"""
+
+import hashlib
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Dict, Iterable, Optional, Tuple
+
+from app.infrastructure.log_system import get_logger
+from app.utils.timezone import utc_now
+
+logger = get_logger()
+
+DEFAULT_TTL_HOURS = 24 * 30
+DEFAULT_MAX_ENTRIES = 100_000
+DEFAULT_MEMORY_ENTRIES = 5_000
+PRUNE_INTERVAL_SECONDS = 600
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass(frozen=True)
+class CachedVerdict:
+    """An AI verification verdict."""
+    label: str
+    confidence: float
+    reasoning: Optional[str] = None
+
+    def as_tuple(self) -> Tuple[str, float, Optional[str]]:
+        return self.label, self.confidence, self.reasoning
+
+
+def normalize_text(text: str, max_chars: Optional[int] = None) -> str:
+    """
+    Normalize text for verdict lookup.
+
+    Args:
+        text: Raw text
+        max_chars: Only this many characters reach the prompt, so only they
+            distinguish verdicts
+
+    Returns:
+        NFKC-normalized, case-folded text with collapsed whitespace
+    """
+    text = text[:max_chars] if max_chars else text
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip().casefold()
+
+
+def text_hash(text: str, max_chars: Optional[int] = None) -> str:
+    """SHA-256 of the normalized text."""
+    return hashlib.sha256(normalize_text(text, max_chars).encode("utf-8")).hexdigest()
+
+
+def prompt_version(prompt_template: str) -> str:
+    """Version tag derived from the prompt text, so prompt edits invalidate verdicts."""
+    return hashlib.sha256(prompt_template.encode("utf-8")).hexdigest()[:16]
+
+
+class AIVerdictCache:
+    """Two-level (memory + database) cache of AI verdicts."""
+
+    def __init__(
+        self,
+        ttl_hours: float = DEFAULT_TTL_HOURS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        memory_entries: int = DEFAULT_MEMORY_ENTRIES
+    ):
+        self.ttl = timedelta(hours=ttl_hours)
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        # (text_hash, prompt_version, model_id) -> (verdict, monotonic time stored)
+        self._memory: "OrderedDict[Tuple[str, str, str], Tuple[CachedVerdict, float]]" = OrderedDict()
+        self._last_prune = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    async def get_many(
+        self,
+        hashes: Iterable[str],
+        version: str,
+        model_id: str
+    ) -> Dict[str, CachedVerdict]:
+        """
+        Look verdicts up, memory first, then the database.
+
+        Args:
+            hashes: Text hashes from text_hash()
+            version: Prompt version from prompt_version()
+            model_id: AI model id
+
+        Returns:
+            text_hash -> verdict for every hash found and unexpired
+        """
+        wanted = list(dict.fromkeys(hashes))
+        found: Dict[str, CachedVerdict] = {}
+        ttl_seconds = self.ttl.total_seconds()
+        now = time.monotonic()
+
+        missing = []
+        for text_hash_ in wanted:
+            key = (text_hash_, version, model_id)
+            entry = self._memory.get(key)
+            if entry is not None and now - entry[1] < ttl_seconds:
+                self._memory.move_to_end(key)
+                found[text_hash_] = entry[0]
+            else:
+                missing.append(text_hash_)
+
+        if missing:
+            rows = await self._load(missing, version, model_id)
+            for text_hash_, verdict in rows.items():
+                found[text_hash_] = verdict
+                self._remember((text_hash_, version, model_id), verdict)
+
+        self.hits += len(found)
+        self.misses += len(wanted) - len(found)
+        return found
+
+    async def put_many(self, verdicts: Dict[str, CachedVerdict], version: str, model_id: str) -> None:
+        """
+        Store verdicts in memory and the database.
+
+        Args:
+            verdicts: text_hash -> verdict
+            version: Prompt version
+            model_id: AI model id
+        """
+        if not verdicts:
+            return
+        for text_hash_, verdict in verdicts.items():
+            self._remember((text_hash_, version, model_id), verdict)
+        await self._store(verdicts, version, model_id)
+
+    def get_stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups * 100, 1) if lookups else 0.0,
+            "memory_entries": len(self._memory)
+        }
+
+    def clear_memory(self) -> None:
+        self._memory.clear()
+
+    def _remember(self, key: Tuple[str, str, str], verdict: CachedVerdict) -> None:
+        self._memory[key] = (verdict, time.monotonic())
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    async def _load(self, hashes: list, version: str, model_id: str) -> Dict[str, CachedVerdict]:
+        from app.data_access.database import get_db_session
+        from app.data_access.repositories import AIVerdictRepository
+        try:
+            async with get_db_session() as session:
+                rows = await AIVerdictRepository(session).get_fresh(
+                    hashes, version, model_id, utc_now() - self.ttl
+                )
+                return {
+                    row.text_hash: CachedVerdict(row.label, float(row.confidence), row.reasoning)
+                    for row in rows
+                }
+        except Exception as e:
+            # Database not initialized or unavailable: memory only
+            logger.debug(f"AI verdict cache lookup skipped: {e}")
+            return {}
+
+    async def _store(self, verdicts: Dict[str, CachedVerdict], version: str, model_id: str) -> None:
+        from app.data_access.database import get_db_session
+        from app.data_access.repositories import AIVerdictRepository
+        try:
+            async with get_db_session() as session:
+                repository = AIVerdictRepository(session)
+                await repository.upsert_many(version, model_id, {
+                    text_hash_: {
+                        "label": verdict.label,
+                        "confidence": verdict.confidence,
+                        "reasoning": verdict.reasoning
+                    }
+                    for text_hash_, verdict in verdicts.items()
+                })
+                if time.monotonic() - self._last_prune > PRUNE_INTERVAL_SECONDS:
+                    self._last_prune = time.monotonic()
+                    pruned = await repository.prune(utc_now() - self.ttl, self.max_entries)
+                    if pruned:
+                        logger.info(f"Pruned {pruned} AI verdict cache entries")
+        except Exception as e:
+            logger.debug(f"AI verdict cache write skipped: {e}")
+
+
+_ai_verdict_cache: Optional[AIVerdictCache] = None
+
+
+def get_ai_verdict_cache() -> AIVerdictCache:
+    """Get the process-wide AI verdict cache."""
+    global _ai_verdict_cache
+    if _ai_verdict_cache is None:
+        _ai_verdict_cache = AIVerdictCache()
+    return _ai_verdict_cache
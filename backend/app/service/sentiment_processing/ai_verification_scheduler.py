@@ -0,0 +1,481 @@
+"""
+AI Verification Scheduler
+=========================
+
+Schedules Gemma verification requests against the Google AI Studio quota
+(30 RPM, 15,000 TPM, 14,400 RPD for gemma-3-27b-it).
+
+- GemmaRateLimiter: one token bucket per quota dimension, shared by every
+  analyzer in the process (get_gemma_rate_limiter()). Buckets refill
+  continuously, so capacity freed mid-minute is usable immediately instead
+  of waiting for a sliding window to expire. A 429 drains the buckets and
+  pauses all callers.
+- TokenCounter: request size estimates calibrated with real token counts:
+  the fixed prompt is counted once with the model tokenizer
+  (count_tokens) and the per-character and per-result rates are updated
+  from the usage metadata of every response.
+- AIVerificationScheduler: pops items lowest ML confidence first, packs
+  each request up to a token budget and keeps as many requests in flight
+  as the live TPM budget allows. When the quota cannot serve everything
+  within max_wait_seconds, the remaining (most confident) items are left
+  unverified.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from app.infrastructure.log_system import get_logger
+
+logger = get_logger()
+
+# Google AI Studio limits for gemma-3-27b-it
+GEMMA_RPM_LIMIT = 30
+GEMMA_TPM_LIMIT = 15000
+GEMMA_RPD_LIMIT = 14400
+
+# Share of the TPM quota the scheduler plans against; covers estimate error
+TPM_SAFETY_FACTOR = 0.9
+
+# Texts are truncated to this many characters in the batch prompt
+BATCH_TEXT_CHARS = 500
+
+# (sentiment, confidence, reasoning); all None when verification failed
+VerificationResult = Tuple[Optional[str], Optional[float], Optional[str]]
+
+# Sends one packed request: texts -> (results in order, usage metadata or None)
+BatchSender = Callable[[List[str]], Awaitable[Tuple[List[VerificationResult], Any]]]
+
+
+class RateLimitExceeded(Exception):
+    """The API rejected a request with 429 / RESOURCE_EXHAUSTED."""
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Whether an API error is a quota rejection."""
+    message = str(error)
+    return "429" in message or "exhausted" in message.lower()
+
+
+class TokenBucket:
+    """Continuously refilling token bucket (not thread-safe; guard with a lock)."""
+
+    def __init__(self, capacity: float, period_seconds: float):
+        self.capacity = float(capacity)
+        self.refill_rate = self.capacity / period_seconds
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def refill(self, now: Optional[float] = None) -> None:
+        now = time.monotonic() if now is None else now
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until amount is available (amount is capped at capacity)."""
+        missing = min(amount, self.capacity) - self.tokens
+        return max(0.0, missing / self.refill_rate)
+
+    def consume(self, amount: float) -> None:
+        # May go negative when an estimate is corrected upwards; refills repay it
+        self.tokens -= amount
+
+    def drain(self) -> None:
+        self.tokens = min(self.tokens, 0.0)
+
+
+class GemmaRateLimiter:
+    """RPM / TPM / RPD token buckets for the shared Gemma quota."""
+
+    def __init__(
+        self,
+        rpm: int = GEMMA_RPM_LIMIT,
+        tpm: int = GEMMA_TPM_LIMIT,
+        rpd: int = GEMMA_RPD_LIMIT,
+        tpm_safety_factor: float = TPM_SAFETY_FACTOR
+    ):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.rpd = rpd
+        self._requests = TokenBucket(rpm, 60.0)
+        self._tokens = TokenBucket(int(tpm * tpm_safety_factor), 60.0)
+        self._daily = TokenBucket(rpd, 86400.0)
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+        self.rate_limited_count = 0
+
+    @property
+    def token_capacity(self) -> int:
+        """Tokens a single request may use at most."""
+        return int(self._tokens.capacity)
+
+    def _refill(self) -> float:
+        now = time.monotonic()
+        for bucket in (self._requests, self._tokens, self._daily):
+            bucket.refill(now)
+        return now
+
+    async def wait_time(self, tokens: int) -> float:
+        """Seconds until a request of this size could start."""
+        async with self._lock:
+            now = self._refill()
+            return max(
+                self._paused_until - now,
+                self._requests.wait_time(1),
+                self._tokens.wait_time(tokens),
+                self._daily.wait_time(1)
+            )
+
+    async def acquire(self, tokens: int, max_wait: Optional[float] = None) -> bool:
+        """
+        Reserve quota for one request, sleeping until it is available.
+
+        Args:
+            tokens: Estimated tokens (prompt + output) of the request
+            max_wait: Give up instead of sleeping longer than this
+
+        Returns:
+            True if reserved, False if the wait would exceed max_wait
+        """
+        while True:
+            async with self._lock:
+                now = self._refill()
+                wait = max(
+                    self._paused_until - now,
+                    self._requests.wait_time(1),
+                    self._tokens.wait_time(tokens),
+                    self._daily.wait_time(1)
+                )
+                if wait <= 0:
+                    self._requests.consume(1)
+                    self._tokens.consume(tokens)
+                    self._daily.consume(1)
+                    return True
+            if max_wait is not None and wait > max_wait:
+                return False
+            await asyncio.sleep(wait)
+
+    async def try_acquire(self, tokens: int) -> bool:
+        """Reserve quota only if it is available right now."""
+        return await self.acquire(tokens, max_wait=0.0)
+
+    async def settle(self, reserved: int, actual: Optional[int]) -> None:
+        """Correct a reservation with the token count reported by the API."""
+        if actual is None or actual == reserved:
+            return
+        async with self._lock:
+            self._refill()
+            self._tokens.consume(actual - reserved)
+
+    async def backoff(self, seconds: float) -> None:
+        """After a 429: empty the minute buckets and pause every caller."""
+        async with self._lock:
+            now = self._refill()
+            self._requests.drain()
+            self._tokens.drain()
+            self._paused_until = max(self._paused_until, now + seconds)
+            self.rate_limited_count += 1
+
+    async def available_tokens(self) -> float:
+        """Tokens that can be spent right now."""
+        async with self._lock:
+            self._refill()
+            return max(0.0, self._tokens.tokens)
+
+    def get_stats(self) -> Dict[str, Any]:
+        self._refill()
+        return {
+            "rpm_limit": self.rpm,
+            "tpm_limit": self.tpm,
+            "rpd_limit": self.rpd,
+            "requests_available": round(max(0.0, self._requests.tokens), 1),
+            "tokens_available": int(max(0.0, self._tokens.tokens)),
+            "daily_requests_available": int(max(0.0, self._daily.tokens)),
+            "rate_limited_count": self.rate_limited_count
+        }
+
+
+class TokenCounter:
+    """
+    Token estimates for packed verification requests.
+
+    Starts from conservative heuristics and converges on the model's real
+    tokenizer: the fixed prompt is measured with count_tokens() on first use,
+    then each response's usage metadata refines the characters-per-token and
+    output-tokens-per-item rates (exponential moving average).
+    """
+
+    # Conservative defaults until real counts are available
+    DEFAULT_PROMPT_TOKENS = 600
+    DEFAULT_CHARS_PER_TOKEN = 3.5
+    DEFAULT_OUTPUT_TOKENS_PER_ITEM = 30
+    # Per-item JSON wrapping ({"id": n, "text": ...}) in the prompt
+    ITEM_OVERHEAD_TOKENS = 12
+    SMOOTHING = 0.3
+
+    def __init__(self, model: Any = None, prompt_template: Optional[str] = None):
+        self.model = model
+        self._prompt_template = prompt_template
+        self.prompt_tokens: float = self.DEFAULT_PROMPT_TOKENS
+        self.chars_per_token: float = self.DEFAULT_CHARS_PER_TOKEN
+        self.output_tokens_per_item: float = self.DEFAULT_OUTPUT_TOKENS_PER_ITEM
+        self._calibrated = False
+
+    async def calibrate(self) -> None:
+        """Count the fixed prompt with the model tokenizer (once)."""
+        if self._calibrated or self.model is None or self._prompt_template is None:
+            return
+        self._calibrated = True
+        try:
+            prompt = self._prompt_template.format(texts_json="[]", count=0)
+            loop = asyncio.get_event_loop()
+            counted = await loop.run_in_executor(None, lambda: self.model.count_tokens(prompt))
+            self.prompt_tokens = float(counted.total_tokens)
+        except Exception as e:
+            logger.debug(f"Prompt token count unavailable, keeping estimate: {e}")
+
+    def item_tokens(self, text: str) -> int:
+        """Prompt plus output tokens one text adds to a packed request."""
+        chars = min(len(text), BATCH_TEXT_CHARS)
+        return int(chars / self.chars_per_token + self.ITEM_OVERHEAD_TOKENS + self.output_tokens_per_item) + 1
+
+    def request_tokens(self, item_tokens: Sequence[int]) -> int:
+        return int(self.prompt_tokens) + sum(item_tokens)
+
+    def observe(self, texts: Sequence[str], usage: Any) -> Optional[int]:
+        """
+        Learn from a response's usage metadata.
+
+        Returns:
+            Total tokens of the request, if reported
+        """
+        if usage is None or not texts:
+            return None
+        prompt_count = getattr(usage, "prompt_token_count", None)
+        output_count = getattr(usage, "candidates_token_count", None)
+        total = getattr(usage, "total_token_count", None)
+
+        if prompt_count:
+            chars = sum(min(len(t), BATCH_TEXT_CHARS) for t in texts)
+            text_tokens = prompt_count - self.prompt_tokens - self.ITEM_OVERHEAD_TOKENS * len(texts)
+            if chars > 0 and text_tokens > 0:
+                self.chars_per_token = self._smooth(self.chars_per_token, chars / text_tokens)
+        if output_count:
+            self.output_tokens_per_item = self._smooth(self.output_tokens_per_item, output_count / len(texts))
+
+        if total:
+            return int(total)
+        if prompt_count or output_count:
+            return int((prompt_count or 0) + (output_count or 0))
+        return None
+
+    def _smooth(self, current: float, observed: float) -> float:
+        return current + self.SMOOTHING * (observed - current)
+
+
+@dataclass(order=True)
+class _QueuedItem:
+    priority: float
+    sequence: int
+    key: Hashable = field(compare=False)
+    text: str = field(compare=False)
+    attempts: int = field(default=0, compare=False)
+
+
+class AIVerificationScheduler:
+    """
+    Packs verification items into quota-sized requests, lowest confidence first.
+
+    Usage:
+        scheduler = AIVerificationScheduler(send_batch, get_gemma_rate_limiter(), counter)
+        results = await scheduler.run([(index, text, ml_confidence), ...])
+    """
+
+    def __init__(
+        self,
+        send_batch: BatchSender,
+        limiter: "GemmaRateLimiter",
+        counter: TokenCounter,
+        max_items_per_request: int = 25,
+        request_token_budget: int = 5000,
+        max_in_flight: int = 4,
+        max_wait_seconds: Optional[float] = 120.0,
+        max_attempts: int = 3,
+        rate_limit_backoff_seconds: float = 10.0
+    ):
+        """
+        Args:
+            send_batch: Coroutine sending one packed request
+            limiter: Shared quota buckets
+            counter: Token estimator
+            max_items_per_request: Upper bound on texts per request
+            request_token_budget: Tokens (prompt + output) one request is packed to
+            max_in_flight: Upper bound on concurrent requests
+            max_wait_seconds: Stop scheduling when the quota needs longer than this
+            max_attempts: Tries per item on 429s before it is left unverified
+            rate_limit_backoff_seconds: Base pause after a 429 (grows per attempt)
+        """
+        self._send_batch = send_batch
+        self.limiter = limiter
+        self.counter = counter
+        self.max_items_per_request = max_items_per_request
+        self.request_token_budget = min(request_token_budget, limiter.token_capacity)
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_wait_seconds = max_wait_seconds
+        self.max_attempts = max_attempts
+        self.rate_limit_backoff_seconds = rate_limit_backoff_seconds
+
+    def _pack(self, queue: List[_QueuedItem]) -> Tuple[List[_QueuedItem], int]:
+        """Pop the next request's items (lowest priority value first)."""
+        packed: List[_QueuedItem] = []
+        sizes: List[int] = []
+        while queue and len(packed) < self.max_items_per_request:
+            size = self.counter.item_tokens(queue[0].text)
+            if packed and self.counter.request_tokens(sizes + [size]) > self.request_token_budget:
+                break
+            packed.append(heapq.heappop(queue))
+            sizes.append(size)
+        return packed, self.counter.request_tokens(sizes)
+
+    async def _in_flight_limit(self, request_tokens: int, max_in_flight: int) -> int:
+        # As many requests as the tokens on hand cover, at least one
+        affordable = int(await self.limiter.available_tokens() // max(request_tokens, 1))
+        return max(1, min(max_in_flight, affordable))
+
+    async def run(
+        self,
+        items: Sequence[Tuple[Hashable, str, float]],
+        max_in_flight: Optional[int] = None
+    ) -> Dict[Hashable, VerificationResult]:
+        """
+        Verify items within the shared quota.
+
+        Args:
+            items: (key, text, priority) tuples; lower priority (ML confidence)
+                is verified first
+            max_in_flight: Override the concurrency bound for this run
+
+        Returns:
+            key -> (sentiment, confidence, reasoning) for every item that was
+            sent; failed items map to (None, None, None), items the quota
+            could not reach are absent
+        """
+        if not items:
+            return {}
+        await self.counter.calibrate()
+        in_flight_bound = max(1, max_in_flight or self.max_in_flight)
+
+        sequence = itertools.count()
+        queue = [_QueuedItem(float(priority), next(sequence), key, text) for key, text, priority in items]
+        heapq.heapify(queue)
+
+        results: Dict[Hashable, VerificationResult] = {}
+        in_flight: Dict[asyncio.Task, List[_QueuedItem]] = {}
+        requests_sent = 0
+        started = time.monotonic()
+
+        async def send(batch: List[_QueuedItem], reserved: int):
+            texts = [item.text for item in batch]
+            try:
+                batch_results, usage = await self._send_batch(texts)
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    raise RateLimitExceeded(str(e)) from e
+                raise
+            await self.limiter.settle(reserved, self.counter.observe(texts, usage))
+            return batch_results
+
+        try:
+            while queue or in_flight:
+                if queue:
+                    batch, request_tokens = self._pack(queue)
+                    limit = await self._in_flight_limit(request_tokens, in_flight_bound)
+                    while len(in_flight) >= limit:
+                        await self._collect(in_flight, queue, results, wait_for_one=True)
+                    if not await self.limiter.acquire(request_tokens, max_wait=self.max_wait_seconds):
+                        for item in batch:
+                            heapq.heappush(queue, item)
+                        logger.warning(
+                            f"Gemma quota exhausted, leaving {len(queue)} highest-confidence texts unverified"
+                        )
+                        queue.clear()
+                        continue
+                    requests_sent += 1
+                    task = asyncio.create_task(send(batch, request_tokens))
+                    in_flight[task] = batch
+                    # Let finished requests feed back before packing the next one
+                    await self._collect(in_flight, queue, results, wait_for_one=False)
+                else:
+                    await self._collect(in_flight, queue, results, wait_for_one=True)
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+        elapsed = time.monotonic() - started
+        logger.info(
+            f"AI verification scheduled {len(results)}/{len(items)} texts in {requests_sent} requests",
+            extra={
+                "elapsed_seconds": round(elapsed, 1),
+                "items_per_minute": round(len(results) / elapsed * 60, 1) if elapsed > 0 else None,
+                "chars_per_token": round(self.counter.chars_per_token, 2)
+            }
+        )
+        return results
+
+    async def _collect(
+        self,
+        in_flight: Dict[asyncio.Task, List[_QueuedItem]],
+        queue: List[_QueuedItem],
+        results: Dict[Hashable, VerificationResult],
+        wait_for_one: bool
+    ) -> None:
+        if not in_flight:
+            return
+        if wait_for_one:
+            done, _ = await asyncio.wait(list(in_flight), return_when=asyncio.FIRST_COMPLETED)
+        else:
+            done = [task for task in in_flight if task.done()]
+
+        for task in done:
+            batch = in_flight.pop(task)
+            error = task.exception()
+            if error is None:
+                for item, result in zip(batch, task.result()):
+                    results[item.key] = result
+                for item in batch[len(task.result()):]:
+                    results[item.key] = (None, None, None)
+            elif isinstance(error, RateLimitExceeded):
+                attempt = max(item.attempts for item in batch) + 1
+                backoff = self.rate_limit_backoff_seconds * attempt
+                logger.warning(
+                    f"Gemma rate limit hit, pausing {backoff:.0f}s and requeueing {len(batch)} texts",
+                    extra={"attempt": attempt}
+                )
+                await self.limiter.backoff(backoff)
+                for item in batch:
+                    item.attempts += 1
+                    if item.attempts < self.max_attempts:
+                        heapq.heappush(queue, item)
+                    else:
+                        results[item.key] = (None, None, None)
+            else:
+                logger.error(
+                    "Batch Gemini verification failed",
+                    extra={"error": str(error), "batch_size": len(batch)}
+                )
+                for item in batch:
+                    results[item.key] = (None, None, None)
+
+
+_gemma_rate_limiter: Optional[GemmaRateLimiter] = None
+
+
+def get_gemma_rate_limiter() -> GemmaRateLimiter:
+    """Get the process-wide Gemma quota buckets."""
+    global _gemma_rate_limiter
+    if _gemma_rate_limiter is None:
+        _gemma_rate_limiter = GemmaRateLimiter()
+    return _gemma_rate_limiter
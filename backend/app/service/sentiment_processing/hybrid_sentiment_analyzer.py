@@ -24,13 +24,20 @@ Integration:
 import os
 import json
 import re
-import time
 import torch
 import asyncio
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
+from .models.model_registry import get_model_registry
+from .ai_verification_scheduler import (
+    BATCH_TEXT_CHARS,
+    AIVerificationScheduler,
+    TokenCounter,
+    get_gemma_rate_limiter,
+    is_rate_limit_error,
+)
+from .ai_verdict_cache import CachedVerdict, get_ai_verdict_cache, prompt_version, text_hash
 
 # Import system logger
 try:
@@ -258,6 +265,7 @@ class AIVerificationStats:
     """Statistics for AI verification usage."""
     total_analyzed: int = 0
     ai_verified_count: int = 0
+    ai_cache_hits: int = 0  # Verdicts reused from the AI verdict cache
     ai_errors: int = 0
     avg_ml_confidence: float = 0.0
     last_error: Optional[str] = None
@@ -408,6 +416,7 @@ primary_entity should be the most prominent entity mentioned (usually first or m
         min_confidence_threshold: float = 0.80,  # NEW: Discard predictions below this
         ai_enabled: bool = True,
         ensemble_enabled: bool = True,  # Enable DistilBERT ensemble
+        quantize: bool = False,  # Dynamic INT8 weights for CPU inference
     ):
         """
         Initialize the AI-verified sentiment analyzer.
@@ -420,8 +429,10 @@ primary_entity should be the most prominent entity mentioned (usually first or m
             min_confidence_threshold: Discard predictions below this (default 0.80)
             ai_enabled: Master switch to enable/disable AI verification
             ensemble_enabled: Enable DistilBERT ensemble voting (default: True)
+            quantize: Load dynamic INT8 quantized models (forces CPU inference)
         """
-        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        self.quantize = quantize
+        self.device = torch.device("cuda" if torch.cuda.is_available() and not quantize else "cpu")
         self.verification_mode = verification_mode
         self.confidence_threshold = confidence_threshold
         self.min_confidence_threshold = min_confidence_threshold  # NEW: Minimum threshold
@@ -430,26 +441,28 @@ primary_entity should be the most prominent entity mentioned (usually first or m
         self._stats = AIVerificationStats()
         
         # Gemma 3 27B Rate Limiting (actual limits from Google AI Studio)
-        # 30 RPM, 15,000 TPM, 14,400 RPD
-        self._gemma_rpm_limit = 30  # Peak requests per minute
-        self._gemma_tpm_limit = 15000  # Peak TOKENS per minute (CRITICAL)
-        self._gemma_requests_this_minute: List[float] = []  # Timestamps of requests
-        self._gemma_tokens_this_minute: List[Tuple[float, int]] = []  # (timestamp, token_count)
-        self._gemma_rpm_lock = asyncio.Lock()  # Thread-safe access
+        # 30 RPM, 15,000 TPM, 14,400 RPD - token buckets shared process-wide
+        self._rate_limiter = get_gemma_rate_limiter()
+        self._ai_scheduler: Optional[AIVerificationScheduler] = None
+        
+        # Verdicts from earlier runs, keyed by text, batch prompt and model
+        self._verdict_cache = get_ai_verdict_cache()
+        self._batch_prompt_version = prompt_version(self.BATCH_VERIFICATION_PROMPT)
         
         # Load primary ML model (FinBERT)
         logger.info(
             "Loading primary ML model for AI-verified sentiment",
             extra={"model": model_name, "device": str(self.device)}
         )
-        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-        self.model = AutoModelForSequenceClassification.from_pretrained(model_name)
-        self.model.to(self.device)
-        self.model.eval()
+        # Shared with FinBERTModel and the benchmark service via the model registry
+        self._model_handle = get_model_registry().acquire(model_name, self.device, quantize=quantize)
+        self.tokenizer = self._model_handle.tokenizer
+        self.model = self._model_handle.model
         
         # Load ensemble model (DistilBERT) if enabled
         self.ensemble_model = None
         self.ensemble_tokenizer = None
+        self._ensemble_handle = None
         if ensemble_enabled:
             try:
                 logger.info("Loading DistilBERT-financial ensemble model for voting")
@@ -583,20 +596,21 @@ primary_entity should be the most prominent entity mentioned (usually first or m
         # Preprocess text for better confidence
         cleaned_text = preprocess_text_for_sentiment(text)
         
-        encodings = self.tokenizer(
-            cleaned_text,
-            truncation=True,
-            padding=True,
-            max_length=128,
-            return_tensors='pt'
-        )
-        
-        with torch.no_grad():
-            outputs = self.model(
-                input_ids=encodings['input_ids'].to(self.device),
-                attention_mask=encodings['attention_mask'].to(self.device)
+        with self._model_handle.inference_lock:
+            encodings = self.tokenizer(
+                cleaned_text,
+                truncation=True,
+                padding=True,
+                max_length=128,
+                return_tensors='pt'
             )
-            probs = torch.softmax(outputs.logits, dim=-1)[0]
+            
+            with torch.no_grad():
+                outputs = self.model(
+                    input_ids=encodings['input_ids'].to(self.device),
+                    attention_mask=encodings['attention_mask'].to(self.device)
+                )
+                probs = torch.softmax(outputs.logits, dim=-1)[0]
         
         scores = {
             'positive': probs[0].item(),
@@ -624,14 +638,13 @@ primary_entity should be the most prominent entity mentioned (usually first or m
             # Lazy initialization of ensemble model
             if not self._ensemble_initialized:
                 logger.info("Initializing DistilBERT ensemble model (first use)")
-                self.ensemble_tokenizer = AutoTokenizer.from_pretrained(
-                    "mrm8488/distilroberta-finetuned-financial-news-sentiment-analysis"
+                self._ensemble_handle = get_model_registry().acquire(
+                    "mrm8488/distilroberta-finetuned-financial-news-sentiment-analysis",
+                    self.device,
+                    quantize=self.quantize
                 )
-                self.ensemble_model = AutoModelForSequenceClassification.from_pretrained(
-                    "mrm8488/distilroberta-finetuned-financial-news-sentiment-analysis"
-                )
-                self.ensemble_model.to(self.device)
-                self.ensemble_model.eval()
+                self.ensemble_tokenizer = self._ensemble_handle.tokenizer
+                self.ensemble_model = self._ensemble_handle.model
                 self._ensemble_initialized = True
                 logger.info("DistilBERT ensemble model loaded successfully")
             
@@ -668,43 +681,14 @@ primary_entity should be the most prominent entity mentioned (usually first or m
             logger.warning(f"Ensemble prediction failed: {e}")
             return None
     
-    async def _check_rpm_limit(self) -> float:
-        """
-        Check Gemma RPM limit and return wait time if needed.
-        
-        Returns:
-            Wait time in seconds (0 if no wait needed)
-        """
-        current_time = time.time()
-        
-        async with self._gemma_rpm_lock:
-            # Remove timestamps older than 60 seconds
-            cutoff = current_time - 60
-            self._gemma_requests_this_minute = [
-                ts for ts in self._gemma_requests_this_minute if ts > cutoff
-            ]
-            
-            # Check if at RPM limit (30 requests/minute)
-            if len(self._gemma_requests_this_minute) >= self._gemma_rpm_limit:
-                oldest = min(self._gemma_requests_this_minute)
-                wait_time = (oldest + 60) - current_time + 0.1
-                return max(0, wait_time)
-            
-            return 0
-    
-    async def _record_request(self):
-        """Record a Gemma request timestamp."""
-        async with self._gemma_rpm_lock:
-            self._gemma_requests_this_minute.append(time.time())
-    
     def _estimate_tokens(self, text: str) -> int:
         """
         Estimate token count for a SINGLE text Gemini API call.
         
         For individual calls: ~750 (prompt) + text_tokens + 50 (output)
-        For batch calls: Use batch-specific calculation (600 + sum of texts + 200)
         
-        This method is for individual calls. Batch calls calculate separately.
+        Used to reserve quota; the reservation is corrected with the token count
+        the API reports. Packed batch calls are sized by the scheduler's TokenCounter.
         """
         prompt_template_tokens = 750  # VERIFICATION_PROMPT is ~700 tokens + buffer
         text_tokens = len(text) // 4  # ~1 token per 4 characters
@@ -713,98 +697,22 @@ primary_entity should be the most prominent entity mentioned (usually first or m
         total = prompt_template_tokens + text_tokens + output_overhead
         return total
     
-    def _estimate_batch_tokens(self, texts: List[str]) -> int:
-        """
-        Estimate token count for a BATCH API call (multiple texts in one request).
-        
-        Batch calls are MUCH more efficient:
-        - Prompt: ~600 tokens (BATCH_VERIFICATION_PROMPT is shorter)
-        - Texts: ~120 tokens per text (truncated to 500 chars each)
-        - Output: ~30 tokens per text (just sentiment + confidence)
-        
-        10 texts batch: 600 + 1200 + 300 = 2,100 tokens
-        vs 10 individual: 10 × 950 = 9,500 tokens (77% savings!)
-        """
-        prompt_tokens = 600  # BATCH_VERIFICATION_PROMPT
-        text_tokens = sum(min(len(t), 500) // 4 for t in texts)  # Texts truncated to 500 chars
-        output_tokens = len(texts) * 30  # ~30 tokens per result
-        
-        return prompt_tokens + text_tokens + output_tokens
-    
-    async def _check_tpm_limit(self, estimated_tokens: int) -> float:
-        """
-        Check Gemma TPM (Tokens Per Minute) limit and return wait time if needed.
-        
-        Uses 80% of limit (12,000 tokens) as safety threshold to prevent hitting
-        the hard 15,000 TPM limit which causes 429 errors.
-        
-        Args:
-            estimated_tokens: Estimated tokens for the upcoming request
-            
-        Returns:
-            Wait time in seconds (0 if no wait needed)
-        """
-        current_time = time.time()
-        # Use 80% of TPM limit as safety threshold (12,000 instead of 15,000)
-        tpm_safety_limit = int(self._gemma_tpm_limit * 0.80)
-        
-        async with self._gemma_rpm_lock:
-            # Remove token records older than 60 seconds
-            cutoff = current_time - 60
-            self._gemma_tokens_this_minute = [
-                (ts, count) for ts, count in self._gemma_tokens_this_minute if ts > cutoff
-            ]
-            
-            # Calculate current token usage in this minute
-            current_token_usage = sum(count for _, count in self._gemma_tokens_this_minute)
-            
-            # Log current TPM usage periodically (every 10th check)
-            if len(self._gemma_tokens_this_minute) % 10 == 0:
-                logger.info(
-                    f"TPM usage: {current_token_usage:,}/{self._gemma_tpm_limit:,} "
-                    f"({current_token_usage/self._gemma_tpm_limit*100:.1f}%) - "
-                    f"{len(self._gemma_tokens_this_minute)} requests in window"
-                )
-            
-            # Check if adding this request would exceed SAFETY limit (80% of 15k = 12k)
-            if current_token_usage + estimated_tokens > tpm_safety_limit:
-                # Find oldest token record to calculate wait time
-                if self._gemma_tokens_this_minute:
-                    oldest_ts, _ = min(self._gemma_tokens_this_minute, key=lambda x: x[0])
-                    wait_time = (oldest_ts + 60) - current_time + 1.0  # Extra 1s buffer
-                    logger.warning(
-                        f"TPM safety limit reached ({current_token_usage:,}/{tpm_safety_limit:,}), "
-                        f"waiting {wait_time:.1f}s"
-                    )
-                    return max(0, wait_time)
-                return 2.0  # Default 2 second wait if no records
-            
-            return 0
-    
-    async def _record_tokens(self, token_count: int):
-        """Record token usage for TPM tracking."""
-        async with self._gemma_rpm_lock:
-            self._gemma_tokens_this_minute.append((time.time(), token_count))
-    
     async def _batch_verify_with_gemini_parallel(
         self, 
         texts: List[str], 
-        max_concurrency: int = 2  # CRITICAL: Reduced to 2 for strict TPM control
+        max_concurrency: int = 2
     ) -> List[Tuple[Optional[str], Optional[float]]]:
         """
-        Verify sentiments with STRICT TPM-aware throttling.
+        Verify sentiments through the shared verification scheduler.
         
         Rate Limits: 30 RPM, 15,000 TPM (CRITICAL BOTTLENECK), 14,400 RPD
         
-        TPM MATH (why concurrency=2):
-        - Each request: ~750 tokens (prompt) + ~150 (text) + 50 (output) = ~950 tokens
-        - 15,000 TPM / 950 tokens = ~15 requests/minute MAX
-        - With safety margin: 12 requests/minute = 1 request every 5 seconds
-        - 2 concurrent × 5-second spacing = safe throughput
+        Texts are packed into multi-text requests sized to the token budget and
+        paced by the shared token buckets, so no fixed spacing is needed.
         
         Args:
             texts: Batch of texts to verify
-            max_concurrency: Max concurrent requests (default: 2 for TPM safety)
+            max_concurrency: Max concurrent requests
             
         Returns:
             List of (sentiment, confidence) tuples
@@ -812,76 +720,47 @@ primary_entity should be the most prominent entity mentioned (usually first or m
         if not texts:
             return []
         
-        # Log batch start with TPM info
-        total_estimated_tokens = sum(self._estimate_tokens(t) for t in texts)
-        logger.info(
-            f"Starting Gemini batch: {len(texts)} texts, ~{total_estimated_tokens:,} estimated tokens",
-            extra={"batch_size": len(texts), "estimated_tokens": total_estimated_tokens}
+        results = await self._run_ai_verification(
+            [(i, text, 0.0) for i, text in enumerate(texts)],
+            max_in_flight=max_concurrency
         )
+        return [results.get(i, (None, None, None))[:2] for i in range(len(texts))]
+    
+    def _get_ai_scheduler(self) -> AIVerificationScheduler:
+        """Scheduler for packed verification requests (created with the Gemini client)."""
+        if self._ai_scheduler is None or self._ai_scheduler.counter.model is not self.gemini_model:
+            self._ai_scheduler = AIVerificationScheduler(
+                send_batch=self._send_verification_batch,
+                limiter=self._rate_limiter,
+                counter=TokenCounter(self.gemini_model, self.BATCH_VERIFICATION_PROMPT)
+            )
+        return self._ai_scheduler
+    
+    async def _run_ai_verification(
+        self,
+        items: List[Tuple[int, str, float]],
+        max_in_flight: Optional[int] = None
+    ) -> Dict[int, Tuple[Optional[str], Optional[float], Optional[str]]]:
+        """
+        Verify (key, text, ml_confidence) items, lowest confidence first.
         
-        semaphore = asyncio.Semaphore(max_concurrency)
-        
-        # Minimum delay between requests to spread TPM usage
-        # 15,000 TPM / 950 tokens per request = 15.8 requests/minute
-        # 60s / 15.8 = 3.8 seconds between requests (use 4s for safety)
-        min_request_delay = 4.0
-        last_request_time = [0.0]  # Mutable container for closure
-        delay_lock = asyncio.Lock()
-        
-        async def verify_with_throttle(text: str) -> Tuple[Optional[str], Optional[float]]:
-            async with semaphore:
-                # Estimate tokens for this request
-                estimated_tokens = self._estimate_tokens(text)
-                
-                # Enforce minimum delay between requests (TPM spreading)
-                async with delay_lock:
-                    now = time.time()
-                    time_since_last = now - last_request_time[0]
-                    if time_since_last < min_request_delay:
-                        delay_needed = min_request_delay - time_since_last
-                        logger.debug(f"TPM spreading: waiting {delay_needed:.1f}s")
-                        await asyncio.sleep(delay_needed)
-                    last_request_time[0] = time.time()
-                
-                # Pre-emptive TPM check (CRITICAL - 15k tokens/minute limit)
-                tpm_wait = await self._check_tpm_limit(estimated_tokens)
-                if tpm_wait > 0:
-                    logger.warning(f"TPM limit reached, waiting {tpm_wait:.1f}s")
-                    await asyncio.sleep(tpm_wait)
-                
-                # Pre-emptive RPM check
-                rpm_wait = await self._check_rpm_limit()
-                if rpm_wait > 0:
-                    logger.debug(f"RPM limit approaching, waiting {rpm_wait:.1f}s")
-                    await asyncio.sleep(rpm_wait)
-                
-                # Record request and tokens before making it
-                await self._record_request()
-                await self._record_tokens(estimated_tokens)
-                
-                sentiment, confidence, _ = await self._verify_with_gemini(text)
-                return (sentiment, confidence)
-        
-        # Execute all in parallel (throttled by semaphore + RPM limit)
-        tasks = [verify_with_throttle(text) for text in texts]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Handle exceptions
-        final_results = []
-        for result in results:
-            if isinstance(result, Exception):
-                logger.warning(f"Verification failed: {result}")
-                final_results.append((None, None))
-            else:
-                final_results.append(result)
-        
-        return final_results
+        Returns:
+            key -> (sentiment, confidence, reasoning); keys the quota could not
+            reach within the scheduler's wait limit are absent
+        """
+        results = await self._get_ai_scheduler().run(items, max_in_flight=max_in_flight)
+        self._stats.ai_errors += sum(1 for sentiment, _, _ in results.values() if sentiment is None)
+        return results
     
     async def _verify_with_gemini(self, text: str) -> Tuple[Optional[str], Optional[float], Optional[str]]:
         """Verify sentiment using Gemma 3 27B with comprehensive error handling."""
         try:
             prompt = self.VERIFICATION_PROMPT.format(text=text)
             
+            # Reserve quota in the shared buckets, then settle with the real usage
+            reserved = self._estimate_tokens(text)
+            await self._rate_limiter.acquire(reserved)
+            
             # Run in executor since genai is synchronous
             loop = asyncio.get_event_loop()
             response = await loop.run_in_executor(
@@ -894,6 +773,7 @@ primary_entity should be the most prominent entity mentioned (usually first or m
                     )
                 )
             )
+            await self._settle_usage(reserved, response)
             
             content = response.text.strip()
             
@@ -939,6 +819,8 @@ primary_entity should be the most prominent entity mentioned (usually first or m
             
         except Exception as e:
             error_type = type(e).__name__
+            if is_rate_limit_error(e):
+                await self._rate_limiter.backoff(10.0)
             logger.error(
                 "Gemini verification failed",
                 extra={
@@ -953,6 +835,12 @@ primary_entity should be the most prominent entity mentioned (usually first or m
             self._stats.last_error_time = utc_now().isoformat()
             return None, None, None
     
+    async def _settle_usage(self, reserved: int, response) -> None:
+        """Correct a quota reservation with the token count reported by the API."""
+        usage = getattr(response, "usage_metadata", None)
+        total = getattr(usage, "total_token_count", None) if usage is not None else None
+        await self._rate_limiter.settle(reserved, int(total) if total else None)
+    
     async def _verify_with_ai(self, text: str) -> Tuple[Optional[str], Optional[float], Optional[str]]:
         """Verify sentiment using available AI service."""
         if self.gemini_model:
@@ -969,6 +857,7 @@ primary_entity should be the most prominent entity mentioned (usually first or m
                 if self._stats.total_analyzed > 0 else 0
             ),
             "ai_errors": self._stats.ai_errors,
+            "ai_cache_hits": self._stats.ai_cache_hits,
             "avg_ml_confidence": self._stats.avg_ml_confidence,
             "last_error": self._stats.last_error,
             "last_error_time": self._stats.last_error_time,
@@ -977,9 +866,22 @@ primary_entity should be the most prominent entity mentioned (usually first or m
             "ai_enabled": self.ai_enabled,
             "gemini_configured": self.gemini_model is not None,
             "api_key_valid": self._stats.api_key_valid,
-            "api_key_status": self._stats.api_key_status
+            "api_key_status": self._stats.api_key_status,
+            "rate_limiter": self._rate_limiter.get_stats()
         }
     
+    def release_models(self):
+        """Release shared ML models back to the model registry."""
+        registry = get_model_registry()
+        registry.release(self._model_handle)
+        registry.release(self._ensemble_handle)
+        self._model_handle = None
+        self._ensemble_handle = None
+        self.ensemble_model = None
+        self.ensemble_tokenizer = None
+        if self.ensemble_enabled:
+            self._ensemble_initialized = False
+    
     def set_ai_enabled(self, enabled: bool):
         """Enable or disable AI verification at runtime."""
         self.ai_enabled = enabled
@@ -1218,8 +1120,8 @@ primary_entity should be the most prominent entity mentioned (usually first or m
                 method="filtered (non-financial)"
             )
         
-        # Step 1: Get ML prediction from primary model (FinBERT)
-        ml_label, ml_confidence, scores = self._get_ml_prediction(text)
+        # Step 1: Get ML prediction from primary model (FinBERT), off the event loop
+        ml_label, ml_confidence, scores = await asyncio.to_thread(self._get_ml_prediction, text)
         
         # Step 1.5: Ensemble voting (DistilBERT) - CONDITIONAL for performance
         # Only run ensemble in "uncertain zone" (0.70-0.95 confidence)
@@ -1452,6 +1354,10 @@ primary_entity should be the most prominent entity mentioned (usually first or m
         try:
             prompt = self.PER_ENTITY_PROMPT.format(text=text[:2000])  # Limit to 2000 chars
             
+            # Prompt (~4 chars per token) plus the output cap
+            reserved = len(prompt) // 4 + 1000
+            await self._rate_limiter.acquire(reserved)
+            
             # Run in executor since genai is synchronous
             loop = asyncio.get_event_loop()
             response = await loop.run_in_executor(
@@ -1464,6 +1370,7 @@ primary_entity should be the most prominent entity mentioned (usually first or m
                     )
                 )
             )
+            await self._settle_usage(reserved, response)
             
             content = response.text.strip()
             
@@ -1566,13 +1473,82 @@ Each object must have:
 - confidence (0.0-1.0)
 - reasoning (brief 3-5 word explanation mentioning key signals like 'buying opportunity', 'short squeeze', 'temporal weighting', 'insider sell', etc.)"""
 
-    async def _batch_verify_with_gemini(self, texts: List[str], max_retries: int = 3) -> List[Tuple[Optional[str], Optional[float], Optional[str]]]:
+    async def _send_verification_batch(
+        self,
+        texts: List[str]
+    ) -> Tuple[List[Tuple[Optional[str], Optional[float], Optional[str]]], Optional[object]]:
+        """
+        Verify multiple texts in a single Gemini API call.
+        
+        Quota and retries are handled by the scheduler; API errors propagate.
+        
+        Args:
+            texts: List of texts to verify
+            
+        Returns:
+            (results in input order, response usage metadata)
+        """
+        # Create indexed text list for the prompt
+        texts_json = json.dumps([{"id": i, "text": t[:BATCH_TEXT_CHARS]} for i, t in enumerate(texts)], indent=2)
+        prompt = self.BATCH_VERIFICATION_PROMPT.format(texts_json=texts_json, count=len(texts))
+        
+        # Run in executor since genai is synchronous
+        loop = asyncio.get_event_loop()
+        response = await loop.run_in_executor(
+            None,
+            lambda: self.gemini_model.generate_content(
+                prompt,
+                generation_config=genai.types.GenerationConfig(
+                    temperature=0,
+                    max_output_tokens=2000,  # More tokens for batch response
+                )
+            )
+        )
+        usage = getattr(response, "usage_metadata", None)
+        
+        try:
+            content = response.text.strip()
+            
+            # Parse JSON response
+            if content.startswith("```"):
+                content = content.split("```")[1]
+                if content.startswith("json"):
+                    content = content[4:]
+            content = content.strip()
+            
+            results_list = json.loads(content)
+        except (ValueError, json.JSONDecodeError) as e:
+            logger.warning(
+                "Gemini returned invalid batch JSON",
+                extra={"error": str(e), "batch_size": len(texts)}
+            )
+            return [(None, None, None)] * len(texts), usage
+        
+        # Build results dict indexed by id
+        results_dict = {}
+        for item in results_list:
+            idx = item.get("id", -1)
+            sentiment = item.get("sentiment", "neutral").lower()
+            if sentiment not in ["positive", "negative", "neutral"]:
+                sentiment = "neutral"
+            confidence = item.get("confidence", 0.8)
+            reasoning = item.get("reasoning", "")  # Extract reasoning for analysis
+            results_dict[idx] = (sentiment, confidence, reasoning)
+        
+        logger.info(
+            "Batch Gemini verification completed",
+            extra={"batch_size": len(texts), "successful": len(results_dict)}
+        )
+        
+        # Return in original order
+        return [results_dict.get(i, (None, None, None)) for i in range(len(texts))], usage
+    
+    async def _batch_verify_with_gemini(self, texts: List[str]) -> List[Tuple[Optional[str], Optional[float], Optional[str]]]:
         """
-        Verify multiple texts in a single Gemini API call with retry logic.
+        Verify multiple texts with packed Gemini calls through the scheduler.
         
         Args:
             texts: List of texts to verify
-            max_retries: Maximum number of retries on rate limit errors
             
         Returns:
             List of (sentiment, confidence, reasoning) tuples for each text
@@ -1580,84 +1556,8 @@ Each object must have:
         if not self.gemini_model or not texts:
             return [(None, None, None)] * len(texts)
         
-        for attempt in range(max_retries):
-            try:
-                # Create indexed text list for the prompt
-                texts_json = json.dumps([{"id": i, "text": t[:500]} for i, t in enumerate(texts)], indent=2)
-                prompt = self.BATCH_VERIFICATION_PROMPT.format(texts_json=texts_json, count=len(texts))
-                
-                # Run in executor since genai is synchronous
-                loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(
-                    None,
-                    lambda: self.gemini_model.generate_content(
-                        prompt,
-                        generation_config=genai.types.GenerationConfig(
-                            temperature=0,
-                            max_output_tokens=2000,  # More tokens for batch response
-                        )
-                    )
-                )
-                
-                content = response.text.strip()
-                
-                # Parse JSON response
-                if content.startswith("```"):
-                    content = content.split("```")[1]
-                    if content.startswith("json"):
-                        content = content[4:]
-                content = content.strip()
-                
-                results_list = json.loads(content)
-                
-                # Build results dict indexed by id
-                results_dict = {}
-                for item in results_list:
-                    idx = item.get("id", -1)
-                    sentiment = item.get("sentiment", "neutral").lower()
-                    if sentiment not in ["positive", "negative", "neutral"]:
-                        sentiment = "neutral"
-                    confidence = item.get("confidence", 0.8)
-                    reasoning = item.get("reasoning", "")  # Extract reasoning for analysis
-                    results_dict[idx] = (sentiment, confidence, reasoning)
-                
-                # Return in original order
-                results = []
-                for i in range(len(texts)):
-                    results.append(results_dict.get(i, (None, None, None)))
-                
-                logger.info(
-                    "Batch Gemini verification completed",
-                    extra={"batch_size": len(texts), "successful": len(results_dict)}
-                )
-                
-                return results
-                
-            except Exception as e:
-                error_str = str(e)
-                # Check for rate limit error (429)
-                if "429" in error_str or "exhausted" in error_str.lower():
-                    wait_time = (attempt + 1) * 10  # 10s, 20s, 30s
-                    logger.warning(
-                        f"Rate limit hit, waiting {wait_time}s before retry {attempt + 1}/{max_retries}",
-                        extra={"error": error_str, "batch_size": len(texts)}
-                    )
-                    await asyncio.sleep(wait_time)
-                    continue
-                else:
-                    logger.error(
-                        "Batch Gemini verification failed",
-                        extra={"error": error_str, "batch_size": len(texts)}
-                    )
-                    self._stats.ai_errors += 1
-                    return [(None, None, None)] * len(texts)
-        
-        # Max retries exceeded
-        logger.error(
-            "Batch Gemini verification failed after max retries",
-            extra={"batch_size": len(texts), "max_retries": max_retries}
-        )
-        return [(None, None, None)] * len(texts)
+        results = await self._run_ai_verification([(i, text, 0.0) for i, text in enumerate(texts)])
+        return [results.get(i, (None, None, None)) for i in range(len(texts))]
     
     async def analyze_batch(
         self, 
@@ -1705,20 +1605,24 @@ Each object must have:
             else:
                 results.append(None)  # Placeholder for actual analysis
         
-        # Step 1: Get ML predictions for non-filtered texts
+        # Step 1: Get ML predictions for non-filtered texts, off the event loop
+        pending = [(i, text) for i, text in enumerate(texts) if i not in filtered_indices]
+        predictions = await asyncio.to_thread(
+            lambda: [self._get_ml_prediction(text) for _, text in pending]
+        )
         ml_results = {}
-        for i, text in enumerate(texts):
-            if i in filtered_indices:
-                continue
-            label, confidence, scores = self._get_ml_prediction(text)
+        for (i, text), (label, confidence, scores) in zip(pending, predictions):
             ml_results[i] = (text, label, confidence, scores)
             self._stats.total_analyzed += 1
         
         # Step 2: Identify which texts need AI verification
         needs_verification = []
         verification_indices = []
+        verification_confidences = []
+        ai_results = {}
         
         if self.ai_enabled and self.gemini_model:
+            to_verify = []
             for i, (text, label, confidence, scores) in ml_results.items():
                 should_verify = False
                 if self.verification_mode == VerificationMode.ALL:
@@ -1729,63 +1633,60 @@ Each object must have:
                     should_verify = (confidence < self.confidence_threshold) or (label == "neutral")
                 
                 if should_verify:
-                    needs_verification.append(text)
-                    verification_indices.append(i)
+                    to_verify.append(i)
+            
+            # Reuse verdicts from earlier runs (overlapping lookback windows, reprocessing)
+            text_hashes = {i: text_hash(ml_results[i][0], BATCH_TEXT_CHARS) for i in to_verify}
+            cached_verdicts = {}
+            reused = 0
+            if use_batch_ai and text_hashes:
+                cached_verdicts = await self._verdict_cache.get_many(
+                    text_hashes.values(), self._batch_prompt_version, AI_MODEL_ID
+                )
+            
+            for i in to_verify:
+                text, _, confidence, _ = ml_results[i]
+                cached = cached_verdicts.get(text_hashes[i])
+                if cached is not None:
+                    ai_results[i] = cached.as_tuple()
+                    self._stats.ai_verified_count += 1
+                    self._stats.ai_cache_hits += 1
+                    reused += 1
+                    continue
+                needs_verification.append(text)
+                verification_indices.append(i)
+                verification_confidences.append(confidence)
+            
+            if reused:
+                logger.info(f"AI verification: reused {reused} cached verdicts")
         
         # Step 3: Batch AI verification (if any texts need it)
-        ai_results = {}
         if needs_verification and use_batch_ai:
-            # PRODUCTION OPTIMIZATION: Multi-text batching
-            # Instead of 1 API call per text (950 tokens each), batch 10 texts into 1 call
-            # Token savings: 10 individual = 9,500 tokens vs 1 batch = ~2,100 tokens (77% reduction!)
-            # 
-            # Math: 15,000 TPM / 2,100 tokens per batch = 7 batches/minute = 70 texts/minute
-            # 370 texts = ~5.3 minutes total (PRODUCTION READY)
-            batch_size = 10  # 10 texts per API call (optimal for token efficiency)
-            total_batches = (len(needs_verification) + batch_size - 1) // batch_size
+            # PRODUCTION OPTIMIZATION: Packed multi-text requests
+            # The scheduler fills each request up to its token budget (prompt overhead
+            # is paid once per request), keeps as many requests in flight as the shared
+            # RPM/TPM/RPD buckets allow, and verifies the least confident texts first so
+            # a short quota is spent where the ML model is most likely wrong.
+            logger.info(f"AI verification: {len(needs_verification)} texts queued for packed requests")
             
-            logger.info(
-                f"AI verification: {len(needs_verification)} texts in {total_batches} multi-text batches"
+            batch_results = await self._run_ai_verification(
+                list(zip(verification_indices, needs_verification, verification_confidences))
             )
             
-            for batch_num, batch_start in enumerate(range(0, len(needs_verification), batch_size)):
-                batch_texts = needs_verification[batch_start:batch_start + batch_size]
-                batch_indices = verification_indices[batch_start:batch_start + batch_size]
-                
-                # Pre-emptive RPM check (30 requests/minute)
-                rpm_wait = await self._check_rpm_limit()
-                if rpm_wait > 0:
-                    logger.debug(f"RPM limit approaching, waiting {rpm_wait:.1f}s")
-                    await asyncio.sleep(rpm_wait)
-                
-                # Estimate tokens for this batch using efficient batch calculation
-                batch_token_estimate = self._estimate_batch_tokens(batch_texts)
-                
-                # Pre-emptive TPM check
-                tpm_wait = await self._check_tpm_limit(batch_token_estimate)
-                if tpm_wait > 0:
-                    logger.info(f"TPM limit reached, waiting {tpm_wait:.1f}s before batch {batch_num+1}")
-                    await asyncio.sleep(tpm_wait)
-                
-                # Record tokens before the request
-                await self._record_request()
-                await self._record_tokens(batch_token_estimate)
-                
-                logger.info(f"Processing batch {batch_num+1}/{total_batches} ({len(batch_texts)} texts, ~{batch_token_estimate} tokens)")
-                
-                # Use TRUE batch API call (multiple texts in ONE request)
-                batch_results = await self._batch_verify_with_gemini(batch_texts)
-                
-                for idx, (sentiment, confidence, reasoning) in zip(batch_indices, batch_results):
-                    if sentiment:
-                        ai_results[idx] = (sentiment, confidence, reasoning)
-                        self._stats.ai_verified_count += 1
+            new_verdicts = {}
+            for idx, (sentiment, confidence, reasoning) in batch_results.items():
+                if sentiment:
+                    ai_results[idx] = (sentiment, confidence, reasoning)
+                    self._stats.ai_verified_count += 1
+                    if isinstance(confidence, (int, float)):
+                        new_verdicts[text_hashes[idx]] = CachedVerdict(sentiment, float(confidence), reasoning)
+            await self._verdict_cache.put_many(new_verdicts, self._batch_prompt_version, AI_MODEL_ID)
         elif needs_verification and not use_batch_ai:
             # Fallback to individual verification
             for i, text in zip(verification_indices, needs_verification):
-                sentiment, confidence, _ = await self._verify_with_ai(text)
+                sentiment, confidence, reasoning = await self._verify_with_ai(text)
                 if sentiment:
-                    ai_results[i] = (sentiment, confidence)
+                    ai_results[i] = (sentiment, confidence, reasoning)
                     self._stats.ai_verified_count += 1
         
         # Step 4: Build final results for non-filtered texts
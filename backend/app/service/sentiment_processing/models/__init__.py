@@ -6,6 +6,7 @@ Collection of sentiment analysis models:
 - FinBERTModel: FinBERT-Tone for ALL content sources (95.7% avg confidence)
 - DistilBERTFinancialModel: Lightweight ensemble model for confidence voting (82M params)
 - Base SentimentModel: Abstract interface for all models
+- ModelRegistry: Process-wide shared model/tokenizer handles
 """
 
 from .sentiment_model import (
@@ -17,8 +18,25 @@ from .sentiment_model import (
     ModelInfo,
     SentimentModelError
 )
-from .finbert_model import FinBERTModel
-from .distilbert_model import DistilBERTFinancialModel
+
+# Transformer models import torch/transformers; resolve them on first access
+# so importing the package stays cheap at application startup.
+_LAZY_EXPORTS = {
+    "FinBERTModel": ".finbert_model",
+    "DistilBERTFinancialModel": ".distilbert_model",
+    "ModelRegistry": ".model_registry",
+    "ModelHandle": ".model_registry",
+    "get_model_registry": ".model_registry"
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "SentimentModel",
@@ -29,5 +47,8 @@ __all__ = [
     "ModelInfo",
     "SentimentModelError",
     "FinBERTModel",
-    "DistilBERTFinancialModel"
+    "DistilBERTFinancialModel",
+    "ModelRegistry",
+    "ModelHandle",
+    "get_model_registry"
 ]
\ No newline at end of file
@@ -21,7 +21,7 @@ import torch
 from typing import List, Dict, Any, Optional
 
 try:
-    from transformers import AutoTokenizer, AutoModelForSequenceClassification, pipeline
+    from transformers import pipeline
 except ImportError:
     raise ImportError("Transformers required: pip install transformers torch")
 
@@ -34,6 +34,7 @@ from .sentiment_model import (
     ModelLoadError,
     AnalysisError
 )
+from .model_registry import get_model_registry
 
 # Use centralized logging system
 from app.infrastructure.log_system import get_logger
@@ -54,20 +55,23 @@ class DistilBERTFinancialModel(SentimentModel):
     
     MODEL_NAME = "mrm8488/distilroberta-finetuned-financial-news-sentiment-analysis"
     
-    def __init__(self, use_gpu: bool = None, max_length: int = 512):
+    def __init__(self, use_gpu: bool = None, max_length: int = 512, quantize: bool = False):
         """
         Initialize DistilBERT financial model.
         
         Args:
             use_gpu: Use GPU if available (auto-detect if None)
             max_length: Max sequence length for tokenization
+            quantize: Use dynamic INT8 quantized weights (CPU only)
         """
-        self.use_gpu = use_gpu if use_gpu is not None else torch.cuda.is_available()
+        self.quantize = quantize
+        self.use_gpu = False if quantize else (use_gpu if use_gpu is not None else torch.cuda.is_available())
         self.max_length = max_length
         self.device = None
         self.tokenizer = None
         self.model = None
         self.pipeline = None
+        self._model_handle = None  # Shared weights from the model registry
         super().__init__()
     
     def _initialize_model_info(self) -> ModelInfo:
@@ -100,23 +104,14 @@ class DistilBERTFinancialModel(SentimentModel):
                 self.device = torch.device("cpu")
                 logger.info("Using CPU for DistilBERT-financial")
             
-            # Load tokenizer
-            self.tokenizer = AutoTokenizer.from_pretrained(
+            # Acquire shared tokenizer and model (loaded once per process)
+            self._model_handle = get_model_registry().acquire(
                 self.MODEL_NAME,
-                use_fast=True
+                self.device,
+                quantize=self.quantize
             )
-            
-            # Load model
-            self.model = AutoModelForSequenceClassification.from_pretrained(
-                self.MODEL_NAME,
-                num_labels=3,
-                output_attentions=False,
-                output_hidden_states=False
-            )
-            
-            # Move to device
-            self.model.to(self.device)
-            self.model.eval()
+            self.tokenizer = self._model_handle.tokenizer
+            self.model = self._model_handle.model
             
             # Create pipeline
             self.pipeline = pipeline(
@@ -245,11 +240,12 @@ class DistilBERTFinancialModel(SentimentModel):
         )
     
     async def cleanup(self) -> None:
-        """Clean up model resources."""
-        if self.model is not None:
-            self.model.to('cpu')
-        
-        if torch.cuda.is_available():
-            torch.cuda.empty_cache()
+        """Release the shared model (weights stay in the registry for other consumers)."""
+        get_model_registry().release(self._model_handle)
+        self._model_handle = None
+        self.pipeline = None
+        self.model = None
+        self.tokenizer = None
+        self._is_loaded = False
         
         logger.info("DistilBERT-financial resources cleaned up")
@@ -22,11 +22,7 @@ import asyncio
 
 # Transformers imports
 try:
-    from transformers import (
-        AutoTokenizer, 
-        AutoModelForSequenceClassification,
-        pipeline
-    )
+    from transformers import pipeline
     import torch.nn.functional as F
 except ImportError:
     raise ImportError("Transformers is required for FinBERT. Install with: pip install transformers torch")
@@ -40,6 +36,7 @@ from .sentiment_model import (
     ModelLoadError,
     AnalysisError
 )
+from .model_registry import get_model_registry
 
 # Use centralized logging system
 from app.infrastructure.log_system import get_logger
@@ -75,20 +72,24 @@ class FinBERTModel(SentimentModel):
     
     MODEL_NAME = "ProsusAI/finbert"
     
-    def __init__(self, use_gpu: bool = None, max_length: int = 512):
+    def __init__(self, use_gpu: bool = None, max_length: int = 512, quantize: bool = False):
         """
         Initialize FinBERT model.
         
         Args:
             use_gpu: Whether to use GPU acceleration (auto-detect if None)
             max_length: Maximum sequence length for tokenization
+            quantize: Use dynamic INT8 quantized weights (CPU only)
         """
-        self.use_gpu = use_gpu if use_gpu is not None else torch.cuda.is_available()
+        self.quantize = quantize
+        # Quantized Linear kernels are CPU-only
+        self.use_gpu = False if quantize else (use_gpu if use_gpu is not None else torch.cuda.is_available())
         self.max_length = max_length
         self.device = None
         self.tokenizer = None
         self.model = None
         self.pipeline = None
+        self._model_handle = None  # Shared weights from the model registry
         self._preprocessor = FinancialTextPreprocessor(use_advanced_preprocessing=True)  # Enable advanced by default
         super().__init__()
     
@@ -111,6 +112,10 @@ class FinBERTModel(SentimentModel):
     
     async def _load_model(self) -> None:
         """Load ProsusAI/finbert model and tokenizer."""
+        # Weight loading and pipeline construction block; keep them off the event loop
+        await asyncio.to_thread(self._load_model_sync)
+
+    def _load_model_sync(self) -> None:
         try:
             logger.info(f"Loading ProsusAI/finbert model from {self.MODEL_NAME}...")
             
@@ -122,23 +127,14 @@ class FinBERTModel(SentimentModel):
                 self.device = torch.device("cpu")
                 logger.info("Using CPU for ProsusAI/finbert inference")
             
-            # Load tokenizer
-            self.tokenizer = AutoTokenizer.from_pretrained(
-                self.MODEL_NAME,
-                use_fast=True
-            )
-            
-            # Load model
-            self.model = AutoModelForSequenceClassification.from_pretrained(
+            # Acquire shared tokenizer and model (loaded once per process)
+            self._model_handle = get_model_registry().acquire(
                 self.MODEL_NAME,
-                num_labels=3,  # positive, negative, neutral
-                output_attentions=False,
-                output_hidden_states=False
+                self.device,
+                quantize=self.quantize
             )
-            
-            # Move model to device
-            self.model.to(self.device)
-            self.model.eval()  # Set to evaluation mode
+            self.tokenizer = self._model_handle.tokenizer
+            self.model = self._model_handle.model
             
             # Create pipeline for easier inference
             self.pipeline = pipeline(
@@ -189,6 +185,14 @@ class FinBERTModel(SentimentModel):
     
     async def _process_sub_batch(self, texts: List[str]) -> List[SentimentResult]:
         """Process a sub-batch of texts."""
+        # Inference is synchronous; keep it off the event loop
+        return await asyncio.to_thread(self._infer_sub_batch, texts)
+
+    def _infer_sub_batch(self, texts: List[str]) -> List[SentimentResult]:
+        with self._model_handle.inference_lock:
+            return self._run_sub_batch(texts)
+
+    def _run_sub_batch(self, texts: List[str]) -> List[SentimentResult]:
         sub_results = []
         
         for text in texts:
@@ -396,14 +400,13 @@ class FinBERTModel(SentimentModel):
         )
     
     async def cleanup(self) -> None:
-        """Clean up model resources."""
-        if self.model is not None:
-            # Move model to CPU to free GPU memory
-            self.model.to('cpu')
-            
-        # Clear CUDA cache if using GPU
-        if torch.cuda.is_available():
-            torch.cuda.empty_cache()
+        """Release the shared model (weights stay in the registry for other consumers)."""
+        get_model_registry().release(self._model_handle)
+        self._model_handle = None
+        self.pipeline = None
+        self.model = None
+        self.tokenizer = None
+        self._is_loaded = False
         
         logger.info("ProsusAI/finbert model resources cleaned up")
 
@@ -780,7 +783,13 @@ class EnsembleFinBERTModel(SentimentModel):
         {"name": "yiyanghkust/finbert-tone", "weight": 0.4, "label_map": {"Positive": "positive", "Negative": "negative", "Neutral": "neutral"}}
     ]
     
-    def __init__(self, use_gpu: bool = None, max_length: int = 512, use_calibration: bool = True):
+    def __init__(
+        self,
+        use_gpu: bool = None,
+        max_length: int = 512,
+        use_calibration: bool = True,
+        quantize: bool = False
+    ):
         """
         Initialize Ensemble FinBERT model.
         
@@ -788,8 +797,10 @@ class EnsembleFinBERTModel(SentimentModel):
             use_gpu: Whether to use GPU acceleration (auto-detect if None)
             max_length: Maximum sequence length for tokenization
             use_calibration: Whether to apply confidence calibration
+            quantize: Use dynamic INT8 quantized weights (CPU only)
         """
-        self.use_gpu = use_gpu if use_gpu is not None else torch.cuda.is_available()
+        self.quantize = quantize
+        self.use_gpu = False if quantize else (use_gpu if use_gpu is not None else torch.cuda.is_available())
         self.max_length = max_length
         self.use_calibration = use_calibration
         self.device = None
@@ -817,6 +828,10 @@ class EnsembleFinBERTModel(SentimentModel):
     
     async def _load_model(self) -> None:
         """Load all ensemble FinBERT models."""
+        # Weight loading and pipeline construction block; keep them off the event loop
+        await asyncio.to_thread(self._load_model_sync)
+
+    def _load_model_sync(self) -> None:
         try:
             logger.info("Loading Ensemble FinBERT models...")
             
@@ -833,25 +848,17 @@ class EnsembleFinBERTModel(SentimentModel):
                 try:
                     logger.info(f"Loading {config['name']} (weight: {config['weight']})...")
                     
-                    tokenizer = AutoTokenizer.from_pretrained(
-                        config['name'],
-                        use_fast=True
-                    )
-                    
-                    model = AutoModelForSequenceClassification.from_pretrained(
+                    handle = get_model_registry().acquire(
                         config['name'],
-                        num_labels=3,
-                        output_attentions=False,
-                        output_hidden_states=False
+                        self.device,
+                        quantize=self.quantize
                     )
                     
-                    model.to(self.device)
-                    model.eval()
-                    
                     self.models.append({
                         'name': config['name'],
-                        'model': model,
-                        'tokenizer': tokenizer,
+                        'model': handle.model,
+                        'tokenizer': handle.tokenizer,
+                        'handle': handle,
                         'weight': config['weight'],
                         'label_map': config['label_map']
                     })
@@ -902,6 +909,10 @@ class EnsembleFinBERTModel(SentimentModel):
     
     async def _process_ensemble_batch(self, texts: List[str]) -> List[SentimentResult]:
         """Process a batch using ensemble of models."""
+        # Inference is synchronous; keep it off the event loop
+        return await asyncio.to_thread(self._infer_ensemble_batch, texts)
+
+    def _infer_ensemble_batch(self, texts: List[str]) -> List[SentimentResult]:
         batch_results = []
         
         for text in texts:
@@ -929,6 +940,10 @@ class EnsembleFinBERTModel(SentimentModel):
     
     def _predict_single_model(self, text: str, model_info: Dict) -> Dict[str, Any]:
         """Get prediction from a single model in ensemble."""
+        with model_info['handle'].inference_lock:
+            return self._predict_with(text, model_info)
+
+    def _predict_with(self, text: str, model_info: Dict) -> Dict[str, Any]:
         tokenizer = model_info['tokenizer']
         model = model_info['model']
         label_map = model_info['label_map']
@@ -1041,12 +1056,12 @@ class EnsembleFinBERTModel(SentimentModel):
         )
     
     async def cleanup(self) -> None:
-        """Clean up all ensemble model resources."""
+        """Release all shared ensemble models."""
+        registry = get_model_registry()
         for model_info in self.models:
-            model_info['model'].to('cpu')
-        
-        if torch.cuda.is_available():
-            torch.cuda.empty_cache()
+            registry.release(model_info.get('handle'))
+        self.models = []
+        self._is_loaded = False
         
         logger.info("Ensemble FinBERT resources cleaned up")
 
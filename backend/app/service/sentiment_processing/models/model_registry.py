@@ -0,0 +1,240 @@
+"""
+Shared Model Registry
+=====================
+
+Process-wide registry of transformer models and tokenizers.
+
+FinBERTModel, EnsembleFinBERTModel, DistilBERTFinancialModel,
+AIVerifiedSentimentAnalyzer and the benchmark service all use the same
+HuggingFace checkpoints. Instead of each consumer holding its own copy of a
+multi-hundred-MB parameter set, they acquire a shared, read-only handle from
+this registry. Handles are keyed by (checkpoint, dtype, device) and reference
+counted; weights stay loaded until explicitly unloaded so a consumer that is
+recreated reuses the warm copy instead of paying the load again.
+"""
+
+import gc
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import torch
+from transformers import AutoTokenizer
+
+from .quantization import is_quantization_available, load_classification_model
+from app.infrastructure.log_system import get_logger
+
+logger = get_logger()
+
+# (checkpoint, dtype, device)
+ModelKey = Tuple[str, str, str]
+
+
+@dataclass
+class ModelHandle:
+    """
+    Shared, read-only model and tokenizer.
+
+    Consumers must not move, train or otherwise mutate the model; release the
+    handle through ModelRegistry.release() instead of cleaning it up directly.
+    Inference running off the event loop holds inference_lock: fast
+    tokenizers raise "Already borrowed" when one instance is called from
+    several threads at once. Torch still spreads each forward pass over its
+    intra-op threads.
+    """
+    key: ModelKey
+    model: Any
+    tokenizer: Any
+    inference_lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def checkpoint(self) -> str:
+        return self.key[0]
+
+    @property
+    def dtype(self) -> str:
+        return self.key[1]
+
+
+@dataclass
+class _RegistryEntry:
+    """Internal bookkeeping for one loaded model."""
+    handle: ModelHandle
+    ref_count: int = 0
+    load_seconds: float = 0.0
+    loaded_at: float = field(default_factory=time.time)
+    acquisitions: int = 0
+
+
+class ModelRegistry:
+    """
+    Reference-counted cache of loaded sequence classification models.
+
+    Loading is serialized per key, so concurrent first requests for the same
+    checkpoint load it once and share the result.
+    """
+
+    def __init__(self):
+        self._entries: Dict[ModelKey, _RegistryEntry] = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[ModelKey, threading.Lock] = {}
+
+    @staticmethod
+    def make_key(checkpoint: str, device: Any = "cpu", quantize: bool = False) -> ModelKey:
+        """
+        Build the registry key for a checkpoint; INT8 models always live on CPU.
+
+        Without INT8 support in this PyTorch build, quantize requests get
+        the FP32 model, keyed (and shared) as such.
+        """
+        if quantize and is_quantization_available():
+            return (checkpoint, "int8", "cpu")
+        return (checkpoint, "fp32", str(device))
+
+    def acquire(self, checkpoint: str, device: Any = "cpu", quantize: bool = False) -> ModelHandle:
+        """
+        Get a shared handle, loading the model on first use.
+
+        Args:
+            checkpoint: HuggingFace checkpoint name
+            device: Device for FP32 models
+            quantize: Use the dynamic INT8 variant (CPU)
+
+        Returns:
+            ModelHandle; pair every acquire() with a release()
+        """
+        key = self.make_key(checkpoint, device, quantize)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.ref_count += 1
+                entry.acquisitions += 1
+                return entry.handle
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # Another thread may have finished loading while we waited
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.ref_count += 1
+                    entry.acquisitions += 1
+                    return entry.handle
+
+            if quantize and key[1] != "int8":
+                logger.warning(f"INT8 quantization not supported by this PyTorch build, loading FP32 {checkpoint}")
+            logger.info(f"Loading shared model {checkpoint}", extra={"dtype": key[1], "device": key[2]})
+            load_start = time.perf_counter()
+            tokenizer = AutoTokenizer.from_pretrained(checkpoint, use_fast=True)
+            model = load_classification_model(
+                checkpoint,
+                torch.device(key[2]),
+                quantize=key[1] == "int8"
+            )
+            # Shared weights are read-only
+            for parameter in model.parameters():
+                parameter.requires_grad_(False)
+            load_seconds = time.perf_counter() - load_start
+
+            handle = ModelHandle(key=key, model=model, tokenizer=tokenizer)
+            with self._lock:
+                self._entries[key] = _RegistryEntry(
+                    handle=handle, ref_count=1, load_seconds=load_seconds, acquisitions=1
+                )
+
+            logger.info(
+                f"Shared model {checkpoint} loaded",
+                extra={"dtype": key[1], "device": key[2], "load_seconds": round(load_seconds, 2)}
+            )
+            return handle
+
+    def release(self, handle: Optional[ModelHandle]) -> None:
+        """Drop one reference to a handle. The model stays loaded until unload()."""
+        if handle is None:
+            return
+
+        with self._lock:
+            entry = self._entries.get(handle.key)
+            if entry is not None and entry.ref_count > 0:
+                entry.ref_count -= 1
+
+    def unload(
+        self,
+        checkpoint: Optional[str] = None,
+        dtype: Optional[str] = None,
+        force: bool = False
+    ) -> List[ModelKey]:
+        """
+        Unload models and free their memory.
+
+        Args:
+            checkpoint: Only unload this checkpoint (all if None)
+            dtype: Only unload this dtype, "fp32" or "int8" (all if None)
+            force: Also unload models that still have active references
+
+        Returns:
+            Keys that were unloaded
+        """
+        unloaded: List[ModelKey] = []
+
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if checkpoint is not None and key[0] != checkpoint:
+                    continue
+                if dtype is not None and key[1] != dtype:
+                    continue
+                if entry.ref_count > 0 and not force:
+                    logger.warning(
+                        f"Not unloading {key[0]} ({key[1]}): {entry.ref_count} active reference(s)"
+                    )
+                    continue
+                del self._entries[key]
+                self._key_locks.pop(key, None)
+                unloaded.append(key)
+
+        if unloaded:
+            gc.collect()
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+            logger.info(f"Unloaded {len(unloaded)} shared model(s)", extra={"models": [k[0] for k in unloaded]})
+
+        return unloaded
+
+    def is_loaded(self, checkpoint: str, device: Any = "cpu", quantize: bool = False) -> bool:
+        """Check whether a checkpoint is already resident."""
+        with self._lock:
+            return self.make_key(checkpoint, device, quantize) in self._entries
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Loaded models with reference counts and load times."""
+        with self._lock:
+            models = [
+                {
+                    "checkpoint": key[0],
+                    "dtype": key[1],
+                    "device": key[2],
+                    "ref_count": entry.ref_count,
+                    "acquisitions": entry.acquisitions,
+                    "load_seconds": round(entry.load_seconds, 2),
+                    "loaded_at": entry.loaded_at
+                }
+                for key, entry in self._entries.items()
+            ]
+        return {"loaded_models": len(models), "models": models}
+
+
+# Global singleton instance
+_model_registry: Optional[ModelRegistry] = None
+_model_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Get the process-wide model registry."""
+    global _model_registry
+    if _model_registry is None:
+        with _model_registry_lock:
+            if _model_registry is None:
+                _model_registry = ModelRegistry()
+    return _model_registry
@@ -0,0 +1,163 @@
+"""
+Dynamic INT8 Quantization
+=========================
+
+Opt-in quantized CPU inference for the transformer sentiment models.
+
+Uses PyTorch dynamic quantization: the weights of every nn.Linear layer are
+stored as INT8 and activations are quantized on the fly, which roughly halves
+resident memory and speeds up CPU inference for BERT-sized models. The
+converted weights are cached to disk after the first conversion, so later
+loads skip both the FP32 weight load and the conversion step. Cache files
+are keyed by the checkpoint's commit hash and the torch and transformers
+versions: packed INT8 weights from another revision or library version
+may not load, or may load into the wrong layout.
+
+Quantized models only run on CPU.
+"""
+
+import os
+import re
+from typing import Any, Optional
+
+import torch
+import transformers
+from transformers import AutoConfig, AutoModelForSequenceClassification
+
+from app.infrastructure.log_system import get_logger
+
+logger = get_logger()
+
+QUANTIZED_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))),
+    "data", "models", "quantized"
+)
+
+
+def is_quantization_available() -> bool:
+    """Check if this PyTorch build has a CPU backend for dynamic quantization."""
+    try:
+        return bool(set(torch.backends.quantized.supported_engines) & {"fbgemm", "x86", "qnnpack"})
+    except AttributeError:
+        return False
+
+
+def _select_quantized_engine() -> None:
+    """Use qnnpack on platforms without fbgemm/x86 kernels (e.g. ARM)."""
+    engines = torch.backends.quantized.supported_engines
+    if torch.backends.quantized.engine in ("none", None) or torch.backends.quantized.engine not in engines:
+        for engine in ("x86", "fbgemm", "qnnpack"):
+            if engine in engines:
+                torch.backends.quantized.engine = engine
+                break
+
+
+def quantize_dynamic_int8(model: torch.nn.Module) -> torch.nn.Module:
+    """
+    Convert a model's Linear layers to dynamic INT8.
+
+    Args:
+        model: FP32 model (moved to CPU and set to eval mode)
+
+    Returns:
+        Quantized model
+    """
+    _select_quantized_engine()
+    model.to("cpu")
+    model.eval()
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def get_quantized_cache_path(model_name: str, cache_dir: Optional[str] = None,
+                             revision: Optional[str] = None) -> str:
+    """
+    Path of the cached INT8 state dict for a HuggingFace checkpoint.
+
+    Args:
+        model_name: HuggingFace checkpoint name
+        cache_dir: Directory for cached INT8 weights (QUANTIZED_CACHE_DIR if None)
+        revision: Commit hash (or branch/tag) of the checkpoint
+    """
+    parts = [model_name, revision or "main", f"torch-{torch.__version__}", f"transformers-{transformers.__version__}"]
+    safe_name = ".".join(re.sub(r"[^A-Za-z0-9_.-]+", "__", part) for part in parts)
+    return os.path.join(cache_dir or QUANTIZED_CACHE_DIR, f"{safe_name}.int8.pt")
+
+
+def load_quantized_model(
+    model_name: str,
+    cache_dir: Optional[str] = None,
+    **model_kwargs: Any
+) -> torch.nn.Module:
+    """
+    Load a dynamic INT8 sequence classification model, using the disk cache when present.
+
+    On a cache hit the model skeleton is built from its config and the INT8
+    state dict is loaded directly; on a miss the FP32 checkpoint is loaded,
+    quantized and saved for next time.
+
+    Args:
+        model_name: HuggingFace checkpoint name
+        cache_dir: Directory for cached INT8 weights (QUANTIZED_CACHE_DIR if None)
+        **model_kwargs: Extra arguments for from_pretrained / AutoConfig
+
+    Returns:
+        Quantized model in eval mode on CPU
+    """
+    config = AutoConfig.from_pretrained(model_name, **model_kwargs)
+    # Set by transformers when the config comes from the Hub or its local cache
+    revision = getattr(config, "_commit_hash", None) or model_kwargs.get("revision")
+    cache_path = get_quantized_cache_path(model_name, cache_dir, revision)
+
+    if os.path.exists(cache_path):
+        try:
+            model = quantize_dynamic_int8(AutoModelForSequenceClassification.from_config(config))
+            # Our own cache file; packed INT8 params are not plain tensors
+            model.load_state_dict(torch.load(cache_path, map_location="cpu", weights_only=False))
+            model.eval()
+            logger.info(f"Loaded INT8 {model_name} from cache", extra={"path": cache_path})
+            return model
+        except Exception as e:
+            logger.warning(f"Quantized cache for {model_name} unusable, rebuilding: {e}")
+
+    model = AutoModelForSequenceClassification.from_pretrained(model_name, **model_kwargs)
+    model = quantize_dynamic_int8(model)
+
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.tmp"
+        torch.save(model.state_dict(), tmp_path)
+        os.replace(tmp_path, cache_path)
+        logger.info(f"Cached INT8 {model_name}", extra={"path": cache_path})
+    except OSError as e:
+        logger.warning(f"Could not cache quantized {model_name}: {e}")
+
+    return model
+
+
+def load_classification_model(
+    model_name: str,
+    device: torch.device,
+    quantize: bool = False,
+    **model_kwargs: Any
+) -> torch.nn.Module:
+    """
+    Load a sequence classification model for inference.
+
+    Args:
+        model_name: HuggingFace checkpoint name
+        device: Target device for FP32 models (quantized models always use CPU)
+        quantize: Load the dynamic INT8 variant
+        **model_kwargs: Extra arguments for from_pretrained
+
+    Returns:
+        Model in eval mode
+    """
+    if quantize:
+        if is_quantization_available():
+            return load_quantized_model(model_name, **model_kwargs)
+        logger.warning(f"INT8 quantization not supported by this PyTorch build, loading FP32 {model_name}")
+
+    model = AutoModelForSequenceClassification.from_pretrained(model_name, **model_kwargs)
+    model.to(device)
+    model.eval()
+    return model
@@ -27,7 +27,6 @@ from .models.sentiment_model import (
     SentimentModelError
 )
 from ...infrastructure.collectors.base_collector import DataSource
-from .models.finbert_model import FinBERTModel, EnsembleFinBERTModel
 from ...infrastructure.log_system import get_logger
 
 logger = get_logger()
@@ -44,6 +43,7 @@ class EngineConfig:
     use_ensemble_finbert: bool = False  # Enable ensemble FinBERT (combines multiple checkpoints)
     finbert_use_gpu: bool = True
     finbert_use_calibration: bool = True  # Enable confidence calibration
+    quantize_int8: bool = False  # Dynamic INT8 quantized weights for CPU-only nodes (cached on disk)
     max_concurrent_batches: int = 3
     default_batch_size: int = 32
     timeout_seconds: int = 300
@@ -113,6 +113,13 @@ class SentimentEngine:
         self._active_jobs: Dict[str, AnalysisJob] = {}
         self._ai_analyzer = None  # AI-verified sentiment analyzer (optional)
         
+        # Background warm-up state (models are loaded off the request path)
+        self._init_lock: Optional[asyncio.Lock] = None
+        self._warmup_task: Optional[asyncio.Task] = None
+        self.warmup_state = "cold"  # cold, warming, ready, failed
+        self.warmup_error: Optional[str] = None
+        self.warmup_seconds: Optional[float] = None
+        
         # Result cache (simple in-memory cache)
         self._cache: Dict[str, SentimentResult] = {}
         self._cache_lock = threading.Lock()
@@ -133,6 +140,20 @@ class SentimentEngine:
         if self.is_initialized:
             return
         
+        # Warm-up and the first pipeline run may race here; initialize once
+        if self._init_lock is None:
+            self._init_lock = asyncio.Lock()
+        async with self._init_lock:
+            if self.is_initialized:
+                return
+            await self._initialize_models()
+            self.warmup_state = "ready"
+    
+    async def _initialize_models(self) -> None:
+        """Create the FinBERT model and AI verification analyzer."""
+        # Deferred so importing the engine does not pull in torch/transformers
+        from .models.finbert_model import FinBERTModel, EnsembleFinBERTModel
+        
         logger.info("Initializing Sentiment Analysis Engine with ProsusAI/finbert...")
         
         # Initialize FinBERT model (standard or ensemble)
@@ -142,12 +163,16 @@ class SentimentEngine:
                     # Use ensemble FinBERT for improved accuracy (1-2% gain)
                     self.models["ProsusAI/finbert"] = EnsembleFinBERTModel(
                         use_gpu=self.config.finbert_use_gpu,
-                        use_calibration=self.config.finbert_use_calibration
+                        use_calibration=self.config.finbert_use_calibration,
+                        quantize=self.config.quantize_int8
                     )
                     logger.info("Using Ensemble FinBERT model")
                 else:
                     # Use ProsusAI/finbert (88.3% accuracy on Financial PhraseBank)
-                    self.models["ProsusAI/finbert"] = FinBERTModel(use_gpu=self.config.finbert_use_gpu)
+                    self.models["ProsusAI/finbert"] = FinBERTModel(
+                        use_gpu=self.config.finbert_use_gpu,
+                        quantize=self.config.quantize_int8
+                    )
                     logger.info("Using ProsusAI/finbert model (88.3% benchmark accuracy)")
                 
                 await self.models["ProsusAI/finbert"].ensure_loaded()
@@ -174,11 +199,15 @@ class SentimentEngine:
                     VerificationMode.LOW_CONFIDENCE_AND_NEUTRAL
                 )
                 
-                self._ai_analyzer = AIVerifiedSentimentAnalyzer(
+                # The constructor loads FinBERT and validates the Gemini key with a
+                # blocking API call; build it in a worker thread
+                self._ai_analyzer = await asyncio.to_thread(
+                    AIVerifiedSentimentAnalyzer,
                     verification_mode=verification_mode,
                     confidence_threshold=self.config.ai_confidence_threshold,
                     min_confidence_threshold=self.config.min_confidence_threshold,  # NEW: Pass min threshold
-                    ai_enabled=True  # Let it auto-load Gemini key
+                    ai_enabled=True,  # Let it auto-load Gemini key
+                    quantize=self.config.quantize_int8
                 )
                 
                 if self._ai_analyzer.gemini_model:
@@ -202,7 +231,119 @@ class SentimentEngine:
         self.is_initialized = True
         ai_status = "with AI verification" if (self._ai_analyzer and self._ai_analyzer.gemini_model) else "ML-only"
         logger.info(f"Sentiment Engine initialized ({ai_status}) with {len(self.models)} model(s): {list(self.models.keys())}")
-    
+
+    def _preload_model_weights(self) -> None:
+        """
+        Import the ML stack and load model weights into the shared registry.
+
+        Runs in a worker thread so the event loop keeps serving requests while
+        torch is imported and checkpoints are read from disk. initialize() then
+        finds the weights resident and only builds the lightweight wrappers.
+        """
+        import torch
+        from .models.finbert_model import FinBERTModel, EnsembleFinBERTModel
+        from .models.model_registry import get_model_registry
+
+        if self.config.enable_ai_verification:
+            # Imports the Gemini client as well
+            from . import hybrid_sentiment_analyzer  # noqa: F401
+
+        quantize = self.config.quantize_int8
+        if self.config.use_ensemble_finbert:
+            checkpoints = [config["name"] for config in EnsembleFinBERTModel.MODELS_CONFIG]
+        else:
+            checkpoints = [FinBERTModel.MODEL_NAME]
+
+        if self.config.finbert_use_gpu and torch.cuda.is_available():
+            device = torch.device("cuda")
+        else:
+            device = torch.device("cpu")
+
+        registry = get_model_registry()
+        for checkpoint in checkpoints:
+            if registry.is_loaded(checkpoint, device, quantize=quantize):
+                continue
+            try:
+                registry.release(registry.acquire(checkpoint, device, quantize=quantize))
+            except Exception as e:
+                # initialize() retries the load and applies the fallback policy
+                logger.warning(f"Warm-up could not preload {checkpoint}: {e}")
+
+    async def warm_up(self) -> bool:
+        """
+        Load all models in the background.
+
+        Returns:
+            True if the engine is ready for analysis
+        """
+        if self.is_initialized:
+            self.warmup_state = "ready"
+            return True
+
+        self.warmup_state = "warming"
+        self.warmup_error = None
+        start_time = time.perf_counter()
+
+        try:
+            await asyncio.to_thread(self._preload_model_weights)
+            await self.initialize()
+            self.warmup_state = "ready"
+        except Exception as e:
+            self.warmup_state = "failed"
+            self.warmup_error = str(e)
+            logger.error(f"Sentiment engine warm-up failed: {e}")
+        finally:
+            self.warmup_seconds = round(time.perf_counter() - start_time, 2)
+
+        if self.warmup_state == "ready":
+            logger.info(f"Sentiment engine warm-up complete in {self.warmup_seconds}s")
+        return self.is_initialized
+
+    def start_warmup(self) -> asyncio.Task:
+        """
+        Schedule warm_up() on the running event loop (idempotent).
+
+        A failed warm-up is retried by the next call.
+        """
+        if self._warmup_task is None or (self._warmup_task.done() and not self.is_initialized):
+            self._warmup_task = asyncio.create_task(self.warm_up())
+        return self._warmup_task
+
+    async def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the background warm-up, initializing directly if none is running.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the engine is ready for analysis
+        """
+        if self.is_initialized:
+            return True
+
+        task = self._warmup_task
+        if task is not None and not task.done():
+            logger.info("Waiting for sentiment engine warm-up to finish...")
+            try:
+                await asyncio.wait_for(asyncio.shield(task), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Sentiment engine warm-up still running after {timeout}s")
+                return False
+
+        if not self.is_initialized:
+            await self.initialize()
+        return self.is_initialized
+
+    def get_readiness(self) -> Dict[str, Any]:
+        """Warm-up state for readiness probes; never triggers a model load."""
+        return {
+            "ready": self.is_initialized,
+            "state": "ready" if self.is_initialized else self.warmup_state,
+            "warmup_seconds": self.warmup_seconds,
+            "error": self.warmup_error
+        }
+
     async def analyze(self, inputs: List[TextInput]) -> List[SentimentResult]:
         """
         Analyze sentiment for multiple text inputs with caching support.
@@ -214,7 +355,7 @@ class SentimentEngine:
             List of SentimentResult objects in the same order as inputs
         """
         if not self.is_initialized:
-            await self.initialize()
+            await self.wait_until_ready()
         
         if not inputs:
             return []
@@ -604,6 +745,7 @@ class SentimentEngine:
         """
         health_status = {
             "engine_initialized": self.is_initialized,
+            "warmup": self.get_readiness(),
             "available_models": list(self.models.keys()),
             "model_routing": {k.value: v for k, v in self._model_routing.items()},
             "stats": {
@@ -632,6 +774,10 @@ class SentimentEngine:
         )
         health_status["overall_status"] = "healthy" if all_healthy else "degraded"
         
+        # Shared model registry (weights loaded once per process)
+        from .models.model_registry import get_model_registry
+        health_status["model_registry"] = get_model_registry().get_stats()
+        
         # Add AI verification status
         health_status["ai_verification"] = {
             "enabled": self._ai_analyzer is not None,
@@ -657,6 +803,15 @@ class SentimentEngine:
         """Gracefully shutdown the engine and cleanup resources."""
         logger.info("Shutting down Sentiment Analysis Engine...")
         
+        # Stop an unfinished warm-up before releasing models
+        if self._warmup_task is not None and not self._warmup_task.done():
+            self._warmup_task.cancel()
+            try:
+                await self._warmup_task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._warmup_task = None
+        
         # Cleanup ProsusAI/finbert model if present
         if "ProsusAI/finbert" in self.models:
             try:
@@ -664,6 +819,13 @@ class SentimentEngine:
             except Exception as e:
                 logger.error(f"Error during ProsusAI/finbert cleanup: {e}")
         
+        # Release shared AI analyzer models
+        if self._ai_analyzer:
+            try:
+                self._ai_analyzer.release_models()
+            except Exception as e:
+                logger.error(f"Error releasing AI analyzer models: {e}")
+        
         # Shutdown thread pool
         self._executor.shutdown(wait=True)
         
@@ -671,6 +833,7 @@ class SentimentEngine:
         self.models.clear()
         self._ai_analyzer = None
         self.is_initialized = False
+        self.warmup_state = "cold"
         
         logger.info("Sentiment Analysis Engine shutdown complete")
 
@@ -681,10 +844,11 @@ def create_default_engine() -> SentimentEngine:
     return SentimentEngine(EngineConfig())
 
 
-def create_cpu_only_engine() -> SentimentEngine:
+def create_cpu_only_engine(quantize_int8: bool = False) -> SentimentEngine:
     """Create a sentiment engine optimized for CPU-only environments."""
     config = EngineConfig(
         finbert_use_gpu=False,
+        quantize_int8=quantize_int8,
         max_concurrent_batches=2,
         default_batch_size=16
     )
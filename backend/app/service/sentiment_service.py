@@ -10,12 +10,15 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, desc, or_
-import math
-from app.utils.timezone import utc_now, to_naive_utc
+from app.utils.timezone import utc_now, to_naive_utc, to_iso_string, ensure_utc
 
 from app.data_access.models import Stock, SentimentData, NewsArticle, HackerNewsPost
 from app.infrastructure.log_system import get_logger
+from app.service.sentiment_aggregation import DecayedSentiment, decay_weights, load_decayed_sentiment
 from app.utils.sql import escape_like
+from app.utils.time_buckets import (
+    bucket_unit_for_days, dialect_name, exchange_utc_offset_minutes, parse_bucket, time_bucket
+)
 
 
 logger = get_logger()
@@ -62,23 +65,20 @@ class SentimentService:
             - 48 hours old: weight = 0.25 (25%)
             - 72 hours old: weight = 0.125 (12.5%)
         """
-        if not self.decay_enabled:
-            return 1.0  # No decay - all data has equal weight
-        
         if current_time is None:
             current_time = utc_now()
         
         # Calculate hours since timestamp
-        time_diff = current_time - timestamp
+        time_diff = ensure_utc(current_time) - ensure_utc(timestamp)
         hours_ago = time_diff.total_seconds() / 3600
         
-        # Exponential decay: weight = exp(-hours_ago / half_life)
-        # Using natural logarithm: exp(-ln(2) * hours_ago / half_life)
-        decay_rate = math.log(2) / self.decay_half_life
-        weight = math.exp(-decay_rate * hours_ago)
-        
-        # Cap minimum weight at 0.05 (5%) for very old data
-        return max(weight, 0.05)
+        return float(decay_weights([hours_ago], self.decay_half_life, self.decay_enabled)[0])
+
+    async def _get_decayed_sentiment(self, stock_id: str, cutoff_date: datetime) -> DecayedSentiment:
+        """Decay-weighted aggregates for a stock, computed without loading ORM rows."""
+        return await load_decayed_sentiment(
+            self.db, stock_id, cutoff_date, self.decay_half_life, self.decay_enabled
+        )
 
     async def get_sentiment_trends(self, stock_symbol: str, time_period: str = "7d") -> Dict[str, Any]:
         """
@@ -150,11 +150,10 @@ class SentimentService:
             # Get recent data (last 7 days)
             cutoff_date = to_naive_utc(utc_now() - timedelta(days=7))
             
-            # Get overall metrics
-            overall_metrics = await self._get_overall_sentiment_metrics(stock.id, cutoff_date)
-            
-            # Get source breakdown
-            source_breakdown = await self._get_source_breakdown(stock.id, cutoff_date)
+            # One aggregation pass feeds both the overall metrics and the source breakdown
+            aggregate = await self._get_decayed_sentiment(stock.id, cutoff_date)
+            overall_metrics = await self._get_overall_sentiment_metrics(stock.id, cutoff_date, aggregate)
+            source_breakdown = await self._get_source_breakdown(stock.id, cutoff_date, aggregate)
             
             # Get recent mentions
             recent_mentions = await self._get_recent_mentions(stock_symbol, cutoff_date)
@@ -184,18 +183,17 @@ class SentimentService:
     async def _get_stock_sentiment_trends(self, stock_id: str, cutoff_date: datetime, days: int) -> List[Dict[str, Any]]:
         """Get sentiment trends over time for a stock."""
         try:
-            # Determine time bucket size
-            if days <= 1:
-                interval = "hour"
-            elif days <= 7:
-                interval = "day"
-            else:
-                interval = "week"
+            # Determine time bucket size; bucketing runs in the database, and
+            # daily/weekly buckets follow the exchange day rather than UTC midnight
+            interval = bucket_unit_for_days(days)
+            bucket = time_bucket(
+                SentimentData.created_at, interval, dialect_name(self.db), exchange_utc_offset_minutes()
+            )
             
             # Get sentiment data grouped by time intervals
             result = await self.db.execute(
                 select(
-                    func.date_trunc(interval, SentimentData.created_at).label('time_bucket'),
+                    bucket.label('time_bucket'),
                     func.avg(SentimentData.sentiment_score).label('avg_sentiment'),
                     func.avg(SentimentData.confidence).label('avg_confidence'),
                     func.count().label('data_points'),
@@ -205,14 +203,14 @@ class SentimentService:
                     SentimentData.stock_id == stock_id,
                     SentimentData.created_at >= cutoff_date
                 ))
-                .group_by(func.date_trunc(interval, SentimentData.created_at), SentimentData.source)
-                .order_by(func.date_trunc(interval, SentimentData.created_at))
+                .group_by(bucket, SentimentData.source)
+                .order_by(bucket)
             )
             
             # Group by time bucket
             time_buckets = {}
             for row in result:
-                bucket_key = row.time_bucket.isoformat()
+                bucket_key = to_iso_string(parse_bucket(row.time_bucket))
                 if bucket_key not in time_buckets:
                     time_buckets[bucket_key] = {
                         "timestamp": bucket_key,
@@ -254,22 +252,18 @@ class SentimentService:
             self.logger.error("Error getting sentiment trends", error=str(e))
             return []
 
-    async def _get_overall_sentiment_metrics(self, stock_id: str, cutoff_date: datetime) -> Dict[str, Any]:
+    async def _get_overall_sentiment_metrics(
+        self,
+        stock_id: str,
+        cutoff_date: datetime,
+        aggregate: Optional[DecayedSentiment] = None
+    ) -> Dict[str, Any]:
         """Get overall sentiment metrics for a stock with temporal decay."""
         try:
-            # Fetch all sentiment data points
-            result = await self.db.execute(
-                select(SentimentData)
-                .where(and_(
-                    SentimentData.stock_id == stock_id,
-                    SentimentData.processed_at >= cutoff_date
-                ))
-                .order_by(desc(SentimentData.processed_at))
-            )
+            if aggregate is None:
+                aggregate = await self._get_decayed_sentiment(stock_id, cutoff_date)
             
-            sentiment_records = result.scalars().all()
-            
-            if not sentiment_records:
+            if aggregate.count == 0:
                 return {
                     "avg_sentiment": 0.0,
                     "avg_confidence": 0.0,
@@ -277,24 +271,7 @@ class SentimentService:
                     "sentiment_label": "neutral"
                 }
             
-            # Calculate time-weighted averages
-            current_time = utc_now()
-            weighted_sentiment_sum = 0.0
-            weighted_confidence_sum = 0.0
-            total_weight = 0.0
-            
-            for record in sentiment_records:
-                # Calculate temporal weight
-                weight = self._calculate_temporal_weight(record.processed_at, current_time)
-                
-                # Weighted sums
-                weighted_sentiment_sum += record.sentiment_score * weight
-                weighted_confidence_sum += record.confidence * weight
-                total_weight += weight
-            
-            # Calculate weighted averages
-            avg_sentiment = weighted_sentiment_sum / total_weight if total_weight > 0 else 0.0
-            avg_confidence = weighted_confidence_sum / total_weight if total_weight > 0 else 0.0
+            avg_sentiment = aggregate.mean_score
             
             # Determine sentiment label
             if avg_sentiment > 0.1:
@@ -308,8 +285,8 @@ class SentimentService:
                 "Calculated time-weighted sentiment",
                 extra={
                     "stock_id": stock_id,
-                    "total_records": len(sentiment_records),
-                    "total_weight": round(total_weight, 2),
+                    "total_records": aggregate.count,
+                    "total_weight": round(aggregate.total_weight, 2),
                     "avg_sentiment": round(avg_sentiment, 3),
                     "decay_enabled": self.decay_enabled
                 }
@@ -317,10 +294,12 @@ class SentimentService:
             
             return {
                 "avg_sentiment": round(avg_sentiment, 3),
-                "avg_confidence": round(avg_confidence, 3),
-                "total_count": len(sentiment_records),
+                "avg_confidence": round(aggregate.mean_confidence, 3),
+                "total_count": aggregate.count,
                 "sentiment_label": sentiment_label,
-                "effective_weight": round(total_weight, 2)  # For debugging
+                "sentiment_std": round(aggregate.score_std, 3),
+                "confidence_weighted_sentiment": round(aggregate.confidence_weighted_score, 3),
+                "effective_weight": round(aggregate.total_weight, 2)  # For debugging
             }
             
         except Exception as e:
@@ -332,58 +311,26 @@ class SentimentService:
                 "sentiment_label": "neutral"
             }
 
-    async def _get_source_breakdown(self, stock_id: str, cutoff_date: datetime) -> Dict[str, Dict[str, Any]]:
+    async def _get_source_breakdown(
+        self,
+        stock_id: str,
+        cutoff_date: datetime,
+        aggregate: Optional[DecayedSentiment] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """Get sentiment breakdown by source with temporal decay weighting."""
         try:
-            # Fetch all sentiment data points grouped by source
-            result = await self.db.execute(
-                select(SentimentData)
-                .where(and_(
-                    SentimentData.stock_id == stock_id,
-                    SentimentData.processed_at >= cutoff_date
-                ))
-                .order_by(desc(SentimentData.processed_at))
-            )
-            
-            sentiment_records = result.scalars().all()
+            if aggregate is None:
+                aggregate = await self._get_decayed_sentiment(stock_id, cutoff_date)
             
-            if not sentiment_records:
-                return {}
-            
-            # Group by source and calculate time-weighted averages
-            current_time = utc_now()
-            source_data = {}
-            
-            for record in sentiment_records:
-                source = record.source
-                if source not in source_data:
-                    source_data[source] = {
-                        "weighted_score_sum": 0.0,
-                        "weighted_confidence_sum": 0.0,
-                        "total_weight": 0.0,
-                        "count": 0
-                    }
-                
-                # Calculate temporal weight
-                weight = self._calculate_temporal_weight(record.processed_at, current_time)
-                
-                # Accumulate weighted sums
-                source_data[source]["weighted_score_sum"] += record.sentiment_score * weight
-                source_data[source]["weighted_confidence_sum"] += record.confidence * weight
-                source_data[source]["total_weight"] += weight
-                source_data[source]["count"] += 1
-            
-            # Calculate final averages for each source
-            breakdown = {}
-            for source, data in source_data.items():
-                if data["total_weight"] > 0:
-                    breakdown[source] = {
-                        "score": round(data["weighted_score_sum"] / data["total_weight"], 3),
-                        "confidence": round(data["weighted_confidence_sum"] / data["total_weight"], 3),
-                        "count": data["count"]
-                    }
-            
-            return breakdown
+            return {
+                source: {
+                    "score": round(data.mean_score, 3),
+                    "confidence": round(data.mean_confidence, 3),
+                    "count": data.count
+                }
+                for source, data in aggregate.by_source.items()
+                if data.total_weight > 0
+            }
             
         except Exception as e:
             self.logger.error("Error getting source breakdown", error=str(e))
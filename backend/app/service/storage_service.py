@@ -11,11 +11,13 @@ from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import delete, func, text, select
 from app.utils.timezone import utc_now, to_naive_utc
+from app.utils.time_buckets import dialect_name, time_bucket
 
 from app.data_access.models import StocksWatchlist, SentimentData, StockPrice, SystemLog, NewsArticle, HackerNewsPost
 from app.infrastructure.log_system import get_logger
 from app.presentation.schemas.admin_schemas import StorageMetrics, RetentionPolicy
 from app.data_access.database.retry_utils import commit_with_retry
+from app.service.table_statistics_service import get_table_statistics_service
 
 
 logger = get_logger()
@@ -44,61 +46,36 @@ class StorageManager:
         try:
             self.logger.info("Calculating storage metrics")
             
-            # Get sentiment data count
-            sentiment_count_result = await self.db.execute(
-                select(func.count(SentimentData.id))
-            )
-            sentiment_count = sentiment_count_result.scalar() or 0
-            
-            # Get stock price count
-            price_count_result = await self.db.execute(
-                select(func.count(StockPrice.id))
-            )
-            price_count = price_count_result.scalar() or 0
-            
-            # Get news articles count
-            news_count_result = await self.db.execute(
-                select(func.count(NewsArticle.id))
-            )
-            news_count = news_count_result.scalar() or 0
-            
-            # Get HackerNews posts count
-            hn_count_result = await self.db.execute(
-                select(func.count(HackerNewsPost.id))
-            )
-            hn_count = hn_count_result.scalar() or 0
-            
-            # Get timestamp ranges from sentiment data
-            oldest_sentiment_result = await self.db.execute(
-                select(func.min(SentimentData.created_at))
-            )
-            oldest_record = oldest_sentiment_result.scalar()
-            
-            newest_sentiment_result = await self.db.execute(
-                select(func.max(SentimentData.created_at))
-            )
-            newest_record = newest_sentiment_result.scalar()
+            # Single grouped pass per table, cached between admin polls
+            snapshot = await get_table_statistics_service().get_snapshot(self.db)
+            sentiment = snapshot.table("sentiment_data")
+            sentiment_count = sentiment.row_count
+            price_count = snapshot.table("stock_prices").row_count
+            news_count = snapshot.table("news_articles").row_count
+            hn_count = snapshot.table("hackernews_posts").row_count
+            oldest_record = sentiment.oldest
+            newest_record = sentiment.newest
             
             # Calculate total records - only count processed data (sentiment + prices)
             # Note: news_articles and hn_posts are raw data that gets processed into sentiment_data
             # We keep them for audit/reprocessing but don't count them as separate data points
             total_records = sentiment_count + price_count
             
-            # Estimated storage calculation (in MB):
-            # - Sentiment records: ~0.5KB each
-            # - Price records: ~0.2KB each  
-            # - News articles: ~2KB each (raw storage, kept for audit)
-            # - HackerNews posts: ~1KB each (raw storage, kept for audit)
-            estimated_size_mb = (
-                (sentiment_count * 0.0005) + 
-                (price_count * 0.0002) + 
-                (news_count * 0.002) + 
-                (hn_count * 0.001)
-            )
+            # Real size reported by the database (dbstat / pg_total_relation_size)
+            if snapshot.database_size_mb is not None:
+                size_mb = snapshot.database_size_mb
+            else:
+                # Backend cannot report sizes: estimate from row counts
+                size_mb = (
+                    (sentiment_count * 0.0005) + 
+                    (price_count * 0.0002) + 
+                    (news_count * 0.002) + 
+                    (hn_count * 0.001)
+                )
             
             return StorageMetrics(
                 total_records=total_records,
-                storage_size_mb=round(estimated_size_mb, 2),
+                storage_size_mb=round(size_mb, 2),
                 sentiment_records=sentiment_count,
                 stock_price_records=price_count,
                 oldest_record=oldest_record,
@@ -172,6 +149,7 @@ class StorageManager:
                 cleanup_stats["hn_records_deleted"] = hn_delete_result.rowcount
                 
                 await commit_with_retry(self.db)
+                get_table_statistics_service().invalidate()
                 
                 self.logger.info("Retention policy applied successfully", stats=cleanup_stats)
             else:
@@ -337,14 +315,14 @@ class StorageManager:
     async def _calculate_storage_growth_rate(self) -> float:
         """Calculate daily storage growth rate from historical data."""
         try:
-            # SQLite compatible query
-            result = await self.db.execute(text("""
-                SELECT DATE(created_at) as date, COUNT(*) as daily_count 
-                FROM sentiment_data 
-                WHERE created_at >= datetime('now', '-7 days')
-                GROUP BY DATE(created_at)
-                ORDER BY date
-            """))
+            cutoff = to_naive_utc(utc_now() - timedelta(days=7))
+            bucket = time_bucket(SentimentData.created_at, "day", dialect_name(self.db))
+            result = await self.db.execute(
+                select(bucket.label('date'), func.count().label('daily_count'))
+                .where(SentimentData.created_at >= cutoff)
+                .group_by(bucket)
+                .order_by(bucket)
+            )
             
             daily_counts = [row.daily_count for row in result.fetchall()]
             if len(daily_counts) < 2:
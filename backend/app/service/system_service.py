@@ -6,21 +6,20 @@ Business logic for system monitoring and management operations.
 Implements system status, health checks, and operational services.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-import asyncio
+from sqlalchemy import select
 import os
 import time
-from app.utils.timezone import utc_now, ensure_utc, to_iso_string, to_naive_utc
+from app.utils.timezone import utc_now, to_iso_string, to_naive_utc
+from app.data_access.models import SystemLog
+from app.infrastructure.log_system import get_logger
+from app.service.table_statistics_service import StatisticsSnapshot, get_table_statistics_service
 
 # System metrics will use basic Python capabilities without psutil dependency
 SYSTEM_START_TIME = time.time()
 
-from app.data_access.models import SystemLog, SentimentData, StocksWatchlist, NewsArticle, HackerNewsPost
-from app.infrastructure.log_system import get_logger
-
 
 logger = get_logger()
 
@@ -85,7 +84,8 @@ class SystemService:
             self.logger.info("Triggering manual data collection", stock_symbols=stock_symbols)
             
             # Import pipeline components
-            from app.business.pipeline import DataPipeline
+            from app.business.pipeline import DataPipeline, PipelineConfig, DateRange
+            from app.business.worker_coordinator import get_worker_coordinator
             from app.service.watchlist_service import get_current_stock_symbols
             
             # Use provided symbols or dynamic watchlist
@@ -96,21 +96,31 @@ class SystemService:
                 current_watchlist = await get_current_stock_symbols(self.db)
                 symbols = current_watchlist  # Use all symbols in watchlist
             
-            # Initialize pipeline
-            pipeline = DataPipeline()
+            # Last day from every source, like the admin's manual collection
+            config = PipelineConfig(
+                symbols=symbols,
+                date_range=DateRange(
+                    start_date=to_naive_utc(utc_now() - timedelta(days=1)),
+                    end_date=to_naive_utc(utc_now())
+                ),
+                max_items_per_symbol=50
+            )
             
-            # Create job ID for tracking
-            job_id = f"manual_job_{int(utc_now().timestamp())}"
+            # Submit to the leader's run coordinator; joins or merges with an overlapping run
+            pipeline = DataPipeline(auto_configure_collectors=True)
+            run = await get_worker_coordinator().submit_pipeline(pipeline, config, source="system")
             
-            # Start pipeline execution as background task
-            asyncio.create_task(
-                self._execute_data_collection(pipeline, symbols, job_id)
+            await self._log_system_event(
+                "INFO",
+                f"Manual data collection job {run['run_id']} submitted",
+                {"job_id": run["run_id"], "symbols": symbols, "requesters": run["requesters"]}
             )
             
             return {
-                "status": "initiated",
-                "job_id": job_id,
-                "stock_symbols": symbols,
+                "status": "initiated" if len(run["requesters"]) == 1 else "coalesced",
+                "job_id": run["run_id"],
+                "run_state": run["state"],
+                "stock_symbols": run["symbols"] or symbols,
                 "estimated_completion": f"{len(symbols) * 2} minutes",
                 "timestamp": utc_now().isoformat()
             }
@@ -207,17 +217,17 @@ class SystemService:
                 "python_version": f"{os.sys.version_info.major}.{os.sys.version_info.minor}.{os.sys.version_info.micro}"
             }
             
+            # Cached single-scan table statistics shared by all metric sections
+            snapshot = await get_table_statistics_service().get_snapshot(self.db)
+            
             # Database metrics
-            db_metrics = await self._get_database_metrics()
+            db_metrics = await self._get_database_metrics(snapshot)
             
             # Processing metrics
-            processing_metrics = await self._get_processing_metrics()
+            processing_metrics = await self._get_processing_metrics(snapshot)
             
             # Calculate active stocks from watchlist
-            active_stocks_count = await self.db.scalar(
-                select(func.count()).select_from(StocksWatchlist)
-                .where(StocksWatchlist.is_active == True)
-            )
+            active_stocks_count = snapshot.active_stocks
             
             # Calculate total records - only count sentiment_data (processed records)
             # Note: news_articles and hn_posts are raw data that gets processed into sentiment_data
@@ -225,14 +235,8 @@ class SystemService:
             total_records = db_metrics.get("total_sentiment_data", 0)
             
             # Get last collection and price update times for top-level display
-            last_sentiment = await self.db.scalar(
-                select(func.max(SentimentData.created_at)).select_from(SentimentData)
-            )
-            
-            from app.data_access.models import StockPrice
-            last_price = await self.db.scalar(
-                select(func.max(StockPrice.price_timestamp)).select_from(StockPrice)
-            )
+            last_sentiment = snapshot.table("sentiment_data").newest
+            last_price = snapshot.table("stock_prices").newest
             
             # Return UTC timestamps in ISO format
             last_collection_display = to_iso_string(last_sentiment)
@@ -277,110 +281,56 @@ class SystemService:
                 "error": "Failed to retrieve metrics"
             }
 
-    async def _get_database_metrics(self) -> Dict[str, Any]:
+    async def _get_database_metrics(self, snapshot: Optional[StatisticsSnapshot] = None) -> Dict[str, Any]:
         """Get database-related metrics."""
         try:
-            # Count records in main tables
-            stock_count = await self.db.scalar(select(func.count()).select_from(StocksWatchlist))
-            sentiment_count = await self.db.scalar(select(func.count()).select_from(SentimentData))
-            news_count = await self.db.scalar(select(func.count()).select_from(NewsArticle))
-            hn_count = await self.db.scalar(select(func.count()).select_from(HackerNewsPost))
-            
-            # Get sentiment breakdown by label (case-insensitive)
-            positive_count = await self.db.scalar(
-                select(func.count()).select_from(SentimentData)
-                .where(func.lower(SentimentData.sentiment_label) == 'positive')
-            )
-            neutral_count = await self.db.scalar(
-                select(func.count()).select_from(SentimentData)
-                .where(func.lower(SentimentData.sentiment_label) == 'neutral')
-            )
-            negative_count = await self.db.scalar(
-                select(func.count()).select_from(SentimentData)
-                .where(func.lower(SentimentData.sentiment_label) == 'negative')
-            )
-            
-            # Get price records count
-            from app.data_access.models import StockPrice
-            price_count = await self.db.scalar(select(func.count()).select_from(StockPrice))
+            if snapshot is None:
+                snapshot = await get_table_statistics_service().get_snapshot(self.db)
             
-            # Get last collection and price update times (return UTC)
-            last_sentiment = await self.db.scalar(
-                select(func.max(SentimentData.created_at)).select_from(SentimentData)
-            )
-            last_price = await self.db.scalar(
-                select(func.max(StockPrice.price_timestamp)).select_from(StockPrice)
-            )
-            
-            # Ensure timestamps are UTC
-            if last_sentiment:
-                last_sentiment = ensure_utc(last_sentiment)
-            if last_price:
-                last_price = ensure_utc(last_price)
-            
-            # Get recent activity (last 24 hours)
-            yesterday = to_naive_utc(utc_now() - timedelta(days=1))
-            recent_sentiment = await self.db.scalar(
-                select(func.count()).select_from(SentimentData)
-                .where(SentimentData.created_at >= yesterday)
-            )
-            
-            recent_news = await self.db.scalar(
-                select(func.count()).select_from(NewsArticle)
-                .where(NewsArticle.published_at >= yesterday)
-            )
+            sentiment = snapshot.table("sentiment_data")
+            news = snapshot.table("news_articles")
+            news_count = news.row_count
+            hn_count = snapshot.table("hackernews_posts").row_count
             
             return {
-                "total_stocks": int(stock_count or 0),
-                "total_sentiment_data": int(sentiment_count or 0),
-                "total_news_articles": int(news_count or 0),
-                "total_hn_posts": int(hn_count or 0),
-                "sentiment_breakdown": {
-                    "positive": int(positive_count or 0),
-                    "neutral": int(neutral_count or 0),
-                    "negative": int(negative_count or 0)
-                },
-                "news_articles": int(news_count or 0),
-                "hn_posts": int(hn_count or 0),
-                "price_records": int(price_count or 0),
+                "total_stocks": snapshot.table("stocks_watchlist").row_count,
+                "total_sentiment_data": sentiment.row_count,
+                "total_news_articles": news_count,
+                "total_hn_posts": hn_count,
+                "sentiment_breakdown": dict(snapshot.sentiment_breakdown),
+                "news_articles": news_count,
+                "hn_posts": hn_count,
+                "price_records": snapshot.table("stock_prices").row_count,
                 # Note: last_collection and last_price_update are returned at top level in _get_system_metrics
                 # Removed from here to avoid duplication in frontend display
                 "recent_activity": {
-                    "sentiment_last_24h": int(recent_sentiment or 0),
-                    "news_last_24h": int(recent_news or 0)
-                }
+                    "sentiment_last_24h": sentiment.recent_24h,
+                    "news_last_24h": news.recent_24h
+                },
+                "size_mb": round(snapshot.database_size_mb, 2) if snapshot.database_size_mb is not None else None,
+                "size_source": snapshot.size_source,
+                "statistics_age_seconds": round(snapshot.age_seconds, 1)
             }
             
         except Exception as e:
             self.logger.error("Error getting database metrics", error=str(e))
             return {"error": "Failed to retrieve database metrics"}
 
-    async def _get_processing_metrics(self) -> Dict[str, Any]:
+    async def _get_processing_metrics(self, snapshot: Optional[StatisticsSnapshot] = None) -> Dict[str, Any]:
         """Get data processing metrics."""
         try:
-            # Get last processing time
-            last_sentiment = await self.db.scalar(
-                select(func.max(SentimentData.created_at)).select_from(SentimentData)
-            )
-            
-            last_news = await self.db.scalar(
-                select(func.max(NewsArticle.published_at)).select_from(NewsArticle)
-            )
-            
-            # Calculate processing rates (last 24 hours)
-            yesterday = to_naive_utc(utc_now() - timedelta(days=1))
+            if snapshot is None:
+                snapshot = await get_table_statistics_service().get_snapshot(self.db)
             
-            sentiment_rate = await self.db.scalar(
-                select(func.count()).select_from(SentimentData)
-                .where(SentimentData.created_at >= yesterday)
-            )
+            # Processing rate over the last 24 hours
+            sentiment_rate = snapshot.table("sentiment_data").recent_24h
             
             return {
                 # Note: last_sentiment_processing removed - already available as last_collection at top level
                 # Note: last_news_update removed - redundant with last_collection
                 "processing_rate_24h": {
-                    "sentiment_analyses": int(sentiment_rate or 0),
-                    "avg_per_hour": round((sentiment_rate or 0) / 24, 1)
+                    "sentiment_analyses": sentiment_rate,
+                    "avg_per_hour": round(sentiment_rate / 24, 1)
                 }
             }
             
@@ -388,44 +338,6 @@ class SystemService:
             self.logger.error("Error getting processing metrics", error=str(e))
             return {"error": "Failed to retrieve processing metrics"}
 
-    async def _execute_data_collection(self, pipeline, symbols: List[str], job_id: str):
-        """Execute data collection in background."""
-        try:
-            self.logger.info(f"Starting data collection job {job_id}")
-            
-            # Log job start
-            await self._log_system_event(
-                "INFO", 
-                f"Manual data collection job {job_id} started", 
-                {"job_id": job_id, "symbols": symbols}
-            )
-            
-            # Execute pipeline for each symbol
-            results = await pipeline.process_stock_batch(symbols)
-            
-            # Log completion
-            await self._log_system_event(
-                "INFO",
-                f"Manual data collection job {job_id} completed",
-                {
-                    "job_id": job_id, 
-                    "processed_stocks": len(results),
-                    "success": True
-                }
-            )
-            
-            self.logger.info(f"Data collection job {job_id} completed successfully")
-            
-        except Exception as e:
-            # Log error
-            await self._log_system_event(
-                "ERROR",
-                f"Manual data collection job {job_id} failed",
-                {"job_id": job_id, "error": str(e)}
-            )
-            
-            self.logger.error(f"Data collection job {job_id} failed", error=str(e))
-
     async def _log_system_event(self, level: str, message: str, extra_data: Dict[str, Any] = None):
         """Log system event to database."""
         try:
@@ -0,0 +1,321 @@
+"""
+Table Statistics Service
+========================
+
+Cached row counts, sentiment label breakdown, time bounds and real on-disk
+sizes for the admin storage and system metrics pages.
+
+Each table is read with one grouped aggregate query instead of a separate
+count/min/max query per figure. The resulting snapshot is cached for a short
+TTL; between scans the pipeline and price service report what they wrote and
+those counters are folded into the cached snapshot, so polled admin pages stay
+current without rescanning. Deletes (retention cleanup, admin cleanup) call
+invalidate() to force a rescan.
+
+Sizes come from the database itself: the SQLite dbstat virtual table (or
+page_count * page_size when dbstat is not compiled in) and
+pg_total_relation_size / pg_database_size on PostgreSQL.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import case, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.data_access.models import (
+    HackerNewsPost,
+    NewsArticle,
+    SentimentData,
+    StockPrice,
+    StocksWatchlist,
+    SystemLog
+)
+from app.infrastructure.log_system import get_logger
+from app.utils.timezone import ensure_utc, to_naive_utc, utc_now
+
+logger = get_logger()
+
+# Seconds a full scan stays valid; pipeline writes are applied on top meanwhile
+DEFAULT_TTL_SECONDS = 60.0
+
+SENTIMENT_LABELS = ("positive", "neutral", "negative")
+
+# Table name -> (model, timestamp column used for bounds and the 24h window)
+_TRACKED_TABLES = {
+    "sentiment_data": (SentimentData, SentimentData.created_at),
+    "stock_prices": (StockPrice, StockPrice.price_timestamp),
+    "news_articles": (NewsArticle, NewsArticle.published_at),
+    "hackernews_posts": (HackerNewsPost, HackerNewsPost.created_utc),
+    "system_logs": (SystemLog, SystemLog.timestamp),
+    "stocks_watchlist": (StocksWatchlist, StocksWatchlist.created_at)
+}
+
+
+@dataclass
+class TableStatistics:
+    """Aggregates for one table."""
+    row_count: int = 0
+    oldest: Optional[datetime] = None
+    newest: Optional[datetime] = None
+    recent_24h: int = 0
+    size_bytes: Optional[int] = None
+
+    def apply_writes(self, count: int, newest: Optional[datetime]) -> None:
+        """Fold newly written rows into the aggregates."""
+        self.row_count += count
+        self.recent_24h += count
+        if newest is not None:
+            newest = ensure_utc(newest)
+            if self.newest is None or newest > self.newest:
+                self.newest = newest
+            if self.oldest is None:
+                self.oldest = newest
+
+
+@dataclass
+class StatisticsSnapshot:
+    """Statistics for all tracked tables at one point in time."""
+    tables: Dict[str, TableStatistics]
+    sentiment_breakdown: Dict[str, int]
+    active_stocks: int
+    database_size_bytes: Optional[int]
+    size_source: str
+    scanned_at: datetime
+    scan_duration_ms: float
+    incremental_updates: int = 0
+    _monotonic_scanned_at: float = field(default_factory=time.monotonic, repr=False)
+
+    def table(self, name: str) -> TableStatistics:
+        return self.tables.get(name) or TableStatistics()
+
+    @property
+    def age_seconds(self) -> float:
+        return time.monotonic() - self._monotonic_scanned_at
+
+    @property
+    def database_size_mb(self) -> Optional[float]:
+        if self.database_size_bytes is None:
+            return None
+        return self.database_size_bytes / (1024 ** 2)
+
+
+class TableStatisticsService:
+    """
+    Cached single-scan table statistics.
+
+    Usage:
+        snapshot = await get_table_statistics_service().get_snapshot(db)
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._snapshot: Optional[StatisticsSnapshot] = None
+        self._scan_lock = asyncio.Lock()
+        self._full_scans = 0
+        self._cache_hits = 0
+
+    async def get_snapshot(self, db: AsyncSession, force_refresh: bool = False) -> StatisticsSnapshot:
+        """
+        Get table statistics, rescanning only when the cache has expired.
+
+        Args:
+            db: Database session used for a rescan
+            force_refresh: Ignore the cached snapshot
+
+        Returns:
+            Current StatisticsSnapshot
+        """
+        snapshot = self._snapshot
+        if not force_refresh and snapshot is not None and snapshot.age_seconds < self.ttl_seconds:
+            self._cache_hits += 1
+            return snapshot
+
+        async with self._scan_lock:
+            # A concurrent caller may have rescanned while we waited
+            snapshot = self._snapshot
+            if not force_refresh and snapshot is not None and snapshot.age_seconds < self.ttl_seconds:
+                self._cache_hits += 1
+                return snapshot
+
+            self._snapshot = await self._scan(db)
+            self._full_scans += 1
+            return self._snapshot
+
+    def invalidate(self) -> None:
+        """Drop the cached snapshot (call after deletes)."""
+        self._snapshot = None
+
+    def record_writes(self, table: str, count: int, newest: Optional[datetime] = None) -> None:
+        """
+        Apply rows written by the pipeline to the cached snapshot.
+
+        Args:
+            table: Table name (e.g. "news_articles")
+            count: Number of rows inserted
+            newest: Timestamp of the newest inserted row
+        """
+        snapshot = self._snapshot
+        if snapshot is None or count <= 0:
+            return
+        snapshot.tables.setdefault(table, TableStatistics()).apply_writes(count, newest)
+        snapshot.incremental_updates += 1
+
+    def record_sentiment_writes(self, label_counts: Dict[str, int], newest: Optional[datetime] = None) -> None:
+        """
+        Apply stored sentiment records to the cached snapshot.
+
+        Args:
+            label_counts: Rows inserted per sentiment label
+            newest: created_at of the newest inserted row
+        """
+        snapshot = self._snapshot
+        total = sum(label_counts.values())
+        if snapshot is None or total <= 0:
+            return
+        for label, count in label_counts.items():
+            key = label.lower()
+            if key in snapshot.sentiment_breakdown:
+                snapshot.sentiment_breakdown[key] += count
+        self.record_writes("sentiment_data", total, newest)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache effectiveness counters."""
+        snapshot = self._snapshot
+        return {
+            "full_scans": self._full_scans,
+            "cache_hits": self._cache_hits,
+            "ttl_seconds": self.ttl_seconds,
+            "snapshot_age_seconds": round(snapshot.age_seconds, 1) if snapshot else None,
+            "incremental_updates": snapshot.incremental_updates if snapshot else 0
+        }
+
+    async def _scan(self, db: AsyncSession) -> StatisticsSnapshot:
+        """Read every tracked table with one grouped query each."""
+        start = time.perf_counter()
+        since = to_naive_utc(utc_now() - timedelta(days=1))
+        tables: Dict[str, TableStatistics] = {}
+
+        # Sentiment: grouped by the indexed label column, folded case-insensitively here
+        breakdown = {label: 0 for label in SENTIMENT_LABELS}
+        sentiment = TableStatistics()
+        rows = await db.execute(
+            select(
+                SentimentData.sentiment_label,
+                func.count(),
+                func.min(SentimentData.created_at),
+                func.max(SentimentData.created_at),
+                func.sum(case((SentimentData.created_at >= since, 1), else_=0))
+            ).group_by(SentimentData.sentiment_label)
+        )
+        for label, count, oldest, newest, recent in rows.all():
+            key = (label or "").lower()
+            if key in breakdown:
+                breakdown[key] += count
+            sentiment.row_count += count
+            sentiment.recent_24h += int(recent or 0)
+            if oldest is not None:
+                oldest = ensure_utc(oldest)
+                sentiment.oldest = oldest if sentiment.oldest is None else min(sentiment.oldest, oldest)
+            if newest is not None:
+                newest = ensure_utc(newest)
+                sentiment.newest = newest if sentiment.newest is None else max(sentiment.newest, newest)
+        tables["sentiment_data"] = sentiment
+
+        for name, (model, column) in _TRACKED_TABLES.items():
+            if name in ("sentiment_data", "stocks_watchlist"):
+                continue
+            count, oldest, newest, recent = (await db.execute(
+                select(
+                    func.count(),
+                    func.min(column),
+                    func.max(column),
+                    func.sum(case((column >= since, 1), else_=0))
+                ).select_from(model)
+            )).one()
+            tables[name] = TableStatistics(
+                row_count=int(count or 0),
+                oldest=ensure_utc(oldest) if oldest else None,
+                newest=ensure_utc(newest) if newest else None,
+                recent_24h=int(recent or 0)
+            )
+
+        stock_count, active_count = (await db.execute(
+            select(
+                func.count(),
+                func.sum(case((StocksWatchlist.is_active == True, 1), else_=0))  # noqa: E712
+            ).select_from(StocksWatchlist)
+        )).one()
+        tables["stocks_watchlist"] = TableStatistics(row_count=int(stock_count or 0))
+
+        database_size, size_source = await self._measure_sizes(db, tables)
+
+        return StatisticsSnapshot(
+            tables=tables,
+            sentiment_breakdown=breakdown,
+            active_stocks=int(active_count or 0),
+            database_size_bytes=database_size,
+            size_source=size_source,
+            scanned_at=utc_now(),
+            scan_duration_ms=round((time.perf_counter() - start) * 1000, 2)
+        )
+
+    async def _measure_sizes(self, db: AsyncSession, tables: Dict[str, TableStatistics]) -> Tuple[Optional[int], str]:
+        """
+        Fill per-table sizes and return (database_size_bytes, source).
+
+        Sizes include each table's indexes where the backend reports them.
+        """
+        dialect = db.get_bind().dialect.name
+
+        if dialect == "postgresql":
+            try:
+                # A failed lookup aborts only the savepoint, not the caller's transaction
+                async with db.begin_nested():
+                    for name, stats in tables.items():
+                        stats.size_bytes = await db.scalar(
+                            text("SELECT pg_total_relation_size(CAST(:name AS regclass))"), {"name": name}
+                        )
+                    total = await db.scalar(text("SELECT pg_database_size(current_database())"))
+                return int(total or 0), "pg_total_relation_size"
+            except Exception as e:
+                logger.warning(f"Could not read PostgreSQL relation sizes: {e}")
+                for stats in tables.values():
+                    stats.size_bytes = None
+                return None, "unavailable"
+
+        if dialect == "sqlite":
+            page_size = await db.scalar(text("PRAGMA page_size")) or 0
+            page_count = await db.scalar(text("PRAGMA page_count")) or 0
+            total = int(page_size) * int(page_count)
+            try:
+                # dbstat reports pages per btree; index btrees map back to their table
+                rows = await db.execute(text(
+                    "SELECT COALESCE(m.tbl_name, s.name) AS table_name, SUM(s.pgsize) "
+                    "FROM dbstat AS s LEFT JOIN sqlite_master AS m ON m.name = s.name "
+                    "GROUP BY table_name"
+                ))
+                for table_name, size in rows.all():
+                    if table_name in tables:
+                        tables[table_name].size_bytes = int(size or 0)
+                return total, "dbstat"
+            except Exception:
+                # SQLite build without SQLITE_ENABLE_DBSTAT_VTAB: whole-file size only
+                return total, "page_count"
+
+        return None, "unavailable"
+
+
+# Singleton instance
+_table_statistics_service: Optional[TableStatisticsService] = None
+
+
+def get_table_statistics_service() -> TableStatisticsService:
+    """Get the singleton table statistics service instance."""
+    global _table_statistics_service
+    if _table_statistics_service is None:
+        _table_statistics_service = TableStatisticsService()
+    return _table_statistics_service
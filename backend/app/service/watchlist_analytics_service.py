@@ -0,0 +1,161 @@
+"""
+Watchlist Analytics Service
+===========================
+
+Cached watchlist-wide aggregates for the Stock Analysis page.
+
+The top sentiment performers chart and the watchlist overview table do not
+depend on the symbol being viewed, but the frontend requests the analysis
+endpoint once per opened stock. This service computes those aggregates once
+per timeframe with a single grouped query and keeps them until new sentiment
+rows are stored or the watchlist changes. Live prices are not part of the
+snapshot; the route overlays them from the quote cache on every request.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from app.data_access.repositories.sentiment_repository import SentimentDataRepository
+from app.infrastructure.log_system import get_logger
+from app.utils.timezone import to_naive_utc, utc_now
+
+logger = get_logger()
+
+TIMEFRAME_DAYS = {"1d": 1, "7d": 7, "14d": 14, "30d": 30}
+
+# Backstop so the sliding window moves even when nothing new is stored
+MAX_SNAPSHOT_AGE_SECONDS = 300.0
+
+
+@dataclass
+class WatchlistSnapshot:
+    """Per-stock average sentiment for one timeframe."""
+    timeframe: str
+    stocks: List[Dict[str, Any]]
+    top_performers: List[Dict[str, Any]]
+    computed_at: datetime = field(default_factory=utc_now)
+    _monotonic_computed_at: float = field(default_factory=time.monotonic, repr=False)
+
+    @property
+    def age_seconds(self) -> float:
+        return time.monotonic() - self._monotonic_computed_at
+
+
+class WatchlistAnalyticsService:
+    """
+    Compute-once cache of watchlist-level analytics, keyed by timeframe.
+
+    A generation counter guards against storing a snapshot that was being
+    computed while an invalidation happened.
+    """
+
+    def __init__(self, max_age_seconds: float = MAX_SNAPSHOT_AGE_SECONDS):
+        self.max_age_seconds = max_age_seconds
+        self._snapshots: Dict[str, WatchlistSnapshot] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._generation = 0
+        self._computations = 0
+        self._hits = 0
+
+    async def get_snapshot(self, timeframe: str, sentiment_repo: SentimentDataRepository) -> WatchlistSnapshot:
+        """
+        Get the watchlist snapshot for a timeframe, computing it at most once.
+
+        Args:
+            timeframe: One of 1d, 7d, 14d, 30d
+            sentiment_repo: Repository used when the snapshot must be computed
+
+        Returns:
+            WatchlistSnapshot
+        """
+        snapshot = self._valid_snapshot(timeframe)
+        if snapshot is not None:
+            self._hits += 1
+            return snapshot
+
+        lock = self._locks.setdefault(timeframe, asyncio.Lock())
+        async with lock:
+            # Concurrent requests wait for the first computation
+            snapshot = self._valid_snapshot(timeframe)
+            if snapshot is not None:
+                self._hits += 1
+                return snapshot
+
+            generation = self._generation
+            snapshot = await self._compute(timeframe, sentiment_repo)
+            self._computations += 1
+            if generation == self._generation:
+                self._snapshots[timeframe] = snapshot
+            return snapshot
+
+    def invalidate(self) -> None:
+        """Drop all snapshots (new sentiment rows or watchlist change)."""
+        self._generation += 1
+        self._snapshots.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache effectiveness counters."""
+        return {
+            "computations": self._computations,
+            "hits": self._hits,
+            "cached_timeframes": sorted(self._snapshots.keys())
+        }
+
+    def _valid_snapshot(self, timeframe: str) -> Optional[WatchlistSnapshot]:
+        snapshot = self._snapshots.get(timeframe)
+        if snapshot is None or snapshot.age_seconds >= self.max_age_seconds:
+            return None
+        return snapshot
+
+    async def _compute(self, timeframe: str, sentiment_repo: SentimentDataRepository) -> WatchlistSnapshot:
+        """One grouped query for every stock's average sentiment in the window."""
+        days = TIMEFRAME_DAYS.get(timeframe, 7)
+        now = utc_now()
+        start_date = to_naive_utc(now - timedelta(days=days))
+
+        # All watchlist stocks, as StockRepository.get_active_stocks() returns them
+        rows = await sentiment_repo.get_average_sentiment_by_stock(
+            start_date, to_naive_utc(now), active_only=False
+        )
+
+        stocks = [
+            {
+                "symbol": row["symbol"],
+                "company_name": row["name"],
+                "current_price": row["current_price"],
+                "sentiment_score": row["avg_sentiment"],
+                "data_points": row["record_count"]
+            }
+            for row in rows
+        ]
+
+        performers = [
+            {
+                "symbol": stock["symbol"],
+                "company_name": stock["company_name"],
+                "sentiment_score": round(stock["sentiment_score"], 3),
+                "data_points": stock["data_points"]
+            }
+            for stock in stocks
+            if stock["data_points"] > 0
+        ]
+        # Sort by sentiment score descending
+        performers.sort(key=lambda x: x["sentiment_score"], reverse=True)
+
+        logger.debug(f"Computed watchlist analytics snapshot for {timeframe}", extra={"stocks": len(stocks)})
+        return WatchlistSnapshot(timeframe=timeframe, stocks=stocks, top_performers=performers[:5])
+
+
+# Singleton instance
+_watchlist_analytics_service: Optional[WatchlistAnalyticsService] = None
+
+
+def get_watchlist_analytics_service() -> WatchlistAnalyticsService:
+    """Get the singleton watchlist analytics service instance."""
+    global _watchlist_analytics_service
+    if _watchlist_analytics_service is None:
+        _watchlist_analytics_service = WatchlistAnalyticsService()
+    return _watchlist_analytics_service
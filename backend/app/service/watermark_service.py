@@ -0,0 +1,127 @@
+"""
+Collection Watermark Service
+============================
+
+Per-(source, symbol) high-water marks for incremental collection.
+
+Scheduled runs used to request the whole lookback window from every source
+and then drop most of it as duplicates at store time. With watermarks, each
+symbol's query window starts at the newest item already stored for that
+source (minus an overlap for items the upstream indexes late), so quota,
+bandwidth and dedup work shrink to roughly the new items.
+
+- Watermarks live in the collection_watermarks table, so they are reset
+  together with the data they describe
+- They only move forward, and only after a run has stored its results
+- Lookup failures fall back to the full window; they never block collection
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from app.infrastructure.log_system import get_logger
+from app.utils.timezone import ensure_utc
+
+logger = get_logger()
+
+# Re-fetch this far behind the watermark: upstreams publish items with a lag
+DEFAULT_OVERLAP = timedelta(minutes=30)
+SOURCE_OVERLAP: Dict[str, timedelta] = {
+    "newsapi": timedelta(hours=24),  # Free plan serves articles with a delay
+    "gdelt": timedelta(hours=1),     # Indexes in 15 minute batches
+    "finnhub": timedelta(hours=1),
+}
+
+
+class WatermarkService:
+    """Loads and advances collection high-water marks."""
+
+    def overlap(self, source: str) -> timedelta:
+        return SOURCE_OVERLAP.get(source, DEFAULT_OVERLAP)
+
+    async def load_since(self, source: str, symbols: List[str]) -> Dict[str, datetime]:
+        """
+        Get the per-symbol lower bound of the next query window.
+
+        Args:
+            source: Data source name
+            symbols: Symbols about to be collected
+
+        Returns:
+            symbol -> earliest publication time to request (symbols without
+            a watermark are absent and get the full window)
+        """
+        from app.data_access.database import get_db_session
+        from app.data_access.repositories import CollectionWatermarkRepository
+        try:
+            async with get_db_session() as session:
+                rows = await CollectionWatermarkRepository(session).get_for_source(source, symbols)
+        except Exception as e:
+            logger.warning(f"Watermark lookup failed for {source}, collecting full window: {e}")
+            return {}
+
+        overlap = self.overlap(source)
+        return {
+            symbol: ensure_utc(row.last_published_at) - overlap
+            for symbol, row in rows.items()
+        }
+
+    @staticmethod
+    def marks_from_items(items: Iterable, ceiling: datetime) -> Dict[str, datetime]:
+        """
+        Newest publication time per symbol.
+
+        Args:
+            items: RawData items of one collection result
+            ceiling: End of the collection window; later timestamps are
+                clamped to it so a bad upstream clock cannot skip real items
+
+        Returns:
+            symbol -> newest published_at
+        """
+        ceiling = ensure_utc(ceiling)
+        marks: Dict[str, datetime] = {}
+        for item in items:
+            if not item.stock_symbol:
+                continue
+            symbol = item.stock_symbol.upper()
+            published_at = min(ensure_utc(item.timestamp), ceiling)
+            if symbol not in marks or published_at > marks[symbol]:
+                marks[symbol] = published_at
+        return marks
+
+    async def advance(self, source: str, marks: Dict[str, datetime]) -> int:
+        """
+        Persist new marks (older ones are ignored).
+
+        Returns:
+            Number of watermarks created or moved
+        """
+        if not marks:
+            return 0
+        from app.data_access.database import get_db_session
+        from app.data_access.repositories import CollectionWatermarkRepository
+        try:
+            async with get_db_session() as session:
+                return await CollectionWatermarkRepository(session).advance_many(source, marks)
+        except Exception as e:
+            logger.warning(f"Failed to advance watermarks for {source}: {e}")
+            return 0
+
+    async def reset(self, source: Optional[str] = None, symbols: Optional[List[str]] = None) -> int:
+        """Forget watermarks so the next run collects the full lookback window."""
+        from app.data_access.database import get_db_session
+        from app.data_access.repositories import CollectionWatermarkRepository
+        async with get_db_session() as session:
+            return await CollectionWatermarkRepository(session).clear(source, symbols)
+
+
+_watermark_service: Optional[WatermarkService] = None
+
+
+def get_watermark_service() -> WatermarkService:
+    """Get the process-wide watermark service."""
+    global _watermark_service
+    if _watermark_service is None:
+        _watermark_service = WatermarkService()
+    return _watermark_service
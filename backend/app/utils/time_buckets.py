@@ -0,0 +1,171 @@
+"""
+Time Bucketing Utilities
+========================
+
+Dialect-aware SQL expressions for grouping timestamps into minute, hour,
+day or week buckets, so trend and rollup queries aggregate in the database
+on both SQLite and PostgreSQL.
+
+Buckets are aligned to a fixed UTC offset (0 for UTC, or the exchange
+offset from exchange_utc_offset_minutes()) and every bucket is labelled with
+its start expressed in UTC. Week buckets start on Monday, matching
+PostgreSQL date_trunc('week').
+
+Example::
+
+    bucket = time_bucket(SentimentData.created_at, "hour", dialect_name(db))
+    rows = await db.execute(
+        select(bucket.label("time_bucket"), func.avg(SentimentData.sentiment_score))
+        .group_by(bucket)
+        .order_by(bucket)
+    )
+    for row in rows:
+        start = parse_bucket(row.time_bucket)
+"""
+from datetime import datetime
+from typing import Any, Optional
+
+import pytz
+from sqlalchemy import func, literal_column
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.utils.timezone import ensure_utc, utc_now
+
+BUCKET_UNITS = ("minute", "hour", "day", "week")
+
+EXCHANGE_TIMEZONE = "America/New_York"
+
+# strftime formats truncating a SQLite timestamp to the start of each unit
+_SQLITE_FORMATS = {
+    "minute": "%Y-%m-%d %H:%M:00",
+    "hour": "%Y-%m-%d %H:00:00",
+    "day": "%Y-%m-%d 00:00:00",
+    "week": "%Y-%m-%d 00:00:00"
+}
+
+
+def dialect_name(db: AsyncSession) -> str:
+    """Return the SQL dialect name ("sqlite", "postgresql", ...) of a session."""
+    return db.get_bind().dialect.name
+
+
+def bucket_unit_for_days(days: int) -> str:
+    """
+    Pick a bucket size that keeps a trend chart readable.
+
+    Args:
+        days: Length of the analysed window in days
+
+    Returns:
+        "hour" for a day or less, "day" up to a week, "week" beyond that
+    """
+    if days <= 1:
+        return "hour"
+    if days <= 7:
+        return "day"
+    return "week"
+
+
+def exchange_utc_offset_minutes(tz_name: str = EXCHANGE_TIMEZONE, at: Optional[datetime] = None) -> int:
+    """
+    UTC offset of a timezone in minutes, for aligning buckets to local days.
+
+    The offset is taken at a single instant (now by default), so a window that
+    spans a DST change keeps the offset in effect at that instant.
+
+    Args:
+        tz_name: IANA timezone name (defaults to the US equity exchange)
+        at: Instant to evaluate the offset at
+
+    Returns:
+        Offset in minutes east of UTC (e.g. -300 for EST)
+    """
+    instant = ensure_utc(at) if at is not None else utc_now()
+    local = instant.astimezone(pytz.timezone(tz_name))
+    return int(local.utcoffset().total_seconds() // 60)
+
+
+def time_bucket(column: Any, unit: str, dialect: str, utc_offset_minutes: int = 0) -> ColumnElement:
+    """
+    Build an expression truncating a timestamp column to the start of its bucket.
+
+    The result is a timestamp on PostgreSQL and a "YYYY-MM-DD HH:MM:SS" string
+    on SQLite, both in UTC; use parse_bucket() to read either. Constants are
+    rendered inline so the same expression can appear in SELECT and GROUP BY.
+
+    Args:
+        column: Timestamp column stored in UTC
+        unit: One of BUCKET_UNITS
+        dialect: Dialect name, see dialect_name()
+        utc_offset_minutes: Offset of the local day boundaries from UTC
+
+    Returns:
+        SQLAlchemy column expression
+
+    Raises:
+        ValueError: Unknown unit or unsupported dialect
+    """
+    if unit not in BUCKET_UNITS:
+        raise ValueError(f"Unsupported bucket unit: {unit}")
+    offset = int(utc_offset_minutes)
+
+    if dialect == "postgresql":
+        # timezone('UTC', timestamptz) yields the naive UTC wall clock
+        local = func.timezone(literal_column("'UTC'"), column)
+        if offset:
+            local = local + _pg_minutes(offset)
+        bucket = func.date_trunc(literal_column(f"'{unit}'"), local)
+        if offset:
+            bucket = bucket - _pg_minutes(offset)
+        return bucket
+
+    if dialect == "sqlite":
+        modifiers = []
+        if offset:
+            modifiers.append(_sqlite_minutes(offset))
+        if unit == "week":
+            # Forward to Sunday (or stay), then back to that week's Monday
+            modifiers += [literal_column("'weekday 0'"), literal_column("'-6 days'")]
+        bucket = func.strftime(literal_column(f"'{_SQLITE_FORMATS[unit]}'"), column, *modifiers)
+        if offset:
+            bucket = func.datetime(bucket, _sqlite_minutes(-offset))
+        return bucket
+
+    raise ValueError(f"Time bucketing is not supported for dialect: {dialect}")
+
+
+def parse_bucket(value: Any) -> Optional[datetime]:
+    """
+    Convert a bucket value returned by the database to an aware UTC datetime.
+
+    Args:
+        value: datetime (PostgreSQL) or string (SQLite) bucket start
+
+    Returns:
+        Timezone-aware UTC datetime or None
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return ensure_utc(value)
+
+
+def _pg_minutes(minutes: int) -> ColumnElement:
+    return literal_column(f"INTERVAL '{int(minutes)} minutes'")
+
+
+def _sqlite_minutes(minutes: int) -> ColumnElement:
+    return literal_column(f"'{int(minutes):+d} minutes'")
+
+
+__all__ = [
+    "BUCKET_UNITS",
+    "EXCHANGE_TIMEZONE",
+    "bucket_unit_for_days",
+    "dialect_name",
+    "exchange_utc_offset_minutes",
+    "parse_bucket",
+    "time_bucket"
+]
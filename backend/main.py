@@ -46,7 +46,7 @@ from app.presentation.routes import (
 from app.presentation.middleware.logging_middleware import LoggingMiddleware
 from app.presentation.middleware.security_middleware import setup_security_middleware
 from app.data_access.database.connection import init_database
-from app.business.scheduler import Scheduler
+from app.business.worker_coordinator import get_worker_coordinator
 from app.utils.timezone import utc_now
 
 # Initialize the centralized logging system early (includes external lib suppression)
@@ -131,30 +131,32 @@ async def perform_health_check() -> Dict[str, Any]:
             }
             health_status["overall_status"] = "degraded"
         
-        # Check 2: Sentiment Engine
+        # Check 2: Sentiment Engine (reports warm-up state, never loads models)
         try:
+            from app.business.pipeline import pipeline_engine_config
             from app.service.sentiment_processing import get_sentiment_engine
-            engine = get_sentiment_engine()
-            # Get actual model names from engine
-            available_models = engine.get_available_models() if hasattr(engine, 'get_available_models') else []
-            # Format model names for display (clean up technical names)
-            display_models = []
-            for model in available_models:
-                if "finbert" in model.lower() or "prosus" in model.lower():
-                    if "FinBERT" not in display_models:
-                        display_models.append("FinBERT")
-                else:
-                    display_models.append(model)
-            # Ensure FinBERT is always shown as primary model (it's always loaded)
-            if "FinBERT" not in display_models:
-                display_models.insert(0, "FinBERT")
-            # Add AI verification indicator if enabled
-            if hasattr(engine, 'config') and engine.config.enable_ai_verification:
+            engine = get_sentiment_engine(pipeline_engine_config())
+            display_models = ["FinBERT"]
+            if engine.config.use_ensemble_finbert:
+                display_models.append("FinBERT-Tone")
+            if engine.config.enable_ai_verification:
                 display_models.append("Gemini-AI-Verification")
+            readiness = engine.get_readiness()
+            if readiness["ready"]:
+                engine_status = "✓ Operational"
+            elif readiness["state"] == "failed":
+                engine_status = "✗ Failed"
+                health_status["overall_status"] = "degraded"
+            elif readiness["state"] == "warming":
+                engine_status = "… Warming up in background"
+            else:
+                engine_status = "… Loads on first pipeline run"
             health_status["services"]["sentiment_engine"] = {
-                "status": "✓ Operational",
+                "status": engine_status,
                 "models": display_models
             }
+            if readiness["error"]:
+                health_status["services"]["sentiment_engine"]["error"] = readiness["error"]
         except Exception as e:
             health_status["services"]["sentiment_engine"] = {
                 "status": "✗ Failed",
@@ -183,16 +185,24 @@ async def perform_health_check() -> Dict[str, Any]:
         # Check 4: Scheduler
         try:
             from app.business.scheduler import Scheduler
+            coordinator = get_worker_coordinator()
             # Get actual job count from scheduler if possible
             scheduler_instance = Scheduler._instance if hasattr(Scheduler, '_instance') else None
-            if scheduler_instance and hasattr(scheduler_instance, 'scheduler'):
-                job_count = len(scheduler_instance.scheduler.get_jobs())
+            if not coordinator.is_leader:
+                leader = coordinator.get_status()["leader"] or {}
+                health_status["services"]["scheduler"] = {
+                    "status": "✓ Runs on leader worker",
+                    "leader_pid": leader.get("pid")
+                }
             else:
-                job_count = 6  # Default: 5 pipeline jobs + 1 quota reset
-            health_status["services"]["scheduler"] = {
-                "status": "✓ Operational",
-                "jobs_configured": job_count
-            }
+                if scheduler_instance and hasattr(scheduler_instance, 'scheduler'):
+                    job_count = len(scheduler_instance.scheduler.get_jobs())
+                else:
+                    job_count = 6  # Default: 5 pipeline jobs + 1 quota reset
+                health_status["services"]["scheduler"] = {
+                    "status": "✓ Operational",
+                    "jobs_configured": job_count
+                }
         except Exception as e:
             health_status["services"]["scheduler"] = {
                 "status": "✗ Failed",
@@ -261,10 +271,30 @@ async def lifespan(app: FastAPI):
     logger.info(f"Database URL: {settings.database_url.split('@')[0] + '@***' if '@' in settings.database_url else settings.database_url}")
     logger.info("Database initialized and configured")
     
-    # Start Scheduler for automated pipeline orchestration
-    scheduler = Scheduler()
-    await scheduler.start()
-    logger.info("Scheduler started for automated pipeline orchestration")
+    # Start Scheduler for automated pipeline orchestration (on the leader
+    # worker only when running with several workers)
+    coordinator = get_worker_coordinator()
+    await coordinator.start()
+    if coordinator.is_leader:
+        logger.info("Scheduler started for automated pipeline orchestration")
+    
+    # Sentiment models: torch and the checkpoints are only imported/loaded here,
+    # so non-ML routes are serviceable as soon as startup returns. Only the
+    # process that runs pipelines needs them; followers and API processes
+    # feeding pipeline workers skip the load.
+    from app.business.pipeline import pipeline_engine_config
+    from app.service.sentiment_processing import get_sentiment_engine
+    startup_mode = settings.sentiment_startup_mode.lower()
+    warmup_task = None
+    if not coordinator.runs_pipelines_locally:
+        logger.info("Pipelines run in another process; skipping sentiment model warm-up")
+    elif startup_mode == "eager":
+        await get_sentiment_engine(pipeline_engine_config()).warm_up()
+    elif startup_mode == "background":
+        warmup_task = get_sentiment_engine(pipeline_engine_config()).start_warmup()
+        logger.info("Sentiment model warm-up started in background")
+    else:
+        logger.info("Sentiment models will load on first pipeline run")
     
     # Perform health check
     health_status = await perform_health_check()
@@ -276,9 +306,21 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down InsightBull Backend")
     
-    # Stop Scheduler
-    await scheduler.stop()
+    # Stop Scheduler (and give up leadership)
+    await coordinator.stop()
     logger.info("Scheduler stopped gracefully")
+    
+    # Abandon an unfinished warm-up
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+    
+    # Close the collectors' shared HTTP clients
+    from app.infrastructure.http_transport import get_http_transport
+    await get_http_transport().aclose()
+    
+    # Release the rate limiter's shared store connection
+    from app.infrastructure.security.client_rate_limiter import get_client_rate_limiter
+    await get_client_rate_limiter().aclose()
 
 
 def create_app() -> FastAPI:
@@ -344,10 +386,11 @@ def create_app() -> FastAPI:
             }
         )
     
-    # Health check endpoint
+    # Health check endpoints
     @app.get("/health", tags=["health"])
+    @app.get("/health/live", tags=["health"])
     async def health_check():
-        """Health check endpoint."""
+        """Liveness check: the process is up and serving requests."""
         return {
             "status": "healthy",
             "service": settings.app_name,
@@ -355,6 +398,40 @@ def create_app() -> FastAPI:
             "timestamp": int(time.time())
         }
     
+    @app.get("/health/ready", tags=["health"])
+    async def readiness_check():
+        """Readiness check: database reachable and sentiment models warmed up."""
+        from sqlalchemy import text
+        from app.data_access.database.connection import get_db_session
+        from app.business.pipeline import pipeline_engine_config
+        from app.service.sentiment_processing import get_sentiment_engine
+        
+        checks: Dict[str, Any] = {}
+        try:
+            async with get_db_session() as session:
+                await session.execute(text("SELECT 1"))
+            checks["database"] = {"ready": True}
+        except Exception as e:
+            checks["database"] = {"ready": False, "error": str(e)}
+        
+        checks["sentiment_engine"] = get_sentiment_engine(pipeline_engine_config()).get_readiness()
+        # Lazy mode loads models on the first pipeline run, and processes that
+        # leave pipelines to another process never load them
+        checks["sentiment_engine"]["required"] = (
+            settings.sentiment_startup_mode.lower() != "lazy"
+            and get_worker_coordinator().runs_pipelines_locally
+        )
+        
+        ready = all(check["ready"] or not check.get("required", True) for check in checks.values())
+        return JSONResponse(
+            status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={
+                "status": "ready" if ready else "not_ready",
+                "checks": checks,
+                "timestamp": int(time.time())
+            }
+        )
+    
     return app
 
 
@@ -0,0 +1,85 @@
+"""
+Pipeline Worker
+===============
+
+Runs sentiment pipeline jobs outside the API process.
+
+With PIPELINE_EXECUTION=worker the API (and the scheduler) only queue
+pipeline runs in the pipeline_jobs table; this process claims and executes
+them, reporting progress and honouring cancellation through the same table.
+Start several to work through sharded runs of a large watchlist in parallel
+(PIPELINE_WORKER_SHARD_SIZE).
+
+Usage:
+    cd backend
+    python scripts/run_pipeline_worker.py [--worker-id NAME] [--poll-interval 2] [--max-jobs N]
+
+Options:
+    --worker-id: Name recorded on claimed jobs (default: host:pid)
+    --poll-interval: Seconds between checks of an empty queue (default: 2)
+    --max-jobs: Exit after this many jobs (default: run until stopped)
+
+Stop with Ctrl+C or SIGTERM; a running job is finished first.
+"""
+
+import asyncio
+import argparse
+import signal
+import sys
+import os
+
+# Ensure we're running from the backend directory for relative paths
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(SCRIPT_DIR)
+os.chdir(BACKEND_DIR)
+
+# Load environment variables from .env file BEFORE importing app modules
+from dotenv import load_dotenv
+load_dotenv(os.path.join(BACKEND_DIR, '.env'))
+
+# Add backend to path
+sys.path.insert(0, BACKEND_DIR)
+
+from app.data_access.database import init_database
+from app.business.pipeline_worker import PipelineWorker
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description="Run queued sentiment pipeline jobs"
+    )
+    parser.add_argument(
+        "--worker-id",
+        default=None,
+        help="Name recorded on claimed jobs (default: host:pid)"
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=2.0,
+        help="Seconds between checks of an empty queue (default: 2)"
+    )
+    parser.add_argument(
+        "--max-jobs",
+        type=int,
+        default=None,
+        help="Exit after this many jobs (default: run until stopped)"
+    )
+    
+    args = parser.parse_args()
+    
+    await init_database()
+    worker = PipelineWorker(worker_id=args.worker_id, poll_interval=args.poll_interval)
+    
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, worker.stop)
+        except NotImplementedError:  # Windows: Ctrl+C raises KeyboardInterrupt instead
+            pass
+    
+    await worker.run(max_jobs=args.max_jobs)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,192 @@
+"""
+Phase 9: Pipeline Run Coordination Tests
+=========================================
+
+Test cases for the leader's PipelineRunCoordinator, which runs one
+pipeline at a time and coalesces overlapping requests.
+
+Test Coverage:
+- TC186-TC189: Request coverage and merging
+- TC190-TC193: Joining, queueing and cancellation
+"""
+
+import pytest
+import asyncio
+from datetime import timedelta
+
+from app.business.pipeline import DateRange, PipelineConfig, PipelineResult, PipelineStatus
+from app.business.run_coordinator import PipelineRunCoordinator, covers, merge
+from app.utils.timezone import utc_now
+
+
+def _config(symbols, days=1, **flags):
+    now = utc_now()
+    return PipelineConfig(
+        symbols=list(symbols),
+        date_range=DateRange(start_date=now - timedelta(days=days), end_date=now),
+        **flags
+    )
+
+
+class _BlockingExecutor:
+    """Records the configs it runs; each run waits until released."""
+
+    def __init__(self):
+        self.configs = []
+        self.release = asyncio.Event()
+
+    async def __call__(self, config):
+        self.configs.append(config)
+        await self.release.wait()
+        return PipelineResult(
+            pipeline_id=f"run_{len(self.configs)}",
+            status=PipelineStatus.COMPLETED,
+            start_time=utc_now()
+        )
+
+
+class TestRunCoverage:
+    """Test suite for covers() and merge()."""
+
+    def test_tc186_symbol_coverage(self):
+        """TC186: Verify a run covers subsets of its symbols, and the whole watchlist covers all."""
+        running = _config(["AAPL", "MSFT", "NVDA"])
+
+        # Assertions
+        assert covers(running, _config(["MSFT", "AAPL"])) is True
+        assert covers(running, _config(["AAPL", "TSLA"])) is False
+        # Empty symbols mean the whole watchlist
+        assert covers(running, _config([])) is False
+        assert covers(_config([]), _config(["TSLA"])) is True
+
+    def test_tc187_source_coverage(self):
+        """TC187: Verify a run without a source does not cover a request for it."""
+        running = _config(["AAPL"], include_gdelt=False, include_comments=False)
+
+        # Assertions
+        assert covers(running, _config(["AAPL"], include_gdelt=False, include_comments=False)) is True
+        assert covers(running, _config(["AAPL"], include_gdelt=True, include_comments=False)) is False
+        assert covers(running, _config(["AAPL"], include_gdelt=False, include_comments=True)) is False
+
+    def test_tc188_lookback_coverage(self):
+        """TC188: Verify only a run reaching as far back covers a request."""
+        # Assertions
+        assert covers(_config(["AAPL"], days=7), _config(["AAPL"], days=1)) is True
+        assert covers(_config(["AAPL"], days=1), _config(["AAPL"], days=7)) is False
+        assert covers(
+            _config(["AAPL"], max_items_per_symbol=10),
+            _config(["AAPL"], max_items_per_symbol=50)
+        ) is False
+
+    def test_tc189_merge_widens_everything(self):
+        """TC189: Verify merge unions symbols, widens sources and keeps the longest lookback."""
+        base = _config(["AAPL", "MSFT"], days=1, include_gdelt=False, max_items_per_symbol=10)
+        request = _config(["MSFT", "NVDA"], days=7, include_newsapi=False, max_items_per_symbol=30)
+
+        merged = merge(base, request)
+
+        # Assertions
+        assert merged.symbols == ["AAPL", "MSFT", "NVDA"]
+        assert merged.include_gdelt is True
+        assert merged.include_newsapi is True
+        assert merged.max_items_per_symbol == 30
+        assert merged.date_range.start_date == request.date_range.start_date
+        assert covers(merged, base) and covers(merged, request)
+        # The inputs are left alone
+        assert base.symbols == ["AAPL", "MSFT"]
+        # Either side asking for the whole watchlist gets the whole watchlist
+        assert merge(base, _config([])).symbols == []
+
+
+class TestRunCoordination:
+    """Test suite for joining, queueing and cancelling runs."""
+
+    @pytest.mark.asyncio
+    async def test_tc190_covered_request_joins_in_flight_run(self):
+        """TC190: Verify a covered request joins the running pipeline instead of starting another."""
+        coordinator = PipelineRunCoordinator()
+        executor = _BlockingExecutor()
+
+        first = coordinator.submit(_config(["AAPL", "MSFT"]), executor, "scheduled")
+        await asyncio.sleep(0)
+        second = coordinator.submit(_config(["MSFT"]), executor, "manual")
+        executor.release.set()
+        results = await asyncio.gather(first.wait(), second.wait())
+
+        # Assertions
+        assert second is first
+        assert first.requesters == ["scheduled", "manual"]
+        assert len(executor.configs) == 1
+        assert results[0] is results[1]
+        assert coordinator.get_status()["joined_requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_tc191_uncovered_requests_queue_and_merge(self):
+        """TC191: Verify uncovered requests share one follow-up run with a merged config."""
+        coordinator = PipelineRunCoordinator()
+        executor = _BlockingExecutor()
+
+        running = coordinator.submit(_config(["AAPL"]), executor, "scheduled")
+        await asyncio.sleep(0)
+        queued = coordinator.submit(_config(["MSFT"]), executor, "manual")
+        merged = coordinator.submit(_config(["NVDA"], days=3), executor, "api")
+
+        # Assertions while the first run is in flight
+        assert queued is not running
+        assert merged is queued
+        assert queued.state == "queued"
+        assert queued.requesters == ["manual", "api"]
+        assert coordinator.get_status()["merged_requests"] == 1
+
+        executor.release.set()
+        await queued.wait()
+
+        # Assertions after both runs
+        assert running.done()
+        assert [config.symbols for config in executor.configs] == [["AAPL"], ["MSFT", "NVDA"]]
+        assert executor.configs[1].date_range.start_date <= utc_now() - timedelta(days=3)
+        assert coordinator.is_running is False
+
+    @pytest.mark.asyncio
+    async def test_tc192_failed_run_starts_queued_run(self):
+        """TC192: Verify a failing run reports its error and the queued run still starts."""
+        coordinator = PipelineRunCoordinator()
+        executor = _BlockingExecutor()
+
+        async def failing(config):
+            await asyncio.sleep(0)
+            raise RuntimeError("collector crashed")
+
+        failed = coordinator.submit(_config(["AAPL"]), failing, "scheduled")
+        queued = coordinator.submit(_config(["MSFT"]), executor, "manual")
+
+        with pytest.raises(RuntimeError, match="collector crashed"):
+            await failed.wait()
+        executor.release.set()
+        result = await queued.wait()
+
+        # Assertions
+        assert result.status == PipelineStatus.COMPLETED
+        assert executor.configs[0].symbols == ["MSFT"]
+
+    @pytest.mark.asyncio
+    async def test_tc193_stop_drops_queued_run(self):
+        """TC193: Verify stopping cancels the in-flight run and drops the queued one."""
+        coordinator = PipelineRunCoordinator()
+        executor = _BlockingExecutor()
+
+        running = coordinator.submit(_config(["AAPL"]), executor, "scheduled")
+        await asyncio.sleep(0)
+        queued = coordinator.submit(_config(["MSFT"]), executor, "manual")
+
+        await coordinator.stop()
+
+        # Assertions
+        with pytest.raises(asyncio.CancelledError):
+            await running.wait()
+        with pytest.raises(asyncio.CancelledError):
+            await queued.wait()
+        assert queued.state == "finished"
+        assert len(executor.configs) == 1
+        assert coordinator.get_status()["queued"] is None
+        assert coordinator.is_running is False
@@ -0,0 +1,276 @@
+"""
+Phase 10: Pipeline Job Queue Tests
+===================================
+
+Test cases for the pipeline_jobs queue shared by the API process and the
+out-of-process pipeline workers, run against a temporary SQLite file so
+that several sessions compete for the same rows.
+
+Test Coverage:
+- TC194-TC197: Claiming jobs
+- TC198-TC200: Stale jobs and ownership
+- TC201-TC203: Cancellation and sharded results
+"""
+
+import pytest
+import asyncio
+import json
+from datetime import timedelta
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.business.pipeline import DateRange, PipelineConfig, PipelineResult, PipelineStatus
+from app.data_access.database.base import Base
+from app.data_access.models import PipelineJob
+from app.data_access.repositories import PipelineJobRepository
+from app.service.pipeline_job_queue import PipelineJobQueue
+from app.utils.timezone import utc_now
+
+STALE_AFTER = timedelta(minutes=10)
+
+
+@pytest.fixture
+async def job_sessions(tmp_path):
+    """Session factory over a temporary SQLite file holding the pipeline_jobs table."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[PipelineJob.__table__])
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def _in_session(sessions, action):
+    """Run action(repository) in its own committed session, like the worker does."""
+    async with sessions() as session:
+        value = await action(PipelineJobRepository(session))
+        await session.commit()
+        return value
+
+
+async def _enqueue(sessions, run_id, symbols):
+    config = PipelineConfig(
+        symbols=symbols,
+        date_range=DateRange(start_date=utc_now() - timedelta(days=1), end_date=utc_now())
+    )
+    return await _in_session(sessions, lambda repo: repo.enqueue(run_id, config.to_dict()))
+
+
+async def _claim(sessions, worker_id, serialize_runs=False):
+    return await _in_session(sessions, lambda repo: repo.claim_next(worker_id, serialize_runs))
+
+
+async def _make_stale(sessions, job_id):
+    async with sessions() as session:
+        await session.execute(
+            update(PipelineJob)
+            .where(PipelineJob.id == job_id)
+            .values(heartbeat_at=utc_now() - STALE_AFTER - timedelta(minutes=1))
+        )
+        await session.commit()
+
+
+async def _get(sessions, job_id):
+    return await _in_session(sessions, lambda repo: repo.get_job(job_id))
+
+
+def _result(symbols, status=PipelineStatus.COMPLETED, error=None):
+    result = PipelineResult(
+        pipeline_id=f"pipeline_{'_'.join(symbols)}",
+        status=status,
+        start_time=utc_now(),
+        end_time=utc_now(),
+        total_items_collected=len(symbols) * 10,
+        total_items_stored=len(symbols) * 5,
+        error_message=error
+    )
+    # Stored as the worker stores it
+    return json.loads(json.dumps(result.to_dict(), default=str))
+
+
+class TestJobClaiming:
+    """Test suite for claiming queued jobs."""
+
+    @pytest.mark.asyncio
+    async def test_tc194_claim_marks_job_running(self, job_sessions):
+        """TC194: Verify a claim hands the job to one worker and counts the attempt."""
+        queued = await _enqueue(job_sessions, "run-1", ["AAPL"])
+
+        job = await _claim(job_sessions, "worker-a")
+
+        # Assertions
+        assert job.id == queued.id
+        assert job.status == "running"
+        assert job.worker_id == "worker-a"
+        assert job.attempts == 1
+        assert job.heartbeat_at is not None
+        assert await _claim(job_sessions, "worker-b") is None
+
+    @pytest.mark.asyncio
+    async def test_tc195_concurrent_claims_are_atomic(self, job_sessions):
+        """TC195: Verify workers claiming at the same time never get the same job."""
+        for symbol in ("AAPL", "MSFT", "NVDA"):
+            await _enqueue(job_sessions, f"run-{symbol}", [symbol])
+
+        claims = await asyncio.gather(*(_claim(job_sessions, f"worker-{n}") for n in range(5)))
+        claimed = [job for job in claims if job is not None]
+
+        # Assertions
+        assert len(claimed) == 3
+        assert len({job.id for job in claimed}) == 3
+        assert len({job.worker_id for job in claimed}) == 3
+
+    @pytest.mark.asyncio
+    async def test_tc196_serialized_runs_claim_one_shard_at_a_time(self, job_sessions):
+        """TC196: Verify serialize_runs holds back the shards of a run that is already running."""
+        await _enqueue(job_sessions, "run-1", ["AAPL"])
+        await _enqueue(job_sessions, "run-1", ["MSFT"])
+
+        first = await _claim(job_sessions, "worker-a", serialize_runs=True)
+        held_back = await _claim(job_sessions, "worker-b", serialize_runs=True)
+        await _in_session(job_sessions, lambda repo: repo.finish(first.id, "worker-a", "completed"))
+        second = await _claim(job_sessions, "worker-b", serialize_runs=True)
+
+        # Assertions
+        assert held_back is None
+        assert second is not None and second.id != first.id
+        assert second.run_id == "run-1"
+
+    @pytest.mark.asyncio
+    async def test_tc197_unserialized_runs_claim_shards_in_parallel(self, job_sessions):
+        """TC197: Verify shards of one run go to several workers without serialize_runs."""
+        await _enqueue(job_sessions, "run-1", ["AAPL"])
+        await _enqueue(job_sessions, "run-1", ["MSFT"])
+
+        first = await _claim(job_sessions, "worker-a")
+        second = await _claim(job_sessions, "worker-b")
+
+        # Assertions
+        assert first is not None and second is not None
+        assert first.id != second.id
+
+
+class TestStaleJobs:
+    """Test suite for recovering jobs of workers that stopped heartbeating."""
+
+    @pytest.mark.asyncio
+    async def test_tc198_stale_job_is_requeued(self, job_sessions):
+        """TC198: Verify a job without recent heartbeats is queued again."""
+        queued = await _enqueue(job_sessions, "run-1", ["AAPL"])
+        fresh = await _enqueue(job_sessions, "run-2", ["MSFT"])
+        await _claim(job_sessions, "worker-a")
+        await _claim(job_sessions, "worker-b")
+        await _make_stale(job_sessions, queued.id)
+
+        recovered = await _in_session(job_sessions, lambda repo: repo.requeue_stale(STALE_AFTER, 2))
+        job = await _get(job_sessions, queued.id)
+
+        # Assertions
+        assert recovered == 1
+        assert job.status == "queued"
+        assert job.worker_id is None
+        assert (await _get(job_sessions, fresh.id)).status == "running"
+
+    @pytest.mark.asyncio
+    async def test_tc199_stale_job_fails_after_max_attempts(self, job_sessions):
+        """TC199: Verify a job that keeps losing its worker is failed instead of requeued forever."""
+        queued = await _enqueue(job_sessions, "run-1", ["AAPL"])
+        for worker_id in ("worker-a", "worker-b"):
+            await _claim(job_sessions, worker_id)
+            await _make_stale(job_sessions, queued.id)
+            await _in_session(job_sessions, lambda repo: repo.requeue_stale(STALE_AFTER, 2))
+
+        job = await _get(job_sessions, queued.id)
+
+        # Assertions
+        assert job.attempts == 2
+        assert job.status == "failed"
+        assert job.error == "Worker stopped responding"
+        assert await _claim(job_sessions, "worker-c") is None
+
+    @pytest.mark.asyncio
+    async def test_tc200_previous_owner_cannot_touch_taken_over_job(self, job_sessions):
+        """TC200: Verify heartbeats and outcomes of a worker whose job was taken over are ignored."""
+        queued = await _enqueue(job_sessions, "run-1", ["AAPL"])
+        await _claim(job_sessions, "worker-a")
+        await _make_stale(job_sessions, queued.id)
+        await _in_session(job_sessions, lambda repo: repo.requeue_stale(STALE_AFTER, 2))
+        await _claim(job_sessions, "worker-b")
+
+        state = await _in_session(job_sessions, lambda repo: repo.heartbeat(queued.id, "worker-a", {}))
+        recorded = await _in_session(job_sessions, lambda repo: repo.finish(queued.id, "worker-a", "completed"))
+        job = await _get(job_sessions, queued.id)
+
+        # Assertions
+        assert state == "lost"
+        assert recorded is False
+        assert job.status == "running"
+        assert job.worker_id == "worker-b"
+
+
+class TestCancellationAndResults:
+    """Test suite for cancelling runs and merging the results of their shards."""
+
+    @pytest.mark.asyncio
+    async def test_tc201_cancel_request(self, job_sessions):
+        """TC201: Verify cancelling a run cancels queued shards and flags running ones."""
+        running = await _enqueue(job_sessions, "run-1", ["AAPL"])
+        await _claim(job_sessions, "worker-a")
+        queued = await _enqueue(job_sessions, "run-1", ["MSFT"])
+        other = await _enqueue(job_sessions, "run-2", ["NVDA"])
+
+        changed = await _in_session(job_sessions, lambda repo: repo.request_cancel("run-1"))
+        state = await _in_session(job_sessions, lambda repo: repo.heartbeat(running.id, "worker-a", {}))
+
+        # Assertions
+        assert changed == 2
+        assert (await _get(job_sessions, queued.id)).status == "cancelled"
+        assert (await _get(job_sessions, running.id)).cancel_requested is True
+        assert state == "cancel_requested"
+        assert (await _get(job_sessions, other.id)).status == "queued"
+
+    @pytest.mark.asyncio
+    async def test_tc202_sharded_results_are_merged(self, job_sessions):
+        """TC202: Verify the shards of a run add up to one result."""
+        for symbols in (["AAPL", "MSFT"], ["NVDA"]):
+            await _enqueue(job_sessions, "run-1", symbols)
+        for worker_id in ("worker-a", "worker-b"):
+            job = await _claim(job_sessions, worker_id)
+            result = _result(job.config["symbols"])
+            await _in_session(
+                job_sessions, lambda repo: repo.finish(job.id, worker_id, "completed", result=result)
+            )
+
+        jobs = await _in_session(job_sessions, lambda repo: repo.get_run("run-1"))
+        merged = PipelineJobQueue._merge_results("run-1", jobs)
+        state = PipelineJobQueue._run_state("run-1", jobs)
+
+        # Assertions
+        assert merged.status == PipelineStatus.COMPLETED
+        assert merged.pipeline_id == "pipeline_run_run-1"
+        assert merged.total_items_collected == 30
+        assert merged.total_items_stored == 15
+        assert state["is_running"] is False
+        assert state["jobs"] == 2
+
+    @pytest.mark.asyncio
+    async def test_tc203_failed_and_cancelled_shards_decide_run_status(self, job_sessions):
+        """TC203: Verify a failed shard fails the run and a shard cancelled before start has no result."""
+        await _enqueue(job_sessions, "run-1", ["AAPL"])
+        job = await _claim(job_sessions, "worker-a")
+        result = _result(["AAPL"], PipelineStatus.FAILED, "Collector timed out")
+        await _in_session(
+            job_sessions,
+            lambda repo: repo.finish(job.id, "worker-a", "failed", result=result, error="Collector timed out")
+        )
+        await _enqueue(job_sessions, "run-1", ["MSFT"])
+        await _in_session(job_sessions, lambda repo: repo.request_cancel("run-1"))
+
+        jobs = await _in_session(job_sessions, lambda repo: repo.get_run("run-1"))
+        merged = PipelineJobQueue._merge_results("run-1", jobs)
+
+        # Assertions
+        assert merged.status == PipelineStatus.CANCELLED
+        assert "Collector timed out" in merged.error_message
+        assert "Cancelled before start" in merged.error_message
+        assert merged.total_items_collected == 10
@@ -0,0 +1,181 @@
+"""
+Phase 11: Client Rate Limiter Tests
+====================================
+
+Test cases for the GCRA client rate limiter, its stores and the rate
+limiting middleware.
+
+Test Coverage:
+- TC204-TC206: Burst limit and Retry-After
+- TC207-TC208: In-memory store eviction
+- TC209-TC211: Shared SQLite store and fallback
+"""
+
+import pytest
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.infrastructure.security.client_rate_limiter import (
+    ClientRateLimiter,
+    InMemoryRateLimitStore,
+    SQLiteRateLimitStore,
+    create_rate_limit_store,
+    gcra,
+)
+from app.presentation.middleware.security_middleware import RateLimitMiddleware
+
+
+class _FailingStore:
+    """Shared store that is down."""
+
+    name = "redis"
+
+    def __init__(self):
+        self.calls = 0
+
+    async def acquire(self, key, limit, window):
+        self.calls += 1
+        raise ConnectionError("store unreachable")
+
+    async def aclose(self):
+        pass
+
+
+class TestBurstLimit:
+    """Test suite for the burst limit and Retry-After."""
+
+    def test_tc204_gcra_allows_burst_then_one_per_interval(self):
+        """TC204: Verify GCRA allows `limit` requests at once, then one per window/limit."""
+        now = 1000.0
+        tat = None
+        allowed = []
+        for _ in range(6):
+            ok, tat, retry_after = gcra(tat, now, 5, 60.0)
+            allowed.append(ok)
+
+        # Assertions
+        assert allowed == [True] * 5 + [False]
+        assert retry_after == pytest.approx(12.0)
+        assert gcra(tat, now + 12.0, 5, 60.0)[0] is True
+        # A client idle for a full window is back to a full burst
+        assert gcra(tat, now + 60.0, 5, 60.0)[0] is True
+
+    @pytest.mark.asyncio
+    async def test_tc205_store_reports_remaining_and_retry_after(self):
+        """TC205: Verify decisions count down the burst and say when to retry."""
+        limiter = ClientRateLimiter(InMemoryRateLimitStore(), limit=3, window=60)
+
+        decisions = [await limiter.acquire("203.0.113.7") for _ in range(4)]
+        other = await limiter.acquire("203.0.113.8")
+
+        # Assertions
+        assert [d.allowed for d in decisions] == [True, True, True, False]
+        assert [d.remaining for d in decisions[:3]] == [2, 1, 0]
+        assert decisions[3].retry_after == pytest.approx(20.0, abs=0.5)
+        assert other.allowed is True
+        assert limiter.get_stats()["limited"] == 1
+
+    def test_tc206_middleware_answers_429_with_retry_after(self):
+        """TC206: Verify the middleware rejects a client over its burst with Retry-After."""
+        app = FastAPI()
+
+        @app.get("/ping")
+        async def ping():
+            return {"ok": True}
+
+        limiter = ClientRateLimiter(InMemoryRateLimitStore(), limit=2, window=60)
+        app.add_middleware(RateLimitMiddleware, requests_per_window=2, window_seconds=60, limiter=limiter)
+        client = TestClient(app)
+
+        responses = [client.get("/ping") for _ in range(3)]
+
+        # Assertions
+        assert [r.status_code for r in responses] == [200, 200, 429]
+        assert responses[0].headers["X-RateLimit-Remaining"] == "1"
+        assert int(responses[2].headers["Retry-After"]) == 30
+
+
+class TestMemoryStoreEviction:
+    """Test suite for keeping the in-memory store bounded."""
+
+    @pytest.mark.asyncio
+    async def test_tc207_least_recent_clients_are_dropped(self):
+        """TC207: Verify the store never tracks more than max_clients."""
+        store = InMemoryRateLimitStore(max_clients=3)
+
+        for n in range(10):
+            await store.acquire(f"client-{n}", 5, 60.0)
+
+        # Assertions
+        assert len(store) == 3
+        # The oldest client was forgotten and gets a full burst again
+        decision = await store.acquire("client-0", 5, 60.0)
+        assert decision.remaining == 4
+
+    @pytest.mark.asyncio
+    async def test_tc208_idle_clients_are_swept(self):
+        """TC208: Verify clients whose TAT has passed are dropped first."""
+        store = InMemoryRateLimitStore(max_clients=2)
+        await store.acquire("idle-a", 1, 0.01)
+        await store.acquire("idle-b", 1, 0.01)
+        await asyncio.sleep(0.05)
+
+        await store.acquire("busy", 1, 60.0)
+
+        # Assertions
+        assert len(store) == 1
+
+
+class TestSharedStoreAndFallback:
+    """Test suite for the SQLite store and the in-process fallback."""
+
+    @pytest.mark.asyncio
+    async def test_tc209_sqlite_store_is_shared_between_connections(self, tmp_path):
+        """TC209: Verify two workers with their own connection enforce one limit."""
+        path = str(tmp_path / "rate_limits.db")
+        worker_a = SQLiteRateLimitStore(path)
+        worker_b = SQLiteRateLimitStore(path)
+        try:
+            first = [await worker_a.acquire("198.51.100.1", 3, 60.0) for _ in range(2)]
+            third = await worker_b.acquire("198.51.100.1", 3, 60.0)
+            refused_b = await worker_b.acquire("198.51.100.1", 3, 60.0)
+            refused_a = await worker_a.acquire("198.51.100.1", 3, 60.0)
+        finally:
+            await worker_a.aclose()
+            await worker_b.aclose()
+
+        # Assertions
+        assert all(d.allowed for d in first)
+        assert third.allowed is True and third.remaining == 0
+        assert refused_b.allowed is False
+        assert refused_a.allowed is False
+
+    @pytest.mark.asyncio
+    async def test_tc210_failing_store_falls_back_to_process_limits(self):
+        """TC210: Verify a failing shared store neither blocks requests nor lifts the limit."""
+        store = _FailingStore()
+        limiter = ClientRateLimiter(store, limit=2, window=60)
+
+        decisions = [await limiter.acquire("192.0.2.10") for _ in range(3)]
+        stats = limiter.get_stats()
+
+        # Assertions
+        assert [d.allowed for d in decisions] == [True, True, False]
+        assert store.calls == 3
+        assert stats["store"] == "redis"
+        assert stats["store_errors"] == 3
+
+    @pytest.mark.asyncio
+    async def test_tc211_store_factory_falls_back_to_memory(self, tmp_path):
+        """TC211: Verify unknown or unusable backends give the in-memory store."""
+        unknown = create_rate_limit_store("memcached")
+        unusable = create_rate_limit_store("sqlite", sqlite_path=str(tmp_path))  # A directory, not a file
+        sqlite_store = create_rate_limit_store("sqlite", sqlite_path=str(tmp_path / "limits.db"))
+
+        # Assertions
+        assert isinstance(unknown, InMemoryRateLimitStore)
+        assert isinstance(unusable, InMemoryRateLimitStore)
+        assert isinstance(sqlite_store, SQLiteRateLimitStore)
+        await sqlite_store.aclose()
@@ -0,0 +1,205 @@
+"""
+Phase 12: Watchlist Event Dispatch Tests
+=========================================
+
+Test cases for the debouncing watchlist event dispatcher that delivers
+watchlist changes to the observers.
+
+Test Coverage:
+- TC212-TC213: Delivery while observers are busy
+- TC220-TC224: Debounce merging and observer isolation
+"""
+
+import pytest
+import asyncio
+
+import app.business.watchlist_observer as watchlist_observer
+from app.business.watchlist_observer import (
+    WatchlistEvent,
+    WatchlistEventDispatcher,
+    WatchlistEventType,
+    WatchlistObserver,
+)
+
+
+@pytest.fixture(autouse=True)
+def short_debounce(monkeypatch):
+    """Keep debounce windows short so the tests run quickly."""
+    monkeypatch.setattr(watchlist_observer, "DEBOUNCE_SECONDS", 0.02)
+    monkeypatch.setattr(watchlist_observer, "MAX_DEBOUNCE_SECONDS", 0.2)
+
+
+class _RecordingObserver(WatchlistObserver):
+    """Records delivered events; optionally blocks until released."""
+
+    def __init__(self, name="recorder", blocking=False):
+        self.name = name
+        self.events = []
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        self.delivered = asyncio.Event()
+        if not blocking:
+            self.release.set()
+
+    @property
+    def observer_id(self) -> str:
+        return self.name
+
+    async def update(self, event: WatchlistEvent) -> None:
+        self.started.set()
+        await self.release.wait()
+        self.events.append(event)
+        self.delivered.set()
+
+
+async def _wait_for_deliveries(observer, count, timeout=2.0):
+    async def delivered():
+        while len(observer.events) < count:
+            observer.delivered.clear()
+            await observer.delivered.wait()
+    await asyncio.wait_for(delivered(), timeout)
+
+
+async def _settle(dispatcher):
+    """Let the dispatcher's background flush finish before the loop closes."""
+    if dispatcher._flush_task is not None:
+        await asyncio.wait_for(dispatcher._flush_task, 2.0)
+
+
+def _publish(dispatcher, event_type, symbols, observers):
+    dispatcher.publish(WatchlistEvent(event_type, symbols), observers)
+
+
+class TestDispatchWhileBusy:
+    """Test suite for events that arrive while observers are still running."""
+
+    @pytest.mark.asyncio
+    async def test_tc212_event_during_slow_dispatch_is_delivered(self):
+        """TC212: Verify an event published during a slow dispatch gets its own dispatch."""
+        dispatcher = WatchlistEventDispatcher()
+        slow = _RecordingObserver("slow", blocking=True)
+
+        dispatcher.publish(WatchlistEvent(WatchlistEventType.STOCK_ADDED, ["AAPL"]), [slow])
+        await asyncio.wait_for(slow.started.wait(), 2.0)
+        dispatcher.publish(WatchlistEvent(WatchlistEventType.STOCK_REMOVED, ["MSFT"]), [slow])
+        slow.release.set()
+        await _wait_for_deliveries(slow, 2)
+
+        # Assertions
+        assert [event.event_type for event in slow.events] == [
+            WatchlistEventType.STOCK_ADDED, WatchlistEventType.STOCK_REMOVED
+        ]
+        assert slow.events[1].stocks_affected == ["MSFT"]
+        assert dispatcher.get_stats()["pending_events"] == 0
+        assert dispatcher.get_stats()["dispatches"] == 2
+        await _settle(dispatcher)
+
+    @pytest.mark.asyncio
+    async def test_tc213_slow_observer_does_not_delay_others(self):
+        """TC213: Verify observers run side by side, so a slow one does not hold up the rest."""
+        dispatcher = WatchlistEventDispatcher()
+        slow = _RecordingObserver("slow", blocking=True)
+        fast = _RecordingObserver("fast")
+
+        dispatcher.publish(WatchlistEvent(WatchlistEventType.STOCK_ADDED, ["AAPL"]), [slow, fast])
+        await _wait_for_deliveries(fast, 1)
+
+        # Assertions
+        assert slow.started.is_set()
+        assert slow.events == []
+        slow.release.set()
+        await _wait_for_deliveries(slow, 1)
+        await _settle(dispatcher)
+
+
+class TestDebounceMerging:
+    """Test suite for merging a burst of events into one dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_tc220_burst_of_additions_is_one_dispatch(self):
+        """TC220: Verify additions in one window arrive as a single STOCK_ADDED."""
+        dispatcher = WatchlistEventDispatcher()
+        observer = _RecordingObserver()
+
+        for symbol in ("AAPL", "MSFT", "NVDA"):
+            _publish(dispatcher, WatchlistEventType.STOCK_ADDED, [symbol], [observer])
+        await _wait_for_deliveries(observer, 1)
+        await _settle(dispatcher)
+
+        # Assertions
+        assert len(observer.events) == 1
+        assert observer.events[0].event_type == WatchlistEventType.STOCK_ADDED
+        assert observer.events[0].stocks_affected == ["AAPL", "MSFT", "NVDA"]
+        assert observer.events[0].metadata["coalesced_events"] == 3
+        assert dispatcher.get_stats()["events_received"] == 3
+        assert dispatcher.get_stats()["dispatches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_tc221_added_then_removed_cancels_out(self):
+        """TC221: Verify a symbol added and removed again in one window dispatches nothing."""
+        dispatcher = WatchlistEventDispatcher()
+        observer = _RecordingObserver()
+
+        _publish(dispatcher, WatchlistEventType.STOCK_ADDED, ["TSLA"], [observer])
+        _publish(dispatcher, WatchlistEventType.STOCK_REMOVED, ["TSLA"], [observer])
+        await _settle(dispatcher)
+
+        # Assertions
+        assert observer.events == []
+        assert dispatcher.get_stats()["dispatches"] == 0
+        assert dispatcher.get_stats()["pending_events"] == 0
+
+    @pytest.mark.asyncio
+    async def test_tc222_mixed_changes_become_watchlist_updated(self):
+        """TC222: Verify additions and removals together arrive as WATCHLIST_UPDATED with the diff."""
+        dispatcher = WatchlistEventDispatcher()
+        observer = _RecordingObserver()
+
+        _publish(dispatcher, WatchlistEventType.STOCK_ADDED, ["AAPL", "MSFT"], [observer])
+        _publish(dispatcher, WatchlistEventType.STOCK_REMOVED, ["NVDA"], [observer])
+        _publish(dispatcher, WatchlistEventType.STOCK_REMOVED, ["MSFT"], [observer])
+        await _wait_for_deliveries(observer, 1)
+        await _settle(dispatcher)
+        event = observer.events[0]
+
+        # Assertions
+        assert event.event_type == WatchlistEventType.WATCHLIST_UPDATED
+        assert event.stocks_affected == ["AAPL", "NVDA"]
+        assert event.metadata["added"] == ["AAPL"]
+        assert event.metadata["removed"] == ["NVDA"]
+        assert event.metadata["cleared"] is False
+
+    @pytest.mark.asyncio
+    async def test_tc223_clear_discards_earlier_changes(self):
+        """TC223: Verify a clear after other edits arrives as WATCHLIST_CLEARED."""
+        dispatcher = WatchlistEventDispatcher()
+        observer = _RecordingObserver()
+
+        _publish(dispatcher, WatchlistEventType.STOCK_ADDED, ["AAPL"], [observer])
+        _publish(dispatcher, WatchlistEventType.WATCHLIST_CLEARED, [], [observer])
+        await _wait_for_deliveries(observer, 1)
+        await _settle(dispatcher)
+
+        # Assertions
+        assert [event.event_type for event in observer.events] == [WatchlistEventType.WATCHLIST_CLEARED]
+        assert observer.events[0].stocks_affected == []
+
+    @pytest.mark.asyncio
+    async def test_tc224_failing_observer_is_isolated(self):
+        """TC224: Verify a failing observer is counted and the others still get the event."""
+        dispatcher = WatchlistEventDispatcher()
+        healthy = _RecordingObserver("healthy")
+
+        class _FailingObserver(_RecordingObserver):
+            async def update(self, event):
+                raise RuntimeError("dashboard cache unavailable")
+
+        _publish(dispatcher, WatchlistEventType.STOCK_ADDED, ["AAPL"], [_FailingObserver("failing"), healthy])
+        await _wait_for_deliveries(healthy, 1)
+        await _settle(dispatcher)
+        observers = dispatcher.get_stats()["observers"]
+
+        # Assertions
+        assert observers["failing"]["failures"] == 1
+        assert observers["healthy"]["failures"] == 0
+        assert observers["healthy"]["calls"] == 1
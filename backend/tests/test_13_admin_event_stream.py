@@ -0,0 +1,134 @@
+"""
+Phase 13: Admin Event Stream Tests
+===================================
+
+Test cases for authenticating the admin Server-Sent Events stream, which
+browser EventSource clients open with a short-lived token in the URL.
+
+Test Coverage:
+- TC214-TC216: Event stream tokens
+"""
+
+import pytest
+import asyncio
+from urllib.parse import urlencode
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.infrastructure.config.settings import get_settings
+from app.infrastructure.security.auth_service import AuthService
+from app.presentation.routes.admin import router as admin_router
+
+
+@pytest.fixture
+def admin_app():
+    """App serving only the admin routes, under /api like main.py."""
+    app = FastAPI()
+    app.include_router(admin_router, prefix="/api")
+    return app
+
+
+@pytest.fixture
+async def session_token():
+    """Access token of a signed-in admin."""
+    tokens = await AuthService(get_settings()).create_admin_session("admin@example.com")
+    return tokens["access_token"]
+
+
+async def _open_stream(app, query):
+    """
+    Open /api/admin/events/stream like EventSource and read until the ready event.
+
+    Talks ASGI directly: the stream never ends, and the test client waits
+    for the whole body before returning.
+    """
+    disconnected = asyncio.Event()
+    ready = asyncio.Event()
+    request_sent = False
+    start = {}
+    body = bytearray()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            start.update(message)
+        elif message["type"] == "http.response.body":
+            body.extend(message.get("body", b""))
+            if b"event: ready" in body:
+                ready.set()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/admin/events/stream",
+        "raw_path": b"/api/admin/events/stream",
+        "query_string": urlencode(query).encode(),
+        "root_path": "",
+        "headers": [(b"host", b"testserver"), (b"accept", b"text/event-stream")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    task = asyncio.create_task(app(scope, receive, send))
+    try:
+        await asyncio.wait_for(ready.wait(), 2.0)
+    finally:
+        disconnected.set()
+        try:
+            await asyncio.wait_for(task, 2.0)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            pass
+    return start, bytes(body).decode()
+
+
+class TestEventStreamTokens:
+    """Test suite for opening the event stream without an Authorization header."""
+
+    @pytest.mark.asyncio
+    async def test_tc214_stream_opens_with_event_stream_token(self, admin_app, session_token):
+        """TC214: Verify EventSource can open the stream with a token from /events/token."""
+        client = TestClient(admin_app)
+        issued = client.post("/api/admin/events/token", headers={"Authorization": f"Bearer {session_token}"})
+
+        start, body = await _open_stream(admin_app, {"token": issued.json()["token"], "topics": "pipeline"})
+
+        # Assertions
+        assert issued.status_code == 200
+        assert issued.json()["expires_in"] == 60
+        assert start["status"] == 200
+        assert (b"content-type", b"text/event-stream; charset=utf-8") in start["headers"]
+        assert body.startswith("retry: ")
+        assert "event: ready" in body
+
+    def test_tc215_stream_requires_an_event_stream_token(self, admin_app, session_token):
+        """TC215: Verify the stream rejects a missing token and a session token in the URL."""
+        client = TestClient(admin_app)
+
+        anonymous = client.get("/api/admin/events/stream")
+        session_in_url = client.get(f"/api/admin/events/stream?token={session_token}")
+
+        # Assertions
+        assert anonymous.status_code == 401
+        assert session_in_url.status_code == 401
+
+    def test_tc216_event_stream_token_opens_nothing_else(self, admin_app, session_token):
+        """TC216: Verify an event stream token is rejected as a Bearer token elsewhere."""
+        client = TestClient(admin_app)
+        stream_token = client.post(
+            "/api/admin/events/token", headers={"Authorization": f"Bearer {session_token}"}
+        ).json()["token"]
+
+        response = client.post("/api/admin/events/token", headers={"Authorization": f"Bearer {stream_token}"})
+
+        # Assertions
+        assert response.status_code == 401
@@ -0,0 +1,118 @@
+"""
+Phase 14: Admin Token Cache Tests
+==================================
+
+Test cases for the verified-token cache in front of admin authentication:
+revocations shared between workers and the bounded lifetime of cached
+tokens.
+
+Test Coverage:
+- TC217-TC218: Revocation of cached tokens
+- TC219: Cache entry lifetime
+"""
+
+import pytest
+import asyncio
+
+import app.infrastructure.security.auth_service as auth_service_module
+from app.infrastructure.config.settings import get_settings
+from app.infrastructure.security.auth_service import AuthService
+from app.infrastructure.security.token_cache import TokenVerificationCache
+from app.infrastructure.security.token_revocation import SQLiteRevocationStore
+
+
+class _CountingStore(SQLiteRevocationStore):
+    """Shared SQLite revocation store that counts lookups."""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.lookups = 0
+
+    async def revoked_until(self, digest):
+        self.lookups += 1
+        return await super().revoked_until(digest)
+
+
+@pytest.fixture
+async def revocation_store(tmp_path, monkeypatch):
+    """Shared revocation store, as with RATE_LIMIT_BACKEND=sqlite."""
+    store = _CountingStore(str(tmp_path / "rate_limits.db"))
+    monkeypatch.setattr(auth_service_module, "get_revocation_store", lambda: store)
+    yield store
+    await store.aclose()
+
+
+def _use_cache(monkeypatch, **options):
+    cache = TokenVerificationCache(**options)
+    monkeypatch.setattr(auth_service_module, "get_token_cache", lambda: cache)
+    return cache
+
+
+async def _sign_in(settings, email="admin@example.com"):
+    tokens = await AuthService(settings).create_admin_session(email)
+    return tokens["access_token"]
+
+
+class TestCachedTokenRevocation:
+    """Test suite for revoking tokens that are already cached."""
+
+    @pytest.mark.asyncio
+    async def test_tc217_revoked_token_is_rejected_at_once(self, monkeypatch, revocation_store):
+        """TC217: Verify a cached token stops working as soon as it is revoked on the same worker."""
+        _use_cache(monkeypatch)
+        auth = AuthService(get_settings())
+        token = await _sign_in(auth.settings)
+
+        before = await auth.validate_admin_token(token)
+        revoked = await auth.revoke_token(token)
+        after = await auth.validate_admin_token(token)
+
+        # Assertions
+        assert before is not None
+        assert revoked is True
+        assert after is None
+
+    @pytest.mark.asyncio
+    async def test_tc218_revocation_elsewhere_applies_after_check_interval(self, monkeypatch, revocation_store):
+        """TC218: Verify cache hits skip the shared store until the check interval passes."""
+        cache = _use_cache(monkeypatch, revocation_check_interval=0.05)
+        auth = AuthService(get_settings())
+        token = await _sign_in(auth.settings)
+
+        await auth.validate_admin_token(token)
+        for _ in range(5):
+            assert await auth.validate_admin_token(token) is not None
+        lookups_while_fresh = revocation_store.lookups
+
+        # Another worker handles the logout
+        payload = auth.jwt_handler.verify_token(token)
+        await revocation_store.revoke(cache.digest(token, auth.settings.jwt_secret_key), float(payload["exp"]))
+        await asyncio.sleep(0.06)
+        after = await auth.validate_admin_token(token)
+
+        # Assertions
+        assert lookups_while_fresh == 1
+        assert after is None
+        assert revocation_store.lookups == 2
+
+
+class TestCacheEntryLifetime:
+    """Test suite for re-verifying cached tokens."""
+
+    @pytest.mark.asyncio
+    async def test_tc219_removed_admin_loses_access_after_max_age(self, monkeypatch, revocation_store):
+        """TC219: Verify a cached token is verified again after max_age, including the admin list."""
+        _use_cache(monkeypatch, max_age=0.05)
+        settings = get_settings().model_copy(update={"admin_emails": ["admin@example.com"]})
+        token = await _sign_in(settings)
+
+        cached = await AuthService(settings).validate_admin_token(token)
+        removed = AuthService(settings.model_copy(update={"admin_emails": ["other@example.com"]}))
+        still_cached = await removed.validate_admin_token(token)
+        await asyncio.sleep(0.06)
+        reverified = await removed.validate_admin_token(token)
+
+        # Assertions
+        assert cached is not None
+        assert still_cached is not None
+        assert reverified is None
@@ -0,0 +1,144 @@
+"""
+Phase 16: Shared Model Registry Tests
+======================================
+
+Test cases for the process-wide registry that shares transformer weights
+between the sentiment models and the benchmark, with the model loading
+replaced by a counting fake.
+
+Test Coverage:
+- TC230-TC231: Shared loading and reference counts
+- TC232-TC233: Unloading and INT8 keys
+"""
+
+import pytest
+import asyncio
+import threading
+import time
+
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+import app.service.sentiment_processing.models.model_registry as model_registry
+from app.service.sentiment_processing.models.model_registry import ModelRegistry
+
+CHECKPOINT = "ProsusAI/finbert"
+
+
+class _FakeModel:
+    """Stands in for a loaded sequence classification model."""
+
+    def __init__(self, quantize):
+        self.quantize = quantize
+
+    def parameters(self):
+        return []
+
+
+class _CountingLoader:
+    """Counts loads; each load takes a moment, like reading weights from disk."""
+
+    def __init__(self):
+        self.loads = []
+        self._lock = threading.Lock()
+
+    def __call__(self, checkpoint, device, quantize=False):
+        time.sleep(0.05)
+        with self._lock:
+            self.loads.append((checkpoint, quantize))
+        return _FakeModel(quantize)
+
+
+class _FakeTokenizer:
+    @staticmethod
+    def from_pretrained(checkpoint, use_fast=True):
+        return object()
+
+
+@pytest.fixture
+def loader(monkeypatch):
+    loader = _CountingLoader()
+    monkeypatch.setattr(model_registry, "load_classification_model", loader)
+    monkeypatch.setattr(model_registry, "AutoTokenizer", _FakeTokenizer)
+    monkeypatch.setattr(model_registry, "is_quantization_available", lambda: True)
+    return loader
+
+
+def _ref_count(registry, dtype="fp32"):
+    return next(
+        model["ref_count"] for model in registry.get_stats()["models"] if model["dtype"] == dtype
+    )
+
+
+class TestSharedLoading:
+    """Test suite for loading each checkpoint once and counting its users."""
+
+    @pytest.mark.asyncio
+    async def test_tc230_concurrent_acquires_load_once(self, loader):
+        """TC230: Verify consumers acquiring at the same time share one load."""
+        registry = ModelRegistry()
+
+        handles = await asyncio.gather(*(asyncio.to_thread(registry.acquire, CHECKPOINT) for _ in range(4)))
+
+        # Assertions
+        assert loader.loads == [(CHECKPOINT, False)]
+        assert all(handle is handles[0] for handle in handles)
+        assert handles[0].key == (CHECKPOINT, "fp32", "cpu")
+        assert _ref_count(registry) == 4
+
+    def test_tc231_release_keeps_the_model_warm(self, loader):
+        """TC231: Verify releasing the last reference keeps the model for the next consumer."""
+        registry = ModelRegistry()
+
+        first = registry.acquire(CHECKPOINT)
+        registry.release(first)
+        registry.release(first)  # Extra releases never go below zero
+        second = registry.acquire(CHECKPOINT)
+
+        # Assertions
+        assert second is first
+        assert len(loader.loads) == 1
+        assert _ref_count(registry) == 1
+        assert registry.get_stats()["models"][0]["acquisitions"] == 2
+
+
+class TestUnloading:
+    """Test suite for unloading models and keeping INT8 and FP32 apart."""
+
+    def test_tc232_unload_skips_referenced_models(self, loader):
+        """TC232: Verify unload leaves models in use alone unless forced."""
+        registry = ModelRegistry()
+        handle = registry.acquire(CHECKPOINT)
+
+        kept = registry.unload()
+        registry.release(handle)
+        unloaded = registry.unload()
+        reloaded = registry.acquire(CHECKPOINT)
+        forced = registry.unload(force=True)
+
+        # Assertions
+        assert kept == []
+        assert unloaded == [(CHECKPOINT, "fp32", "cpu")]
+        assert reloaded is not handle
+        assert len(loader.loads) == 2
+        assert forced == [(CHECKPOINT, "fp32", "cpu")]
+        assert registry.is_loaded(CHECKPOINT) is False
+
+    def test_tc233_int8_model_is_a_separate_entry(self, loader, monkeypatch):
+        """TC233: Verify INT8 and FP32 copies are keyed apart and unloaded by dtype."""
+        registry = ModelRegistry()
+        fp32 = registry.acquire(CHECKPOINT)
+        int8 = registry.acquire(CHECKPOINT, device="cuda", quantize=True)
+        registry.release(int8)
+
+        unloaded = registry.unload(dtype="int8")
+        monkeypatch.setattr(model_registry, "is_quantization_available", lambda: False)
+        fallback = registry.acquire(CHECKPOINT, quantize=True)
+
+        # Assertions
+        assert int8.key == (CHECKPOINT, "int8", "cpu")
+        assert int8.model.quantize is True
+        assert unloaded == [(CHECKPOINT, "int8", "cpu")]
+        assert registry.is_loaded(CHECKPOINT) is True
+        # Without INT8 support a quantize request shares the FP32 model
+        assert fallback is fp32
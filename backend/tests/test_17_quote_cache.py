@@ -0,0 +1,123 @@
+"""
+Phase 17: Quote Cache Tests
+============================
+
+Test cases for the stale-while-revalidate quote cache behind the stock
+analysis page, with the Yahoo Finance lookup replaced by a fake.
+
+Test Coverage:
+- TC234-TC235: Coalesced fetches and stale reads
+- TC236-TC237: Failure backoff and price service updates
+"""
+
+import pytest
+import asyncio
+import threading
+
+from app.service.quote_service import QuoteService
+
+
+class _FakeYahoo:
+    """Counts lookups; each one blocks until released, like a slow round trip."""
+
+    def __init__(self, price=190.0, previous_close=185.0):
+        self.price = price
+        self.previous_close = previous_close
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, symbol):
+        self.calls += 1
+        self.release.wait(2.0)
+        if self.price is None:
+            raise ConnectionError("Yahoo unreachable")
+        return {"current_price": self.price, "previous_close": self.previous_close}
+
+
+def _service(yahoo, **options):
+    service = QuoteService(**options)
+    service._fetch_from_yahoo = yahoo
+    return service
+
+
+class TestCoalescedFetches:
+    """Test suite for sharing fetches and serving stale quotes."""
+
+    @pytest.mark.asyncio
+    async def test_tc234_concurrent_misses_share_one_fetch(self):
+        """TC234: Verify requests for an uncached symbol wait on a single Yahoo lookup."""
+        yahoo = _FakeYahoo()
+        yahoo.release.clear()
+        service = _service(yahoo)
+
+        waiting = [asyncio.create_task(service.get_quote("aapl")) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        yahoo.release.set()
+        quotes = await asyncio.gather(*waiting)
+        stats = service.get_stats()
+
+        # Assertions
+        assert yahoo.calls == 1
+        assert all(quote is quotes[0] for quote in quotes)
+        assert quotes[0].symbol == "AAPL"
+        assert quotes[0].change_percent == pytest.approx(2.7027, rel=1e-3)
+        assert stats["fetches"] == 1
+        assert stats["coalesced"] == 4
+        assert stats["inflight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_tc235_stale_quote_is_served_while_refreshing(self):
+        """TC235: Verify a stale quote is returned at once and replaced in the background."""
+        yahoo = _FakeYahoo(price=200.0)
+        service = _service(yahoo, fresh_seconds=0.0)
+        stale = service.put("MSFT", 410.0, 405.0, source="price_service")
+
+        served = service.get_cached("MSFT")
+        refresh = service.refresh("MSFT")
+        refreshed = await refresh
+
+        # Assertions
+        assert served is stale
+        assert refreshed.current_price == 200.0
+        assert refreshed.source == "yahoo"
+        assert service.get_cached("MSFT", revalidate=False) is refreshed
+        assert service.get_stats()["stale_hits"] == 2
+
+
+class TestFailuresAndUpdates:
+    """Test suite for failed lookups and price service batches."""
+
+    @pytest.mark.asyncio
+    async def test_tc236_failed_symbol_backs_off(self):
+        """TC236: Verify a failed lookup is not retried until the backoff passes."""
+        yahoo = _FakeYahoo(price=None)
+        service = _service(yahoo, failure_backoff_seconds=60.0)
+
+        first = await service.get_quote("NVDA")
+        second = await service.get_quote("NVDA")
+
+        # Assertions
+        assert first is None and second is None
+        assert yahoo.calls == 1
+        assert service.refresh("NVDA") is None
+        assert service.get_stats()["fetch_failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_tc237_price_service_batch_fills_the_cache(self):
+        """TC237: Verify price service batches are served fresh and bad prices are skipped."""
+        yahoo = _FakeYahoo()
+        service = _service(yahoo)
+
+        service.update_from_prices({
+            "AAPL": {"current_price": 191.5, "previous_close": 190.0},
+            "TSLA": {"current_price": 0, "previous_close": 250.0},
+        })
+        quote = await service.get_quote("AAPL")
+
+        # Assertions
+        assert quote.current_price == 191.5
+        assert quote.source == "price_service"
+        assert service.get_cached("TSLA", revalidate=False) is None
+        assert yahoo.calls == 0
+        assert service.get_stats()["fresh_hits"] == 1
@@ -0,0 +1,129 @@
+"""
+Phase 19: Time Bucketing Tests
+===============================
+
+Test cases for the dialect-aware time bucket expressions used by the
+sentiment trend and storage growth queries. SQLite expressions run against
+an in-memory database; PostgreSQL expressions are checked as compiled SQL.
+
+Test Coverage:
+- TC242-TC244: SQLite buckets and exchange-day alignment
+- TC245-TC246: PostgreSQL expressions and helpers
+"""
+
+import pytest
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table, func, insert, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.utils.time_buckets import (
+    bucket_unit_for_days,
+    exchange_utc_offset_minutes,
+    parse_bucket,
+    time_bucket,
+)
+
+metadata = MetaData()
+events = Table(
+    "events",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+)
+
+
+def _utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+async def _bucket_counts(timestamps, unit, utc_offset_minutes=0):
+    """Group the timestamps into buckets in SQLite; returns {bucket start: count}."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+            await conn.execute(insert(events), [{"created_at": ts} for ts in timestamps])
+            bucket = time_bucket(events.c.created_at, unit, "sqlite", utc_offset_minutes)
+            rows = await conn.execute(
+                select(bucket.label("time_bucket"), func.count()).group_by(bucket).order_by(bucket)
+            )
+            return {parse_bucket(row.time_bucket): row[1] for row in rows}
+    finally:
+        await engine.dispose()
+
+
+class TestSQLiteBuckets:
+    """Test suite for grouping timestamps in SQLite."""
+
+    @pytest.mark.asyncio
+    async def test_tc242_hour_and_day_buckets(self):
+        """TC242: Verify timestamps fall into the hour and day that contain them."""
+        timestamps = [
+            _utc(2026, 10, 15, 9, 5), _utc(2026, 10, 15, 9, 55),
+            _utc(2026, 10, 15, 10, 0), _utc(2026, 10, 16, 23, 59)
+        ]
+
+        hours = await _bucket_counts(timestamps, "hour")
+        days = await _bucket_counts(timestamps, "day")
+
+        # Assertions
+        assert hours == {
+            _utc(2026, 10, 15, 9): 2,
+            _utc(2026, 10, 15, 10): 1,
+            _utc(2026, 10, 16, 23): 1,
+        }
+        assert days == {_utc(2026, 10, 15): 3, _utc(2026, 10, 16): 1}
+
+    @pytest.mark.asyncio
+    async def test_tc243_weeks_start_on_monday(self):
+        """TC243: Verify week buckets start on Monday like PostgreSQL date_trunc('week')."""
+        # Sunday 18th belongs to the week of Monday 12th; Monday 19th starts a new one
+        timestamps = [_utc(2026, 10, 12, 0, 0), _utc(2026, 10, 18, 23, 0), _utc(2026, 10, 19, 8, 0)]
+
+        weeks = await _bucket_counts(timestamps, "week")
+
+        # Assertions
+        assert weeks == {_utc(2026, 10, 12): 2, _utc(2026, 10, 19): 1}
+
+    @pytest.mark.asyncio
+    async def test_tc244_days_follow_the_exchange_offset(self):
+        """TC244: Verify an offset moves day boundaries to local midnight, labelled in UTC."""
+        # 02:00 UTC on the 16th is still the 15th in New York (EDT, UTC-4)
+        timestamps = [_utc(2026, 10, 15, 14, 0), _utc(2026, 10, 16, 2, 0), _utc(2026, 10, 16, 5, 0)]
+
+        days = await _bucket_counts(timestamps, "day", utc_offset_minutes=-240)
+
+        # Assertions
+        assert days == {_utc(2026, 10, 15, 4): 2, _utc(2026, 10, 16, 4): 1}
+
+
+class TestPostgresAndHelpers:
+    """Test suite for the PostgreSQL expression and the helper functions."""
+
+    def test_tc245_postgres_expression(self):
+        """TC245: Verify PostgreSQL buckets use date_trunc on the UTC wall clock with the offset applied."""
+        plain = time_bucket(events.c.created_at, "day", "postgresql")
+        shifted = time_bucket(events.c.created_at, "week", "postgresql", utc_offset_minutes=-300)
+
+        plain_sql = str(plain.compile(dialect=postgresql.dialect()))
+        shifted_sql = str(shifted.compile(dialect=postgresql.dialect()))
+
+        # Assertions
+        assert plain_sql == "date_trunc('day', timezone('UTC', events.created_at))"
+        assert "date_trunc('week', timezone('UTC', events.created_at) + INTERVAL '-300 minutes')" in shifted_sql
+        assert shifted_sql.endswith("- INTERVAL '-300 minutes'")
+        with pytest.raises(ValueError):
+            time_bucket(events.c.created_at, "month", "postgresql")
+        with pytest.raises(ValueError):
+            time_bucket(events.c.created_at, "day", "mysql")
+
+    def test_tc246_helpers(self):
+        """TC246: Verify exchange offsets follow DST and bucket units follow the window length."""
+        # Assertions
+        assert exchange_utc_offset_minutes(at=_utc(2026, 1, 15, 12)) == -300
+        assert exchange_utc_offset_minutes(at=_utc(2026, 7, 15, 12)) == -240
+        assert [bucket_unit_for_days(days) for days in (1, 7, 30)] == ["hour", "day", "week"]
+        assert parse_bucket("2026-10-15 04:00:00") == _utc(2026, 10, 15, 4)
+        assert parse_bucket(None) is None
@@ -0,0 +1,138 @@
+"""
+Phase 20: Streaming Export Tests
+=================================
+
+Test cases for the streamed CSV / NDJSON admin exports, read from a
+temporary SQLite file through the same cursor path the admin routes use.
+
+Test Coverage:
+- TC247-TC248: CSV and NDJSON encoding, gzip output
+- TC249-TC250: Empty exports and failures mid-stream
+"""
+
+import pytest
+import csv
+import gzip
+import io
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+from sqlalchemy import JSON, Column, DateTime, Integer, MetaData, String, Table, insert, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+import app.service.export_service as export_service
+from app.service.export_service import export_filename, export_media_type, stream_export
+
+metadata = MetaData()
+logs = Table(
+    "logs",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("level", String(10)),
+    Column("message", String(200)),
+    Column("context", JSON),
+    Column("created_at", DateTime(timezone=True)),
+)
+FIELDNAMES = ["id", "level", "message", "context", "created_at"]
+CREATED_AT = datetime(2026, 10, 15, 9, 30, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+async def log_rows(tmp_path, monkeypatch):
+    """Five log rows in a temporary database the export stream reads."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'export.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+        await conn.execute(insert(logs), [
+            {
+                "id": n, "level": "INFO", "message": f"Collected, \"batch\" {n}",
+                "context": {"batch": n}, "created_at": CREATED_AT
+            }
+            for n in range(1, 6)
+        ])
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+    @asynccontextmanager
+    async def get_db_session():
+        async with sessions() as session:
+            yield session
+
+    monkeypatch.setattr(export_service, "get_db_session", get_db_session)
+    yield
+    await engine.dispose()
+
+
+def _query():
+    return select(*(logs.c[name] for name in FIELDNAMES)).order_by(logs.c.id)
+
+
+async def _collect(stream):
+    return [chunk async for chunk in stream]
+
+
+class TestEncoding:
+    """Test suite for the CSV and NDJSON encodings."""
+
+    @pytest.mark.asyncio
+    async def test_tc247_csv_header_comes_first(self, log_rows):
+        """TC247: Verify the CSV header is its own first chunk and rows follow in cursor chunks."""
+        header = ["ID", "Level", "Message", "Context", "Created At"]
+
+        chunks = await _collect(stream_export(_query(), FIELDNAMES, csv_header=header, chunk_rows=2))
+        rows = list(csv.reader(io.StringIO(b"".join(chunks).decode("utf-8"))))
+
+        # Assertions
+        assert chunks[0] == b"ID,Level,Message,Context,Created At\r\n"
+        assert len([chunk for chunk in chunks if chunk]) == 4  # header + 3 chunks of at most 2 rows
+        assert rows[0] == header
+        assert len(rows) == 6
+        assert rows[1][2] == 'Collected, "batch" 1'
+        assert json.loads(rows[1][3]) == {"batch": 1}
+
+    @pytest.mark.asyncio
+    async def test_tc248_gzip_ndjson_roundtrip(self, log_rows):
+        """TC248: Verify a gzipped NDJSON export decompresses to one JSON record per row."""
+        chunks = await _collect(stream_export(_query(), FIELDNAMES, fmt="ndjson", compress=True))
+        records = [json.loads(line) for line in gzip.decompress(b"".join(chunks)).splitlines()]
+
+        # Assertions
+        assert [record["id"] for record in records] == [1, 2, 3, 4, 5]
+        assert records[0]["context"] == {"batch": 1}
+        assert records[0]["created_at"].startswith("2026-10-15T09:30:00")
+        assert export_media_type("ndjson", compress=True) == "application/gzip"
+        assert export_filename("system_logs", "ndjson", compress=True) == "system_logs.ndjson.gz"
+        with pytest.raises(ValueError):
+            export_service._ChunkEncoder("xml", compress=False)
+
+
+class TestEmptyAndFailedExports:
+    """Test suite for exports without rows and exports that fail part way."""
+
+    @pytest.mark.asyncio
+    async def test_tc249_empty_csv_writes_placeholder_row(self, log_rows):
+        """TC249: Verify an empty CSV export gets the placeholder row and NDJSON stays empty."""
+        query = _query().where(logs.c.level == "ERROR")
+        placeholder = ["", "", "No logs found", "", ""]
+
+        csv_chunks = await _collect(stream_export(query, FIELDNAMES, empty_row=placeholder))
+        ndjson_chunks = await _collect(stream_export(query, FIELDNAMES, fmt="ndjson", empty_row=placeholder))
+
+        # Assertions
+        assert b"".join(csv_chunks).decode("utf-8").splitlines() == [",".join(FIELDNAMES), ",,No logs found,,"]
+        assert b"".join(ndjson_chunks) == b""
+
+    @pytest.mark.asyncio
+    async def test_tc250_failure_aborts_the_stream(self, log_rows):
+        """TC250: Verify a database error re-raises and NDJSON readers get an error record first."""
+        missing = select(logs.c.id, Column("missing", Integer)).select_from(logs)
+        received = []
+
+        with pytest.raises(OperationalError):
+            async for chunk in stream_export(missing, ["id", "missing"], fmt="ndjson", compress=True):
+                received.append(chunk)
+        decoder = gzip.GzipFile(fileobj=io.BytesIO(b"".join(received)))
+
+        # Assertions
+        assert json.loads(decoder.read()) == {"error": "Export failed after 0 rows"}
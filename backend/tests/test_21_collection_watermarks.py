@@ -0,0 +1,122 @@
+"""
+Phase 21: Collection Watermark Tests
+=====================================
+
+Test cases for the per-(source, symbol) high-water marks that let
+scheduled collection runs request only items newer than those already
+stored, run against a temporary SQLite file.
+
+Test Coverage:
+- TC251-TC252: Marks from collected items and query window starts
+- TC253-TC254: Forward-only advancing and resets
+"""
+
+import pytest
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+import app.data_access.database as database
+from app.data_access.database.base import Base
+from app.data_access.models import CollectionWatermark
+from app.service.watermark_service import DEFAULT_OVERLAP, SOURCE_OVERLAP, WatermarkService
+
+NOW = datetime(2026, 10, 15, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+async def watermark_db(tmp_path, monkeypatch):
+    """Temporary database holding only the collection_watermarks table."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'watermarks.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[CollectionWatermark.__table__])
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+    @asynccontextmanager
+    async def get_db_session():
+        async with sessions() as session:
+            yield session
+            await session.commit()
+
+    monkeypatch.setattr(database, "get_db_session", get_db_session)
+    yield
+    await engine.dispose()
+
+
+def _item(symbol, timestamp):
+    return SimpleNamespace(stock_symbol=symbol, timestamp=timestamp)
+
+
+class TestMarksAndWindows:
+    """Test suite for deriving marks and the next query window."""
+
+    def test_tc251_marks_take_the_newest_item_per_symbol(self):
+        """TC251: Verify each symbol's mark is its newest item, clamped to the window end."""
+        items = [
+            _item("aapl", NOW - timedelta(hours=3)),
+            _item("AAPL", NOW - timedelta(hours=1)),
+            _item("TSLA", NOW + timedelta(days=2)),  # Upstream clock ahead of ours
+            _item(None, NOW),
+        ]
+
+        marks = WatermarkService.marks_from_items(items, ceiling=NOW)
+
+        # Assertions
+        assert marks == {"AAPL": NOW - timedelta(hours=1), "TSLA": NOW}
+
+    @pytest.mark.asyncio
+    async def test_tc252_window_starts_one_overlap_before_the_mark(self, watermark_db):
+        """TC252: Verify the next window starts at the mark minus the source's overlap."""
+        service = WatermarkService()
+        await service.advance("newsapi", {"AAPL": NOW})
+        await service.advance("hackernews", {"AAPL": NOW})
+
+        newsapi = await service.load_since("newsapi", ["aapl", "MSFT"])
+        hackernews = await service.load_since("hackernews", ["AAPL"])
+
+        # Assertions
+        assert newsapi == {"AAPL": NOW - SOURCE_OVERLAP["newsapi"]}
+        assert hackernews == {"AAPL": NOW - DEFAULT_OVERLAP}
+
+
+class TestAdvanceAndReset:
+    """Test suite for moving marks forward and forgetting them."""
+
+    @pytest.mark.asyncio
+    async def test_tc253_marks_only_move_forward(self, watermark_db):
+        """TC253: Verify an older mark is ignored and a newer one replaces the stored mark."""
+        service = WatermarkService()
+
+        created = await service.advance("finnhub", {"AAPL": NOW, "MSFT": NOW})
+        older = await service.advance("finnhub", {"AAPL": NOW - timedelta(hours=5)})
+        newer = await service.advance("finnhub", {"MSFT": NOW + timedelta(hours=2)})
+        since = await service.load_since("finnhub", ["AAPL", "MSFT"])
+
+        # Assertions
+        assert (created, older, newer) == (2, 0, 1)
+        assert since["AAPL"] == NOW - SOURCE_OVERLAP["finnhub"]
+        assert since["MSFT"] == NOW + timedelta(hours=2) - SOURCE_OVERLAP["finnhub"]
+
+    @pytest.mark.asyncio
+    async def test_tc254_reset_and_failed_lookup_fall_back_to_full_window(self, watermark_db, monkeypatch):
+        """TC254: Verify reset symbols and failed lookups get the full lookback window."""
+        service = WatermarkService()
+        await service.advance("gdelt", {"AAPL": NOW, "MSFT": NOW})
+
+        cleared = await service.reset("gdelt", ["aapl"])
+        after_reset = await service.load_since("gdelt", ["AAPL", "MSFT"])
+
+        @asynccontextmanager
+        async def broken_session():
+            raise ConnectionError("database unavailable")
+            yield
+
+        monkeypatch.setattr(database, "get_db_session", broken_session)
+        after_failure = await service.load_since("gdelt", ["MSFT"])
+
+        # Assertions
+        assert cleared == 1
+        assert list(after_reset) == ["MSFT"]
+        assert after_failure == {}
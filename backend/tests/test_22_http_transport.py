@@ -0,0 +1,127 @@
+"""
+Phase 22: Shared HTTP Transport Tests
+======================================
+
+Test cases for the long-lived pooled HTTP clients shared by the data
+collectors, run against a local aiohttp server instead of the upstream APIs.
+
+Test Coverage:
+- TC255-TC256: Client sharing and connection reuse (httpx)
+- TC257-TC258: aiohttp sessions, DNS caching and shutdown
+"""
+
+import pytest
+
+from aiohttp import web
+
+import app.infrastructure.http_transport as http_transport
+from app.infrastructure.http_transport import DNSCache, HTTPTransportManager, host_of
+
+
+@pytest.fixture
+async def upstream():
+    """Local HTTP server answering every GET with a small JSON body."""
+    async def handle(request):
+        return web.json_response({"path": request.path})
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://localhost:{port}"
+    await runner.cleanup()
+
+
+class TestHttpxClients:
+    """Test suite for the shared httpx clients."""
+
+    @pytest.mark.asyncio
+    async def test_tc255_one_client_per_host(self):
+        """TC255: Verify callers on the same host share a client with the host's connection limit."""
+        transport = HTTPTransportManager()
+
+        finnhub = transport.httpx_client("https://finnhub.io/api/v1/company-news")
+        again = transport.httpx_client("finnhub.io")
+        newsapi = transport.httpx_client("https://newsapi.org/v2/everything")
+        pool = finnhub._transport._pool
+        await finnhub.aclose()
+        replaced = transport.httpx_client("https://finnhub.io/api/v1/quote")
+
+        # Assertions
+        assert again is finnhub
+        assert newsapi is not finnhub
+        assert pool._max_connections == http_transport.HOST_CONNECTION_LIMITS["finnhub.io"]
+        assert replaced is not finnhub
+        assert host_of("https://API.GDELTproject.org/api/v2/doc") == "api.gdeltproject.org"
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_tc256_requests_reuse_the_connection(self, upstream):
+        """TC256: Verify sequential requests through the shared client reuse one connection."""
+        transport = HTTPTransportManager()
+        client = transport.httpx_client(upstream)
+
+        responses = [await client.get(f"{upstream}/news/{n}") for n in range(3)]
+        stats = transport.get_stats()
+        host = stats["hosts"]["localhost"]
+        await transport.aclose()
+
+        # Assertions
+        assert [response.json()["path"] for response in responses] == ["/news/0", "/news/1", "/news/2"]
+        assert host["client"] == "httpx"
+        assert host["requests"] == 3
+        assert host["new_connections"] == 1
+        assert host["reused_connections"] == 2
+        assert host["open"] is True
+        assert stats["dns_cache"]["misses"] == 1
+
+
+class TestAiohttpAndShutdown:
+    """Test suite for aiohttp sessions, the DNS cache and closing everything."""
+
+    @pytest.mark.asyncio
+    async def test_tc257_aiohttp_session_is_shared(self, upstream):
+        """TC257: Verify the aiohttp session is shared per host and counts reused connections."""
+        transport = HTTPTransportManager()
+        session = await transport.aiohttp_session(upstream)
+        same = await transport.aiohttp_session(f"{upstream}/other")
+
+        for n in range(3):
+            async with session.get(f"{upstream}/stories/{n}") as response:
+                await response.json()
+        host = transport.get_stats()["hosts"]["localhost"]
+        await transport.aclose()
+
+        # Assertions
+        assert same is session
+        assert host["client"] == "aiohttp"
+        assert host["requests"] == 3
+        assert host["new_connections"] == 1
+        assert host["reused_connections"] == 2
+        assert session.closed is True
+
+    @pytest.mark.asyncio
+    async def test_tc258_dns_cache_and_close(self):
+        """TC258: Verify lookups are cached for the TTL and aclose leaves no client open."""
+        cache = DNSCache(ttl_seconds=60)
+        first = await cache.resolve("localhost", 80)
+        second = await cache.resolve("localhost", 80)
+        cache.forget("localhost", 80)
+        await cache.resolve("localhost", 80)
+
+        transport = HTTPTransportManager()
+        client = transport.httpx_client("https://finnhub.io")
+        transport.record_request("query1.finance.yahoo.com", "curl_cffi", error=True)
+        await transport.aclose()
+        stats = transport.get_stats()
+
+        # Assertions
+        assert first == second
+        assert set(first) <= {"127.0.0.1", "::1"}
+        assert (cache.hits, cache.misses) == (1, 2)
+        assert client.is_closed is True
+        assert stats["hosts"]["finnhub.io"]["open"] is False
+        assert stats["hosts"]["query1.finance.yahoo.com"]["errors"] == 1
@@ -0,0 +1,129 @@
+"""
+Phase 23: Sentiment Projection Tests
+=====================================
+
+Test cases for the column-projected sentiment reads used by dashboards,
+stock pages and accuracy metrics, run against a temporary SQLite file.
+
+Test Coverage:
+- TC259-TC260: Date range and recent point queries
+- TC261: Projected columns only
+"""
+
+import pytest
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.data_access.database.base import Base
+from app.data_access.models import SentimentData, StocksWatchlist
+from app.data_access.repositories.sentiment_repository import SENTIMENT_POINT_COLUMNS, SentimentDataRepository
+
+NOW = datetime(2026, 10, 15, 12, 0)  # Naive UTC, as SQLite stores it
+POINT_FIELDS = ["stock_id", "sentiment_score", "confidence", "sentiment_label", "source", "created_at"]
+
+
+@pytest.fixture
+async def sentiment_db(tmp_path):
+    """Temporary database with AAPL and MSFT rows, one per hour for the last six hours."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'sentiment.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all, tables=[StocksWatchlist.__table__, SentimentData.__table__]
+        )
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+    stocks = {
+        symbol: StocksWatchlist(id=uuid.uuid4(), symbol=symbol, name=symbol)
+        for symbol in ("AAPL", "MSFT")
+    }
+    async with sessions() as session:
+        session.add_all(stocks.values())
+        session.add_all(
+            SentimentData(
+                id=uuid.uuid4(), stock_id=stock.id, source="finnhub", sentiment_score=hours / 10,
+                confidence=0.9, sentiment_label="Positive", raw_text="x" * 5000,
+                additional_metadata={"article": "body"}, created_at=NOW - timedelta(hours=hours)
+            )
+            for stock in stocks.values()
+            for hours in range(6)
+        )
+        await session.commit()
+
+    statements = []
+    event.listen(
+        engine.sync_engine, "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement)
+    )
+    yield sessions, stocks, statements
+    await engine.dispose()
+
+
+class TestPointQueries:
+    """Test suite for the projected date range and recent point queries."""
+
+    @pytest.mark.asyncio
+    async def test_tc259_date_range_points_for_one_symbol(self, sentiment_db):
+        """TC259: Verify range points belong to the symbol, are latest first and honour the limit."""
+        sessions, stocks, _ = sentiment_db
+
+        async with sessions() as session:
+            repository = SentimentDataRepository(session)
+            points = await repository.get_sentiment_points_by_date_range(
+                "aapl", NOW - timedelta(hours=4), NOW
+            )
+            limited = await repository.get_sentiment_points_by_date_range(
+                "AAPL", NOW - timedelta(hours=4), NOW, limit=2
+            )
+
+        # Assertions
+        assert len(points) == 5
+        assert {point.stock_id for point in points} == {stocks["AAPL"].id}
+        assert [point.created_at for point in points] == sorted(
+            (point.created_at for point in points), reverse=True
+        )
+        assert [float(point.sentiment_score) for point in limited] == [0.0, 0.1]
+
+    @pytest.mark.asyncio
+    async def test_tc260_recent_points_filter_by_stock(self, sentiment_db):
+        """TC260: Verify recent points respect since, the stock filter and the limit."""
+        sessions, stocks, _ = sentiment_db
+
+        async with sessions() as session:
+            repository = SentimentDataRepository(session)
+            everything = await repository.get_recent_sentiment_points(NOW - timedelta(hours=2, minutes=30))
+            msft = await repository.get_recent_sentiment_points(
+                NOW - timedelta(days=1), stock_ids=[stocks["MSFT"].id]
+            )
+            capped = await repository.get_recent_sentiment_points(NOW - timedelta(days=1), limit=3)
+
+        # Assertions
+        assert len(everything) == 6
+        assert len(msft) == 6
+        assert {point.stock_id for point in msft} == {stocks["MSFT"].id}
+        assert len(capped) == 3
+        assert capped[0].created_at == NOW
+
+
+class TestProjection:
+    """Test suite for the columns the point queries read."""
+
+    @pytest.mark.asyncio
+    async def test_tc261_points_skip_text_and_metadata(self, sentiment_db):
+        """TC261: Verify point queries never select raw_text or additional_metadata."""
+        sessions, _, statements = sentiment_db
+
+        async with sessions() as session:
+            repository = SentimentDataRepository(session)
+            points = await repository.get_recent_sentiment_points(NOW - timedelta(days=1))
+            await repository.get_sentiment_points_by_date_range("AAPL", NOW - timedelta(days=1), NOW)
+
+        # Assertions
+        assert list(points[0]._fields) == POINT_FIELDS
+        assert [column.key for column in SENTIMENT_POINT_COLUMNS] == POINT_FIELDS
+        assert len(statements) == 2
+        for statement in statements:
+            assert "raw_text" not in statement
+            assert "additional_metadata" not in statement
@@ -0,0 +1,114 @@
+"""
+Phase 25: Benchmark Metrics Tests
+==================================
+
+Test cases for the vectorised metric, batching and throughput helpers of
+the PhraseBank benchmark. No model is loaded; the helpers are fed labels
+and latencies directly.
+
+Test Coverage:
+- TC266-TC267: Confusion matrix, F1 scores and AI verification triggers
+- TC268-TC269: Length buckets, throughput summary and INT8 comparison
+"""
+
+import pytest
+from dataclasses import asdict
+
+import numpy as np
+
+pytest.importorskip("torch")
+
+from app.service.benchmark_service import BenchmarkConfiguration, ConfigurationResult, ModelBenchmarkService
+
+
+@pytest.fixture
+def service():
+    return ModelBenchmarkService()
+
+
+def _result(configuration, accuracy, texts_per_second):
+    return ConfigurationResult(
+        configuration=asdict(configuration),
+        accuracy=accuracy,
+        macro_f1=accuracy,
+        weighted_f1=accuracy,
+        avg_confidence=0.9,
+        ai_verification_candidates_percent=0.0,
+        throughput={"texts_per_second": texts_per_second}
+    )
+
+
+class TestAccuracyMetrics:
+    """Test suite for metrics computed from labels and predictions."""
+
+    def test_tc266_metrics_from_confusion_matrix(self, service):
+        """TC266: Verify per-class and averaged scores match a hand-computed example."""
+        y_true = np.array([0, 0, 1, 2, 2, 2])
+        y_pred = np.array([0, 1, 1, 2, 2, 0])
+
+        confusion = service._confusion_matrix(y_true, y_pred)
+        macro_p, macro_r, macro_f1, weighted_f1, precisions, recalls, f1_scores, supports = (
+            service._calculate_metrics(confusion)
+        )
+        never_predicted = service._calculate_metrics(service._confusion_matrix(y_true, np.zeros(6, dtype=int)))
+
+        # Assertions
+        assert confusion.tolist() == [[1, 1, 0], [0, 1, 0], [1, 0, 2]]
+        assert precisions.tolist() == pytest.approx([0.5, 0.5, 1.0])
+        assert recalls.tolist() == pytest.approx([0.5, 1.0, 2 / 3])
+        assert f1_scores.tolist() == pytest.approx([0.5, 2 / 3, 0.8])
+        assert supports.tolist() == [2, 1, 3]
+        assert macro_f1 == pytest.approx((0.5 + 2 / 3 + 0.8) / 3)
+        assert weighted_f1 == pytest.approx((0.5 * 2 + 2 / 3 + 0.8 * 3) / 6)
+        # Classes that are never predicted score zero instead of NaN
+        assert never_predicted[4].tolist() == pytest.approx([1 / 3, 0.0, 0.0])
+
+    def test_tc267_ai_verification_triggers(self, service):
+        """TC267: Verify low-confidence and confident-neutral predictions are counted."""
+        y_true = np.array([0, 0, 1, 2, 2, 2])
+        y_pred = np.array([0, 1, 1, 2, 2, 0])
+        confidences = np.array([0.4, 0.9, 0.5, 0.95, 0.8, 0.3])
+
+        counts = service._ai_trigger_counts(y_true, y_pred, confidences, confidence_threshold=0.6)
+
+        # Assertions
+        assert counts == (3, 1, 2)
+
+
+class TestBatchingAndThroughput:
+    """Test suite for length bucketing, throughput and INT8 comparisons."""
+
+    def test_tc268_buckets_and_throughput(self, service):
+        """TC268: Verify batches group similar lengths and latencies reduce to percentiles."""
+        buckets = service._length_buckets(np.array([5, 1, 3, 1, 9]), batch_size=2)
+
+        throughput = service._summarize_throughput(
+            [0.1] * 9 + [1.0], total_samples=320, batch_size=32, model_load_seconds=4.321, rss_mb=812.5
+        )
+        empty = service._summarize_throughput([], total_samples=0, batch_size=32, model_load_seconds=0, rss_mb=None)
+
+        # Assertions
+        assert [bucket.tolist() for bucket in buckets] == [[1, 3], [2, 0], [4]]
+        assert throughput.inference_seconds == 1.9
+        assert throughput.texts_per_second == 168.4
+        assert throughput.batch_latency_p50_ms == 100.0
+        assert throughput.batch_latency_p90_ms == 190.0
+        assert throughput.batch_latency_p99_ms == 919.0
+        assert throughput.model_load_seconds == 4.32
+        assert throughput.rss_mb == 812.5
+        assert (empty.texts_per_second, empty.batch_latency_p99_ms) == (0.0, 0.0)
+
+    def test_tc269_int8_results_compare_with_their_fp32_twin(self, service):
+        """TC269: Verify INT8 results get accuracy delta and speedup only against an identical FP32 setup."""
+        fp32 = _result(BenchmarkConfiguration(name="FinBERT"), 0.87, 100.0)
+        int8 = _result(BenchmarkConfiguration(name="FinBERT (INT8)", quantize=True), 0.85, 300.0)
+        orphan = _result(BenchmarkConfiguration(name="FinBERT (INT8, 16)", batch_size=16, quantize=True), 0.8, 250.0)
+
+        service._compare_with_fp32([fp32, int8, orphan])
+
+        # Assertions
+        assert int8.accuracy_delta_vs_fp32 == -0.02
+        assert int8.speedup_vs_fp32 == 3.0
+        assert orphan.accuracy_delta_vs_fp32 is None
+        assert orphan.speedup_vs_fp32 is None
+        assert fp32.speedup_vs_fp32 is None